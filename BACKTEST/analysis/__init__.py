@@ -0,0 +1,43 @@
+"""
+Backtest result analysis.
+
+Vectorized performance, risk and trade statistics, walk-forward and
+Monte Carlo robustness studies.
+"""
+
+from BACKTEST.analysis.metrics_calculator import calculate_performance_metrics, equity_arrays
+from BACKTEST.analysis.monte_carlo import MonteCarloCosts, bootstrap_trades, distribution
+from BACKTEST.analysis.risk_analyzer import (
+    drawdown_stats,
+    exposure,
+    return_ratios,
+    rolling_returns,
+)
+from BACKTEST.analysis.trade_analyzer import (
+    TradeArrays,
+    exit_reason_breakdown,
+    side_breakdown,
+    trade_return_ratios,
+    trade_statistics,
+)
+from BACKTEST.analysis.walk_forward import Fold, WalkForward, walk_forward_folds
+
+__all__ = [
+    "TradeArrays",
+    "trade_statistics",
+    "trade_return_ratios",
+    "side_breakdown",
+    "exit_reason_breakdown",
+    "drawdown_stats",
+    "return_ratios",
+    "rolling_returns",
+    "exposure",
+    "calculate_performance_metrics",
+    "equity_arrays",
+    "Fold",
+    "WalkForward",
+    "walk_forward_folds",
+    "MonteCarloCosts",
+    "bootstrap_trades",
+    "distribution",
+]
@@ -0,0 +1,137 @@
+"""
+Single-pass performance metrics for a backtest.
+
+Combines trade statistics (trade_analyzer) and equity curve risk metrics
+(risk_analyzer) computed on arrays, so sweeps can score many candidates
+without iterating over Trade objects or equity curve dicts.
+"""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.analysis.risk_analyzer import (
+    NS_PER_SECOND,
+    SECONDS_PER_YEAR,
+    drawdown_stats,
+    exposure,
+    periods_per_year,
+    return_ratios,
+    rolling_returns,
+)
+from BACKTEST.analysis.trade_analyzer import (
+    TradeArrays,
+    exit_reason_breakdown,
+    side_breakdown,
+    trade_return_ratios,
+    trade_statistics,
+)
+
+DEFAULT_ROLLING_WINDOW_SECONDS = 24 * 3600
+
+EquityInput = Union[Mapping[str, np.ndarray], List[Dict[str, Any]]]
+
+
+def equity_arrays(equity_curve: EquityInput) -> Dict[str, np.ndarray]:
+    """
+    Normalize an equity curve to {"timestamp": ns, "equity": values} arrays.
+
+    Accepts BalanceTracker.get_equity_arrays() output or the list of point
+    dicts stored on BacktestResult.equity_curve.
+    """
+    if isinstance(equity_curve, Mapping):
+        return {
+            "timestamp": np.asarray(equity_curve["timestamp"], dtype=np.int64),
+            "equity": np.asarray(equity_curve["equity"], dtype=np.float64),
+        }
+    if not equity_curve:
+        return {"timestamp": np.empty(0, dtype=np.int64), "equity": np.empty(0, dtype=np.float64)}
+    return {
+        "timestamp": pd.to_datetime([p["timestamp"] for p in equity_curve], utc=True).asi8,
+        "equity": np.array([p.get("equity", p.get("balance")) for p in equity_curve], dtype=np.float64),
+    }
+
+
+def calculate_performance_metrics(
+    trades: Union[TradeArrays, Iterable[Any]],
+    equity_curve: EquityInput,
+    initial_balance: float,
+    final_balance: Optional[float] = None,
+    risk_free_rate: float = 0.0,
+    rolling_window_seconds: float = DEFAULT_ROLLING_WINDOW_SECONDS
+) -> Dict[str, Any]:
+    """
+    Compute all performance metrics in one pass over array data.
+
+    Args:
+        trades: TradeArrays or Trade objects
+        equity_curve: Equity arrays or equity curve points
+        initial_balance: Starting capital
+        final_balance: Ending capital (default: last equity point)
+        risk_free_rate: Annual risk-free rate
+        rolling_window_seconds: Window for rolling return statistics
+
+    Returns:
+        Flat metrics dict plus "by_side" and "by_exit_reason" breakdowns;
+        all values are JSON-serializable.
+    """
+    if not isinstance(trades, TradeArrays):
+        trades = TradeArrays.from_trades(trades)
+    curve = equity_arrays(equity_curve)
+    timestamps, equity = curve["timestamp"], curve["equity"]
+
+    if final_balance is None:
+        final_balance = float(equity[-1]) if len(equity) else initial_balance
+    total_return = final_balance - initial_balance
+
+    metrics: Dict[str, Any] = {
+        "initial_balance": initial_balance,
+        "final_balance": final_balance,
+        "total_return": total_return,
+        "total_return_percent": total_return / initial_balance * 100 if initial_balance > 0 else 0.0,
+    }
+    metrics.update(trade_statistics(trades))
+    metrics.update(trade_return_ratios(trades, risk_free_rate))
+    metrics.update(drawdown_stats(timestamps, equity))
+
+    # 자산 곡선 기반 (연율화) 지표
+    annualization = periods_per_year(timestamps)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(equity) / equity[:-1] if len(equity) > 1 else np.empty(0)
+    returns = returns[np.isfinite(returns)]
+    equity_ratios = return_ratios(returns, annualization, risk_free_rate)
+    metrics["equity_sharpe_ratio"] = equity_ratios["sharpe_ratio"]
+    metrics["equity_sortino_ratio"] = equity_ratios["sortino_ratio"]
+
+    span_seconds = (timestamps[-1] - timestamps[0]) / NS_PER_SECOND if len(timestamps) > 1 else 0.0
+    annual_return_percent = None
+    if span_seconds > 0 and initial_balance > 0 and final_balance > 0:
+        # 짧은 구간은 연율화 시 overflow 가능 → None
+        with np.errstate(over="ignore"):
+            growth = np.power(final_balance / initial_balance, SECONDS_PER_YEAR / span_seconds)
+        if np.isfinite(growth):
+            annual_return_percent = float((growth - 1) * 100)
+    metrics["annualized_return_percent"] = annual_return_percent
+    max_dd_pct = metrics["max_drawdown_percent"]
+    metrics["calmar_ratio"] = (
+        annual_return_percent / abs(max_dd_pct) if annual_return_percent is not None and max_dd_pct < 0 else None
+    )
+
+    rolling = rolling_returns(timestamps, equity, rolling_window_seconds) if len(equity) else np.empty(0)
+    rolling = rolling[~np.isnan(rolling)]
+    metrics["rolling_window_seconds"] = rolling_window_seconds
+    metrics["rolling_return_mean_percent"] = float(rolling.mean() * 100) if len(rolling) else None
+    metrics["rolling_return_best_percent"] = float(rolling.max() * 100) if len(rolling) else None
+    metrics["rolling_return_worst_percent"] = float(rolling.min() * 100) if len(rolling) else None
+
+    if len(timestamps) > 1:
+        closed = trades.closed
+        exit_ns = np.where(closed, trades.exit_ns, timestamps[-1])
+        metrics["exposure_percent"] = exposure(trades.entry_ns, exit_ns, timestamps[0], timestamps[-1]) * 100
+    else:
+        metrics["exposure_percent"] = 0.0
+
+    metrics["by_side"] = side_breakdown(trades)
+    metrics["by_exit_reason"] = exit_reason_breakdown(trades)
+    return metrics
@@ -0,0 +1,283 @@
+"""
+Monte Carlo robustness analysis.
+
+Two complementary studies:
+  - bootstrap_trades(): resamples a run's trade sequence (optionally in
+    blocks) and perturbs each path's fee rate and slippage, fully
+    vectorized over paths x trades.
+  - MonteCarloCosts: re-simulates the strategy with sampled fee_rate /
+    slippage_percent through the engine's OrderSimulator, running the
+    scenarios in parallel workers over one shared candle array.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import Candle
+from BACKTEST.optimization.grid_search import SUMMARY_METRICS, SweepPool
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# 경로 x 거래 행렬 한 번에 다루는 최대 원소 수 (메모리 제한)
+MAX_MATRIX_ELEMENTS = 4_000_000
+
+
+def distribution(values: Iterable[float]) -> Optional[Dict[str, float]]:
+    """Mean, std, min/max and PERCENTILES of values (None values dropped)."""
+    array = np.array([v for v in values if v is not None], dtype=np.float64)
+    if not len(array):
+        return None
+    stats = {
+        "mean": float(array.mean()),
+        "std": float(array.std()),
+        "min": float(array.min()),
+        "max": float(array.max()),
+    }
+    stats.update({f"p{q}": float(v) for q, v in zip(PERCENTILES, np.percentile(array, PERCENTILES))})
+    return stats
+
+
+def trade_cost_arrays(trades: Iterable[Any]) -> Dict[str, np.ndarray]:
+    """
+    Closed-trade P&L and cost bases in one pass.
+
+    Returns:
+        pnl: Net P&L (fees and slippage included)
+        fees: Entry + exit fee (scales linearly with fee_rate)
+        slippage_base: P&L change per 1% slippage on both fills
+            ((entry + exit price) * quantity * leverage / 100, matching
+            PositionManager's leveraged P&L)
+    """
+    rows = [
+        (t.pnl, t.entry_fee + t.exit_fee, (t.entry_price + t.exit_price) * t.quantity * t.leverage / 100)
+        for t in trades
+        if t.exit_timestamp is not None and t.pnl is not None and t.exit_price is not None
+    ]
+    if not rows:
+        return {name: np.empty(0) for name in ("pnl", "fees", "slippage_base")}
+    pnl, fees, slippage_base = (np.array(column, dtype=np.float64) for column in zip(*rows))
+    return {"pnl": pnl, "fees": fees, "slippage_base": slippage_base}
+
+
+def _sample_indices(rng: np.random.Generator, n: int, paths: int, block_size: int) -> np.ndarray:
+    if block_size <= 1:
+        return rng.integers(0, n, size=(paths, n))
+    block_size = min(block_size, n)
+    blocks = -(-n // block_size)
+    starts = rng.integers(0, n - block_size + 1, size=(paths, blocks))
+    return (starts[:, :, None] + np.arange(block_size)).reshape(paths, -1)[:, :n]
+
+
+def bootstrap_trades(
+    trades: Iterable[Any],
+    initial_balance: float,
+    n_paths: int = 1000,
+    fee_rate: float = 0.0005,
+    slippage_percent: float = 0.05,
+    fee_rate_range: Optional[Tuple[float, float]] = None,
+    slippage_range: Optional[Tuple[float, float]] = None,
+    block_size: int = 1,
+    ruin_drawdown_percent: float = 50.0,
+    seed: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Bootstrap equity paths from a run's closed trades.
+
+    Args:
+        trades: Trades of the original run
+        initial_balance: Starting capital
+        n_paths: Number of resampled paths
+        fee_rate / slippage_percent: Settings the trades were simulated with
+        fee_rate_range / slippage_range: Uniform ranges sampled once per
+            path (None = keep the original cost)
+        block_size: Resample runs of consecutive trades (keeps streaks)
+        ruin_drawdown_percent: Drawdown counted as ruin
+        seed: RNG seed
+
+    Returns:
+        Distributions of final return and max drawdown, loss / ruin
+        probabilities
+    """
+    costs = trade_cost_arrays(trades)
+    n = len(costs["pnl"])
+    if not n:
+        raise ValueError("No closed trades to bootstrap")
+
+    rng = np.random.default_rng(seed)
+    fee_rates = rng.uniform(*fee_rate_range, size=n_paths) if fee_rate_range else np.full(n_paths, fee_rate)
+    slippages = rng.uniform(*slippage_range, size=n_paths) if slippage_range else np.full(n_paths, slippage_percent)
+    fee_scale = fee_rates / fee_rate - 1 if fee_rate > 0 else np.zeros(n_paths)
+    slippage_delta = slippages - slippage_percent
+
+    final_returns = np.empty(n_paths)
+    max_drawdowns = np.empty(n_paths)
+    chunk = max(1, MAX_MATRIX_ELEMENTS // n)
+    for lo in range(0, n_paths, chunk):
+        hi = min(lo + chunk, n_paths)
+        idx = _sample_indices(rng, n, hi - lo, block_size)
+        pnl = (
+            costs["pnl"][idx]
+            - fee_scale[lo:hi, None] * costs["fees"][idx]
+            - slippage_delta[lo:hi, None] * costs["slippage_base"][idx]
+        )
+        equity = initial_balance + np.cumsum(pnl, axis=1)
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), initial_balance)
+        final_returns[lo:hi] = (equity[:, -1] / initial_balance - 1) * 100
+        max_drawdowns[lo:hi] = ((equity - peaks) / peaks).min(axis=1) * 100
+
+    return {
+        "paths": n_paths,
+        "trades_per_path": n,
+        "block_size": block_size,
+        "final_return_percent": distribution(final_returns),
+        "max_drawdown_percent": distribution(max_drawdowns),
+        "probability_of_loss": float((final_returns < 0).mean()),
+        "probability_of_ruin": float((max_drawdowns <= -ruin_drawdown_percent).mean()),
+        "fee_rate_range": list(fee_rate_range) if fee_rate_range else None,
+        "slippage_range": list(slippage_range) if slippage_range else None,
+    }
+
+
+class MonteCarloCosts:
+    """Re-simulates one parameter set under sampled fee / slippage settings."""
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_params: Dict[str, Any],
+        fee_rate_range: Tuple[float, float],
+        slippage_range: Tuple[float, float],
+        n_scenarios: int = 100,
+        strategy_name: str = "hyperrsi",
+        initial_balance: float = 10000.0,
+        seed: Optional[int] = None,
+        max_workers: Optional[int] = None,
+        warmup_candles: int = 200,
+        results_path: Optional[str] = None
+    ):
+        """
+        Initialize cost scenarios.
+
+        Args:
+            strategy_params: Parameters every scenario runs with
+            fee_rate_range / slippage_range: Uniform sampling ranges
+                (slippage in percent, as OrderSimulator)
+            n_scenarios: Number of sampled scenarios
+            seed: RNG seed for the scenario settings
+            max_workers: Worker processes (default: CPU count)
+            warmup_candles: Extra candles loaded before start_date
+            results_path: JSONL file receiving one row per scenario
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.start_date = start_date
+        self.end_date = end_date
+        self.strategy_params = strategy_params
+        self.strategy_name = strategy_name
+        self.initial_balance = initial_balance
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.warmup_candles = warmup_candles
+        self.results_path = results_path
+
+        rng = np.random.default_rng(seed)
+        self.scenarios = [
+            {"scenario": i, "fee_rate": float(fee), "slippage_percent": float(slippage)}
+            for i, (fee, slippage) in enumerate(zip(
+                rng.uniform(*fee_rate_range, size=n_scenarios),
+                rng.uniform(*slippage_range, size=n_scenarios)
+            ))
+        ]
+
+    async def load_candles(self, data_provider: DataProvider) -> Tuple[List[Candle], Optional[dict]]:
+        """Load candles (with warm-up history) and symbol info once."""
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        load_start = self.start_date - timeframe_to_timedelta(self.timeframe) * self.warmup_candles
+        candles = await data_provider.get_candles(self.symbol, self.timeframe, load_start, self.end_date)
+        symbol_info = await data_provider.get_symbol_info(self.symbol)
+        return candles, symbol_info
+
+    async def run_async(
+        self,
+        data_provider: DataProvider,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """Load candles through data_provider, then run the scenarios in a thread."""
+        candles, symbol_info = await self.load_candles(data_provider)
+        return await asyncio.to_thread(self.run, candles, symbol_info, progress_callback)
+
+    def run(
+        self,
+        candles: List[Candle],
+        symbol_info: Optional[dict] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every scenario.
+
+        Returns:
+            Per-scenario rows and the distribution of each summary metric
+        """
+        started_at = datetime.utcnow()
+        sweep = {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "strategy_name": self.strategy_name,
+            "initial_balance": self.initial_balance,
+            "fee_rate": self.scenarios[0]["fee_rate"] if self.scenarios else 0.0,
+            "slippage_percent": self.scenarios[0]["slippage_percent"] if self.scenarios else 0.0,
+            "symbol_info": symbol_info,
+        }
+        rows: List[Dict[str, Any]] = []
+        results_file = open(self.results_path, "w", encoding="utf-8") if self.results_path else None
+        try:
+            with SweepPool(candles, sweep, self.max_workers) as pool:
+                tasks = ({"params": self.strategy_params, **scenario} for scenario in self.scenarios)
+                for row in pool.run(tasks):
+                    row = {**self.scenarios[row["scenario"]], **row}
+                    row.pop("key", None)
+                    rows.append(row)
+                    if results_file:
+                        results_file.write(json.dumps(row, default=str) + "\n")
+                        results_file.flush()
+                    if "error" in row:
+                        logger.warning(f"Scenario {row['scenario']} failed: {row['error']}")
+                    if progress_callback:
+                        progress_callback(len(rows), len(self.scenarios))
+        finally:
+            if results_file:
+                results_file.close()
+
+        rows.sort(key=lambda r: r["scenario"])
+        scored = [r["metrics"] for r in rows if "metrics" in r]
+        completed_at = datetime.utcnow()
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "strategy_name": self.strategy_name,
+            "scenarios": rows,
+            "total_scenarios": len(self.scenarios),
+            "failed_scenarios": len(rows) - len(scored),
+            "metrics": {name: distribution(m.get(name) for m in scored) for name in SUMMARY_METRICS},
+            "probability_of_loss": (
+                float(np.mean([m["total_return_percent"] < 0 for m in scored])) if scored else None
+            ),
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "execution_time_seconds": (completed_at - started_at).total_seconds(),
+        }
+
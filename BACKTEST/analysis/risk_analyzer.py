@@ -0,0 +1,123 @@
+"""
+Vectorized equity curve risk metrics.
+
+Works on (timestamps in epoch ns, equity) arrays such as
+BalanceTracker.get_equity_arrays(). Points may be unevenly spaced (sampled
+curves); returns are annualized from the median point spacing.
+"""
+
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+NS_PER_SECOND = 1_000_000_000
+SECONDS_PER_YEAR = 365 * 24 * 3600
+
+
+def periods_per_year(timestamps: np.ndarray) -> Optional[float]:
+    """Annualization factor from the median spacing between points."""
+    if len(timestamps) < 2:
+        return None
+    step = float(np.median(np.diff(timestamps))) / NS_PER_SECOND
+    return SECONDS_PER_YEAR / step if step > 0 else None
+
+
+def drawdown_stats(timestamps: np.ndarray, equity: np.ndarray) -> Dict[str, Any]:
+    """
+    Maximum drawdown (amount, percent of peak) and longest time under water.
+
+    Returns:
+        max_drawdown (<= 0), max_drawdown_percent (<= 0),
+        max_drawdown_duration_seconds, and the peak/trough timestamps (ns)
+    """
+    if not len(equity):
+        return {
+            "max_drawdown": 0.0,
+            "max_drawdown_percent": 0.0,
+            "max_drawdown_duration_seconds": 0.0,
+            "max_drawdown_peak_ns": None,
+            "max_drawdown_trough_ns": None,
+        }
+
+    peaks = np.maximum.accumulate(equity)
+    drawdown = equity - peaks
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown_pct = np.where(peaks > 0, drawdown / peaks * 100, 0.0)
+    trough = int(np.argmin(drawdown))
+
+    # 마지막 고점 시각까지의 경과 시간 = 수중 기간
+    is_peak = equity >= peaks
+    last_peak_ns = np.maximum.accumulate(np.where(is_peak, timestamps, timestamps[0]))
+    underwater_ns = timestamps - last_peak_ns
+    peak = int(np.flatnonzero(is_peak[:trough + 1])[-1])
+
+    return {
+        "max_drawdown": float(drawdown[trough]),
+        "max_drawdown_percent": float(drawdown_pct.min()),
+        "max_drawdown_duration_seconds": float(underwater_ns.max() / NS_PER_SECOND),
+        "max_drawdown_peak_ns": int(timestamps[peak]),
+        "max_drawdown_trough_ns": int(timestamps[trough]),
+    }
+
+
+def return_ratios(
+    returns: np.ndarray,
+    annualization: Optional[float] = None,
+    risk_free_rate: float = 0.0
+) -> Dict[str, float]:
+    """
+    Sharpe and Sortino ratios of periodic returns.
+
+    Args:
+        returns: Periodic simple returns (fractions)
+        annualization: Periods per year (None = not annualized)
+        risk_free_rate: Annual risk-free rate
+    """
+    if len(returns) < 2:
+        return {"sharpe_ratio": 0.0, "sortino_ratio": 0.0}
+
+    per_period_rf = risk_free_rate / annualization if annualization else risk_free_rate
+    excess = returns - per_period_rf
+    std = returns.std(ddof=1)
+    downside = np.sqrt(np.mean(np.minimum(excess, 0.0) ** 2))
+    scale = np.sqrt(annualization) if annualization else 1.0
+    return {
+        "sharpe_ratio": float(excess.mean() / std * scale) if std > 0 else 0.0,
+        "sortino_ratio": float(excess.mean() / downside * scale) if downside > 0 else 0.0,
+    }
+
+
+def rolling_returns(timestamps: np.ndarray, equity: np.ndarray, window_seconds: float) -> np.ndarray:
+    """
+    Return over the trailing window at every point (NaN until a full window).
+
+    Uses the last point at or before t - window as the base.
+    """
+    window_ns = int(window_seconds * NS_PER_SECOND)
+    base = np.searchsorted(timestamps, timestamps - window_ns, side="right") - 1
+    full = (base >= 0) & (timestamps - timestamps[0] >= window_ns)
+    result = np.full(len(equity), np.nan)
+    base_equity = equity[base[full]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result[full] = np.where(base_equity != 0, equity[full] / base_equity - 1, np.nan)
+    return result
+
+
+def exposure(entry_ns: np.ndarray, exit_ns: np.ndarray, start_ns: int, end_ns: int) -> float:
+    """
+    Fraction of [start_ns, end_ns] with at least one open trade.
+
+    Overlapping trades (partial exits, hedges) are merged before measuring.
+    """
+    span = end_ns - start_ns
+    if span <= 0 or not len(entry_ns):
+        return 0.0
+    order = np.argsort(entry_ns, kind="stable")
+    starts = np.clip(entry_ns[order], start_ns, end_ns)
+    ends = np.clip(exit_ns[order], start_ns, end_ns)
+    covered_until = np.maximum.accumulate(ends)
+    # 이전 구간들의 최대 종료 시각 이후에 시작하면 새 그룹
+    new_group = np.concatenate(([True], starts[1:] > covered_until[:-1]))
+    group_starts = np.flatnonzero(new_group)
+    group_ends = np.maximum.reduceat(ends, group_starts)
+    return float((group_ends - starts[group_starts]).sum() / span)
@@ -0,0 +1,214 @@
+"""
+Vectorized trade statistics.
+
+Trades are converted once into column arrays (TradeArrays); every statistic
+below is computed from those arrays without iterating over Trade objects.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.models.trade import ExitReason, TradeSide
+
+# side 코드: 1 = long, -1 = short
+SIDE_CODES = {TradeSide.LONG: 1, TradeSide.SHORT: -1}
+
+# exit_reason 코드: ExitReason 순서, 미청산 = -1
+EXIT_REASONS: Tuple[ExitReason, ...] = tuple(ExitReason)
+EXIT_REASON_CODES = {reason: code for code, reason in enumerate(EXIT_REASONS)}
+
+_NAT = np.iinfo(np.int64).min
+
+
+@dataclass
+class TradeArrays:
+    """Column view of a trade list (timestamps in epoch ns, missing values NaN/-1)."""
+
+    entry_ns: np.ndarray
+    exit_ns: np.ndarray
+    pnl: np.ndarray
+    pnl_percent: np.ndarray
+    fees: np.ndarray
+    side: np.ndarray
+    exit_reason: np.ndarray
+
+    @classmethod
+    def from_trades(cls, trades: Iterable[Any]) -> "TradeArrays":
+        """Build arrays from Trade objects in a single pass."""
+        rows = [
+            (
+                _epoch_ns(t.entry_timestamp),
+                _epoch_ns(t.exit_timestamp) if t.exit_timestamp is not None else _NAT,
+                np.nan if t.pnl is None else t.pnl,
+                np.nan if t.pnl_percent is None else t.pnl_percent,
+                t.entry_fee + t.exit_fee,
+                SIDE_CODES.get(t.side, 0),
+                EXIT_REASON_CODES.get(t.exit_reason, -1),
+            )
+            for t in trades
+        ]
+        if not rows:
+            return cls.empty()
+        entry_ns, exit_ns, pnl, pnl_percent, fees, side, exit_reason = zip(*rows)
+        return cls(
+            entry_ns=np.array(entry_ns, dtype=np.int64),
+            exit_ns=np.array(exit_ns, dtype=np.int64),
+            pnl=np.array(pnl, dtype=np.float64),
+            pnl_percent=np.array(pnl_percent, dtype=np.float64),
+            fees=np.array(fees, dtype=np.float64),
+            side=np.array(side, dtype=np.int8),
+            exit_reason=np.array(exit_reason, dtype=np.int16),
+        )
+
+    @classmethod
+    def empty(cls) -> "TradeArrays":
+        return cls(
+            entry_ns=np.empty(0, dtype=np.int64),
+            exit_ns=np.empty(0, dtype=np.int64),
+            pnl=np.empty(0, dtype=np.float64),
+            pnl_percent=np.empty(0, dtype=np.float64),
+            fees=np.empty(0, dtype=np.float64),
+            side=np.empty(0, dtype=np.int8),
+            exit_reason=np.empty(0, dtype=np.int16),
+        )
+
+    def __len__(self) -> int:
+        return len(self.entry_ns)
+
+    @property
+    def closed(self) -> np.ndarray:
+        return self.exit_ns != _NAT
+
+    def select(self, mask: np.ndarray) -> "TradeArrays":
+        return TradeArrays(**{name: getattr(self, name)[mask] for name in self.__dataclass_fields__})
+
+    def closed_by_exit_time(self) -> "TradeArrays":
+        """Closed trades ordered by exit time (stable for equal exits)."""
+        closed = self.select(self.closed)
+        return closed.select(np.argsort(closed.exit_ns, kind="stable"))
+
+
+def _epoch_ns(value) -> int:
+    # naive datetime은 UTC로 간주
+    return pd.Timestamp(value).value
+
+
+def longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values."""
+    if not mask.any():
+        return 0
+    padded = np.concatenate(([False], mask, [False])).astype(np.int8)
+    edges = np.flatnonzero(np.diff(padded))
+    return int((edges[1::2] - edges[::2]).max())
+
+
+def trailing_run(mask: np.ndarray) -> int:
+    """Length of the run of True values at the end."""
+    falses = np.flatnonzero(~mask)
+    return int(len(mask) - (falses[-1] + 1 if len(falses) else 0))
+
+
+def _group_summary(codes: np.ndarray, pnl: np.ndarray, labels: Dict[int, str]) -> Dict[str, Dict[str, Any]]:
+    """Count / wins / pnl per code with bincount (codes >= 0 only)."""
+    known = codes >= 0
+    codes, pnl = codes[known].astype(np.int64), pnl[known]
+    if not len(codes):
+        return {}
+    size = int(codes.max()) + 1
+    valid = ~np.isnan(pnl)
+    counts = np.bincount(codes, minlength=size)
+    wins = np.bincount(codes, weights=valid & (np.nan_to_num(pnl) > 0), minlength=size)
+    totals = np.bincount(codes, weights=np.where(valid, pnl, 0.0), minlength=size)
+    summary = {}
+    for code in np.flatnonzero(counts).tolist():
+        count = int(counts[code])
+        summary[labels[code]] = {
+            "trades": count,
+            "winning_trades": int(wins[code]),
+            "win_rate": float(wins[code] / count * 100),
+            "total_pnl": float(totals[code]),
+            "avg_pnl": float(totals[code] / count),
+        }
+    return summary
+
+
+def side_breakdown(trades: TradeArrays) -> Dict[str, Dict[str, Any]]:
+    """Per-side statistics of closed trades."""
+    closed = trades.select(trades.closed)
+    # -1(short) → 0, 1(long) → 2 로 옮겨 bincount 사용
+    codes = np.where(closed.side == 0, -1, closed.side.astype(np.int64) + 1)
+    return _group_summary(codes, closed.pnl, {0: "short", 2: "long"})
+
+
+def exit_reason_breakdown(trades: TradeArrays) -> Dict[str, Dict[str, Any]]:
+    """Per-exit-reason statistics of closed trades."""
+    closed = trades.select(trades.closed)
+    return _group_summary(
+        closed.exit_reason, closed.pnl, {code: reason.value for code, reason in enumerate(EXIT_REASONS)}
+    )
+
+
+def trade_statistics(trades: TradeArrays) -> Dict[str, Any]:
+    """
+    Win/loss statistics of closed trades.
+
+    Same definitions as BacktestResult.calculate_metrics: trades without a
+    P&L count as neither win nor loss, profit_factor is 0 without losses.
+    """
+    closed = trades.closed_by_exit_time()
+    pnl = closed.pnl
+    valid = ~np.isnan(pnl)
+    wins = valid & (np.nan_to_num(pnl) > 0)
+    losses = valid & (np.nan_to_num(pnl) < 0)
+    total = len(closed)
+
+    win_pnl, loss_pnl = pnl[wins], pnl[losses]
+    gross_profit = float(win_pnl.sum())
+    gross_loss = float(-loss_pnl.sum())
+    durations = (closed.exit_ns - closed.entry_ns) / 1e9
+    durations = durations[durations != 0]
+
+    return {
+        "total_trades": total,
+        "winning_trades": int(wins.sum()),
+        "losing_trades": int(losses.sum()),
+        "win_rate": float(wins.sum() / total * 100) if total else 0.0,
+        "avg_win": float(win_pnl.mean()) if len(win_pnl) else 0.0,
+        "avg_loss": float(loss_pnl.mean()) if len(loss_pnl) else 0.0,
+        "largest_win": float(win_pnl.max()) if len(win_pnl) else 0.0,
+        "largest_loss": float(loss_pnl.min()) if len(loss_pnl) else 0.0,
+        "gross_profit": gross_profit,
+        "gross_loss": gross_loss,
+        "profit_factor": gross_profit / gross_loss if gross_loss > 0 else 0.0,
+        "net_pnl": float(pnl[valid].sum()),
+        "expectancy": float(pnl[valid].mean()) if valid.any() else 0.0,
+        "avg_trade_duration_minutes": float(durations.mean() / 60) if len(durations) else None,
+        "total_fees_paid": float(closed.fees.sum()),
+        "max_consecutive_wins": longest_run(wins),
+        "max_consecutive_losses": longest_run(losses),
+        "current_streak": trailing_run(wins) or -trailing_run(losses),
+    }
+
+
+def trade_return_ratios(trades: TradeArrays, risk_free_rate: float = 0.0) -> Dict[str, float]:
+    """
+    Per-trade Sharpe and Sortino ratios from pnl_percent (not annualized).
+
+    Sharpe matches BacktestResult.calculate_sharpe_ratio (population std).
+    """
+    returns = trades.pnl_percent[trades.closed]
+    returns = returns[~np.isnan(returns)]
+    if len(returns) < 2:
+        return {"sharpe_ratio": 0.0, "sortino_ratio": 0.0}
+
+    excess = returns.mean() - risk_free_rate
+    std = returns.std()
+    downside = np.sqrt(np.mean(np.minimum(returns, 0.0) ** 2))
+    return {
+        "sharpe_ratio": float(excess / std) if std > 0 else 0.0,
+        "sortino_ratio": float(excess / downside) if downside > 0 else 0.0,
+    }
+
@@ -0,0 +1,318 @@
+"""
+Walk-forward analysis.
+
+Slices the backtest range into rolling (or anchored) in-sample /
+out-of-sample folds. Every parameter combination is run on every in-sample
+window, the best one per fold (rank_by) is then run on the following
+out-of-sample window. All runs share one SweepPool, so the candle array is
+loaded once and folds run in parallel worker processes.
+"""
+
+import asyncio
+import json
+import os
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import Candle
+from BACKTEST.optimization.grid_search import SweepPool, expand_param_grid, rank_results
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 구간 경계 캔들이 in-sample과 out-of-sample에 중복되지 않도록 끝을 1µs 당김
+_BOUNDARY = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class Fold:
+    """One in-sample / out-of-sample window pair (inclusive bounds)."""
+
+    index: int
+    in_sample_start: datetime
+    in_sample_end: datetime
+    out_of_sample_start: datetime
+    out_of_sample_end: datetime
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fold": self.index,
+            "in_sample_start": self.in_sample_start.isoformat(),
+            "in_sample_end": self.in_sample_end.isoformat(),
+            "out_of_sample_start": self.out_of_sample_start.isoformat(),
+            "out_of_sample_end": self.out_of_sample_end.isoformat(),
+        }
+
+
+def walk_forward_folds(
+    start_date: datetime,
+    end_date: datetime,
+    in_sample: timedelta,
+    out_of_sample: timedelta,
+    step: Optional[timedelta] = None,
+    anchored: bool = False
+) -> List[Fold]:
+    """
+    Split [start_date, end_date] into walk-forward folds.
+
+    Args:
+        in_sample: In-sample window length
+        out_of_sample: Out-of-sample window length
+        step: Shift between folds (default: out_of_sample, i.e.
+            non-overlapping out-of-sample windows)
+        anchored: Keep every in-sample window starting at start_date
+            (expanding window)
+
+    Returns:
+        Folds whose out-of-sample window ends on or before end_date
+    """
+    step = step or out_of_sample
+    if in_sample <= timedelta(0) or out_of_sample <= timedelta(0) or step <= timedelta(0):
+        raise ValueError("Walk-forward window lengths must be positive")
+
+    folds = []
+    boundary = start_date + in_sample
+    while boundary + out_of_sample <= end_date:
+        folds.append(Fold(
+            index=len(folds),
+            in_sample_start=start_date if anchored else boundary - in_sample,
+            in_sample_end=boundary - _BOUNDARY,
+            out_of_sample_start=boundary,
+            out_of_sample_end=boundary + out_of_sample - _BOUNDARY,
+        ))
+        boundary += step
+    return folds
+
+
+def _compounded_percent(returns_percent: Sequence[float]) -> float:
+    return float((np.prod([1 + r / 100 for r in returns_percent]) - 1) * 100)
+
+
+class WalkForward:
+    """Parallel walk-forward optimization over one symbol/timeframe."""
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        param_ranges: Dict[str, Any],
+        in_sample: timedelta,
+        out_of_sample: timedelta,
+        step: Optional[timedelta] = None,
+        anchored: bool = False,
+        base_params: Optional[Dict[str, Any]] = None,
+        strategy_name: str = "hyperrsi",
+        rank_by: Sequence[str] = ("sharpe_ratio", "total_return_percent"),
+        min_trades: int = 1,
+        initial_balance: float = 10000.0,
+        fee_rate: float = 0.0005,
+        slippage_percent: float = 0.05,
+        max_workers: Optional[int] = None,
+        warmup_candles: int = 200,
+        results_path: Optional[str] = None,
+        combinations: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Initialize walk-forward analysis.
+
+        Args:
+            param_ranges: Ranges per parameter (see expand_param_grid)
+            in_sample / out_of_sample / step / anchored: Fold layout
+                (see walk_forward_folds)
+            rank_by: Metrics selecting the in-sample winner (see rank_results)
+            min_trades: In-sample runs with fewer trades are not eligible
+            max_workers: Worker processes (default: CPU count)
+            warmup_candles: Extra candles loaded before start_date
+            results_path: JSONL file receiving one row per finished fold
+            combinations: Explicit combinations (overrides param_ranges)
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.start_date = start_date
+        self.end_date = end_date
+        self.strategy_name = strategy_name
+        self.rank_by = list(rank_by)
+        self.min_trades = min_trades
+        self.initial_balance = initial_balance
+        self.fee_rate = fee_rate
+        self.slippage_percent = slippage_percent
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.warmup_candles = warmup_candles
+        self.results_path = results_path
+        self.combinations = combinations if combinations is not None else expand_param_grid(param_ranges, base_params)
+        self.folds = walk_forward_folds(start_date, end_date, in_sample, out_of_sample, step, anchored)
+        if not self.folds:
+            raise ValueError("Backtest range is shorter than one in-sample + out-of-sample window")
+
+    async def load_candles(self, data_provider: DataProvider) -> Tuple[List[Candle], Optional[dict]]:
+        """Load candles (with warm-up history) and symbol info once."""
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        load_start = self.start_date - timeframe_to_timedelta(self.timeframe) * self.warmup_candles
+        candles = await data_provider.get_candles(self.symbol, self.timeframe, load_start, self.end_date)
+        symbol_info = await data_provider.get_symbol_info(self.symbol)
+        return candles, symbol_info
+
+    async def run_async(
+        self,
+        data_provider: DataProvider,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """Load candles through data_provider, then run the folds in a thread."""
+        candles, symbol_info = await self.load_candles(data_provider)
+        return await asyncio.to_thread(self.run, candles, symbol_info, progress_callback)
+
+    def _sweep(self, symbol_info: Optional[dict]) -> Dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "strategy_name": self.strategy_name,
+            "initial_balance": self.initial_balance,
+            "fee_rate": self.fee_rate,
+            "slippage_percent": self.slippage_percent,
+            "symbol_info": symbol_info,
+        }
+
+    def run(
+        self,
+        candles: List[Candle],
+        symbol_info: Optional[dict] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run all folds.
+
+        Args:
+            candles: Timestamp-sorted candles covering warm-up + full range
+            symbol_info: DataProvider.get_symbol_info() result
+            progress_callback: Called with (completed, total) runs
+
+        Returns:
+            Summary with per-fold results and out-of-sample aggregates
+        """
+        started_at = datetime.utcnow()
+        total = len(self.folds) * (len(self.combinations) + 1)
+        completed = 0
+        logger.info(
+            f"Walk-forward {self.symbol} {self.timeframe}: {len(self.folds)} folds x "
+            f"{len(self.combinations)} combinations, {self.max_workers} workers"
+        )
+
+        in_sample_tasks = [
+            {
+                "params": params,
+                "fold": fold.index,
+                "phase": "in_sample",
+                "start_date": fold.in_sample_start.isoformat(),
+                "end_date": fold.in_sample_end.isoformat(),
+            }
+            for fold in self.folds
+            for params in self.combinations
+        ]
+        in_sample_rows: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        out_of_sample_rows: Dict[int, Dict[str, Any]] = {}
+        fold_results: List[Dict[str, Any]] = []
+
+        results_file = open(self.results_path, "w", encoding="utf-8") if self.results_path else None
+        try:
+            with SweepPool(candles, self._sweep(symbol_info), self.max_workers) as pool:
+                for row in pool.run(in_sample_tasks):
+                    in_sample_rows[row["fold"]].append(row)
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+                winners = {}
+                for fold in self.folds:
+                    eligible = [
+                        r for r in in_sample_rows[fold.index]
+                        if "metrics" in r and (r["metrics"].get("total_trades") or 0) >= self.min_trades
+                    ]
+                    ranked = rank_results(eligible, self.rank_by)
+                    if ranked:
+                        winners[fold.index] = ranked[0]
+                    else:
+                        completed += 1
+
+                out_of_sample_tasks = [
+                    {
+                        "params": winners[fold.index]["params"],
+                        "fold": fold.index,
+                        "phase": "out_of_sample",
+                        "start_date": fold.out_of_sample_start.isoformat(),
+                        "end_date": fold.out_of_sample_end.isoformat(),
+                    }
+                    for fold in self.folds if fold.index in winners
+                ]
+                for row in pool.run(out_of_sample_tasks):
+                    out_of_sample_rows[row["fold"]] = row
+                    completed += 1
+                    if progress_callback:
+                        progress_callback(completed, total)
+
+            for fold in self.folds:
+                result = self._fold_result(
+                    fold, in_sample_rows[fold.index], winners.get(fold.index), out_of_sample_rows.get(fold.index)
+                )
+                fold_results.append(result)
+                if results_file:
+                    results_file.write(json.dumps(result, default=str) + "\n")
+        finally:
+            if results_file:
+                results_file.close()
+
+        return self._summarize(fold_results, started_at)
+
+    def _fold_result(self, fold, rows, winner, out_of_sample) -> Dict[str, Any]:
+        result = {
+            **fold.to_dict(),
+            "in_sample_combinations": len(rows),
+            "in_sample_failed": sum(1 for r in rows if "error" in r),
+            "best_params": winner["params"] if winner else None,
+            "in_sample_metrics": winner["metrics"] if winner else None,
+            "out_of_sample_metrics": (out_of_sample or {}).get("metrics"),
+        }
+        if winner is None:
+            result["error"] = "No eligible in-sample combination"
+        elif out_of_sample and "error" in out_of_sample:
+            result["error"] = out_of_sample["error"]
+        return result
+
+    def _summarize(self, fold_results: List[Dict[str, Any]], started_at: datetime) -> Dict[str, Any]:
+        scored = [f for f in fold_results if f["out_of_sample_metrics"]]
+        oos_returns = [f["out_of_sample_metrics"]["total_return_percent"] for f in scored]
+        is_returns = [f["in_sample_metrics"]["total_return_percent"] for f in scored]
+        mean_is = float(np.mean(is_returns)) if is_returns else None
+        completed_at = datetime.utcnow()
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "strategy_name": self.strategy_name,
+            "rank_by": self.rank_by,
+            "folds": fold_results,
+            "total_folds": len(self.folds),
+            "scored_folds": len(scored),
+            "out_of_sample": {
+                "total_trades": sum(f["out_of_sample_metrics"]["total_trades"] for f in scored),
+                "compounded_return_percent": _compounded_percent(oos_returns) if scored else None,
+                "mean_return_percent": float(np.mean(oos_returns)) if scored else None,
+                "profitable_folds": sum(1 for r in oos_returns if r > 0),
+            },
+            # OOS 평균 수익 / IS 평균 수익 (1에 가까울수록 과최적화가 적음)
+            "walk_forward_efficiency": (
+                float(np.mean(oos_returns)) / mean_is if mean_is else None
+            ),
+            "distinct_best_params": len({json.dumps(f["best_params"], sort_keys=True, default=str) for f in scored}),
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "execution_time_seconds": (completed_at - started_at).total_seconds(),
+        }
@@ -1,11 +1,12 @@
 """BACKTEST API Routes Package"""
 
-from BACKTEST.api.routes import backtest, optimization, results, candles
+from BACKTEST.api.routes import backtest, optimization, results, candles, jobs
 
 __all__ = [
     "backtest",
     "optimization",
     "results",
     "candles",
+    "jobs",
 ]
 
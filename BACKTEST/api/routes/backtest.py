@@ -2,9 +2,13 @@
 Backtest API routes.
 """
 
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+import asyncio
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query, Request, Response
+from fastapi.responses import JSONResponse
 from uuid import uuid4, UUID
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from BACKTEST.api.schemas import (
     BacktestRunRequest,
@@ -13,9 +17,20 @@ from BACKTEST.api.schemas import (
     CandleDataRequest,
     RecalculateIndicatorsRequest
 )
-from BACKTEST.engine import BacktestEngine
-from BACKTEST.data import TimescaleProvider
-from BACKTEST.strategies import HyperrsiStrategy
+from BACKTEST.config import backtest_config
+from BACKTEST.data import LocalStoreProvider, TimescaleProvider
+from BACKTEST.data.chart_series import (
+    CHART_TIMEFRAMES,
+    bucket_seconds_for,
+    decode_cursor,
+    load_chart_page,
+    series_etag,
+    validate_columns,
+)
+from BACKTEST.jobs import JobStatus, get_job_manager
+from BACKTEST.models.result import BacktestResult
+from BACKTEST.storage.result_cache import get_result_cache
+from BACKTEST.api.routes.jobs import submit_backtest_job
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,6 +38,32 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
+async def _lookup_cached_result(request_data: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    """결과 캐시 조회 (캐시 오류는 미스로 처리)"""
+    if not backtest_config.RESULT_CACHE_ENABLED:
+        return None, None
+    try:
+        cache = get_result_cache()
+        key = await cache.build_key(request_data)
+        return key, (await cache.get(key) if key else None)
+    except Exception as e:
+        logger.warning(f"결과 캐시 조회 실패: {e}")
+        return None, None
+
+
+async def _store_cached_result(key: str, result: Dict[str, Any]) -> None:
+    """
+    실행 전에 계산한 키로 결과 저장
+
+    실행 중 캔들이 추가/백필되면 이후 조회 키가 달라지므로,
+    이전 데이터로 계산된 결과가 새 워터마크 키로 저장되지 않습니다.
+    """
+    try:
+        await get_result_cache().set(key, result)
+    except Exception as e:
+        logger.warning(f"결과 캐시 저장 실패: {e}")
+
+
 @router.post(
     "/run",
     response_model=BacktestDetailResponse,
@@ -373,69 +414,54 @@ DCA가 활성화되면 포지션당 여러 번 진입하여 평균 단가를 조
 )
 async def run_backtest(
     request: BacktestRunRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    response: Response
 ):
     """
     백테스트 시뮬레이션을 실행합니다.
 
     이 엔드포인트는 제공된 파라미터로 백테스트를 실행하고,
     거래 내역, 자산 곡선, 성과 지표를 포함한 전체 결과를 반환합니다.
+
+    동일한 요청(같은 데이터 구간/파라미터/엔진 버전)은 결과 캐시에서 바로 반환되며,
+    X-Backtest-Cache 헤더에 hit/miss가 표시됩니다.
     """
-    # Create data provider
-    data_provider = TimescaleProvider()
+    request_data = request.model_dump(mode="json")
+    cache_key, cached = await _lookup_cached_result(request_data)
+    if cached is not None:
+        logger.info(f"Backtest cache hit: {request.symbol} {request.timeframe}")
+        response.headers["X-Backtest-Cache"] = "hit"
+        return BacktestDetailResponse(**BacktestResult(**cached).model_dump(by_alias=True))
+
+    response.headers["X-Backtest-Cache"] = "miss"
+    logger.info(
+        f"Starting backtest: {request.symbol} {request.timeframe} "
+        f"from {request.start_date} to {request.end_date}"
+    )
 
+    # 캔들 루프는 CPU 바운드이므로 작업 프로세스 풀에서 실행하고 결과만 기다림
+    job = submit_backtest_job(request, persist=False)
     try:
-        logger.info(
-            f"Starting backtest: {request.symbol} {request.timeframe} "
-            f"from {request.start_date} to {request.end_date}"
-        )
-
-        # Create backtest engine
-        engine = BacktestEngine(
-            data_provider=data_provider,
-            initial_balance=request.initial_balance,
-            fee_rate=request.fee_rate,
-            slippage_percent=request.slippage_percent
-        )
-
-        # Create strategy instance based on strategy_name
-        if request.strategy_name.lower() == "hyperrsi":
-            strategy = HyperrsiStrategy(request.strategy_params)
-            strategy.validate_params()
-        else:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Unknown strategy: {request.strategy_name}. Supported strategies: hyperrsi"
-            )
-
-        # Run backtest
-        result = await engine.run(
-            user_id=UUID("00000000-0000-0000-0000-000000000000"),  # TODO: Get from auth
-            symbol=request.symbol,
-            timeframe=request.timeframe,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            strategy_name=request.strategy_name,
-            strategy_params=request.strategy_params,
-            strategy_executor=strategy
-        )
-
-        return BacktestDetailResponse(**result.model_dump(by_alias=True))
-
-    except ValueError as e:
-        logger.error(f"Validation error: {e}")
-        raise HTTPException(status_code=400, detail=str(e))
+        job = await get_job_manager().wait(job.job_id)
+    except asyncio.CancelledError:
+        # 클라이언트 연결이 끊기면 작업도 취소
+        get_job_manager().cancel(job.job_id)
+        raise
 
-    except Exception as e:
-        logger.error(f"Backtest execution failed: {e}")
+    if job.status != JobStatus.COMPLETED:
+        logger.error(f"Backtest execution failed: {job.error}")
+        if job.error_type == "ValueError":
+            raise HTTPException(status_code=400, detail=job.error)
         raise HTTPException(
             status_code=500,
-            detail=f"Backtest execution failed: {str(e)}"
+            detail=f"Backtest execution failed: {job.error or job.status.value}"
         )
 
-    finally:
-        # Ensure database session is closed
-        await data_provider.close()
+    if cache_key:
+        background_tasks.add_task(_store_cached_result, cache_key, job.result)
+
+    result = BacktestResult(**job.result)
+    return BacktestDetailResponse(**result.model_dump(by_alias=True))
 
 
 @router.get(
@@ -1230,6 +1256,140 @@ async def get_candles_for_chart(request: CandleDataRequest):
         await data_provider.close()
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+async def _series_generation(symbol: str, timeframe: str) -> int:
+    """지표 재계산 시 증가하는 시리즈 세대 번호 (조회 실패 시 0)"""
+    try:
+        return await get_result_cache().generation(symbol, timeframe)
+    except Exception as e:
+        logger.warning(f"Series generation lookup failed: {e}")
+        return 0
+
+
+@router.get(
+    "/candles/series",
+    summary="캔들 시계열 조회 (차트용, 컬럼 배열)",
+    description="""
+# 캔들 시계열 조회 (차트용)
+
+차트에 필요한 컬럼만 컬럼 배열 형태로 조회합니다. 긴 구간은 서버에서 시간 버킷으로
+다운샘플링하고, 커서로 페이지를 나누며, ETag로 변경되지 않은 구간은 304로 응답합니다.
+
+## 쿼리 파라미터
+
+- **symbol** (string, required): 거래 심볼 ("BTC-USDT-SWAP")
+- **timeframe** (string, required): 1m, 3m, 5m, 15m, 30m, 1h, 2h, 4h, 6h, 12h, 1d
+- **from** / **to** (datetime, required): 조회 구간 (UTC, 양 끝 포함)
+- **columns** (string[], optional): 조회할 컬럼 (반복 또는 쉼표 구분, 기본값: OHLCV)
+  - open, high, low, close, volume, rsi, atr, ema, sma, trend_state, CYCLE_Bull, CYCLE_Bear, BB_State
+- **max_points** (int, optional): 구간 전체 최대 포인트 수
+  - 캔들 수가 더 많으면 타임프레임 배수의 버킷으로 집계
+  - open=첫 값, high=최대, low=최소, close=마지막, volume=합계, 지표=마지막 값
+- **cursor** (string, optional): 이전 응답의 next_cursor (다음 페이지)
+
+## 응답
+
+```json
+{
+  "symbol": "BTC-USDT-SWAP",
+  "timeframe": "15m",
+  "bucket_seconds": null,
+  "count": 2,
+  "columns": {
+    "timestamp": [1735689600000, 1735690500000],
+    "close": [42050.0, 42180.5],
+    "trend_state": [0, 2]
+  },
+  "next_cursor": null
+}
+```
+
+- timestamp는 epoch 밀리초, 값이 없으면 null
+- next_cursor가 null이 아니면 같은 파라미터에 cursor를 붙여 다음 페이지를 조회
+- 응답의 ETag를 If-None-Match로 보내면 데이터가 그대로일 때 304 (본문 없음)
+""",
+    responses={
+        304: {"description": "변경 없음 (If-None-Match 일치)"},
+        400: {"description": "❌ 잘못된 요청 (컬럼/타임프레임/구간/커서)"},
+        500: {"description": "🚨 서버 오류"}
+    }
+)
+async def get_candle_series(
+    request: Request,
+    symbol: str = Query(..., description="거래 심볼", example="BTC-USDT-SWAP"),
+    timeframe: str = Query(..., description="타임프레임", example="15m"),
+    start: datetime = Query(..., alias="from", description="시작 시각 (UTC)"),
+    end: datetime = Query(..., alias="to", description="종료 시각 (UTC)"),
+    columns: Optional[List[str]] = Query(None, description="조회할 컬럼 (기본값: OHLCV)"),
+    max_points: Optional[int] = Query(
+        None, ge=2, le=backtest_config.CHART_MAX_POINTS, description="구간 전체 최대 포인트 수"
+    ),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서")
+):
+    """
+    차트용 캔들 컬럼 배열을 조회합니다.
+
+    비동기 DB 세션으로 요청한 컬럼만 읽고, 필요한 경우 time_bucket으로 집계합니다.
+    """
+    try:
+        names = validate_columns(columns)
+        if timeframe not in CHART_TIMEFRAMES:
+            raise ValueError(f"Invalid timeframe. Must be one of: {list(CHART_TIMEFRAMES)}")
+        if end <= start:
+            raise ValueError("to must be after from")
+        if cursor:
+            page_start, bucket_seconds = decode_cursor(cursor)
+        else:
+            page_start, bucket_seconds = start, bucket_seconds_for(timeframe, start, end, max_points)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    data_provider = TimescaleProvider()
+    try:
+        watermark = await data_provider.get_data_watermark(symbol, timeframe, page_start, end)
+        etag = series_etag(
+            {
+                "symbol": symbol.upper(),
+                "timeframe": timeframe,
+                "from": page_start.isoformat(),
+                "to": end.isoformat(),
+                "columns": names,
+                "bucket_seconds": bucket_seconds,
+                "page_size": backtest_config.CHART_PAGE_SIZE,
+            },
+            watermark,
+            await _series_generation(symbol, timeframe) if watermark else 0
+        )
+        if etag and _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag})
+
+        page = await load_chart_page(
+            data_provider, symbol, timeframe, page_start, end, names,
+            bucket_seconds, backtest_config.CHART_PAGE_SIZE
+        )
+
+    except Exception as e:
+        logger.error(f"Failed to fetch candle series: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to fetch candle series: {str(e)}"
+        )
+    finally:
+        await data_provider.close()
+
+    headers = {"Cache-Control": "private, no-cache"}
+    if etag:
+        headers["ETag"] = etag
+    return JSONResponse(content=page, headers=headers)
+
+
 @router.post(
     "/recalculate-indicators",
     summary="지표 재계산 (trend_state, CYCLE, BB_State)",
@@ -1436,6 +1596,16 @@ async def recalculate_indicators(request: RecalculateIndicatorsRequest):
         # Commit changes
         await session.commit()
 
+        # 로컬 캔들 저장소의 이전 지표 값 무효화
+        if backtest_config.USE_LOCAL_CANDLE_STORE:
+            LocalStoreProvider().invalidate(request.symbol, request.timeframe)
+        # 지표 값 변경은 워터마크에 반영되지 않으므로 결과 캐시도 무효화
+        if backtest_config.RESULT_CACHE_ENABLED:
+            try:
+                await get_result_cache().invalidate(request.symbol, request.timeframe)
+            except Exception as e:
+                logger.warning(f"결과 캐시 무효화 실패: {e}")
+
         logger.info(
             f"Successfully updated {update_count} candles with recalculated indicators"
         )
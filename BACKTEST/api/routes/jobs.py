@@ -0,0 +1,108 @@
+"""
+Backtest Job API Routes
+
+백테스트를 프로세스 풀 작업으로 실행하고 진행 상황을 SSE로 스트리밍합니다.
+"""
+
+import json
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from BACKTEST.api.schemas import BacktestRunRequest
+from BACKTEST.jobs import JobLimitExceededError, create_strategy, get_job_manager
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+def submit_backtest_job(request: BacktestRunRequest, persist: bool = True):
+    """
+    요청을 검증하고 작업 큐에 등록합니다.
+
+    Raises:
+        HTTPException: 400 (잘못된 전략/파라미터), 429 (노드 작업 한도 초과)
+    """
+    try:
+        create_strategy(request.strategy_name, request.strategy_params)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        return get_job_manager().submit(request.model_dump(mode="json"), persist=persist)
+    except JobLimitExceededError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+def _get_job_or_404(job_id: str):
+    job = get_job_manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Backtest job not found")
+    return job
+
+
+@router.post("", status_code=202)
+async def create_backtest_job(request: BacktestRunRequest) -> Dict[str, Any]:
+    """
+    백테스트 작업을 등록하고 즉시 job_id를 반환합니다.
+
+    - 실행은 별도 프로세스에서 진행되어 API 이벤트 루프를 막지 않습니다.
+    - 진행 상황: GET /backtest/jobs/{job_id}/events (SSE)
+    - 완료 시 결과는 BacktestRepository로 저장되며 backtest_id가 채워집니다.
+    """
+    job = submit_backtest_job(request)
+    logger.info(f"Backtest job submitted: {job.job_id} {request.symbol} {request.timeframe}")
+    return job.to_dict()
+
+
+@router.get("")
+async def list_backtest_jobs() -> List[Dict[str, Any]]:
+    """이 노드의 대기/실행/최근 완료 작업 목록"""
+    return [job.to_dict() for job in get_job_manager().list_jobs()]
+
+
+@router.get("/{job_id}")
+async def get_backtest_job(job_id: str) -> Dict[str, Any]:
+    """작업 상태 조회 (진행률, 거래 수, 저장된 backtest_id)"""
+    return _get_job_or_404(job_id).to_dict()
+
+
+@router.get("/{job_id}/result")
+async def get_backtest_job_result(job_id: str) -> Dict[str, Any]:
+    """완료된 작업의 전체 결과"""
+    job = _get_job_or_404(job_id)
+    if job.result is None:
+        raise HTTPException(status_code=409, detail=f"Backtest job is {job.status.value}")
+    return job.result
+
+
+@router.get("/{job_id}/events")
+async def stream_backtest_job_events(job_id: str) -> StreamingResponse:
+    """
+    작업 진행 상황 SSE 스트림
+
+    각 이벤트는 작업 상태 JSON이며, 작업이 끝나면(completed/failed/cancelled) 스트림이 종료됩니다.
+    """
+    _get_job_or_404(job_id)
+
+    async def event_stream():
+        async for snapshot in get_job_manager().subscribe(job_id):
+            yield f"event: {snapshot['status']}\ndata: {json.dumps(snapshot)}\n\n"
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.delete("/{job_id}")
+async def cancel_backtest_job(job_id: str) -> Dict[str, Any]:
+    """대기/실행 중인 작업 취소"""
+    job = _get_job_or_404(job_id)
+    if not get_job_manager().cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Backtest job is already {job.status.value}")
+    return job.to_dict()
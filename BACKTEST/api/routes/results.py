@@ -4,11 +4,12 @@ Backtest Results API Routes
 Provides endpoints for saving, retrieving, and managing backtest results.
 """
 
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from BACKTEST.engine.balance_tracker import downsample_equity_curve
 from BACKTEST.models.result import BacktestResult
 from BACKTEST.storage.backtest_repository import BacktestRepository
 from shared.database.session import DatabaseConfig
@@ -66,12 +67,14 @@ async def save_backtest_result(
 @router.get("/{backtest_id}")
 async def get_backtest_result(
     backtest_id: UUID,
+    equity_points: Optional[int] = Query(default=None, ge=2, description="자산 곡선 최대 포인트 수 (LTTB 다운샘플링)"),
     db: AsyncSession = Depends(get_db_session)
 ) -> BacktestResult:
     """
     특정 백테스트 결과를 조회합니다 (전체 상세 정보 포함).
 
     - **backtest_id**: 백테스트 고유 ID
+    - **equity_points**: 차트용 자산 곡선 포인트 수 제한 (기본: 전체)
 
     Returns:
         전체 백테스트 결과 (성과 지표, 통계 및 차트 포함)
@@ -88,6 +91,9 @@ async def get_backtest_result(
                 detail=f"백테스트 결과를 찾을 수 없습니다: {backtest_id}"
             )
 
+        if equity_points is not None and result.equity_curve:
+            result.equity_curve = downsample_equity_curve(result.equity_curve, equity_points)
+
         return result
 
     except HTTPException:
@@ -25,6 +25,9 @@ class BacktestRunRequest(BaseModel):
     initial_balance: Optional[float] = Field(10000.0, description="Initial capital", gt=0)
     fee_rate: Optional[float] = Field(0.0005, description="Trading fee rate", ge=0, le=0.01)
     slippage_percent: Optional[float] = Field(0.05, description="Slippage %", ge=0, le=1.0)
+    equity_curve_points: Optional[int] = Field(
+        None, description="Downsample equity curve to this many points (LTTB)", ge=2
+    )
 
     @validator("end_date")
     def validate_dates(cls, v, values):
@@ -4,6 +4,8 @@ BACKTEST Configuration
 Backtest service configuration settings.
 """
 
+import os
+
 from shared.config import get_settings as get_shared_settings
 
 # Shared settings
@@ -25,12 +27,42 @@ class BacktestConfig:
     # Data settings
     MAX_CANDLES_PER_REQUEST: int = 100000
     DEFAULT_TIMEFRAME: str = "15m"
+    # 백테스트 작업/스윕에서 로컬 캔들 저장소(LocalStoreProvider) 사용 여부
+    USE_LOCAL_CANDLE_STORE: bool = os.getenv("BACKTEST_USE_LOCAL_CANDLE_STORE", "false").lower() == "true"
+    # LocalStoreProvider 캔들 파일 위치 (심볼/타임프레임/월 단위 파티션)
+    LOCAL_CANDLE_STORE_DIR: str = os.getenv(
+        "BACKTEST_CANDLE_STORE_DIR", os.path.expanduser("~/.cache/tradingboost/backtest_candles")
+    )
+
+    # 차트 시계열 API: 페이지당 최대 포인트 수, 요청 가능한 max_points 상한
+    CHART_PAGE_SIZE: int = int(os.getenv("BACKTEST_CHART_PAGE_SIZE", "5000"))
+    CHART_MAX_POINTS: int = int(os.getenv("BACKTEST_CHART_MAX_POINTS", "10000"))
 
     # Strategy settings
     AVAILABLE_STRATEGIES: list[str] = ["hyperrsi"]
 
+    # 결과 저장: "rows" (backtest_balance_snapshots) 또는 "compressed" (backtest_runs.equity_curve_compressed)
+    EQUITY_CURVE_STORAGE: str = os.getenv("BACKTEST_EQUITY_CURVE_STORAGE", "rows")
+
+    # 동일 요청 결과 캐시 (Redis, 요청/코드 버전/데이터 워터마크 해시 기준)
+    RESULT_CACHE_ENABLED: bool = os.getenv("BACKTEST_RESULT_CACHE_ENABLED", "true").lower() == "true"
+    RESULT_CACHE_TTL_SECONDS: int = int(os.getenv("BACKTEST_RESULT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+    # 자산 곡선 샘플링: N개 스냅샷마다 저장, 또는 자산이 비율만큼 변하면 저장 (낙폭 통계는 전체 기준)
+    EQUITY_CURVE_SAMPLE_EVERY: int = int(os.getenv("BACKTEST_EQUITY_CURVE_SAMPLE_EVERY", "1"))
+    EQUITY_CURVE_CHANGE_THRESHOLD: float = float(os.getenv("BACKTEST_EQUITY_CURVE_CHANGE_THRESHOLD", "0"))
+
+    # 이벤트 로그: 링 버퍼 크기, 이벤트 타입별 상세도 (예: "trend_check=record,trailing_stop_updated=count")
+    EVENT_LOG_MAX_EVENTS: int = int(os.getenv("BACKTEST_EVENT_LOG_MAX_EVENTS", "10000"))
+    EVENT_LOG_VERBOSITY: str = os.getenv("BACKTEST_EVENT_LOG_VERBOSITY", "")
+    # 캔들 처리 단계별 소요 시간 측정 (detailed_metrics["phase_timings"])
+    PROFILE_PHASES: bool = os.getenv("BACKTEST_PROFILE_PHASES", "false").lower() == "true"
+
     # Performance settings
-    MAX_CONCURRENT_BACKTESTS: int = 3
+    MAX_CONCURRENT_BACKTESTS: int = 3  # Worker processes per node
+    MAX_PENDING_BACKTESTS: int = 20  # Queued + running jobs per node
+    MAX_FINISHED_BACKTEST_JOBS: int = 100  # Finished jobs kept for status lookups
+    BACKTEST_PROGRESS_INTERVAL: int = 500  # Candles between progress events
 
 
 # Create singleton instance
@@ -5,9 +5,14 @@ Backtest data providers.
 from BACKTEST.data.data_provider import DataProvider
 from BACKTEST.data.timescale_provider import TimescaleProvider
 from BACKTEST.data.okx_provider import OKXProvider
+from BACKTEST.data.candle_array import CandleArrayProvider
+from BACKTEST.data.local_store_provider import LocalStoreProvider, create_backtest_data_provider
 
 __all__ = [
     "DataProvider",
     "TimescaleProvider",
     "OKXProvider",
+    "CandleArrayProvider",
+    "LocalStoreProvider",
+    "create_backtest_data_provider",
 ]
@@ -0,0 +1,113 @@
+"""
+Candle lists as float64 matrices.
+
+Compact array form of a candle series (one row per candle, None as NaN)
+used for memory-mapped sharing between processes and for local columnar
+candle files, plus an in-memory DataProvider over a candle list.
+"""
+
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import Candle, CandleRecord
+
+# 배열에 저장하지 않는 Candle 필드 (시리즈 전체에서 동일)
+_CONSTANT_FIELDS = ("timestamp", "symbol", "timeframe", "data_source")
+
+
+def candle_columns() -> List[Tuple[str, str]]:
+    """(field, kind) for Candle fields stored in the array. kind: float/int/bool"""
+    columns = []
+    for name, field in Candle.model_fields.items():
+        if name in _CONSTANT_FIELDS:
+            continue
+        annotation = str(field.annotation)
+        if "bool" in annotation:
+            kind = "bool"
+        elif "int" in annotation:
+            kind = "int"
+        else:
+            kind = "float"
+        columns.append((name, kind))
+    return columns
+
+
+def candles_to_array(candles: Sequence[Candle]) -> Tuple[np.ndarray, List[Tuple[str, str]]]:
+    """
+    Candle list → float64 matrix (row per candle, None as NaN).
+
+    Column 0 is the timestamp in epoch nanoseconds.
+    """
+    columns = candle_columns()
+    data = np.full((len(candles), len(columns) + 1), np.nan, dtype=np.float64)
+    data[:, 0] = [pd.Timestamp(c.timestamp).value for c in candles]
+    for j, (name, _) in enumerate(columns, start=1):
+        data[:, j] = [np.nan if (v := getattr(c, name)) is None else float(v) for c in candles]
+    return data, columns
+
+
+def array_to_candles(
+    data: np.ndarray,
+    columns: Sequence[Tuple[str, str]],
+    symbol: str,
+    timeframe: str,
+    data_source: str
+) -> List[CandleRecord]:
+    """Inverse of candles_to_array (values were validated when first loaded)."""
+    timestamps = pd.to_datetime(data[:, 0].astype(np.int64), utc=True).to_pydatetime()
+    rows = data[:, 1:].tolist()
+    candles = []
+    for ts, row in zip(timestamps, rows):
+        fields = {"timestamp": ts, "symbol": symbol, "timeframe": timeframe, "data_source": data_source}
+        for (name, kind), value in zip(columns, row):
+            if value != value:
+                fields[name] = None
+            elif kind == "int":
+                fields[name] = int(value)
+            elif kind == "bool":
+                fields[name] = bool(value)
+            else:
+                fields[name] = value
+        candles.append(CandleRecord(**fields))
+    return candles
+
+
+class CandleArrayProvider(DataProvider):
+    """In-memory DataProvider over a pre-loaded, timestamp-sorted candle list."""
+
+    def __init__(self, candles: List[Candle], symbol_info: Optional[dict] = None):
+        self.candles = candles
+        self.symbol_info = symbol_info
+        self._timestamps = np.array([pd.Timestamp(c.timestamp).value for c in candles], dtype=np.int64)
+
+    def _slice(self, start_date: datetime, end_date: datetime) -> List[Candle]:
+        lo = np.searchsorted(self._timestamps, pd.Timestamp(start_date).value, side="left")
+        hi = np.searchsorted(self._timestamps, pd.Timestamp(end_date).value, side="right")
+        return self.candles[lo:hi]
+
+    async def get_candles(self, symbol, timeframe, start_date, end_date, limit=None) -> List[Candle]:
+        candles = self._slice(start_date, end_date)
+        return candles[:limit] if limit else candles
+
+    async def get_candles_df(self, symbol, timeframe, start_date, end_date, limit=None) -> pd.DataFrame:
+        candles = await self.get_candles(symbol, timeframe, start_date, end_date, limit)
+        return pd.DataFrame([c.model_dump() for c in candles])
+
+    async def validate_data_availability(self, symbol, timeframe, start_date, end_date) -> dict:
+        available = bool(self._slice(start_date, end_date))
+        return {
+            "available": available,
+            "coverage": 1.0 if available else 0.0,
+            "missing_periods": [],
+            "data_source": "memory",
+        }
+
+    async def get_latest_timestamp(self, symbol, timeframe) -> Optional[datetime]:
+        return self.candles[-1].timestamp if self.candles else None
+
+    async def get_symbol_info(self, symbol) -> Optional[dict]:
+        return self.symbol_info
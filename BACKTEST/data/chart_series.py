@@ -0,0 +1,216 @@
+"""
+Column-oriented candle series for the chart UI.
+
+A chart request names a time range, the columns it draws and the number
+of points it can show. Ranges with more candles than that are aggregated
+into time buckets (first open, max high, min low, last close, summed
+volume, last indicator value), long ranges are paged with opaque keyset
+cursors, and every page carries an ETag built from the request and the
+data watermark so unchanged ranges are answered with 304.
+"""
+
+import base64
+import hashlib
+import json
+import math
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# API 컬럼명 → (candlesdb 컬럼, 버킷 집계, 값 타입)
+CHART_COLUMNS: Dict[str, Tuple[str, str, str]] = {
+    "open": ("open", "first", "float"),
+    "high": ("high", "max", "float"),
+    "low": ("low", "min", "float"),
+    "close": ("close", "last", "float"),
+    "volume": ("volume", "sum", "float"),
+    "rsi": ("rsi14", "last", "float"),
+    "atr": ("atr", "last", "float"),
+    "ema": ("ema7", "last", "float"),
+    "sma": ("ma20", "last", "float"),
+    "trend_state": ("trend_state", "last", "int"),
+    "CYCLE_Bull": ("cycle_bull", "last", "bool"),
+    "CYCLE_Bear": ("cycle_bear", "last", "bool"),
+    "BB_State": ("bb_state", "last", "int"),
+}
+DEFAULT_CHART_COLUMNS = ("open", "high", "low", "close", "volume")
+CHART_TIMEFRAMES = ("1m", "3m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "12h", "1d")
+
+
+def validate_columns(columns: Optional[Sequence[str]]) -> List[str]:
+    """
+    Requested chart columns in request order (comma-separated items are
+    split), defaulting to OHLCV.
+
+    Raises:
+        ValueError: Unknown column
+    """
+    names = [name.strip() for item in (columns or []) for name in item.split(",") if name.strip()]
+    unknown = [name for name in names if name not in CHART_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown columns: {unknown}. Available: {list(CHART_COLUMNS)}")
+    return list(dict.fromkeys(names)) or list(DEFAULT_CHART_COLUMNS)
+
+
+def bucket_seconds_for(timeframe: str, start_date: datetime, end_date: datetime,
+                       max_points: Optional[int]) -> Optional[int]:
+    """
+    Bucket width (a multiple of the timeframe) that fits the range into
+    max_points, or None when the raw candles already fit.
+    """
+    from shared.utils.time_helpers import timeframe_to_seconds
+
+    if not max_points:
+        return None
+    step = timeframe_to_seconds(timeframe)
+    candles = int((end_date - start_date).total_seconds() // step) + 1
+    if candles <= max_points:
+        return None
+    return math.ceil(candles / max_points) * step
+
+
+def encode_cursor(next_start_ms: int, bucket_seconds: Optional[int]) -> str:
+    """Opaque cursor for the page starting at next_start_ms."""
+    payload = json.dumps({"s": int(next_start_ms), "b": bucket_seconds}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Optional[int]]:
+    """
+    Page start and bucket width of a cursor.
+
+    Raises:
+        ValueError: Malformed cursor
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        start = datetime.fromtimestamp(int(payload["s"]) / 1000, tz=timezone.utc)
+        bucket = payload.get("b")
+        return start, int(bucket) if bucket else None
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+
+def aggregate_buckets(arrays: Dict[str, np.ndarray], columns: Sequence[str],
+                      bucket_seconds: int) -> Dict[str, np.ndarray]:
+    """
+    Aggregate raw column arrays into epoch-aligned time buckets (the
+    in-memory equivalent of the time_bucket query).
+
+    Args:
+        arrays: "timestamp" (epoch ms, ascending) and float column arrays
+        columns: Columns to aggregate (see CHART_COLUMNS)
+        bucket_seconds: Bucket width
+
+    Returns:
+        Bucket start timestamps (epoch ms) and aggregated columns
+    """
+    bucket_ms = bucket_seconds * 1000
+    buckets = arrays["timestamp"] // bucket_ms * bucket_ms
+    if not len(buckets):
+        return {name: arrays[name][:0] for name in ("timestamp", *columns)}
+    starts, first = np.unique(buckets, return_index=True)
+    last = np.append(first[1:], len(buckets)) - 1
+
+    result = {"timestamp": starts}
+    for name in columns:
+        values = arrays[name]
+        how = CHART_COLUMNS[name][1]
+        if how == "first":
+            result[name] = values[first]
+        elif how == "last":
+            result[name] = values[last]
+        elif how == "max":
+            result[name] = np.fmax.reduceat(values, first)
+        elif how == "min":
+            result[name] = np.fmin.reduceat(values, first)
+        else:
+            result[name] = np.add.reduceat(np.nan_to_num(values), first)
+    return result
+
+
+def columns_to_json(arrays: Dict[str, np.ndarray], columns: Sequence[str]) -> Dict[str, list]:
+    """Column arrays as JSON lists (NaN → null, typed per CHART_COLUMNS)."""
+    result = {"timestamp": arrays["timestamp"].astype(np.int64).tolist()}
+    for name in columns:
+        values = arrays[name]
+        missing = np.isnan(values)
+        kind = CHART_COLUMNS[name][2]
+        if kind == "int":
+            listed = np.where(missing, 0, values).astype(np.int64).tolist()
+        elif kind == "bool":
+            listed = (values != 0).tolist()
+        else:
+            listed = values.tolist()
+        if missing.any():
+            listed = [None if flag else value for value, flag in zip(listed, missing.tolist())]
+        result[name] = listed
+    return result
+
+
+def series_etag(request: Dict[str, Any], watermark: Optional[dict], generation: int = 0) -> Optional[str]:
+    """
+    Strong ETag of a chart page, or None when the data watermark is
+    unknown (the page is then never answered with 304).
+    """
+    if not watermark:
+        return None
+    payload = json.dumps(
+        {"request": request, "watermark": watermark, "generation": generation},
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return '"' + hashlib.sha256(payload.encode()).hexdigest()[:32] + '"'
+
+
+async def load_chart_page(
+    data_provider,
+    symbol: str,
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    columns: Sequence[str],
+    bucket_seconds: Optional[int],
+    page_size: int
+) -> Dict[str, Any]:
+    """
+    One page of a chart series.
+
+    Args:
+        data_provider: Provider answering get_candle_columns()
+        symbol: Trading symbol
+        timeframe: Candle timeframe
+        start_date: Page start (inclusive)
+        end_date: Range end (inclusive)
+        columns: Validated column names
+        bucket_seconds: Bucket width or None for raw candles
+        page_size: Maximum points per page
+
+    Returns:
+        {"timestamp": [...], <column>: [...]}, point count and next_cursor
+        (None on the last page)
+    """
+    arrays = await data_provider.get_candle_columns(
+        symbol, timeframe, start_date, end_date, columns, limit=page_size + 1, bucket_seconds=bucket_seconds
+    )
+    count = len(arrays["timestamp"])
+    next_cursor = None
+    if count > page_size:
+        arrays = {name: values[:page_size] for name, values in arrays.items()}
+        # 다음 페이지는 이 페이지의 마지막 포인트(버킷) 다음부터
+        step_ms = bucket_seconds * 1000 if bucket_seconds else 1
+        next_cursor = encode_cursor(int(arrays["timestamp"][-1]) + step_ms, bucket_seconds)
+        count = page_size
+
+    return {
+        "symbol": symbol,
+        "timeframe": timeframe,
+        "bucket_seconds": bucket_seconds,
+        "count": count,
+        "columns": columns_to_json(arrays, columns),
+        "next_cursor": next_cursor,
+    }
@@ -6,7 +6,8 @@ Defines the contract that all data sources must implement.
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 
 from BACKTEST.models.candle import Candle
@@ -139,3 +140,99 @@ class DataProvider(ABC):
             }
         """
         pass
+
+    async def get_data_watermark(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[dict]:
+        """
+        Summary of the stored candles in a window that changes whenever
+        candles are added or backfilled there (used as a cache key part).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            start_date: Start datetime (UTC)
+            end_date: End datetime (UTC)
+
+        Returns:
+            {"count": int, "first": iso, "last": iso} or None if the
+            provider cannot tell (results are then not cached)
+        """
+        return None
+
+    async def get_bucket_closes(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        bucket_minutes: Sequence[int]
+    ) -> Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Closing price of every higher-timeframe bucket built from the stored
+        base-timeframe candles in a window (time_bucket + last(close)).
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Base timeframe
+            start_date: Start datetime (UTC)
+            end_date: End datetime (UTC)
+            bucket_minutes: Bucket sizes in minutes
+
+        Returns:
+            {minutes: (bucket start epoch seconds, bucket close)} or None
+            if the provider cannot aggregate (callers resample in memory)
+        """
+        return None
+
+    async def get_candle_columns(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        columns: Sequence[str],
+        limit: Optional[int] = None,
+        bucket_seconds: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Column arrays of the stored candles in a window, optionally
+        aggregated into time buckets (chart series, see chart_series).
+
+        The default builds the arrays from get_candles(); database
+        providers override it with a column/time_bucket query.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            start_date: Start datetime (UTC, inclusive)
+            end_date: End datetime (UTC, inclusive)
+            columns: Column names of chart_series.CHART_COLUMNS
+            limit: Maximum number of points
+            bucket_seconds: Bucket width (None for raw candles)
+
+        Returns:
+            {"timestamp": epoch ms int64, <column>: float64 (NaN = null)}
+        """
+        from BACKTEST.data.chart_series import aggregate_buckets
+
+        candles = await self.get_candles(symbol, timeframe, start_date, end_date)
+        arrays = {
+            "timestamp": np.array(
+                [pd.Timestamp(c.timestamp).value // 1_000_000 for c in candles], dtype=np.int64
+            )
+        }
+        for name in columns:
+            values = (getattr(c, name, None) for c in candles)
+            arrays[name] = np.array(
+                [np.nan if value is None else float(value) for value in values], dtype=np.float64
+            )
+        if bucket_seconds:
+            arrays = aggregate_buckets(arrays, columns, bucket_seconds)
+        if limit:
+            arrays = {name: values[:limit] for name, values in arrays.items()}
+        return arrays
@@ -0,0 +1,304 @@
+"""
+Local columnar candle store.
+
+DataProvider that materializes candles (with indicators) from a source
+provider into local files partitioned by (symbol, timeframe, month) and
+memory-maps them on every later read. Only ranges a partition has not
+covered yet (normally the live tail) are fetched from the source again.
+
+Layout:
+    {root}/{SYMBOL}/{timeframe}/{YYYY-MM}.npy   float64 matrix (see candle_array)
+    {root}/{SYMBOL}/{timeframe}/{YYYY-MM}.json  columns, covered range, data_source
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.data.candle_array import array_to_candles, candle_columns, candles_to_array
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import CandleRecord
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+STORE_VERSION = 1
+
+_PANDAS_DTYPES = {"int": "Int64", "bool": "boolean"}
+
+
+def _ns(dt: datetime) -> int:
+    ts = pd.Timestamp(dt)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.value
+
+
+def _dt(ns: int) -> datetime:
+    return pd.Timestamp(ns, tz="UTC").to_pydatetime()
+
+
+def _month_partitions(start_ns: int, end_ns: int) -> List[Tuple[str, int, int]]:
+    """(key, first_ns, last_ns) of every UTC month touching [start_ns, end_ns]."""
+    month = pd.Timestamp(start_ns, tz="UTC").to_period("M")
+    last = pd.Timestamp(end_ns, tz="UTC").to_period("M")
+    partitions = []
+    while month <= last:
+        first_ns = month.start_time.tz_localize("UTC").value
+        next_ns = (month + 1).start_time.tz_localize("UTC").value
+        partitions.append((str(month), first_ns, next_ns - 1))
+        month += 1
+    return partitions
+
+
+class LocalStoreProvider(DataProvider):
+    """
+    Memory-mapped local candle store in front of another DataProvider.
+
+    Repeated backtests and sweeps over the same range read the local files
+    only; get_candles_df() builds the DataFrame straight from the columns
+    without creating per-row objects.
+    """
+
+    def __init__(self, source: Optional[DataProvider] = None, root_dir: Optional[str] = None):
+        """
+        Initialize store.
+
+        Args:
+            source: Provider used to fill missing ranges (default: TimescaleProvider)
+            root_dir: Store directory (default: LOCAL_CANDLE_STORE_DIR)
+        """
+        from BACKTEST.config import backtest_config
+
+        self._source = source
+        self._own_source = source is None
+        self.root_dir = root_dir or backtest_config.LOCAL_CANDLE_STORE_DIR
+        self.columns = candle_columns()
+
+    @property
+    def source(self) -> DataProvider:
+        if self._source is None:
+            from BACKTEST.data.timescale_provider import TimescaleProvider
+            self._source = TimescaleProvider()
+        return self._source
+
+    async def close(self) -> None:
+        if self._own_source and self._source is not None and hasattr(self._source, "close"):
+            await self._source.close()
+
+    # ---------- files ----------
+
+    def _series_dir(self, symbol: str, timeframe: str) -> str:
+        safe_symbol = symbol.upper().replace("/", "-").replace(":", "-")
+        return os.path.join(self.root_dir, safe_symbol, timeframe)
+
+    def _load_meta(self, path: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(path + ".json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # 모델 필드가 바뀐 파티션은 다시 채움
+        if meta.get("version") != STORE_VERSION or [tuple(c) for c in meta["columns"]] != self.columns:
+            return None
+        return meta
+
+    def _write_partition(self, path: str, data: np.ndarray, meta: Dict[str, Any]) -> None:
+        """Write data + meta atomically (open memory maps keep the old file)."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp.npy", "wb") as f:
+            np.save(f, data)
+        os.replace(path + ".tmp.npy", path + ".npy")
+        with open(path + ".tmp.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+        os.replace(path + ".tmp.json", path + ".json")
+
+    def invalidate(self, symbol: str, timeframe: str) -> None:
+        """Drop every stored partition of a series (next read refetches)."""
+        shutil.rmtree(self._series_dir(symbol, timeframe), ignore_errors=True)
+
+    # ---------- sync ----------
+
+    async def _fetch(self, symbol: str, timeframe: str, start_ns: int, end_ns: int) -> List[CandleRecord]:
+        candles = await self.source.get_candles(symbol, timeframe, _dt(start_ns), _dt(end_ns))
+        return [c for c in candles if start_ns <= _ns(c.timestamp) <= end_ns]
+
+    async def sync(self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime) -> None:
+        """
+        Make the store cover [start_date, end_date] (up to the last closed candle).
+
+        Partitions keep one contiguous covered range, so at most the missing
+        head and tail of each partition are fetched from the source.
+        """
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        closed_ns = _ns(datetime.now(timezone.utc) - timeframe_to_timedelta(timeframe))
+        start_ns, end_ns = _ns(start_date), min(_ns(end_date), closed_ns)
+        if start_ns > end_ns:
+            return
+
+        series_dir = self._series_dir(symbol, timeframe)
+        for key, first_ns, last_ns in _month_partitions(start_ns, end_ns):
+            lo, hi = max(start_ns, first_ns), min(end_ns, last_ns)
+            path = os.path.join(series_dir, key)
+            meta = self._load_meta(path)
+            if meta is None:
+                missing = [(lo, hi)]
+                covered = (lo, hi)
+            else:
+                c0, c1 = meta["covered"]
+                if c0 <= lo and hi <= c1:
+                    continue
+                # datetime 해상도(µs) 단위로 경계를 띄워 이미 받은 캔들 제외
+                missing = [r for r in ((lo, c0 - 1000), (c1 + 1000, hi)) if r[0] <= r[1]]
+                covered = (min(lo, c0), max(hi, c1))
+
+            fetched: List[CandleRecord] = []
+            for range_start, range_end in missing:
+                fetched += await self._fetch(symbol, timeframe, range_start, range_end)
+
+            new_data, _ = candles_to_array(fetched)
+            if meta is not None:
+                new_data = np.concatenate([np.load(path + ".npy"), new_data])
+            # 타임스탬프 중복 시 새로 받은 값 우선
+            order = np.argsort(new_data[:, 0], kind="stable")
+            sorted_ts = new_data[order, 0]
+            keep = np.append(sorted_ts[1:] != sorted_ts[:-1], True) if len(sorted_ts) else []
+            data = new_data[order][keep]
+
+            self._write_partition(path, data, {
+                "version": STORE_VERSION,
+                "columns": self.columns,
+                "covered": list(covered),
+                "data_source": fetched[0].data_source if fetched else (meta or {}).get("data_source", "unknown"),
+            })
+            logger.info(
+                f"Local candle store: {symbol} {timeframe} {key} +{len(fetched)} candles "
+                f"({len(data)} stored)"
+            )
+
+    def _read(self, symbol: str, timeframe: str, start_date: datetime, end_date: datetime) -> Tuple[np.ndarray, str]:
+        """Stored rows in [start_date, end_date] and their data_source."""
+        start_ns, end_ns = _ns(start_date), _ns(end_date)
+        series_dir = self._series_dir(symbol, timeframe)
+        parts = []
+        data_source = "unknown"
+        for key, _, _ in _month_partitions(start_ns, end_ns):
+            path = os.path.join(series_dir, key)
+            meta = self._load_meta(path)
+            if meta is None:
+                continue
+            data_source = meta["data_source"]
+            data = np.load(path + ".npy", mmap_mode="r")
+            lo = np.searchsorted(data[:, 0], start_ns, side="left")
+            hi = np.searchsorted(data[:, 0], end_ns, side="right")
+            parts.append(data[lo:hi])
+        if not parts:
+            return np.empty((0, len(self.columns) + 1)), data_source
+        return np.concatenate(parts), data_source
+
+    async def _load(self, symbol, timeframe, start_date, end_date, limit=None) -> Tuple[np.ndarray, str]:
+        await self.sync(symbol, timeframe, start_date, end_date)
+        data, data_source = self._read(symbol, timeframe, start_date, end_date)
+        return (data[:limit] if limit else data), data_source
+
+    # ---------- DataProvider ----------
+
+    async def get_candles(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> List[CandleRecord]:
+        data, data_source = await self._load(symbol, timeframe, start_date, end_date, limit)
+        return array_to_candles(data, self.columns, symbol, timeframe, data_source)
+
+    async def get_candles_df(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """Candle DataFrame indexed by timestamp (same columns as TimescaleProvider)."""
+        data, data_source = await self._load(symbol, timeframe, start_date, end_date, limit)
+        columns = {}
+        for j, (name, kind) in enumerate(self.columns, start=1):
+            values = np.asarray(data[:, j])
+            # int/bool 컬럼은 None(NaN)을 유지하는 nullable dtype으로
+            columns[name] = pd.array(values, dtype=_PANDAS_DTYPES[kind]) if kind in _PANDAS_DTYPES else values
+        index = pd.DatetimeIndex(pd.to_datetime(data[:, 0].astype(np.int64), utc=True), name="timestamp")
+        df = pd.DataFrame(columns, index=index)
+        df["symbol"] = symbol
+        df["timeframe"] = timeframe
+        df["data_source"] = data_source
+        return df
+
+    async def validate_data_availability(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> dict:
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        try:
+            data, _ = await self._load(symbol, timeframe, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Error validating data availability: {e}")
+            return {
+                "available": False,
+                "coverage": 0.0,
+                "missing_periods": [(start_date, end_date)],
+                "data_source": "local_store",
+                "error": str(e)
+            }
+
+        expected_count = int((end_date - start_date) / timeframe_to_timedelta(timeframe))
+        coverage = len(data) / expected_count if expected_count > 0 else 0.0
+        return {
+            "available": len(data) > 0,
+            "coverage": coverage,
+            "missing_periods": [] if coverage >= 1.0 else [(start_date, end_date)],
+            "data_source": "local_store",
+            "actual_count": len(data),
+            "expected_count": expected_count
+        }
+
+    async def get_latest_timestamp(self, symbol: str, timeframe: str) -> Optional[datetime]:
+        return await self.source.get_latest_timestamp(symbol, timeframe)
+
+    async def get_symbol_info(self, symbol: str) -> Optional[dict]:
+        return await self.source.get_symbol_info(symbol)
+
+    async def get_data_watermark(self, symbol, timeframe, start_date, end_date) -> Optional[dict]:
+        return await self.source.get_data_watermark(symbol, timeframe, start_date, end_date)
+
+    async def get_bucket_closes(self, symbol, timeframe, start_date, end_date, bucket_minutes):
+        """Bucket closes from the stored timestamp/close columns (no Candle objects)."""
+        from shared.indicators import bucket_closes_np
+
+        data, _ = await self._load(symbol, timeframe, start_date, end_date)
+        close_column = 1 + [name for name, _ in self.columns].index("close")
+        timestamps = data[:, 0].astype(np.int64) // 1_000_000_000
+        close = np.ascontiguousarray(data[:, close_column])
+        return {minutes: bucket_closes_np(close, timestamps, minutes) for minutes in bucket_minutes}
+
+
+def create_backtest_data_provider() -> DataProvider:
+    """Provider for backtest runs: local store over TimescaleDB when enabled."""
+    from BACKTEST.config import backtest_config
+    from BACKTEST.data.timescale_provider import TimescaleProvider
+
+    if backtest_config.USE_LOCAL_CANDLE_STORE:
+        return LocalStoreProvider()
+    return TimescaleProvider()
@@ -0,0 +1,100 @@
+"""
+Multi-timeframe candle prefetch for backtest runs.
+
+One candle query loads the warm-up lookback and the simulated window, and
+one bucket-aggregate query loads every higher-timeframe close the trend
+state needs (the MTF inputs of compute_indicator_arrays). The result is
+handed to the indicator matrix as aligned arrays and serves the
+strategy's lookback requests from memory, so the simulation neither
+resamples nor goes back to the database.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import Candle
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PrefetchedCandles:
+    """Warm-up history, run candles and their aligned MTF closes."""
+
+    warmup: List[Candle]
+    candles: List[Candle]
+    # compute_indicator_arrays() 인자명 → warmup + candles 길이의 종가 배열
+    mtf_closes: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    @property
+    def history(self) -> List[Candle]:
+        """Warm-up followed by run candles."""
+        return self.warmup + self.candles
+
+
+async def prefetch_candles(
+    data_provider: DataProvider,
+    symbol: str,
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    warmup_bars: int
+) -> PrefetchedCandles:
+    """
+    Load a run's candles with warm-up history and higher-timeframe closes.
+
+    Args:
+        data_provider: Data source provider
+        symbol: Trading symbol
+        timeframe: Base timeframe
+        start_date: First simulated candle time
+        end_date: Last simulated candle time
+        warmup_bars: Candles loaded before start_date
+
+    Returns:
+        PrefetchedCandles (candles empty when the window has no data)
+    """
+    from shared.indicators import align_bucket_closes_np, bucket_closes_np, mtf_close_minutes
+    from shared.utils.time_helpers import timeframe_to_seconds, timeframe_to_timedelta
+
+    load_start = start_date - timeframe_to_timedelta(timeframe) * max(warmup_bars, 0)
+    history = await data_provider.get_candles(symbol, timeframe, load_start, end_date)
+    timestamps_ns = np.array([pd.Timestamp(c.timestamp).value for c in history], dtype=np.int64)
+    split = int(np.searchsorted(timestamps_ns, pd.Timestamp(start_date).value, side="left"))
+    first = max(split - warmup_bars, 0)
+    warmup, candles = history[first:split], history[split:]
+    history, timestamps_ns = history[first:], timestamps_ns[first:]
+    if not candles:
+        return PrefetchedCandles(warmup=warmup, candles=[])
+
+    timestamps = timestamps_ns // 1_000_000_000
+    close = np.array([c.close for c in history], dtype=np.float64)
+    minutes = mtf_close_minutes(timeframe_to_seconds(timeframe) // 60)
+
+    buckets = None
+    try:
+        buckets = await data_provider.get_bucket_closes(
+            symbol, timeframe, history[0].timestamp, history[-1].timestamp, sorted(set(minutes.values()))
+        )
+    except Exception as e:
+        logger.warning(f"Bucket close query failed, resampling in memory: {e}")
+
+    mtf_closes = {}
+    for name, target_minutes in minutes.items():
+        if buckets and target_minutes in buckets:
+            starts, bucket_close = buckets[target_minutes]
+        else:
+            starts, bucket_close = bucket_closes_np(close, timestamps, target_minutes)
+        mtf_closes[name] = align_bucket_closes_np(close, timestamps, target_minutes, starts, bucket_close)
+
+    logger.info(
+        f"Prefetched {symbol} {timeframe}: {len(warmup)} warm-up + {len(candles)} candles, "
+        f"MTF {sorted(set(minutes.values()))}m ({'aggregated' if buckets else 'in memory'})"
+    )
+    return PrefetchedCandles(warmup=warmup, candles=candles, mtf_closes=mtf_closes)
@@ -5,14 +5,15 @@ Provides efficient access to historical candle data stored in TimescaleDB.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 import aiohttp
 
 from BACKTEST.data.data_provider import DataProvider
-from BACKTEST.models.candle import Candle
+from BACKTEST.models.candle import Candle, CandleRecord, validate_candle_batch, to_candle_records
 from shared.database.session import DatabaseConfig
 from shared.config import get_settings
 from shared.logging import get_logger
@@ -174,7 +175,8 @@ class TimescaleProvider(DataProvider):
             limit: Optional maximum number of candles
 
         Returns:
-            List of Candle objects sorted by timestamp
+            List of CandleRecord objects sorted by timestamp (validated as a
+            batch; convert with to_model() where a pydantic Candle is needed)
         """
         session = await self._get_session()
         table_name = self._get_table_name(symbol, timeframe)
@@ -219,7 +221,7 @@ class TimescaleProvider(DataProvider):
             rows = result.fetchall()
 
             candles = [
-                Candle(
+                CandleRecord(
                     timestamp=row.timestamp,
                     symbol=symbol,  # Use original symbol from parameter
                     timeframe=row.timeframe,  # Use timeframe from DB
@@ -238,17 +240,11 @@ class TimescaleProvider(DataProvider):
                     CYCLE_Bull=bool(row.cycle_bull) if row.cycle_bull is not None else None,
                     CYCLE_Bear=bool(row.cycle_bear) if row.cycle_bear is not None else None,
                     BB_State=int(row.bb_state) if row.bb_state is not None else None,
-                    bollinger_upper=None,
-                    bollinger_middle=None,
-                    bollinger_lower=None,
-                    macd=None,
-                    macd_signal=None,
-                    macd_histogram=None,
-                    data_source="candlesdb",
-                    is_complete=True
+                    data_source="candlesdb"
                 )
                 for row in rows
             ]
+            validate_candle_batch(candles)
 
             logger.info(
                 f"Fetched {len(candles)} candles from TimescaleDB "
@@ -322,9 +318,9 @@ class TimescaleProvider(DataProvider):
                 f"Fetching all data from OKX API..."
             )
             okx_provider = _get_okx_provider()
-            all_candles = await okx_provider.get_candles(
+            all_candles = to_candle_records(await okx_provider.get_candles(
                 symbol, timeframe, start_date, end_date
-            )
+            ))
             # Save to DB
             if all_candles:
                 await self._save_candles_to_db(symbol, timeframe, all_candles)
@@ -352,7 +348,7 @@ class TimescaleProvider(DataProvider):
                 symbol, timeframe, gap_start, gap_end
             )
             if gap_candles:
-                filled_candles.extend(gap_candles)
+                filled_candles.extend(to_candle_records(gap_candles))
                 logger.info(f"Filled {len(gap_candles)} candles for gap")
 
         # Save filled candles to DB
@@ -643,6 +639,165 @@ class TimescaleProvider(DataProvider):
                 "error": str(e)
             }
 
+    async def get_data_watermark(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> Optional[dict]:
+        """
+        Candle count and first/last timestamp in the window.
+
+        New candles and backfilled gaps both change the result; the query
+        only touches the (time, timeframe) index.
+        """
+        session = await self._get_session()
+        table_name = self._get_table_name(symbol, timeframe)
+
+        try:
+            query = text(f"""
+                SELECT COUNT(*) as count, MIN(time) as first, MAX(time) as last
+                FROM {table_name}
+                WHERE timeframe = :timeframe
+                    AND time >= :start_date
+                    AND time <= :end_date
+            """)
+            row = (await session.execute(
+                query,
+                {"timeframe": timeframe, "start_date": start_date, "end_date": end_date}
+            )).one()
+            return {
+                "count": row.count,
+                "first": row.first.isoformat() if row.first else None,
+                "last": row.last.isoformat() if row.last else None,
+            }
+
+        except Exception as e:
+            logger.error(f"Error getting data watermark: {e}")
+            return None
+
+    async def get_bucket_closes(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        bucket_minutes: Sequence[int]
+    ) -> Optional[Dict[int, Tuple[np.ndarray, np.ndarray]]]:
+        """
+        Higher-timeframe closes of the window for every bucket size in one
+        time_bucket aggregate query.
+        """
+        session = await self._get_session()
+        table_name = self._get_table_name(symbol, timeframe)
+
+        try:
+            query = text(f"""
+                SELECT
+                    b.minutes,
+                    EXTRACT(EPOCH FROM time_bucket(make_interval(mins => b.minutes), c.time))::bigint as bucket,
+                    last(c.close, c.time) as close
+                FROM {table_name} c
+                CROSS JOIN unnest(CAST(:minutes AS int[])) AS b(minutes)
+                WHERE c.timeframe = :timeframe
+                    AND c.time >= :start_date
+                    AND c.time <= :end_date
+                GROUP BY b.minutes, bucket
+                ORDER BY b.minutes, bucket
+            """)
+            rows = (await session.execute(
+                query,
+                {
+                    "minutes": list(bucket_minutes),
+                    "timeframe": timeframe,
+                    "start_date": start_date,
+                    "end_date": end_date
+                }
+            )).fetchall()
+
+            buckets = {}
+            for minutes in bucket_minutes:
+                selected = [row for row in rows if row.minutes == minutes]
+                buckets[minutes] = (
+                    np.array([row.bucket for row in selected], dtype=np.int64),
+                    np.array([float(row.close) for row in selected], dtype=np.float64)
+                )
+            return buckets
+
+        except Exception as e:
+            logger.error(f"Error aggregating bucket closes: {e}")
+            return None
+
+    async def get_candle_columns(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        columns: Sequence[str],
+        limit: Optional[int] = None,
+        bucket_seconds: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Chart columns of the window straight from candlesdb: only the
+        requested columns, aggregated with time_bucket when bucket_seconds
+        is given. Unlike get_candles() it never fills indicators or gaps.
+        """
+        from BACKTEST.data.chart_series import CHART_COLUMNS
+
+        session = await self._get_session()
+        table_name = self._get_table_name(symbol, timeframe)
+
+        if bucket_seconds:
+            aggregates = {
+                "first": "first({column}, time)",
+                "last": "last({column}, time)",
+                "max": "max({column})",
+                "min": "min({column})",
+                "sum": "sum({column})",
+            }
+            time_expr = "time_bucket(make_interval(secs => :bucket_seconds), time, TIMESTAMPTZ '1970-01-01')"
+            selected = [
+                aggregates[CHART_COLUMNS[name][1]].format(column=CHART_COLUMNS[name][0]) + f' as "{name}"'
+                for name in columns
+            ]
+            group_by = "GROUP BY 1"
+        else:
+            time_expr = "time"
+            selected = [f'{CHART_COLUMNS[name][0]} as "{name}"' for name in columns]
+            group_by = ""
+
+        query_str = f"""
+            SELECT
+                (EXTRACT(EPOCH FROM {time_expr}) * 1000)::bigint as timestamp
+                {"".join(", " + column for column in selected)}
+            FROM {table_name}
+            WHERE timeframe = :timeframe
+                AND time >= :start_date
+                AND time <= :end_date
+            {group_by}
+            ORDER BY 1
+        """
+        if limit:
+            query_str += f" LIMIT {int(limit)}"
+        params = {"timeframe": timeframe, "start_date": start_date, "end_date": end_date}
+        if bucket_seconds:
+            params["bucket_seconds"] = bucket_seconds
+
+        try:
+            rows = (await session.execute(text(query_str), params)).fetchall()
+        except Exception as e:
+            logger.error(f"Error fetching chart columns from TimescaleDB: {e}")
+            raise
+
+        arrays = {"timestamp": np.array([row.timestamp for row in rows], dtype=np.int64)}
+        for index, name in enumerate(columns, start=1):
+            arrays[name] = np.array(
+                [np.nan if row[index] is None else float(row[index]) for row in rows], dtype=np.float64
+            )
+        return arrays
+
     async def get_latest_timestamp(
         self,
         symbol: str,
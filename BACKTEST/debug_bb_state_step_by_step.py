@@ -6,7 +6,7 @@ import asyncio
 import math
 from datetime import datetime, timedelta
 from BACKTEST.data.timescale_provider import TimescaleProvider
-from shared.indicators._all_indicators import calc_sma, calc_stddev
+from shared.indicators import calc_sma, calc_stddev
 from shared.indicators._core import pivothigh, pivotlow, crossover, falling, rising
 import logging
 
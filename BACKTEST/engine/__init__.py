@@ -2,15 +2,37 @@
 Backtest engine components.
 """
 
-from BACKTEST.engine.balance_tracker import BalanceTracker, BalanceSnapshot
+from BACKTEST.engine.balance_tracker import (
+    BalanceTracker,
+    BalanceSnapshot,
+    downsample_equity_curve,
+    lttb_indices,
+)
 from BACKTEST.engine.position_manager import PositionManager
 from BACKTEST.engine.order_simulator import OrderSimulator, OrderType, SlippageModel
-from BACKTEST.engine.event_logger import EventLogger, EventType, BacktestEvent
+from BACKTEST.engine.event_logger import (
+    BacktestEvent,
+    EventLogger,
+    EventType,
+    EventVerbosity,
+    LazyMessage,
+    PhaseProfiler,
+    parse_verbosity,
+)
+from BACKTEST.engine.indicator_matrix import IndicatorMatrix
 from BACKTEST.engine.backtest_engine import BacktestEngine
+from BACKTEST.engine.portfolio_engine import (
+    LegBalanceTracker,
+    PortfolioEngine,
+    PortfolioLeg,
+    combine_equity_arrays,
+)
 
 __all__ = [
     "BalanceTracker",
     "BalanceSnapshot",
+    "downsample_equity_curve",
+    "lttb_indices",
     "PositionManager",
     "OrderSimulator",
     "OrderType",
@@ -18,5 +40,14 @@ __all__ = [
     "EventLogger",
     "EventType",
     "BacktestEvent",
+    "EventVerbosity",
+    "LazyMessage",
+    "PhaseProfiler",
+    "parse_verbosity",
+    "IndicatorMatrix",
     "BacktestEngine",
+    "LegBalanceTracker",
+    "PortfolioEngine",
+    "PortfolioLeg",
+    "combine_equity_arrays",
 ]
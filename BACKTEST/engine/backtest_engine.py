@@ -3,16 +3,27 @@ Main backtest engine for running strategy simulations.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 from uuid import UUID
 import asyncio
 import pandas as pd
 
+from BACKTEST.analysis.metrics_calculator import calculate_performance_metrics
+from BACKTEST.data.candle_array import CandleArrayProvider
 from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.data.mtf_prefetch import PrefetchedCandles, prefetch_candles
 from BACKTEST.engine.balance_tracker import BalanceTracker
 from BACKTEST.engine.position_manager import PositionManager
 from BACKTEST.engine.order_simulator import OrderSimulator, SlippageModel
-from BACKTEST.engine.event_logger import EventLogger, EventType
+from BACKTEST.engine.event_logger import (
+    EventLogger,
+    EventType,
+    EventVerbosity,
+    LazyMessage,
+    PhaseProfiler,
+    parse_verbosity,
+)
+from BACKTEST.engine.indicator_matrix import IndicatorMatrix
 from BACKTEST.engine.dca_calculator import (
     calculate_dca_levels,
     check_dca_condition,
@@ -39,6 +50,12 @@ from BACKTEST.engine.dual_side_utils import (
 
 logger = get_logger(__name__)
 
+# progress_callback(processed, total, trades) - 예외를 던지면 백테스트가 중단됨
+ProgressCallback = Callable[[int, int, int], None]
+
+# 지표 매트릭스 워밍업 캔들 수 (trend_state는 최소 200개 필요)
+INDICATOR_WARMUP_BARS = 300
+
 
 class BacktestEngine:
     """Main backtesting engine."""
@@ -49,7 +66,11 @@ class BacktestEngine:
         initial_balance: float = 10000.0,
         fee_rate: float = 0.0005,
         slippage_percent: float = 0.05,
-        enable_event_logging: bool = True
+        enable_event_logging: bool = True,
+        equity_sample_every: int = 1,
+        equity_change_threshold: float = 0.0,
+        event_verbosity: Optional[Dict[EventType, EventVerbosity]] = None,
+        enable_profiling: bool = False
     ):
         """
         Initialize backtest engine.
@@ -60,20 +81,41 @@ class BacktestEngine:
             fee_rate: Trading fee rate (default 0.05%)
             slippage_percent: Slippage percentage (default 0.05%)
             enable_event_logging: Enable detailed event logging
+            equity_sample_every: Store every N-th equity snapshot
+            equity_change_threshold: Also store a snapshot when equity moved
+                by this fraction (see BalanceTracker)
+            event_verbosity: Per event type verbosity (default:
+                EVENT_LOG_VERBOSITY)
+            enable_profiling: Time the engine phases of every candle and
+                report them in detailed_metrics["phase_timings"]
         """
+        from BACKTEST.config import backtest_config
+
         self.data_provider = data_provider
         self.initial_balance = initial_balance
         self.fee_rate = fee_rate
 
         # Core components
-        self.balance_tracker = BalanceTracker(initial_balance)
+        self.balance_tracker = BalanceTracker(
+            initial_balance,
+            sample_every=equity_sample_every,
+            change_threshold=equity_change_threshold
+        )
         self.position_manager = PositionManager(fee_rate)
         self.dual_position_manager = PositionManager(fee_rate)
         self.order_simulator = OrderSimulator(
             slippage_model=SlippageModel.PERCENTAGE,
             slippage_percent=slippage_percent
         )
-        self.event_logger = EventLogger() if enable_event_logging else None
+        self.event_logger = EventLogger(
+            max_events=backtest_config.EVENT_LOG_MAX_EVENTS,
+            verbosity=(
+                event_verbosity if event_verbosity is not None
+                else parse_verbosity(backtest_config.EVENT_LOG_VERBOSITY)
+            )
+        ) if enable_event_logging else None
+        self.enable_profiling = enable_profiling
+        self.profiler: Optional[PhaseProfiler] = None
 
         # State
         self.is_running = False
@@ -82,6 +124,7 @@ class BacktestEngine:
         self.dual_side_params: Dict[str, Any] = {}
         self.dual_entry_count: int = 0
         self.strategy_executor = None  # Will be set in run()
+        self.indicator_matrix: Optional[IndicatorMatrix] = None
         self.symbol_info: Optional[Dict[str, Any]] = None  # Symbol specifications (min_size, etc.)
 
         logger.info(
@@ -147,7 +190,12 @@ class BacktestEngine:
         end_date: datetime,
         strategy_name: str,
         strategy_params: Dict[str, Any],
-        strategy_executor  # Will be Strategy interface
+        strategy_executor,  # Will be Strategy interface
+        progress_callback: Optional[ProgressCallback] = None,
+        progress_interval: int = 500,
+        precompute_indicators: bool = True,
+        indicator_matrix: Optional[IndicatorMatrix] = None,
+        equity_curve_points: Optional[int] = None
     ) -> BacktestResult:
         """
         Run backtest simulation.
@@ -161,6 +209,17 @@ class BacktestEngine:
             strategy_name: Strategy name
             strategy_params: Strategy parameters
             strategy_executor: Strategy execution instance
+            progress_callback: Called with (processed, total, trades) every
+                progress_interval candles and once at the end. Raising from
+                the callback aborts the run (used for job cancellation).
+            progress_interval: Candles between progress callbacks
+            precompute_indicators: Build an IndicatorMatrix for the run so
+                missing candle indicators are looked up instead of recomputed
+                from price_history on every candle
+            indicator_matrix: Prebuilt matrix covering the run (e.g. shared
+                across a parameter sweep); skips the warm-up fetch
+            equity_curve_points: Downsample the result equity curve to this
+                many points (LTTB); drawdown statistics stay exact
 
         Returns:
             BacktestResult with complete results
@@ -168,6 +227,94 @@ class BacktestEngine:
         self.is_running = True
         started_at = datetime.utcnow()
 
+        logger.info(
+            f"Starting backtest: {symbol} {timeframe} "
+            f"from {start_date} to {end_date}"
+        )
+        await self._prepare(symbol, timeframe, strategy_executor)
+        if self.enable_profiling:
+            self._instrument_phases(strategy_executor)
+
+        try:
+            candles = await self._load_run_candles(
+                start_date, end_date, precompute_indicators, indicator_matrix
+            )
+
+            logger.info(f"Processing {len(candles)} candles...")
+            self.balance_tracker.reserve(len(candles) // self.balance_tracker.sample_every + 1)
+
+            # Process each candle
+            total_candles = len(candles)
+            for idx, candle in enumerate(candles):
+                self.current_candle = candle
+
+                # Process candle
+                await self._process_candle(candle, strategy_executor)
+
+                if progress_callback and (idx + 1) % progress_interval == 0:
+                    progress_callback(idx + 1, total_candles, self._trade_count())
+
+            if progress_callback:
+                progress_callback(total_candles, total_candles, self._trade_count())
+
+            result = self._build_result(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                strategy_name=strategy_name,
+                strategy_params=strategy_params,
+                started_at=started_at,
+                last_candle=candles[-1],
+                equity_curve_points=equity_curve_points
+            )
+
+            logger.info(
+                f"Backtest completed: {result.total_trades} trades, "
+                f"Return: {result.total_return_percent:.2f}%, "
+                f"Win rate: {result.win_rate:.2f}%"
+            )
+
+            return result
+
+        except Exception as e:
+            logger.error(f"Backtest failed: {e}")
+            if self.event_logger:
+                self.event_logger.log_error("Backtest execution failed", e)
+            raise
+
+        finally:
+            self.is_running = False
+            if self.profiler:
+                self.profiler.restore()
+
+    def _instrument_phases(self, strategy_executor) -> None:
+        """Time the per-candle phases of this run (see PhaseProfiler)."""
+        self.profiler = PhaseProfiler()
+        for obj, method_name, phase in (
+            (self, "_process_candle", "candle"),
+            (strategy_executor, "generate_signal", "signal"),
+            (self, "_check_exit_conditions", "exit_check"),
+            (self, "_check_dual_exit_conditions", "dual_exit_check"),
+            (self, "_check_dca_conditions", "dca_check"),
+            (self, "_record_snapshot", "snapshot"),
+        ):
+            if hasattr(obj, method_name):
+                self.profiler.instrument(obj, method_name, phase)
+
+    def _trace(self, event_type: EventType, message, data=None) -> None:
+        """Record a per-candle diagnostic event (off unless its verbosity is raised)."""
+        if self.event_logger:
+            self.event_logger.log_event(event_type, message, data)
+
+    async def _prepare(self, symbol: str, timeframe: str, strategy_executor) -> None:
+        """
+        Set run state and load symbol specifications.
+
+        Args:
+            symbol: Trading symbol
+            timeframe: Timeframe
+            strategy_executor: Strategy execution instance
+        """
         # Store symbol and strategy params for access in methods
         self.symbol = symbol
         self.timeframe = timeframe
@@ -176,11 +323,7 @@ class BacktestEngine:
         self.strategy_executor = strategy_executor
         self.dual_side_params = merge_dual_side_params(self.strategy_params)
         self.dual_entry_count = 0
-
-        logger.info(
-            f"Starting backtest: {symbol} {timeframe} "
-            f"from {start_date} to {end_date}"
-        )
+        self.indicator_matrix = None
 
         # Fetch symbol specifications (min_size, contract_size, etc.)
         self.symbol_info = await self.data_provider.get_symbol_info(symbol)
@@ -213,129 +356,171 @@ class BacktestEngine:
         if hasattr(strategy_executor, 'set_data_provider'):
             strategy_executor.set_data_provider(self.data_provider, symbol, timeframe)
 
-        try:
-            # Validate data availability
-            validation = await self.data_provider.validate_data_availability(
-                symbol, timeframe, start_date, end_date
-            )
+    async def _load_run_candles(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        precompute_indicators: bool = True,
+        indicator_matrix: Optional[IndicatorMatrix] = None
+    ) -> List[Candle]:
+        """
+        Validate and fetch the candles of the run, then attach the indicator
+        matrix to the strategy (call _prepare() first).
+        """
+        # Validate data availability
+        validation = await self.data_provider.validate_data_availability(
+            self.symbol, self.timeframe, start_date, end_date
+        )
 
-            if not validation["available"]:
-                raise ValueError("No data available for specified period")
+        if not validation["available"]:
+            raise ValueError("No data available for specified period")
 
-            if validation["coverage"] < 0.9:
-                logger.warning(
-                    f"Low data coverage: {validation['coverage']*100:.1f}%"
-                )
+        if validation["coverage"] < 0.9:
+            logger.warning(
+                f"Low data coverage: {validation['coverage']*100:.1f}%"
+            )
 
+        if indicator_matrix is None and precompute_indicators:
+            # 워밍업 + 구간 캔들과 상위 TF 종가를 한 번에 로드
+            prefetched = await prefetch_candles(
+                self.data_provider, self.symbol, self.timeframe, start_date, end_date, INDICATOR_WARMUP_BARS
+            )
+            candles = prefetched.candles
+            if candles:
+                indicator_matrix = self._build_indicator_matrix(prefetched)
+                # 전략의 과거 데이터 요청은 메모리에서 처리
+                if hasattr(self.strategy_executor, 'set_data_provider'):
+                    self.strategy_executor.set_data_provider(
+                        CandleArrayProvider(prefetched.history, self.symbol_info), self.symbol, self.timeframe
+                    )
+        else:
             # Fetch candle data
             candles = await self.data_provider.get_candles(
-                symbol, timeframe, start_date, end_date
+                self.symbol, self.timeframe, start_date, end_date
             )
 
-            if not candles:
-                raise ValueError("No candles returned from data provider")
-
-            logger.info(f"Processing {len(candles)} candles...")
-
-            # Process each candle
-            total_candles = len(candles)
-            for idx, candle in enumerate(candles):
-                self.current_candle = candle
+        if not candles:
+            raise ValueError("No candles returned from data provider")
 
-                # Process candle
-                await self._process_candle(candle, strategy_executor)
+        self.indicator_matrix = indicator_matrix
+        if hasattr(self.strategy_executor, 'set_indicator_matrix'):
+            self.strategy_executor.set_indicator_matrix(indicator_matrix)
+        return candles
 
-                # Progress update every 100 candles
-                #if (idx + 1) % 100 == 0:
-                #    progress = ((idx + 1) / total_candles) * 100
-                #    logger.info(f"Progress: {progress:.1f}% ({idx + 1}/{total_candles})")
-
-            # Check for remaining position (keep as unrealized P&L)
-            unrealized_pnl = 0.0
-            last_candle = candles[-1]
-            if self.position_manager.has_position():
-                position = self.position_manager.get_position()
-                position.update_unrealized_pnl(last_candle.close)
-                unrealized_pnl += position.unrealized_pnl
-                logger.warning(
-                    f"🚨 [MAIN POSITION NOT CLOSED] Backtest ended with open position: "
-                    f"side={position.side.value}, entry_price={position.entry_price:.2f}, "
-                    f"current_price={last_candle.close:.2f}, "
-                    f"total_qty={position.get_total_quantity():.6f}, "
-                    f"remaining_qty={position.get_current_quantity():.6f}, "
-                    f"unrealized_pnl={position.unrealized_pnl:.2f}, "
-                    f"dca_count={position.dca_count}, "
-                    f"tp1_filled={position.tp1_filled}, tp2_filled={position.tp2_filled}, tp3_filled={position.tp3_filled}"
-                )
-
-            if self.dual_position_manager.has_position():
-                dual_position = self.dual_position_manager.get_position()
-                dual_position.update_unrealized_pnl(last_candle.close)
-                unrealized_pnl += dual_position.unrealized_pnl
-                logger.warning(
-                    f"🚨 [DUAL POSITION NOT CLOSED] Backtest ended with open dual position: "
-                    f"side={dual_position.side.value}, entry_price={dual_position.entry_price:.2f}, "
-                    f"current_price={last_candle.close:.2f}, "
-                    f"total_qty={dual_position.get_total_quantity():.6f}, "
-                    f"remaining_qty={dual_position.get_current_quantity():.6f}, "
-                    f"unrealized_pnl={dual_position.unrealized_pnl:.2f}, "
-                    f"dca_count={dual_position.dca_count}"
-                )
-
-            # Build result
-            completed_at = datetime.utcnow()
-            execution_time = (completed_at - started_at).total_seconds()
-
-            result = BacktestResult(
-                user_id=user_id,
-                symbol=symbol,
-                timeframe=timeframe,
-                start_date=start_date,
-                end_date=end_date,
-                strategy_name=strategy_name,
-                strategy_params=strategy_params,
-                started_at=started_at,
-                completed_at=completed_at,
-                execution_time_seconds=execution_time,
-                initial_balance=self.initial_balance,
-                final_balance=self.balance_tracker.current_balance,
-                unrealized_pnl=unrealized_pnl,
-                trades=self._get_all_trades(),
-                equity_curve=self.balance_tracker.get_equity_curve()
+    def _build_result(
+        self,
+        user_id: UUID,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_name: str,
+        strategy_params: Dict[str, Any],
+        started_at: datetime,
+        last_candle: Candle,
+        equity_curve_points: Optional[int] = None
+    ) -> BacktestResult:
+        """
+        Build the BacktestResult of a finished run (open positions are kept
+        as unrealized P&L at last_candle).
+        """
+        # Check for remaining position (keep as unrealized P&L)
+        unrealized_pnl = 0.0
+        if self.position_manager.has_position():
+            position = self.position_manager.get_position()
+            position.update_unrealized_pnl(last_candle.close)
+            unrealized_pnl += position.unrealized_pnl
+            logger.warning(
+                f"🚨 [MAIN POSITION NOT CLOSED] Backtest ended with open position: "
+                f"side={position.side.value}, entry_price={position.entry_price:.2f}, "
+                f"current_price={last_candle.close:.2f}, "
+                f"total_qty={position.get_total_quantity():.6f}, "
+                f"remaining_qty={position.get_current_quantity():.6f}, "
+                f"unrealized_pnl={position.unrealized_pnl:.2f}, "
+                f"dca_count={position.dca_count}, "
+                f"tp1_filled={position.tp1_filled}, tp2_filled={position.tp2_filled}, tp3_filled={position.tp3_filled}"
             )
 
-            # Calculate metrics
-            result.calculate_metrics()
-            result.sharpe_ratio = result.calculate_sharpe_ratio()
-
-            # Add balance tracker stats
-            balance_stats = self.balance_tracker.get_statistics()
-            result.max_drawdown = balance_stats.get("max_drawdown", 0.0)
-            result.max_drawdown_percent = balance_stats.get("max_drawdown_percent", 0.0)
+        if self.dual_position_manager.has_position():
+            dual_position = self.dual_position_manager.get_position()
+            dual_position.update_unrealized_pnl(last_candle.close)
+            unrealized_pnl += dual_position.unrealized_pnl
+            logger.warning(
+                f"🚨 [DUAL POSITION NOT CLOSED] Backtest ended with open dual position: "
+                f"side={dual_position.side.value}, entry_price={dual_position.entry_price:.2f}, "
+                f"current_price={last_candle.close:.2f}, "
+                f"total_qty={dual_position.get_total_quantity():.6f}, "
+                f"remaining_qty={dual_position.get_current_quantity():.6f}, "
+                f"unrealized_pnl={dual_position.unrealized_pnl:.2f}, "
+                f"dca_count={dual_position.dca_count}"
+            )
 
-            # Add event summary if logging enabled
-            if self.event_logger:
-                result.detailed_metrics = {
-                    "event_summary": self.event_logger.get_event_summary(),
-                    "balance_stats": balance_stats
-                }
+        # Build result
+        completed_at = datetime.utcnow()
+        execution_time = (completed_at - started_at).total_seconds()
+
+        result = BacktestResult(
+            user_id=user_id,
+            symbol=self.symbol,
+            timeframe=self.timeframe,
+            start_date=start_date,
+            end_date=end_date,
+            strategy_name=strategy_name,
+            strategy_params=strategy_params,
+            started_at=started_at,
+            completed_at=completed_at,
+            execution_time_seconds=execution_time,
+            initial_balance=self.balance_tracker.initial_balance,
+            final_balance=self.balance_tracker.current_balance,
+            unrealized_pnl=unrealized_pnl,
+            trades=self._get_all_trades(),
+            equity_curve=self.balance_tracker.get_equity_curve(max_points=equity_curve_points)
+        )
 
-            logger.info(
-                f"Backtest completed: {result.total_trades} trades, "
-                f"Return: {result.total_return_percent:.2f}%, "
-                f"Win rate: {result.win_rate:.2f}%"
-            )
+        # Calculate metrics (vectorized, one pass over trades + equity arrays)
+        performance = calculate_performance_metrics(
+            result.trades,
+            self.balance_tracker.get_equity_arrays(),
+            result.initial_balance,
+            result.final_balance
+        )
+        result.calculate_metrics(performance)
+        result.sharpe_ratio = performance["sharpe_ratio"]
+        result.sortino_ratio = performance["sortino_ratio"]
 
-            return result
+        # Add balance tracker stats (exact even when the curve is sampled)
+        balance_stats = self.balance_tracker.get_statistics()
+        result.max_drawdown = balance_stats.get("max_drawdown", 0.0)
+        result.max_drawdown_percent = balance_stats.get("max_drawdown_percent", 0.0)
 
-        except Exception as e:
-            logger.error(f"Backtest failed: {e}")
-            if self.event_logger:
-                self.event_logger.log_error("Backtest execution failed", e)
-            raise
+        result.detailed_metrics = {"performance": performance}
+        # Add event summary if logging enabled
+        if self.event_logger:
+            result.detailed_metrics.update({
+                "event_summary": self.event_logger.get_event_summary(),
+                "balance_stats": balance_stats
+            })
+        if self.profiler:
+            result.detailed_metrics["phase_timings"] = self.profiler.summary(total_phase="candle")
+        return result
+
+    def _build_indicator_matrix(self, prefetched: PrefetchedCandles) -> IndicatorMatrix:
+        """
+        Precompute fallback indicators for the whole run in one pass.
 
-        finally:
-            self.is_running = False
+        Warm-up candles before the first simulated candle are included so
+        indicators are defined from the start of the period; higher-timeframe
+        closes come prefetched instead of being resampled.
+        """
+        from shared.utils.time_helpers import timeframe_to_seconds
+
+        rsi_period = getattr(getattr(self.strategy_executor, 'signal_generator', None), 'rsi_period', 14)
+        matrix = IndicatorMatrix.from_candles(
+            prefetched.history,
+            rsi_period=rsi_period,
+            timeframe_minutes=timeframe_to_seconds(self.timeframe) // 60,
+            mtf_closes=prefetched.mtf_closes
+        )
+        logger.info(f"Indicator matrix built: {len(matrix)} bars ({len(prefetched.warmup)} warm-up)")
+        return matrix
 
     async def _process_candle(
         self,
@@ -398,7 +583,7 @@ class BacktestEngine:
                 if self.event_logger:
                     self.event_logger.log_event(
                         event_type=EventType.TRAILING_STOP_ACTIVATED,
-                        message=f"Trailing stop activated @ {candle.close:.2f}",
+                        message=LazyMessage("Trailing stop activated @ {:.2f}", candle.close),
                         data={"unrealized_pnl_percent": position.unrealized_pnl_percent}
                     )
 
@@ -412,7 +597,7 @@ class BacktestEngine:
                 # Calculate position size
                 quantity, leverage = strategy_executor.calculate_position_size(
                     signal,
-                    self.balance_tracker.current_balance,
+                    self.balance_tracker.available_balance,
                     candle.close
                 )
 
@@ -585,7 +770,7 @@ class BacktestEngine:
                     if self.event_logger:
                         self.event_logger.log_event(
                             event_type=EventType.TRAILING_STOP_HIT,
-                            message=f"Trailing stop hit @ {filled_price:.2f}",
+                            message=LazyMessage("Trailing stop hit @ {:.2f}", filled_price),
                             data={"pnl": trade.pnl}
                         )
                     self._handle_dual_after_main_close(trade.exit_reason, candle, filled_price)
@@ -665,7 +850,9 @@ class BacktestEngine:
                     if self.event_logger:
                         self.event_logger.log_event(
                             event_type=EventType.TAKE_PROFIT_HIT,
-                            message=f"TP{tp_level} hit @ {filled_price:.2f} ({exit_ratio*100:.0f}% closed)",
+                            message=LazyMessage(
+                                "TP{} hit @ {:.2f} ({:.0f}% closed)", tp_level, filled_price, exit_ratio * 100
+                            ),
                             data={"pnl": trade.pnl, "tp_level": tp_level, "exit_ratio": exit_ratio}
                         )
                     logger.info(
@@ -744,7 +931,7 @@ class BacktestEngine:
                         if activated and self.event_logger:
                             self.event_logger.log_event(
                                 event_type=EventType.TRAILING_STOP_ACTIVATED,
-                                message=f"Trailing stop activated after TP{tp_level}",
+                                message=LazyMessage("Trailing stop activated after TP{}", tp_level),
                                 data={
                                     "tp_level": tp_level,
                                     "trailing_offset": trailing_offset,
@@ -848,10 +1035,9 @@ class BacktestEngine:
         # Check if DCA limit reached
         pyramiding_limit = self.strategy_params.get('pyramiding_limit', 3)
         if position.dca_count >= pyramiding_limit:
-            logger.debug(
-                f"[DCA] DCA limit reached: "
-                f"count={position.dca_count}, limit={pyramiding_limit}"
-            )
+            self._trace(EventType.DCA_CHECK, LazyMessage(
+                "[DCA] DCA limit reached: count={}, limit={}", position.dca_count, pyramiding_limit
+            ))
             return
 
         # Check if DCA levels exist
@@ -872,13 +1058,10 @@ class BacktestEngine:
         )
 
         if not price_check_result:
-            logger.debug(
-                f"[DCA] Price condition NOT met: "
-                f"current={candle.close:.2f}, "
-                f"next_dca_level={position.dca_levels[0]:.2f}, "
-                f"side={position.side.value}, "
-                f"use_check_DCA_with_price={self.strategy_params.get('use_check_DCA_with_price', True)}"
-            )
+            self._trace(EventType.DCA_CHECK, LazyMessage(
+                "[DCA] Price condition NOT met: current={:.2f}, next_dca_level={:.2f}, side={}",
+                candle.close, position.dca_levels[0], position.side.value
+            ))
             return  # Price hasn't reached DCA level
 
 
@@ -886,6 +1069,9 @@ class BacktestEngine:
         # Check RSI condition (if enabled)
         rsi = candle.rsi if hasattr(candle, 'rsi') else None
 
+        if rsi is None and self.indicator_matrix is not None:
+            rsi = self.indicator_matrix.value("rsi", candle.timestamp)
+
         # If RSI is None, try to calculate it from strategy
         if rsi is None and self.strategy_executor:
             if hasattr(self.strategy_executor, 'calculate_rsi_from_history'):
@@ -910,6 +1096,10 @@ class BacktestEngine:
         ema_value = candle.ema if hasattr(candle, 'ema') and candle.ema else None
         sma_value = candle.sma if hasattr(candle, 'sma') and candle.sma else None
 
+        if (ema_value is None or sma_value is None) and self.indicator_matrix is not None:
+            ema_value = ema_value or self.indicator_matrix.value("ema", candle.timestamp)
+            sma_value = sma_value or self.indicator_matrix.value("sma", candle.timestamp)
+
         # If EMA/SMA is None, try to calculate from strategy
         if (ema_value is None or sma_value is None) and self.strategy_executor:
             if hasattr(self.strategy_executor, 'calculate_trend_indicators'):
@@ -919,6 +1109,8 @@ class BacktestEngine:
 
         # Get trend_state from candle (PineScript indicator)
         trend_state = candle.trend_state if hasattr(candle, 'trend_state') else None
+        if trend_state is None and self.indicator_matrix is not None:
+            trend_state = self.indicator_matrix.trend_state(candle.timestamp)
 
         use_trend_logic = self.strategy_params.get('use_trend_logic', True)
         trend_check_result = check_trend_condition_for_dca(
@@ -933,10 +1125,10 @@ class BacktestEngine:
 
             return
         else:
-            logger.debug(
-                f"[DCA] ✅ Trend condition MET: "
-                f"trend_state={trend_state}, EMA={ema_value}, SMA={sma_value}, use_trend_logic={use_trend_logic}"
-            )
+            self._trace(EventType.DCA_CHECK, LazyMessage(
+                "[DCA] ✅ Trend condition MET: trend_state={}, EMA={}, SMA={}, use_trend_logic={}",
+                trend_state, ema_value, sma_value, use_trend_logic
+            ))
 
         # All conditions met - execute DCA entry
         logger.info(
@@ -1182,7 +1374,9 @@ class BacktestEngine:
         if self.event_logger:
             self.event_logger.log_event(
                 event_type=EventType.POSITION_OPENED,
-                message=f"Dual-side {'open' if self.dual_entry_count == 1 else 'add'} @ {filled_price:.2f}",
+                message=LazyMessage(
+                    "Dual-side {} @ {:.2f}", 'open' if self.dual_entry_count == 1 else 'add', filled_price
+                ),
                 data={
                     "side": opposite_side.value,
                     "qty": quantity,
@@ -1247,7 +1441,7 @@ class BacktestEngine:
                     if self.event_logger:
                         self.event_logger.log_event(
                             event_type=EventType.TAKE_PROFIT_HIT,
-                            message=f"Dual-side TP hit @ {filled_price:.2f}",
+                            message=LazyMessage("Dual-side TP hit @ {:.2f}", filled_price),
                             data={"pnl": trade.pnl}
                         )
 
@@ -1311,7 +1505,7 @@ class BacktestEngine:
             if self.event_logger:
                 self.event_logger.log_event(
                     event_type=EventType.POSITION_CLOSED,
-                    message=f"Dual-side position closed ({reason.value}) @ {exit_price:.2f}",
+                    message=LazyMessage("Dual-side position closed ({}) @ {:.2f}", reason.value, exit_price),
                     data={"pnl": trade.pnl, "side": trade.side.value}
                 )
         return trade
@@ -1412,16 +1606,21 @@ class BacktestEngine:
         if hasattr(self.strategy_executor, 'signal_generator'):
             # Use cached trend_state from candle if available (from TimescaleDB)
             trend_state = getattr(candle, 'trend_state', None)
+            if trend_state is None and self.indicator_matrix is not None:
+                trend_state = self.indicator_matrix.trend_state(candle.timestamp)
 
             if trend_state is None:
                 # Fallback: Calculate trend_state if not in DB
-                logger.info("[TREND_EXIT] trend_state not found in candle, calculating...")
+                self._trace(EventType.TREND_CHECK, "[TREND_EXIT] trend_state not found in candle, calculating...")
 
                 # Get price history from strategy and convert to DataFrame
                 price_history = self.strategy_executor.price_history
 
                 if len(price_history) < 20:  # Need at least 20 candles for SMA20
-                    logger.info(f"[TREND_EXIT] Insufficient price history: {len(price_history)} < 20")
+                    self._trace(
+                        EventType.TREND_CHECK,
+                        LazyMessage("[TREND_EXIT] Insufficient price history: {} < 20", len(price_history))
+                    )
                     return False
 
                 # Build DataFrame with OHLCV columns
@@ -1445,31 +1644,27 @@ class BacktestEngine:
                 else:  # minutes
                     current_timeframe_minutes = timeframe_value
 
-                logger.info(
-                    f"[TREND_EXIT] Checking trend reversal: time={candle.timestamp}, "
-                    f"side={position.side.value}, price={candle.close:.2f}, "
-                    f"history_len={len(candles_df)}, timeframe={self.timeframe} ({current_timeframe_minutes}m)"
-                )
+                self._trace(EventType.TREND_CHECK, LazyMessage(
+                    "[TREND_EXIT] Checking trend reversal: time={}, side={}, price={:.2f}, "
+                    "history_len={}, timeframe={} ({}m)",
+                    candle.timestamp, position.side.value, candle.close,
+                    len(candles_df), self.timeframe, current_timeframe_minutes
+                ))
 
                 trend_state = self.strategy_executor.signal_generator.calculate_trend_state(
                     candles_df,
                     current_timeframe_minutes=current_timeframe_minutes
                 )
-            else:
-                logger.info(
-                    f"[TREND_EXIT] Using cached trend_state from DB: time={candle.timestamp}, "
-                    f"side={position.side.value}, price={candle.close:.2f}, "
-                    f"trend_state={trend_state}"
-                )
 
-            logger.info(
-                f"[TREND_EXIT] trend_state={trend_state}, side={position.side.value}, "
-                f"entry_price={position.entry_price:.2f}, current_price={candle.close:.2f}, "
-                f"unrealized_pnl={((candle.close - position.entry_price) / position.entry_price * 100 * (1 if position.side == TradeSide.LONG else -1)):.2f}%"
-            )
+            self._trace(EventType.TREND_CHECK, LazyMessage(
+                "[TREND_EXIT] trend_state={}, side={}, entry_price={:.2f}, current_price={:.2f}, "
+                "unrealized_pnl={:.2f}%",
+                trend_state, position.side.value, position.entry_price, candle.close,
+                (candle.close - position.entry_price) / position.entry_price * 100
+                * (1 if position.side == TradeSide.LONG else -1)
+            ))
 
             if trend_state is None:
-                logger.info("[TREND_EXIT] trend_state is None, skipping")
                 return False
 
             # Check if strong trend reversal against position
@@ -1478,17 +1673,10 @@ class BacktestEngine:
                 # Long position in strong downtrend
                 should_exit = True
                 reason = "Strong downtrend reversal (state=-2)"
-                logger.info(f"[TREND_EXIT] ✅ LONG exit condition met: trend_state={trend_state}")
             elif position.side == TradeSide.SHORT and trend_state == 2:
                 # Short position in strong uptrend
                 should_exit = True
                 reason = "Strong uptrend reversal (state=+2)"
-                logger.info(f"[TREND_EXIT] ✅ SHORT exit condition met: trend_state={trend_state}")
-            else:
-                logger.info(
-                    f"[TREND_EXIT] No exit condition met: side={position.side.value}, "
-                    f"trend_state={trend_state}"
-                )
 
             if should_exit:
                 logger.info(
@@ -1509,7 +1697,7 @@ class BacktestEngine:
                     if self.event_logger:
                         self.event_logger.log_event(
                             event_type=EventType.STOP_LOSS_HIT,  # Reuse STOP_LOSS event type
-                            message=f"Trend reversal exit: {reason}",
+                            message=LazyMessage("Trend reversal exit: {}", reason),
                             data={
                                 "trend_state": trend_state,
                                 "pnl": trade.pnl,
@@ -1527,6 +1715,10 @@ class BacktestEngine:
 
         return False
 
+    def _trade_count(self) -> int:
+        """Number of trades so far (main + dual), without building the merged list."""
+        return len(self.position_manager.get_trade_history()) + len(self.dual_position_manager.get_trade_history())
+
     def _get_all_trades(self) -> List:
         """Get all executed trades."""
         trades = self.position_manager.get_trade_history() + self.dual_position_manager.get_trade_history()
@@ -1552,6 +1744,7 @@ class BacktestEngine:
         self.strategy_executor = None
         self.dual_side_params = {}
         self.dual_entry_count = 0
+        self.indicator_matrix = None
         logger.info("BacktestEngine reset to initial state")
 
     def _is_last_main_dca(self, position: Position) -> bool:
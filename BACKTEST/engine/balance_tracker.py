@@ -1,10 +1,18 @@
 """
 Balance tracker for backtest equity curve management.
+
+Snapshots are stored column-wise in preallocated NumPy arrays. Peak,
+drawdown and equity statistics are updated on every snapshot, so they stay
+exact when the stored curve is sampled (every N points / on equity change)
+or downsampled for display (LTTB).
 """
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
 
 from shared.logging import get_logger
 
@@ -25,19 +33,89 @@ class BalanceSnapshot:
     cumulative_trades: int = 0
 
 
+# position_side 저장 코드 (int8 배열)
+_POSITION_SIDES = (None, "long", "short", "hedged")
+_POSITION_SIDE_CODES = {side: code for code, side in enumerate(_POSITION_SIDES)}
+
+_INITIAL_CAPACITY = 1024
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, target: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Args:
+        x: Ascending x values (e.g. epoch ns)
+        y: Values to preserve the visual shape of
+        target: Number of points to keep (first and last always kept)
+
+    Returns:
+        Sorted indices of the kept points
+    """
+    n = len(x)
+    if target >= n:
+        return np.arange(n)
+    if target < 3:
+        return np.array([0, n - 1][:max(target, 0)], dtype=np.int64)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    every = (n - 2) / (target - 2)
+    indices = np.empty(target, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(target - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample_equity_curve(equity_curve: List[Dict[str, Any]], max_points: int) -> List[Dict[str, Any]]:
+    """LTTB-downsample stored equity curve points (timestamp/equity dicts)."""
+    if len(equity_curve) <= max_points:
+        return equity_curve
+    timestamps = pd.to_datetime([point["timestamp"] for point in equity_curve], utc=True).asi8
+    equity = np.array(
+        [point.get("equity", point.get("balance")) for point in equity_curve], dtype=np.float64
+    )
+    return [equity_curve[i] for i in lttb_indices(timestamps, equity, max_points)]
+
+
 class BalanceTracker:
     """Tracks balance and equity curve during backtesting."""
 
-    def __init__(self, initial_balance: float):
+    def __init__(
+        self,
+        initial_balance: float,
+        sample_every: int = 1,
+        change_threshold: float = 0.0
+    ):
         """
         Initialize balance tracker.
 
         Args:
             initial_balance: Starting capital
+            sample_every: Store every N-th snapshot (1 = all)
+            change_threshold: Also store a snapshot when equity moved by this
+                fraction since the last stored one (0 = off)
+
+        Snapshots where a trade closed and the latest snapshot are always
+        kept, so balance steps and the final value are exact.
         """
+        if sample_every < 1:
+            raise ValueError("sample_every must be >= 1")
         self.initial_balance = initial_balance
         self.current_balance = initial_balance
-        self.snapshots: List[BalanceSnapshot] = []
+        self.sample_every = sample_every
+        self.change_threshold = change_threshold
 
         # Drawdown tracking
         self.peak_balance = initial_balance
@@ -49,8 +127,50 @@ class BalanceTracker:
         self.cumulative_pnl = 0.0
         self.cumulative_trades = 0
 
+        self._allocate(_INITIAL_CAPACITY)
         logger.info(f"BalanceTracker initialized with {initial_balance} USDT")
 
+    def _allocate(self, capacity: int) -> None:
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._balance = np.empty(capacity, dtype=np.float64)
+        self._equity = np.empty(capacity, dtype=np.float64)
+        self._unrealized_pnl = np.empty(capacity, dtype=np.float64)
+        self._position_size = np.empty(capacity, dtype=np.float64)
+        self._position_side = np.empty(capacity, dtype=np.int8)
+        self._cumulative_pnl = np.empty(capacity, dtype=np.float64)
+        self._cumulative_trades = np.empty(capacity, dtype=np.int64)
+        self._size = 0
+        self._last: Optional[tuple] = None  # 마지막 스냅샷 (저장 여부와 무관)
+        self._last_stored = True
+        self._skipped = 0
+        self._tz_aware = True
+
+        # 전체 스냅샷 기준 통계 (샘플링과 무관하게 정확)
+        self._observed = 0
+        self._equity_min = float("inf")
+        self._equity_max = float("-inf")
+        self._equity_sum = 0.0
+
+    def _columns(self) -> tuple:
+        return (
+            self._timestamps, self._balance, self._equity, self._unrealized_pnl,
+            self._position_size, self._position_side, self._cumulative_pnl, self._cumulative_trades,
+        )
+
+    def reserve(self, capacity: int) -> None:
+        """Grow storage to hold at least capacity stored snapshots."""
+        current = len(self._timestamps)
+        if capacity <= current:
+            return
+        for name, column in zip(
+            ("_timestamps", "_balance", "_equity", "_unrealized_pnl",
+             "_position_size", "_position_side", "_cumulative_pnl", "_cumulative_trades"),
+            self._columns()
+        ):
+            grown = np.empty(capacity, dtype=column.dtype)
+            grown[:self._size] = column[:self._size]
+            setattr(self, name, grown)
+
     def add_snapshot(
         self,
         timestamp: datetime,
@@ -68,23 +188,54 @@ class BalanceTracker:
             unrealized_pnl: Current unrealized P&L
         """
         equity = self.current_balance + unrealized_pnl
-
-        snapshot = BalanceSnapshot(
-            timestamp=timestamp,
-            balance=self.current_balance,
-            equity=equity,
-            position_side=position_side,
-            position_size=position_size,
-            unrealized_pnl=unrealized_pnl,
-            cumulative_pnl=self.cumulative_pnl,
-            cumulative_trades=self.cumulative_trades
+        if self._observed == 0:
+            self._tz_aware = timestamp.tzinfo is not None
+
+        row = (
+            pd.Timestamp(timestamp).value,
+            self.current_balance,
+            equity,
+            unrealized_pnl,
+            position_size,
+            _POSITION_SIDE_CODES.get(position_side, 0),
+            self.cumulative_pnl,
+            self.cumulative_trades,
         )
+        if self._should_store(equity):
+            self._store(row)
+            self._last_stored = True
+            self._skipped = 0
+        else:
+            self._last_stored = False
+            self._skipped += 1
+        self._last = row
 
-        self.snapshots.append(snapshot)
+        self._observed += 1
+        self._equity_sum += equity
+        self._equity_min = min(self._equity_min, equity)
+        self._equity_max = max(self._equity_max, equity)
 
         # Update drawdown tracking
         self._update_drawdown(equity)
 
+    def _should_store(self, equity: float) -> bool:
+        if self._size == 0 or self.sample_every == 1 or self._skipped + 1 >= self.sample_every:
+            return True
+        last = self._size - 1
+        if self.cumulative_trades != self._cumulative_trades[last]:
+            return True
+        if self.change_threshold > 0:
+            reference = abs(self._equity[last]) or 1.0
+            return abs(equity - self._equity[last]) >= self.change_threshold * reference
+        return False
+
+    def _store(self, row: tuple) -> None:
+        if self._size == len(self._timestamps):
+            self.reserve(2 * len(self._timestamps))
+        for column, value in zip(self._columns(), row):
+            column[self._size] = value
+        self._size += 1
+
     def update_balance(self, pnl: float, fee: float = 0.0) -> None:
         """
         Update balance after trade close.
@@ -103,6 +254,11 @@ class BalanceTracker:
             f"New balance={self.current_balance:.2f}"
         )
 
+    @property
+    def available_balance(self) -> float:
+        """Capital available for sizing a new entry."""
+        return self.current_balance
+
     def _update_drawdown(self, current_equity: float) -> None:
         """
         Update drawdown metrics.
@@ -124,22 +280,81 @@ class BalanceTracker:
                 if self.peak_balance > 0:
                     self.max_drawdown_percent = (self.max_drawdown / self.peak_balance) * 100
 
-    def get_equity_curve(self) -> List[Dict[str, Any]]:
+    def get_equity_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Stored curve as arrays (timestamps in epoch ns), ending with the
+        latest snapshot even when sampling skipped it.
+        """
+        names = (
+            "timestamp", "balance", "equity", "unrealized_pnl",
+            "position_size", "position_side", "cumulative_pnl", "cumulative_trades",
+        )
+        arrays = {name: column[:self._size] for name, column in zip(names, self._columns())}
+        if not self._last_stored:
+            arrays = {
+                name: np.append(column, value).astype(column.dtype)
+                for (name, column), value in zip(arrays.items(), self._last)
+            }
+        return arrays
+
+    @property
+    def snapshots(self) -> List[BalanceSnapshot]:
+        """Stored snapshots as BalanceSnapshot objects."""
+        arrays = self.get_equity_arrays()
+        return [
+            BalanceSnapshot(
+                timestamp=ts,
+                balance=balance,
+                equity=equity,
+                position_side=_POSITION_SIDES[side],
+                position_size=size,
+                unrealized_pnl=upnl,
+                cumulative_pnl=cum_pnl,
+                cumulative_trades=cum_trades
+            )
+            for ts, balance, equity, upnl, size, side, cum_pnl, cum_trades in zip(
+                self._to_datetimes(arrays["timestamp"]),
+                arrays["balance"].tolist(), arrays["equity"].tolist(),
+                arrays["unrealized_pnl"].tolist(), arrays["position_size"].tolist(),
+                arrays["position_side"].tolist(), arrays["cumulative_pnl"].tolist(),
+                arrays["cumulative_trades"].tolist()
+            )
+        ]
+
+    def _to_datetimes(self, timestamps: np.ndarray) -> List[datetime]:
+        index = pd.to_datetime(timestamps, utc=self._tz_aware)
+        return list(index.to_pydatetime())
+
+    def get_equity_curve(self, max_points: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get equity curve data for visualization.
 
+        Args:
+            max_points: Downsample to this many points with LTTB (None = all
+                stored points)
+
         Returns:
             List of equity curve points
         """
+        arrays = self.get_equity_arrays()
+        if max_points is not None and len(arrays["timestamp"]) > max_points:
+            keep = lttb_indices(arrays["timestamp"], arrays["equity"], max_points)
+            arrays = {name: column[keep] for name, column in arrays.items()}
+
+        drawdown = arrays["equity"] - self.peak_balance
         return [
             {
-                "timestamp": snap.timestamp.isoformat(),
-                "balance": snap.balance,
-                "equity": snap.equity,
-                "cumulative_pnl": snap.cumulative_pnl,
-                "drawdown": snap.equity - self.peak_balance
+                "timestamp": ts.isoformat(),
+                "balance": balance,
+                "equity": equity,
+                "cumulative_pnl": cum_pnl,
+                "drawdown": dd
             }
-            for snap in self.snapshots
+            for ts, balance, equity, cum_pnl, dd in zip(
+                self._to_datetimes(arrays["timestamp"]),
+                arrays["balance"].tolist(), arrays["equity"].tolist(),
+                arrays["cumulative_pnl"].tolist(), drawdown.tolist()
+            )
         ]
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -149,11 +364,9 @@ class BalanceTracker:
         Returns:
             Dictionary of statistics
         """
-        if not self.snapshots:
+        if not self._observed:
             return {}
 
-        equities = [snap.equity for snap in self.snapshots]
-
         return {
             "initial_balance": self.initial_balance,
             "current_balance": self.current_balance,
@@ -163,15 +376,15 @@ class BalanceTracker:
             "cumulative_pnl": self.cumulative_pnl,
             "cumulative_trades": self.cumulative_trades,
             "total_return_percent": ((self.current_balance - self.initial_balance) / self.initial_balance) * 100,
-            "min_equity": min(equities),
-            "max_equity": max(equities),
-            "avg_equity": sum(equities) / len(equities)
+            "min_equity": self._equity_min,
+            "max_equity": self._equity_max,
+            "avg_equity": self._equity_sum / self._observed
         }
 
     def reset(self) -> None:
         """Reset tracker to initial state."""
         self.current_balance = self.initial_balance
-        self.snapshots.clear()
+        self._allocate(_INITIAL_CAPACITY)
         self.peak_balance = self.initial_balance
         self.current_drawdown = 0.0
         self.max_drawdown = 0.0
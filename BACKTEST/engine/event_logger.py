@@ -1,11 +1,20 @@
 """
 Event logger for recording backtest events and decisions.
+
+Events are kept in a ring buffer (the oldest are dropped once max_events
+is reached) and their messages are formatted only when read, so recording
+costs no string formatting. Each event type has a verbosity level; types
+switched off cost a dictionary lookup. PhaseProfiler optionally times the
+engine phases of every candle.
 """
 
+import inspect
+from collections import deque
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
-from enum import Enum
+from enum import Enum, IntEnum
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Union
 
 from shared.logging import get_logger
 
@@ -23,43 +32,143 @@ class EventType(str, Enum):
     TRAILING_STOP_UPDATED = "trailing_stop_updated"
     TRAILING_STOP_HIT = "trailing_stop_hit"
     BALANCE_UPDATED = "balance_updated"
+    TREND_CHECK = "trend_check"
+    DCA_CHECK = "dca_check"
     ERROR = "error"
     WARNING = "warning"
     INFO = "info"
 
 
-@dataclass
+class EventVerbosity(IntEnum):
+    """How much of an event type is kept."""
+    OFF = 0  # 무시
+    COUNT = 1  # 개수만 집계
+    RECORD = 2  # 링 버퍼에 저장
+    LOG = 3  # 저장 + 콘솔 로그
+
+
+# 캔들마다 발생하는 진단 이벤트는 기본 OFF, 체결 이벤트는 콘솔에도 출력
+DEFAULT_VERBOSITY: Dict[EventType, EventVerbosity] = {
+    EventType.POSITION_OPENED: EventVerbosity.LOG,
+    EventType.POSITION_CLOSED: EventVerbosity.LOG,
+    EventType.STOP_LOSS_HIT: EventVerbosity.LOG,
+    EventType.TAKE_PROFIT_HIT: EventVerbosity.LOG,
+    EventType.TREND_CHECK: EventVerbosity.OFF,
+    EventType.DCA_CHECK: EventVerbosity.OFF,
+}
+
+
+def parse_verbosity(spec: str) -> Dict[EventType, EventVerbosity]:
+    """
+    Parse a verbosity override string.
+
+    Args:
+        spec: Comma-separated "event_type=level" pairs, e.g.
+            "trend_check=record,trailing_stop_updated=count"
+
+    Returns:
+        Verbosity per event type
+
+    Raises:
+        ValueError: Unknown event type or level
+    """
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        name, _, level = item.partition("=")
+        try:
+            levels[EventType(name.strip().lower())] = EventVerbosity[level.strip().upper()]
+        except (KeyError, ValueError):
+            raise ValueError(f"Invalid event verbosity: {item!r}")
+    return levels
+
+
+class LazyMessage:
+    """Message template formatted on first read."""
+
+    __slots__ = ("template", "args", "fields")
+
+    def __init__(self, template: str, *args: Any, **fields: Any):
+        self.template = template
+        self.args = args
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return self.template.format(*self.args, **self.fields)
+
+
+MessageType = Union[str, LazyMessage, Callable[[], str]]
+DataType = Union[Dict[str, Any], Callable[[], Dict[str, Any]], None]
+
+
 class BacktestEvent:
-    """Single backtest event record."""
+    """Single backtest event record (message and data resolved on read)."""
+
+    __slots__ = ("timestamp", "event_type", "severity", "_message", "_data")
 
-    timestamp: datetime
-    event_type: EventType
-    message: str
-    data: Dict[str, Any] = field(default_factory=dict)
-    severity: str = "info"  # info, warning, error
+    def __init__(
+        self,
+        timestamp: datetime,
+        event_type: EventType,
+        message: MessageType,
+        data: DataType = None,
+        severity: str = "info"  # info, warning, error
+    ):
+        self.timestamp = timestamp
+        self.event_type = event_type
+        self.severity = severity
+        self._message = message
+        self._data = data
+
+    @property
+    def message(self) -> str:
+        if not isinstance(self._message, str):
+            self._message = self._message() if callable(self._message) else str(self._message)
+        return self._message
+
+    @property
+    def data(self) -> Dict[str, Any]:
+        if callable(self._data):
+            self._data = self._data()
+        if self._data is None:
+            self._data = {}
+        return self._data
 
 
 class EventLogger:
     """Records and manages backtest events."""
 
-    def __init__(self, max_events: int = 10000):
+    def __init__(
+        self,
+        max_events: int = 10000,
+        verbosity: Optional[Mapping[EventType, EventVerbosity]] = None,
+        default_verbosity: EventVerbosity = EventVerbosity.RECORD
+    ):
         """
         Initialize event logger.
 
         Args:
-            max_events: Maximum number of events to store
+            max_events: Ring buffer size (oldest events are dropped)
+            verbosity: Per event type overrides of DEFAULT_VERBOSITY
+            default_verbosity: Level of event types not configured
         """
         self.max_events = max_events
-        self.events: List[BacktestEvent] = []
+        self.events: Deque[BacktestEvent] = deque(maxlen=max_events)
+        self.verbosity: Dict[EventType, EventVerbosity] = {**DEFAULT_VERBOSITY, **(verbosity or {})}
+        self.default_verbosity = default_verbosity
+        self.dropped_events = 0
         self._event_counts: Dict[EventType, int] = {}
 
         logger.info(f"EventLogger initialized with max_events={max_events}")
 
+    def enabled(self, event_type: EventType, level: EventVerbosity = EventVerbosity.RECORD) -> bool:
+        """Whether events of this type are kept at (at least) the given level."""
+        return self.verbosity.get(event_type, self.default_verbosity) >= level
+
     def log_event(
         self,
         event_type: EventType,
-        message: str,
-        data: Optional[Dict[str, Any]] = None,
+        message: MessageType,
+        data: DataType = None,
         severity: str = "info"
     ) -> None:
         """
@@ -67,39 +176,32 @@ class EventLogger:
 
         Args:
             event_type: Type of event
-            message: Event description
-            data: Additional event data
+            message: Event description (str, LazyMessage or callable;
+                formatted on read)
+            data: Additional event data (dict or callable returning one)
             severity: Event severity level
         """
-        event = BacktestEvent(
-            timestamp=datetime.utcnow(),
-            event_type=event_type,
-            message=message,
-            data=data or {},
-            severity=severity
-        )
-
-        self.events.append(event)
+        level = self.verbosity.get(event_type, self.default_verbosity)
+        if level == EventVerbosity.OFF:
+            return
 
         # Update counts
         self._event_counts[event_type] = self._event_counts.get(event_type, 0) + 1
+        if level == EventVerbosity.COUNT:
+            return
 
-        # Trim events if exceeding max
-        if len(self.events) > self.max_events:
-            self.events = self.events[-self.max_events:]
+        if len(self.events) == self.max_events:
+            self.dropped_events += 1
+        event = BacktestEvent(datetime.utcnow(), event_type, message, data, severity)
+        self.events.append(event)
 
-        # Log to console for important events
+        # Log to console for errors, warnings and LOG-level event types
         if severity == "error":
-            logger.error(f"[{event_type.value}] {message}")
+            logger.error(f"[{event_type.value}] {event.message}")
         elif severity == "warning":
-            logger.warning(f"[{event_type.value}] {message}")
-        elif event_type in [
-            EventType.POSITION_OPENED,
-            EventType.POSITION_CLOSED,
-            EventType.STOP_LOSS_HIT,
-            EventType.TAKE_PROFIT_HIT
-        ]:
-            logger.info(f"[{event_type.value}] {message}")
+            logger.warning(f"[{event_type.value}] {event.message}")
+        elif level >= EventVerbosity.LOG:
+            logger.info(f"[{event_type.value}] {event.message}")
 
     def log_signal(
         self,
@@ -119,8 +221,8 @@ class EventLogger:
         """
         self.log_event(
             EventType.SIGNAL_GENERATED,
-            f"Signal generated: {signal_type} - {reason}",
-            data={
+            LazyMessage("Signal generated: {} - {}", signal_type, reason),
+            data=lambda: {
                 "timestamp": timestamp.isoformat(),
                 "signal_type": signal_type,
                 "reason": reason,
@@ -150,22 +252,23 @@ class EventLogger:
             reason: Entry reason/signal description
             indicators: Indicator values at entry
         """
-        data = {
-            "timestamp": timestamp.isoformat(),
-            "side": side,
-            "entry_price": entry_price,
-            "quantity": quantity,
-            "leverage": leverage
-        }
-
-        if reason:
-            data["reason"] = reason
-        if indicators:
-            data["indicators"] = indicators
+        def data() -> Dict[str, Any]:
+            payload = {
+                "timestamp": timestamp.isoformat(),
+                "side": side,
+                "entry_price": entry_price,
+                "quantity": quantity,
+                "leverage": leverage
+            }
+            if reason:
+                payload["reason"] = reason
+            if indicators:
+                payload["indicators"] = indicators
+            return payload
 
         self.log_event(
             EventType.POSITION_OPENED,
-            f"Position opened: {side} @ {entry_price:.2f}",
+            LazyMessage("Position opened: {side} @ {price:.2f}", side=side, price=entry_price),
             data=data
         )
 
@@ -191,8 +294,11 @@ class EventLogger:
         """
         self.log_event(
             EventType.POSITION_CLOSED,
-            f"Position closed: {side} @ {exit_price:.2f}, PNL={pnl:.2f} ({pnl_percent:.2f}%)",
-            data={
+            LazyMessage(
+                "Position closed: {side} @ {price:.2f}, PNL={pnl:.2f} ({pnl_percent:.2f}%)",
+                side=side, price=exit_price, pnl=pnl, pnl_percent=pnl_percent
+            ),
+            data=lambda: {
                 "timestamp": timestamp.isoformat(),
                 "side": side,
                 "exit_price": exit_price,
@@ -220,8 +326,8 @@ class EventLogger:
         """
         self.log_event(
             EventType.STOP_LOSS_HIT,
-            f"Stop loss hit @ {stop_price:.2f}, filled @ {filled_price:.2f}",
-            data={
+            LazyMessage("Stop loss hit @ {:.2f}, filled @ {:.2f}", stop_price, filled_price),
+            data=lambda: {
                 "timestamp": timestamp.isoformat(),
                 "stop_price": stop_price,
                 "filled_price": filled_price,
@@ -247,8 +353,8 @@ class EventLogger:
         """
         self.log_event(
             EventType.TAKE_PROFIT_HIT,
-            f"Take profit hit @ {tp_price:.2f}, PNL={pnl:.2f}",
-            data={
+            LazyMessage("Take profit hit @ {:.2f}, PNL={:.2f}", tp_price, pnl),
+            data=lambda: {
                 "timestamp": timestamp.isoformat(),
                 "tp_price": tp_price,
                 "pnl": pnl
@@ -273,8 +379,8 @@ class EventLogger:
         """
         self.log_event(
             EventType.TRAILING_STOP_UPDATED,
-            f"Trailing stop updated: {old_price} -> {new_price:.2f}",
-            data={
+            LazyMessage("Trailing stop updated: {} -> {:.2f}", old_price, new_price),
+            data=lambda: {
                 "timestamp": timestamp.isoformat(),
                 "old_price": old_price,
                 "new_price": new_price,
@@ -322,7 +428,7 @@ class EventLogger:
         Returns:
             List of events
         """
-        events = self.events
+        events = list(self.events)
 
         if event_type:
             events = [e for e in events if e.event_type == event_type]
@@ -341,6 +447,7 @@ class EventLogger:
         """
         return {
             "total_events": len(self.events),
+            "dropped_events": self.dropped_events,
             "event_counts": {
                 event_type.value: count
                 for event_type, count in self._event_counts.items()
@@ -371,4 +478,84 @@ class EventLogger:
         """Clear all logged events."""
         self.events.clear()
         self._event_counts.clear()
+        self.dropped_events = 0
         logger.info("EventLogger cleared")
+
+
+class PhaseProfiler:
+    """
+    Wall-clock time per engine phase (signal, exit check, DCA check,
+    snapshot, ...).
+
+    Methods are timed by shadowing them on the instance with a timing
+    wrapper (instrument()), so runs without a profiler pay nothing.
+    """
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.calls: Dict[str, int] = {}
+        self._instrumented: List[tuple] = []
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add one timed call of a phase."""
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def instrument(self, obj: Any, method_name: str, phase: str) -> None:
+        """
+        Time every call of obj.method_name (sync or async) as phase until
+        restore() is called.
+        """
+        method = getattr(obj, method_name)
+        if inspect.iscoroutinefunction(method):
+            @wraps(method)
+            async def timed(*args, **kwargs):
+                started = perf_counter()
+                try:
+                    return await method(*args, **kwargs)
+                finally:
+                    self.add(phase, perf_counter() - started)
+        else:
+            @wraps(method)
+            def timed(*args, **kwargs):
+                started = perf_counter()
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    self.add(phase, perf_counter() - started)
+
+        self._instrumented.append((obj, method_name, obj.__dict__.get(method_name)))
+        setattr(obj, method_name, timed)
+
+    def restore(self) -> None:
+        """Remove every instrument() wrapper."""
+        for obj, method_name, original in reversed(self._instrumented):
+            if original is None:
+                delattr(obj, method_name)
+            else:
+                setattr(obj, method_name, original)
+        self._instrumented.clear()
+
+    def summary(self, total_phase: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Timing per phase.
+
+        Args:
+            total_phase: Phase enclosing the others; adds each phase's
+                share of it
+
+        Returns:
+            {phase: {"calls", "total_seconds", "mean_us"[, "share"]}}
+        """
+        total = self.seconds.get(total_phase) if total_phase else None
+        summary = {}
+        for phase, seconds in self.seconds.items():
+            calls = self.calls[phase]
+            summary[phase] = {
+                "calls": calls,
+                "total_seconds": round(seconds, 6),
+                "mean_us": round(seconds / calls * 1e6, 3),
+            }
+            if total:
+                summary[phase]["share"] = round(seconds / total, 4)
+        return summary
@@ -0,0 +1,130 @@
+"""
+Precomputed indicator matrix for backtest runs.
+
+Computes every fallback indicator the engine and HyperrsiStrategy need
+(RSI, ATR, EMA7/SMA20, trend state) for the whole run once, as arrays,
+instead of rebuilding pandas objects from price_history on every candle.
+
+No-lookahead contract: the value at bar i is computed only from bars
+0..i, so matrix values equal what a per-candle computation over the
+history up to that bar would produce.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.models.candle import Candle
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# calculate_trend_state()와 같은 최소 데이터 요구량
+TREND_MIN_BARS = 200
+EMA_PERIOD = 7
+SMA_PERIOD = 20
+ATR_PERIOD = 14
+
+
+class IndicatorMatrix:
+    """Per-bar indicator arrays indexed by candle timestamp."""
+
+    def __init__(self, timestamps: np.ndarray, columns: Dict[str, np.ndarray]):
+        """
+        Args:
+            timestamps: Epoch nanoseconds per bar (ascending)
+            columns: Indicator name → float64 array (NaN = not available)
+        """
+        self.timestamps = timestamps
+        self.columns = columns
+        self._index = {int(ts): i for i, ts in enumerate(timestamps)}
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_candles(
+        cls,
+        candles: Sequence[Candle],
+        rsi_period: int = 14,
+        timeframe_minutes: Optional[int] = None,
+        mtf_closes: Optional[Dict[str, np.ndarray]] = None
+    ) -> "IndicatorMatrix":
+        """
+        Build the matrix from timestamp-sorted candles (warm-up history first).
+
+        Args:
+            candles: Candles covering warm-up + simulated period
+            rsi_period: RSI period used by the strategy
+            timeframe_minutes: Current timeframe (MTF resampling in trend state)
+            mtf_closes: Higher-timeframe closes aligned to candles, keyed by
+                compute_indicator_arrays() argument (see prefetch_candles);
+                missing ones are resampled from candles
+        """
+        from shared.indicators import compute_indicator_arrays
+
+        timestamps = np.array([pd.Timestamp(c.timestamp).value for c in candles], dtype=np.int64)
+        high = pd.Series([c.high for c in candles], dtype=np.float64)
+        low = pd.Series([c.low for c in candles], dtype=np.float64)
+        close = pd.Series([c.close for c in candles], dtype=np.float64)
+        bar = np.arange(len(candles))
+
+        # SignalGenerator.calculate_rsi / calculate_atr와 같은 단순 이동평균 방식
+        delta = close.diff()
+        avg_gain = delta.where(delta > 0, 0.0).rolling(window=rsi_period).mean()
+        avg_loss = (-delta.where(delta < 0, 0.0)).rolling(window=rsi_period).mean()
+        rsi = (100.0 - (100.0 / (1.0 + avg_gain / avg_loss))).to_numpy()
+        rsi[bar < rsi_period] = np.nan
+
+        tr = pd.concat([high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1).max(axis=1)
+        atr = tr.rolling(window=ATR_PERIOD).mean().to_numpy()
+        atr[bar < ATR_PERIOD] = np.nan
+
+        ema = close.ewm(span=EMA_PERIOD, adjust=False).mean().to_numpy()
+        ema[bar < EMA_PERIOD - 1] = np.nan
+        sma = close.rolling(window=SMA_PERIOD).mean().to_numpy()
+
+        trend_state = np.zeros(len(candles), dtype=np.float64)
+        if len(candles) >= TREND_MIN_BARS:
+            arrays = compute_indicator_arrays(
+                high.to_numpy(), low.to_numpy(), close.to_numpy(), timestamps // 1_000_000_000,
+                rsi_period=rsi_period,
+                atr_period=ATR_PERIOD,
+                current_timeframe_minutes=timeframe_minutes,
+                **(mtf_closes or {}),
+            )
+            trend_state = np.nan_to_num(arrays["trend_state"].astype(np.float64), nan=0.0)
+            trend_state[bar < TREND_MIN_BARS - 1] = 0.0
+
+        return cls(timestamps, {
+            "rsi": rsi,
+            "atr": atr,
+            "ema": ema,
+            "sma": sma,
+            "trend_state": trend_state,
+        })
+
+    def index_of(self, timestamp: datetime) -> Optional[int]:
+        """Bar number of a candle timestamp, None if not in the matrix."""
+        return self._index.get(pd.Timestamp(timestamp).value)
+
+    def value(self, name: str, timestamp: datetime, offset: int = 0) -> Optional[float]:
+        """
+        Indicator value at a bar (offset -1 = previous bar).
+
+        Returns:
+            Value or None when the bar is unknown or the indicator is not
+            yet defined there
+        """
+        i = self.index_of(timestamp)
+        if i is None or not 0 <= i + offset < len(self.timestamps):
+            return None
+        v = self.columns[name][i + offset]
+        return None if v != v else float(v)
+
+    def trend_state(self, timestamp: datetime) -> Optional[int]:
+        v = self.value("trend_state", timestamp)
+        return None if v is None else int(v)
+
@@ -0,0 +1,462 @@
+"""
+Multi-symbol portfolio backtest.
+
+Runs one BacktestEngine per symbol ("leg") against one account:
+  - shared capital: the candle streams of all legs are heap-merged in
+    timestamp order and processed in a single pass. Every leg sizes its
+    entries from the portfolio equity left after the margin held by the
+    other legs, and realized P&L of every leg moves the one portfolio
+    balance (as multi_symbol_service trades in production).
+  - independent capital: every leg trades its own allocation, so legs run
+    in parallel worker processes and their equity curves are summed.
+
+Both modes report per-symbol BacktestResults and combined metrics.
+"""
+
+import asyncio
+import heapq
+import itertools
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+import pandas as pd
+
+from BACKTEST.analysis.metrics_calculator import calculate_performance_metrics
+from BACKTEST.data.candle_array import CandleArrayProvider, array_to_candles, candles_to_array
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.engine.backtest_engine import INDICATOR_WARMUP_BARS, BacktestEngine
+from BACKTEST.engine.balance_tracker import BalanceTracker, lttb_indices
+from BACKTEST.models.result import BacktestResult
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PortfolioLeg:
+    """One symbol of the portfolio."""
+
+    symbol: str
+    strategy_params: Dict[str, Any] = field(default_factory=dict)
+    # 독립 자본 모드의 자본 배분 비중 (전체 비중 합 대비)
+    weight: float = 1.0
+
+
+class LegBalanceTracker(BalanceTracker):
+    """
+    Per-symbol tracker of a shared-capital leg.
+
+    Keeps the leg's own equity curve, measured against the whole account
+    (the leg's P&L contribution), forwards realized P&L to the portfolio
+    tracker and sizes entries from the portfolio's free capital.
+    """
+
+    def __init__(
+        self,
+        initial_balance: float,
+        portfolio: BalanceTracker,
+        available: Callable[[], float],
+        **kwargs
+    ):
+        """
+        Initialize leg tracker.
+
+        Args:
+            initial_balance: Account capital (base of per-symbol metrics)
+            portfolio: Tracker of the combined account
+            available: Free portfolio capital for this leg
+            **kwargs: BalanceTracker sampling options
+        """
+        super().__init__(initial_balance, **kwargs)
+        self.portfolio = portfolio
+        self._available = available
+        self.last_unrealized_pnl = 0.0
+        self.last_position_size = 0.0
+
+    def add_snapshot(
+        self,
+        timestamp: datetime,
+        position_side: Optional[str] = None,
+        position_size: float = 0.0,
+        unrealized_pnl: float = 0.0
+    ) -> None:
+        super().add_snapshot(timestamp, position_side, position_size, unrealized_pnl)
+        self.last_unrealized_pnl = unrealized_pnl
+        self.last_position_size = position_size
+
+    def update_balance(self, pnl: float, fee: float = 0.0) -> None:
+        super().update_balance(pnl, fee)
+        self.portfolio.update_balance(pnl, fee)
+
+    @property
+    def available_balance(self) -> float:
+        return self._available()
+
+    def reset(self) -> None:
+        super().reset()
+        self.last_unrealized_pnl = 0.0
+        self.last_position_size = 0.0
+
+
+def _locked_margin(engine: BacktestEngine) -> float:
+    """Margin held by the open main / dual positions of a leg."""
+    margin = 0.0
+    for manager in (engine.position_manager, engine.dual_position_manager):
+        if manager.has_position():
+            position = manager.get_position()
+            margin += position.entry_price * position.get_current_quantity() / position.leverage
+    return margin
+
+
+def combine_equity_arrays(
+    curves: Sequence[Dict[str, np.ndarray]],
+    initial_values: Sequence[float]
+) -> Dict[str, np.ndarray]:
+    """
+    Sum independent equity curves on the union of their timestamps.
+
+    Each curve is carried forward between its own points and counts as its
+    initial value before its first point.
+
+    Args:
+        curves: BalanceTracker.get_equity_arrays() outputs
+        initial_values: Starting capital per curve
+
+    Returns:
+        {"timestamp", "balance", "equity"} arrays
+    """
+    timestamps = np.unique(np.concatenate([c["timestamp"] for c in curves])) if curves else np.empty(0, dtype=np.int64)
+    balance = np.zeros(len(timestamps))
+    equity = np.zeros(len(timestamps))
+    for curve, initial in zip(curves, initial_values):
+        idx = np.searchsorted(curve["timestamp"], timestamps, side="right") - 1
+        before_start = idx < 0
+        idx = np.maximum(idx, 0)
+        if len(curve["timestamp"]):
+            balance += np.where(before_start, initial, curve["balance"][idx])
+            equity += np.where(before_start, initial, curve["equity"][idx])
+        else:
+            balance += initial
+            equity += initial
+    return {"timestamp": timestamps, "balance": balance, "equity": equity}
+
+
+def _equity_points(arrays: Dict[str, np.ndarray], tz_aware: bool, max_points: Optional[int]) -> List[Dict[str, Any]]:
+    if max_points is not None and len(arrays["timestamp"]) > max_points:
+        keep = lttb_indices(arrays["timestamp"], arrays["equity"], max_points)
+        arrays = {name: column[keep] for name, column in arrays.items()}
+    timestamps = pd.to_datetime(arrays["timestamp"], utc=tz_aware).to_pydatetime()
+    return [
+        {"timestamp": ts.isoformat(), "balance": balance, "equity": equity}
+        for ts, balance, equity in zip(timestamps, arrays["balance"].tolist(), arrays["equity"].tolist())
+    ]
+
+
+def _run_independent_leg(payload: Dict[str, Any]) -> Tuple[BacktestResult, Dict[str, np.ndarray]]:
+    """Run one independent leg in a worker process."""
+    from BACKTEST.jobs.worker import create_strategy
+
+    candles = array_to_candles(
+        payload["data"], payload["columns"], payload["symbol"], payload["timeframe"], payload["data_source"]
+    )
+    engine = BacktestEngine(
+        data_provider=CandleArrayProvider(candles, payload["symbol_info"]),
+        initial_balance=payload["allocation"],
+        fee_rate=payload["fee_rate"],
+        slippage_percent=payload["slippage_percent"],
+        enable_event_logging=payload["enable_event_logging"],
+        equity_sample_every=payload["equity_sample_every"],
+        equity_change_threshold=payload["equity_change_threshold"]
+    )
+    result = asyncio.run(engine.run(
+        user_id=payload["user_id"],
+        symbol=payload["symbol"],
+        timeframe=payload["timeframe"],
+        start_date=payload["start_date"],
+        end_date=payload["end_date"],
+        strategy_name=payload["strategy_name"],
+        strategy_params=payload["strategy_params"],
+        strategy_executor=create_strategy(payload["strategy_name"], payload["strategy_params"]),
+        equity_curve_points=payload["equity_curve_points"]
+    ))
+    return result, engine.balance_tracker.get_equity_arrays()
+
+
+class PortfolioEngine:
+    """Backtests several symbols against one account."""
+
+    def __init__(
+        self,
+        data_provider: DataProvider,
+        initial_balance: float = 10000.0,
+        fee_rate: float = 0.0005,
+        slippage_percent: float = 0.05,
+        share_capital: bool = True,
+        max_workers: Optional[int] = None,
+        enable_event_logging: bool = False,
+        equity_sample_every: int = 1,
+        equity_change_threshold: float = 0.0
+    ):
+        """
+        Initialize portfolio engine.
+
+        Args:
+            data_provider: Data source provider
+            initial_balance: Starting capital of the whole account
+            fee_rate: Trading fee rate
+            slippage_percent: Slippage percentage
+            share_capital: Couple the legs through one balance and margin
+                pool (False = independent allocations, run in parallel)
+            max_workers: Worker processes for independent legs (default:
+                CPU count, capped by the number of legs)
+            enable_event_logging: Keep an EventLogger per leg
+            equity_sample_every / equity_change_threshold: Equity curve
+                sampling (see BalanceTracker)
+        """
+        self.data_provider = data_provider
+        self.initial_balance = initial_balance
+        self.fee_rate = fee_rate
+        self.slippage_percent = slippage_percent
+        self.share_capital = share_capital
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.enable_event_logging = enable_event_logging
+        self.equity_sample_every = equity_sample_every
+        self.equity_change_threshold = equity_change_threshold
+
+    def _allocations(self, legs: Sequence[PortfolioLeg]) -> List[float]:
+        total_weight = sum(leg.weight for leg in legs)
+        if total_weight <= 0 or any(leg.weight < 0 for leg in legs):
+            raise ValueError("Portfolio leg weights must be non-negative with a positive sum")
+        return [self.initial_balance * leg.weight / total_weight for leg in legs]
+
+    async def run(
+        self,
+        user_id: UUID,
+        legs: Sequence[PortfolioLeg],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_name: str = "hyperrsi",
+        equity_curve_points: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the portfolio backtest.
+
+        Args:
+            user_id: User ID
+            legs: Symbols with their strategy parameters (and weights for
+                independent capital)
+            timeframe: Timeframe shared by every leg
+            start_date: Start date
+            end_date: End date
+            strategy_name: Strategy of every leg
+            equity_curve_points: Downsample every equity curve to this many
+                points (LTTB); metrics use the full curves
+
+        Returns:
+            Combined balance, equity curve and metrics plus the per-symbol
+            BacktestResults under "results"
+        """
+        if not legs:
+            raise ValueError("Portfolio needs at least one symbol")
+        symbols = [leg.symbol for leg in legs]
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("Portfolio symbols must be unique")
+
+        started_at = datetime.utcnow()
+        logger.info(
+            f"Starting portfolio backtest: {', '.join(symbols)} {timeframe} "
+            f"from {start_date} to {end_date} (share_capital={self.share_capital})"
+        )
+        allocations = None
+        if self.share_capital:
+            results, combined, tz_aware, final_balance = await self._run_shared(
+                user_id, legs, timeframe, start_date, end_date, strategy_name, equity_curve_points
+            )
+        else:
+            allocations = self._allocations(legs)
+            results, combined, tz_aware, final_balance = await self._run_independent(
+                user_id, legs, allocations, timeframe, start_date, end_date, strategy_name, equity_curve_points
+            )
+
+        trades = [trade for result in results for trade in result.trades]
+        unrealized_pnl = sum(result.unrealized_pnl for result in results)
+        performance = calculate_performance_metrics(trades, combined, self.initial_balance, final_balance)
+        completed_at = datetime.utcnow()
+
+        logger.info(
+            f"Portfolio backtest completed: {len(trades)} trades, "
+            f"Return: {performance['total_return_percent']:.2f}%"
+        )
+        return {
+            "symbols": symbols,
+            "timeframe": timeframe,
+            "start_date": start_date,
+            "end_date": end_date,
+            "strategy_name": strategy_name,
+            "share_capital": self.share_capital,
+            "allocations": dict(zip(symbols, allocations)) if allocations else None,
+            "initial_balance": self.initial_balance,
+            "final_balance": final_balance,
+            "unrealized_pnl": unrealized_pnl,
+            "total_return_percent": performance["total_return_percent"],
+            "max_drawdown_percent": performance["max_drawdown_percent"],
+            "total_trades": performance["total_trades"],
+            "metrics": performance,
+            "equity_curve": _equity_points(combined, tz_aware, equity_curve_points),
+            "results": dict(zip(symbols, results)),
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "execution_time_seconds": (completed_at - started_at).total_seconds(),
+        }
+
+    async def _run_shared(
+        self,
+        user_id: UUID,
+        legs: Sequence[PortfolioLeg],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_name: str,
+        equity_curve_points: Optional[int]
+    ) -> Tuple[List[BacktestResult], Dict[str, np.ndarray], bool, float]:
+        from BACKTEST.jobs.worker import create_strategy
+
+        started_at = datetime.utcnow()
+        portfolio = BalanceTracker(
+            self.initial_balance,
+            sample_every=self.equity_sample_every,
+            change_threshold=self.equity_change_threshold
+        )
+        engines: List[BacktestEngine] = []
+        streams = []
+        last_candles = []
+        total_candles = 0
+
+        def free_capital(own: BacktestEngine) -> float:
+            # 다른 심볼의 미실현 손익을 반영한 자산에서 사용 중인 증거금을 뺀 금액
+            others = [e for e in engines if e is not own]
+            equity = portfolio.current_balance + sum(e.balance_tracker.last_unrealized_pnl for e in others)
+            return max(equity - sum(_locked_margin(e) for e in others), 0.0)
+
+        for index, leg in enumerate(legs):
+            engine = BacktestEngine(
+                data_provider=self.data_provider,
+                initial_balance=self.initial_balance,
+                fee_rate=self.fee_rate,
+                slippage_percent=self.slippage_percent,
+                enable_event_logging=self.enable_event_logging
+            )
+            engine.balance_tracker = LegBalanceTracker(
+                self.initial_balance,
+                portfolio,
+                available=lambda engine=engine: free_capital(engine),
+                sample_every=self.equity_sample_every,
+                change_threshold=self.equity_change_threshold
+            )
+            engine.is_running = True
+            await engine._prepare(leg.symbol, timeframe, create_strategy(strategy_name, leg.strategy_params))
+            candles = await engine._load_run_candles(start_date, end_date)
+            engine.balance_tracker.reserve(len(candles) // self.equity_sample_every + 1)
+            engines.append(engine)
+            streams.append(zip((c.timestamp for c in candles), itertools.repeat(index), candles))
+            last_candles.append(candles[-1])
+            total_candles += len(candles)
+        portfolio.reserve(total_candles // self.equity_sample_every + 1)
+
+        try:
+            # 심볼별 캔들 스트림을 시간순으로 병합 (같은 시각은 심볼 순서대로)
+            merged = heapq.merge(*streams, key=lambda item: (item[0], item[1]))
+            for timestamp, group in itertools.groupby(merged, key=lambda item: item[0]):
+                for _, index, candle in group:
+                    engine = engines[index]
+                    engine.current_candle = candle
+                    await engine._process_candle(candle, engine.strategy_executor)
+                portfolio.add_snapshot(
+                    timestamp=timestamp,
+                    position_size=sum(e.balance_tracker.last_position_size for e in engines),
+                    unrealized_pnl=sum(e.balance_tracker.last_unrealized_pnl for e in engines)
+                )
+        finally:
+            for engine in engines:
+                engine.is_running = False
+
+        results = [
+            engine._build_result(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                strategy_name=strategy_name,
+                strategy_params=leg.strategy_params,
+                started_at=started_at,
+                last_candle=last_candle,
+                equity_curve_points=equity_curve_points
+            )
+            for engine, leg, last_candle in zip(engines, legs, last_candles)
+        ]
+        combined = portfolio.get_equity_arrays()
+        tz_aware = last_candles[0].timestamp.tzinfo is not None
+        return results, combined, tz_aware, portfolio.current_balance
+
+    async def _run_independent(
+        self,
+        user_id: UUID,
+        legs: Sequence[PortfolioLeg],
+        allocations: Sequence[float],
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        strategy_name: str,
+        equity_curve_points: Optional[int]
+    ) -> Tuple[List[BacktestResult], Dict[str, np.ndarray], bool, float]:
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        # 캔들은 부모에서 한 번 로드 (워커는 DB 연결 없이 메모리 provider 사용)
+        load_start = start_date - timeframe_to_timedelta(timeframe) * INDICATOR_WARMUP_BARS
+        payloads = []
+        for leg, allocation in zip(legs, allocations):
+            candles = await self.data_provider.get_candles(leg.symbol, timeframe, load_start, end_date)
+            if not candles:
+                raise ValueError(f"No candles returned from data provider for {leg.symbol}")
+            data, columns = candles_to_array(candles)
+            payloads.append({
+                "data": data,
+                "columns": columns,
+                "data_source": candles[0].data_source,
+                "tz_aware": candles[0].timestamp.tzinfo is not None,
+                "symbol": leg.symbol,
+                "symbol_info": await self.data_provider.get_symbol_info(leg.symbol),
+                "timeframe": timeframe,
+                "start_date": start_date,
+                "end_date": end_date,
+                "user_id": user_id,
+                "strategy_name": strategy_name,
+                "strategy_params": leg.strategy_params,
+                "allocation": allocation,
+                "fee_rate": self.fee_rate,
+                "slippage_percent": self.slippage_percent,
+                "enable_event_logging": self.enable_event_logging,
+                "equity_sample_every": self.equity_sample_every,
+                "equity_change_threshold": self.equity_change_threshold,
+                "equity_curve_points": equity_curve_points,
+            })
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=min(self.max_workers, len(payloads)),
+            mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            outputs = await asyncio.gather(*(
+                loop.run_in_executor(executor, _run_independent_leg, payload) for payload in payloads
+            ))
+
+        results = [result for result, _ in outputs]
+        combined = combine_equity_arrays([curve for _, curve in outputs], allocations)
+        tz_aware = payloads[0]["tz_aware"]
+        return results, combined, tz_aware, sum(result.final_balance for result in results)
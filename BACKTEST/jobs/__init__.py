@@ -0,0 +1,23 @@
+"""
+Background backtest jobs (process pool + progress streaming).
+"""
+
+from BACKTEST.jobs.manager import (
+    BacktestJob,
+    BacktestJobManager,
+    JobLimitExceededError,
+    JobStatus,
+    get_job_manager,
+)
+from BACKTEST.jobs.worker import BacktestCancelledError, create_strategy, run_backtest_job
+
+__all__ = [
+    "BacktestJob",
+    "BacktestJobManager",
+    "JobLimitExceededError",
+    "JobStatus",
+    "get_job_manager",
+    "BacktestCancelledError",
+    "create_strategy",
+    "run_backtest_job",
+]
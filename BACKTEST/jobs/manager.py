@@ -0,0 +1,330 @@
+"""
+Backtest job manager.
+
+Runs backtests in a process pool so the candle loop never blocks the API
+event loop. Jobs are queued when all workers are busy, stream progress
+events to subscribers (SSE), can be cancelled, and persist their result
+through BacktestRepository when they finish.
+"""
+
+import asyncio
+import multiprocessing
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from BACKTEST.config import backtest_config
+from BACKTEST.jobs.worker import BacktestCancelledError, run_backtest_job
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class JobStatus(str, Enum):
+    """Backtest job lifecycle."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobLimitExceededError(Exception):
+    """Raised when the node already has the maximum number of pending jobs."""
+
+
+@dataclass
+class BacktestJob:
+    """In-memory state of one backtest job."""
+
+    job_id: str
+    request: Dict[str, Any]
+    status: JobStatus = JobStatus.QUEUED
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    processed: int = 0
+    total: int = 0
+    trades: int = 0
+    backtest_id: Optional[UUID] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    error_type: Optional[str] = None
+    persist: bool = True
+    cancel_event: Any = None
+    future: Any = None
+    subscribers: List[asyncio.Queue] = field(default_factory=list)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Job status without the result payload."""
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "symbol": self.request.get("symbol"),
+            "timeframe": self.request.get("timeframe"),
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "processed": self.processed,
+            "total": self.total,
+            "progress_percent": round(self.processed / self.total * 100, 2) if self.total else 0.0,
+            "trades": self.trades,
+            "backtest_id": str(self.backtest_id) if self.backtest_id else None,
+            "error": self.error,
+            "error_type": self.error_type,
+        }
+
+
+class BacktestJobManager:
+    """Process-pool backed backtest job queue (one instance per API node)."""
+
+    def __init__(
+        self,
+        max_workers: int = backtest_config.MAX_CONCURRENT_BACKTESTS,
+        max_pending: int = backtest_config.MAX_PENDING_BACKTESTS,
+        max_finished: int = backtest_config.MAX_FINISHED_BACKTEST_JOBS,
+        progress_interval: int = backtest_config.BACKTEST_PROGRESS_INTERVAL,
+        job_fn: Callable[..., Dict[str, Any]] = run_backtest_job,
+        mp_start_method: str = "spawn"
+    ):
+        """
+        Initialize job manager.
+
+        Args:
+            max_workers: Backtests running at the same time on this node
+            max_pending: Queued + running jobs accepted before rejecting new ones
+            max_finished: Finished jobs kept in memory for status/result lookups
+            progress_interval: Candles between progress events
+            job_fn: Worker entry point (module-level, picklable)
+            mp_start_method: multiprocessing start method. "spawn" keeps
+                inherited DB/Redis connections out of the workers.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self.progress_interval = progress_interval
+        self.job_fn = job_fn
+        self.mp_start_method = mp_start_method
+
+        self._jobs: "OrderedDict[str, BacktestJob]" = OrderedDict()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._mp_manager = None
+        self._events = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._drain_thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> None:
+        """Start the worker pool (call from the running event loop)."""
+        if self._executor is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        ctx = multiprocessing.get_context(self.mp_start_method)
+        self._mp_manager = ctx.Manager()
+        self._events = self._mp_manager.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=ctx)
+        self._stopping.clear()
+        self._drain_thread = threading.Thread(target=self._drain_events, name="backtest-job-events", daemon=True)
+        self._drain_thread.start()
+        logger.info(f"BacktestJobManager started: workers={self.max_workers}, max_pending={self.max_pending}")
+
+    def shutdown(self) -> None:
+        """Cancel outstanding jobs and stop the pool."""
+        if self._executor is None:
+            return
+        for job in self._jobs.values():
+            if not job.finished:
+                self._request_cancel(job)
+        self._stopping.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._drain_thread:
+            self._drain_thread.join(timeout=2)
+        self._mp_manager.shutdown()
+        self._executor = None
+        logger.info("BacktestJobManager stopped")
+
+    # ==================== Jobs ====================
+
+    def submit(self, request: Dict[str, Any], persist: bool = True) -> BacktestJob:
+        """
+        Queue a backtest.
+
+        Args:
+            request: BacktestRunRequest fields in JSON mode (+ optional user_id)
+            persist: Save the completed result via BacktestRepository
+
+        Raises:
+            JobLimitExceededError: Too many queued/running jobs on this node
+            RuntimeError: Manager not started
+        """
+        if self._executor is None:
+            raise RuntimeError("BacktestJobManager is not started")
+        pending = sum(1 for job in self._jobs.values() if not job.finished)
+        if pending >= self.max_pending:
+            raise JobLimitExceededError(f"Too many pending backtests ({pending}/{self.max_pending})")
+
+        job = BacktestJob(job_id=str(uuid4()), request=request, persist=persist)
+        job.cancel_event = self._mp_manager.Event()
+        job.future = self._executor.submit(
+            self.job_fn, job.job_id, request, self._events, job.cancel_event, self.progress_interval
+        )
+        self._jobs[job.job_id] = job
+        self._loop.create_task(self._watch(job))
+        logger.info(f"Backtest job queued: {job.job_id} {request.get('symbol')} {request.get('timeframe')}")
+        return job
+
+    def get(self, job_id: str) -> Optional[BacktestJob]:
+        return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[BacktestJob]:
+        return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job.
+
+        Returns:
+            False if the job does not exist or already finished
+        """
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return False
+        self._request_cancel(job)
+        return True
+
+    def _request_cancel(self, job: BacktestJob) -> None:
+        # 대기 중이면 future 취소로 끝나고, 실행 중이면 워커가 다음 진행 콜백에서 중단
+        job.cancel_event.set()
+        job.future.cancel()
+
+    async def wait(self, job_id: str) -> BacktestJob:
+        """Wait until the job finishes."""
+        job = self._jobs[job_id]
+        async for _ in self.subscribe(job_id):
+            pass
+        return job
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield job status snapshots until the job finishes.
+
+        The first snapshot is the current state; the last one has a
+        finished status.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise KeyError(job_id)
+        updates: asyncio.Queue = asyncio.Queue()
+        job.subscribers.append(updates)
+        try:
+            snapshot = job.to_dict()
+            while True:
+                yield snapshot
+                if job.finished:
+                    return
+                snapshot = await updates.get()
+                # 밀린 진행 이벤트는 최신 상태만 전달
+                while not updates.empty():
+                    snapshot = updates.get_nowait()
+        finally:
+            job.subscribers.remove(updates)
+
+    # ==================== Internals ====================
+
+    def _drain_events(self) -> None:
+        """Forward worker progress events to the event loop."""
+        while not self._stopping.is_set():
+            try:
+                event = self._events.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            except (EOFError, OSError):
+                return
+            self._loop.call_soon_threadsafe(self._apply_event, event)
+
+    def _apply_event(self, event: Dict[str, Any]) -> None:
+        job = self._jobs.get(event.get("job_id"))
+        if job is None or job.finished:
+            return
+        if event["type"] == "started":
+            job.status = JobStatus.RUNNING
+            job.started_at = datetime.utcnow()
+        elif event["type"] == "progress":
+            job.status = JobStatus.RUNNING
+            job.processed = event["processed"]
+            job.total = event["total"]
+            job.trades = event["trades"]
+        self._publish(job)
+
+    def _publish(self, job: BacktestJob) -> None:
+        snapshot = job.to_dict()
+        for updates in job.subscribers:
+            updates.put_nowait(snapshot)
+
+    async def _watch(self, job: BacktestJob) -> None:
+        try:
+            job.result = await asyncio.wrap_future(job.future)
+            # 마지막 진행 이벤트보다 future 완료가 먼저 도착할 수 있음
+            if job.total:
+                job.processed = job.total
+            job.trades = job.result.get("total_trades", job.trades)
+            if job.persist:
+                try:
+                    job.backtest_id = await self._persist(job.result)
+                except Exception as e:
+                    # 결과는 메모리에 남아 있으므로 작업 자체는 완료로 처리
+                    logger.error(f"Failed to persist backtest job result: {job.job_id} - {e}")
+                    job.error = f"Result persistence failed: {e}"
+            job.status = JobStatus.COMPLETED
+        except (CancelledError, asyncio.CancelledError, BacktestCancelledError):
+            job.status = JobStatus.CANCELLED
+        except Exception as e:
+            logger.error(f"Backtest job failed: {job.job_id} - {e}")
+            job.status = JobStatus.FAILED
+            job.error = str(e)
+            job.error_type = type(e).__name__
+        finally:
+            job.finished_at = datetime.utcnow()
+            self._publish(job)
+            self._prune_finished()
+            logger.info(f"Backtest job {job.status.value}: {job.job_id}")
+
+    async def _persist(self, result: Dict[str, Any]) -> UUID:
+        from BACKTEST.models.result import BacktestResult
+        from BACKTEST.storage.backtest_repository import BacktestRepository
+        from shared.database.session import DatabaseConfig
+
+        session_factory = DatabaseConfig.get_session_factory()
+        async with session_factory() as session:
+            return await BacktestRepository(session).save(BacktestResult(**result))
+
+    def _prune_finished(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+
+_job_manager: Optional[BacktestJobManager] = None
+
+
+def get_job_manager() -> BacktestJobManager:
+    """Get the node-wide job manager (created on first use)."""
+    global _job_manager
+    if _job_manager is None:
+        _job_manager = BacktestJobManager()
+    return _job_manager
@@ -0,0 +1,114 @@
+"""
+Backtest job worker.
+
+Entry point executed inside the job process pool. Each job runs the
+CPU-bound candle loop in its own process with its own event loop and
+database engine, and reports progress back through a shared queue.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from BACKTEST.strategies import HyperrsiStrategy
+
+# Default user until auth is wired into the backtest API
+DEFAULT_USER_ID = UUID("00000000-0000-0000-0000-000000000000")
+
+
+class BacktestCancelledError(Exception):
+    """Raised inside the worker when the job's cancel event is set."""
+
+
+def create_strategy(strategy_name: str, strategy_params: Dict[str, Any]):
+    """
+    Create and validate a strategy instance.
+
+    Raises:
+        ValueError: Unknown strategy or invalid parameters
+    """
+    if strategy_name.lower() == "hyperrsi":
+        strategy = HyperrsiStrategy(strategy_params)
+        strategy.validate_params()
+        return strategy
+    raise ValueError(f"Unknown strategy: {strategy_name}. Supported strategies: hyperrsi")
+
+
+def run_backtest_job(
+    job_id: str,
+    request: Dict[str, Any],
+    events,
+    cancel_event,
+    progress_interval: int = 500
+) -> Dict[str, Any]:
+    """
+    Run one backtest in a worker process.
+
+    Args:
+        job_id: Job ID (attached to every progress event)
+        request: BacktestRunRequest fields (JSON-compatible)
+        events: Manager queue for progress events
+        cancel_event: Manager event set by BacktestJobManager.cancel()
+        progress_interval: Candles between progress events
+
+    Returns:
+        BacktestResult dumped in JSON mode
+    """
+    return asyncio.run(_run(job_id, request, events, cancel_event, progress_interval))
+
+
+async def _run(job_id, request, events, cancel_event, progress_interval) -> Dict[str, Any]:
+    from BACKTEST.config import backtest_config
+    from BACKTEST.data import create_backtest_data_provider
+    from BACKTEST.engine import BacktestEngine
+
+    if cancel_event.is_set():
+        raise BacktestCancelledError(job_id)
+    events.put({"job_id": job_id, "type": "started"})
+
+    def on_progress(processed: int, total: int, trades: int) -> None:
+        # 큐 전송 전에 취소 여부를 확인하여 다음 진행 구간까지 기다리지 않음
+        if cancel_event.is_set():
+            raise BacktestCancelledError(job_id)
+        events.put({
+            "job_id": job_id,
+            "type": "progress",
+            "processed": processed,
+            "total": total,
+            "trades": trades,
+        })
+
+    data_provider = create_backtest_data_provider()
+    try:
+        engine = BacktestEngine(
+            data_provider=data_provider,
+            initial_balance=request["initial_balance"],
+            fee_rate=request["fee_rate"],
+            slippage_percent=request["slippage_percent"],
+            equity_sample_every=backtest_config.EQUITY_CURVE_SAMPLE_EVERY,
+            equity_change_threshold=backtest_config.EQUITY_CURVE_CHANGE_THRESHOLD,
+            enable_profiling=backtest_config.PROFILE_PHASES
+        )
+        strategy = create_strategy(request["strategy_name"], request["strategy_params"])
+
+        result = await engine.run(
+            user_id=UUID(request["user_id"]) if request.get("user_id") else DEFAULT_USER_ID,
+            symbol=request["symbol"],
+            timeframe=request["timeframe"],
+            start_date=_as_datetime(request["start_date"]),
+            end_date=_as_datetime(request["end_date"]),
+            strategy_name=request["strategy_name"],
+            strategy_params=request["strategy_params"],
+            strategy_executor=strategy,
+            progress_callback=on_progress,
+            progress_interval=progress_interval,
+            equity_curve_points=request.get("equity_curve_points")
+        )
+        return result.model_dump(mode="json")
+    finally:
+        await data_provider.close()
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
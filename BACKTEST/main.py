@@ -13,6 +13,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from BACKTEST.config import backtest_config
+from BACKTEST.jobs import get_job_manager
 from shared.logging import get_logger
 from shared.database.session import init_db
 from shared.api.health import router as health_router
@@ -100,12 +101,17 @@ async def lifespan(_app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
 
+    # Start backtest job workers
+    job_manager = get_job_manager()
+    job_manager.start()
+
     logger.info(f"BACKTEST service started on port {backtest_config.PORT}")
 
     yield  # Application runs here
 
     # Shutdown
     logger.info("Shutting down BACKTEST service...")
+    job_manager.shutdown()
 
 
 # Initialize FastAPI app with lifespan
@@ -140,9 +146,10 @@ async def root():
 
 
 # Import and include routers
-from BACKTEST.api.routes import backtest, results, candles
+from BACKTEST.api.routes import backtest, results, candles, jobs
 
 app.include_router(health_router, prefix="/health", tags=["health"])
+app.include_router(jobs.router, prefix="/backtest/jobs", tags=["backtest-jobs"])
 app.include_router(backtest.router, prefix="/backtest", tags=["backtest"])
 app.include_router(results.router, prefix="/api", tags=["results"])
 app.include_router(candles.router, prefix="/candles", tags=["candles"])
@@ -2,13 +2,16 @@
 Backtest data models.
 """
 
-from BACKTEST.models.candle import Candle
+from BACKTEST.models.candle import Candle, CandleRecord, validate_candle_batch, to_candle_records
 from BACKTEST.models.trade import Trade, TradeSide, ExitReason
 from BACKTEST.models.position import Position
 from BACKTEST.models.result import BacktestResult
 
 __all__ = [
     "Candle",
+    "CandleRecord",
+    "validate_candle_batch",
+    "to_candle_records",
     "Trade",
     "TradeSide",
     "ExitReason",
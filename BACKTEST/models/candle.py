@@ -1,9 +1,18 @@
 """
 Candle data model for backtesting system.
+
+Candle is the validated pydantic model used at API boundaries.
+CandleRecord is the slotted, unvalidated equivalent the data providers and
+the engine hot loop use; batches are checked once with
+validate_candle_batch() against the same field constraints.
 """
 
+import operator
+from dataclasses import dataclass, fields
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -96,3 +105,111 @@ class Candle(BaseModel):
         if self.low > min(self.open, self.close, self.high):
             return False
         return True
+
+
+@dataclass(slots=True)
+class CandleRecord:
+    """
+    Lightweight candle for internal engine use.
+
+    Same fields and defaults as Candle, without per-instance validation
+    (see BACKTEST/scripts/benchmark_candles.py for memory/load time). Validate
+    batches with validate_candle_batch() and convert with to_model() only
+    where a pydantic Candle is required.
+    """
+
+    timestamp: datetime
+    symbol: str
+    timeframe: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    rsi: Optional[float] = None
+    atr: Optional[float] = None
+    ema: Optional[float] = None
+    sma: Optional[float] = None
+    bollinger_upper: Optional[float] = None
+    bollinger_middle: Optional[float] = None
+    bollinger_lower: Optional[float] = None
+    macd: Optional[float] = None
+    macd_signal: Optional[float] = None
+    macd_histogram: Optional[float] = None
+    trend_state: Optional[int] = None
+    auto_trend_state: Optional[int] = None
+    CYCLE_Bull: Optional[bool] = None
+    CYCLE_Bear: Optional[bool] = None
+    BB_State: Optional[int] = None
+    data_source: str = "unknown"
+    is_complete: bool = True
+
+    @classmethod
+    def from_model(cls, candle: Candle) -> "CandleRecord":
+        return cls(**{name: getattr(candle, name) for name in CANDLE_FIELDS})
+
+    def to_model(self) -> Candle:
+        """Pydantic Candle with the same values (batch already validated)."""
+        return Candle.model_construct(**self.model_dump())
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Field dict, same keys as Candle.model_dump()."""
+        return {name: getattr(self, name) for name in CANDLE_FIELDS}
+
+    def validate_ohlc(self) -> bool:
+        """Validate OHLC relationships."""
+        return Candle.validate_ohlc(self)
+
+
+CANDLE_FIELDS = tuple(f.name for f in fields(CandleRecord))
+
+_BOUND_OPS = {"gt": operator.gt, "ge": operator.ge, "lt": operator.lt, "le": operator.le}
+
+
+def _field_bounds() -> Dict[str, List[tuple]]:
+    """Numeric constraints declared on Candle fields (gt/ge/lt/le)."""
+    bounds: Dict[str, List[tuple]] = {}
+    for name, info in Candle.model_fields.items():
+        for meta in info.metadata:
+            for kind in _BOUND_OPS:
+                limit = getattr(meta, kind, None)
+                if limit is not None:
+                    bounds.setdefault(name, []).append((kind, limit))
+    return bounds
+
+
+_FIELD_BOUNDS = _field_bounds()
+
+
+def validate_candle_batch(records: Sequence[CandleRecord]) -> None:
+    """
+    Check a batch of records against the Candle field constraints at once.
+
+    Raises:
+        ValueError: First violated constraint, with the offending timestamp
+    """
+    if not records:
+        return
+    for name, bounds in _FIELD_BOUNDS.items():
+        required = Candle.model_fields[name].is_required()
+        values = np.fromiter(
+            (np.nan if (v := getattr(r, name)) is None else v for r in records),
+            dtype=np.float64,
+            count=len(records)
+        )
+        missing = np.isnan(values)
+        invalid = missing if required else np.zeros(len(records), dtype=bool)
+        with np.errstate(invalid="ignore"):
+            for kind, limit in bounds:
+                invalid |= ~missing & ~_BOUND_OPS[kind](values, limit)
+        if invalid.any():
+            i = int(np.argmax(invalid))
+            raise ValueError(
+                f"Invalid candle at {records[i].timestamp}: {name}={getattr(records[i], name)} "
+                f"violates {', '.join(f'{kind} {limit}' for kind, limit in bounds)}"
+            )
+
+
+def to_candle_records(candles: Iterable[Any]) -> List[CandleRecord]:
+    """Convert pydantic Candles (records pass through unchanged)."""
+    return [c if isinstance(c, CandleRecord) else CandleRecord.from_model(c) for c in candles]
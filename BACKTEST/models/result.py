@@ -109,56 +109,46 @@ class BacktestResult(BaseModel):
             }
         }
 
-    def calculate_metrics(self) -> None:
-        """Calculate all performance metrics from trade history."""
+    def calculate_metrics(self, stats: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Calculate all performance metrics from trade history.
+
+        Args:
+            stats: Precomputed trade statistics (trade_statistics or
+                calculate_performance_metrics output); computed from
+                self.trades when omitted
+        """
         if not self.trades:
             return
 
-        closed_trades = [t for t in self.trades if not t.is_open]
+        if stats is None:
+            from BACKTEST.analysis.trade_analyzer import TradeArrays, trade_statistics
+            stats = trade_statistics(TradeArrays.from_trades(self.trades))
 
-        if not closed_trades:
+        if not stats["total_trades"]:
             return
 
-        # Count wins/losses
-        winners = [t for t in closed_trades if t.pnl and t.pnl > 0]
-        losers = [t for t in closed_trades if t.pnl and t.pnl < 0]
-
-        self.total_trades = len(closed_trades)
-        self.winning_trades = len(winners)
-        self.losing_trades = len(losers)
-
-        # Win rate
-        if self.total_trades > 0:
-            self.win_rate = (self.winning_trades / self.total_trades) * 100
+        self.total_trades = stats["total_trades"]
+        self.winning_trades = stats["winning_trades"]
+        self.losing_trades = stats["losing_trades"]
+        self.win_rate = stats["win_rate"]
 
         # Average win/loss
-        if winners:
-            self.avg_win = sum(t.pnl for t in winners) / len(winners)
-            self.largest_win = max(t.pnl for t in winners)
-
-        if losers:
-            self.avg_loss = sum(t.pnl for t in losers) / len(losers)
-            self.largest_loss = min(t.pnl for t in losers)
-
-        # Profit factor
-        total_profit = sum(t.pnl for t in winners) if winners else 0
-        total_loss = abs(sum(t.pnl for t in losers)) if losers else 0
-        if total_loss > 0:
-            self.profit_factor = total_profit / total_loss
+        self.avg_win = stats["avg_win"]
+        self.largest_win = stats["largest_win"]
+        self.avg_loss = stats["avg_loss"]
+        self.largest_loss = stats["largest_loss"]
+        self.profit_factor = stats["profit_factor"]
 
         # Total return
         self.total_return = self.final_balance - self.initial_balance
         if self.initial_balance > 0:
             self.total_return_percent = (self.total_return / self.initial_balance) * 100
 
-        # Average trade duration
-        durations = [t.duration_seconds for t in closed_trades if t.duration_seconds]
-        if durations:
-            avg_seconds = sum(durations) / len(durations)
-            self.avg_trade_duration_minutes = avg_seconds / 60
+        if stats["avg_trade_duration_minutes"] is not None:
+            self.avg_trade_duration_minutes = stats["avg_trade_duration_minutes"]
 
-        # Total fees
-        self.total_fees_paid = sum(t.total_fees for t in closed_trades)
+        self.total_fees_paid = stats["total_fees_paid"]
 
     def calculate_sharpe_ratio(self, risk_free_rate: float = 0.0) -> float:
         """
@@ -173,23 +163,6 @@ class BacktestResult(BaseModel):
         if not self.trades:
             return 0.0
 
-        import numpy as np
-
-        # Get returns from closed trades
-        returns = [
-            t.pnl_percent for t in self.trades
-            if not t.is_open and t.pnl_percent is not None
-        ]
-
-        if len(returns) < 2:
-            return 0.0
-
-        returns_array = np.array(returns)
-        mean_return = np.mean(returns_array)
-        std_return = np.std(returns_array)
-
-        if std_return == 0:
-            return 0.0
+        from BACKTEST.analysis.trade_analyzer import TradeArrays, trade_return_ratios
 
-        sharpe = (mean_return - risk_free_rate) / std_return
-        return float(sharpe)
+        return trade_return_ratios(TradeArrays.from_trades(self.trades), risk_free_rate)["sharpe_ratio"]
@@ -0,0 +1,23 @@
+"""
+Strategy parameter optimization (parallel sweeps).
+"""
+
+from BACKTEST.optimization.grid_search import (
+    CandleArrayProvider,
+    GridSearch,
+    SweepPool,
+    expand_param_grid,
+    params_key,
+    rank_results,
+)
+from BACKTEST.optimization.parameter_optimizer import ParameterOptimizer
+
+__all__ = [
+    "CandleArrayProvider",
+    "GridSearch",
+    "SweepPool",
+    "expand_param_grid",
+    "params_key",
+    "rank_results",
+    "ParameterOptimizer",
+]
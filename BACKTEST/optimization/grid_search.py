@@ -0,0 +1,485 @@
+"""
+Parallel grid search for strategy parameters.
+
+Candles are loaded once, written to a read-only memory-mapped array and
+shared by every worker process. Each worker rebuilds the Candle list once
+and then runs one BacktestEngine per parameter combination against an
+in-memory data provider. Finished combinations are appended to a JSONL
+checkpoint so an interrupted sweep resumes where it stopped.
+
+SweepPool exposes the same workers for other studies (walk-forward folds,
+Monte Carlo cost scenarios): a task may override the run window and the
+fee/slippage settings of the sweep.
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+
+from BACKTEST.data.candle_array import CandleArrayProvider, array_to_candles, candles_to_array
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.models.candle import Candle
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 요약에 포함하는 BacktestResult 지표 (랭킹 키로 사용 가능)
+SUMMARY_METRICS = (
+    "total_return_percent",
+    "sharpe_ratio",
+    "sortino_ratio",
+    "max_drawdown_percent",
+    "win_rate",
+    "profit_factor",
+    "total_trades",
+    "final_balance",
+    "total_fees_paid",
+)
+
+CHECKPOINT_VERSION = 1
+
+# 작업(task)별로 덮어쓸 수 있는 sweep 설정
+TASK_OVERRIDES = ("start_date", "end_date", "fee_rate", "slippage_percent")
+
+
+# ==================== Parameter grid ====================
+
+def _expand_values(name: str, spec: Any) -> List[Any]:
+    """
+    Parameter range spec → list of values.
+
+    Accepts a list of values, a scalar, or {"start", "stop", "step"}
+    (stop inclusive).
+    """
+    if isinstance(spec, dict):
+        try:
+            start, stop, step = spec["start"], spec["stop"], spec["step"]
+        except KeyError as e:
+            raise ValueError(f"Range for {name} needs start/stop/step: missing {e}")
+        if step <= 0:
+            raise ValueError(f"Range step for {name} must be positive")
+        count = int(round((stop - start) / step)) + 1
+        values = [start + i * step for i in range(max(count, 0))]
+        if all(isinstance(v, int) for v in (start, stop, step)):
+            return values
+        return [round(v, 10) for v in values]
+    if isinstance(spec, (list, tuple)):
+        if not spec:
+            raise ValueError(f"Empty value list for {name}")
+        return list(spec)
+    return [spec]
+
+
+def expand_param_grid(
+    param_ranges: Dict[str, Any],
+    base_params: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Cartesian product of parameter ranges, merged over base_params.
+
+    Args:
+        param_ranges: {name: [values] | {"start", "stop", "step"} | value}
+        base_params: Fixed strategy params applied to every combination
+
+    Returns:
+        Parameter dicts in deterministic order
+    """
+    names = sorted(param_ranges)
+    value_lists = [_expand_values(name, param_ranges[name]) for name in names]
+    base = dict(base_params or {})
+    return [{**base, **dict(zip(names, values))} for values in itertools.product(*value_lists)]
+
+
+def params_key(params: Dict[str, Any]) -> str:
+    """Stable identity of a parameter combination (checkpoint key)."""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+# ==================== Worker ====================
+
+# 워커 프로세스 전역 상태 (initializer에서 한 번 설정)
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(array_path: str, sweep: Dict[str, Any], quiet: bool) -> None:
+    data = np.load(array_path, mmap_mode="r")
+    candles = array_to_candles(
+        data, [tuple(c) for c in sweep["columns"]], sweep["symbol"], sweep["timeframe"], sweep["data_source"]
+    )
+    _worker["provider"] = CandleArrayProvider(candles, sweep["symbol_info"])
+    _worker["sweep"] = sweep
+    _worker["loop"] = asyncio.new_event_loop()
+    # (RSI 기간, 구간)별 지표 매트릭스 (조합 간 재사용)
+    _worker["matrices"] = {}
+    if quiet:
+        # 조합마다 반복되는 엔진/전략 INFO 로그 억제
+        import BACKTEST.engine  # noqa: F401
+        import BACKTEST.strategies  # noqa: F401
+        for name in list(logging.root.manager.loggerDict):
+            if name.startswith("BACKTEST.") and not name.startswith("BACKTEST.optimization"):
+                logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def _run_task(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one backtest in a worker (returns a summary row).
+
+    Args:
+        task: {"params": strategy params} plus optional TASK_OVERRIDES
+            (ISO dates / rates); other keys are copied into the row
+    """
+    from BACKTEST.engine import BacktestEngine
+    from BACKTEST.jobs.worker import create_strategy
+
+    params = task["params"]
+    settings = {**_worker["sweep"], **{k: task[k] for k in TASK_OVERRIDES if k in task}}
+    row: Dict[str, Any] = {"key": params_key(params), "params": params}
+    row.update({k: v for k, v in task.items() if k != "params" and k not in TASK_OVERRIDES})
+    try:
+        strategy = create_strategy(settings["strategy_name"], params)
+        engine = BacktestEngine(
+            data_provider=_worker["provider"],
+            initial_balance=settings["initial_balance"],
+            fee_rate=settings["fee_rate"],
+            slippage_percent=settings["slippage_percent"],
+            enable_event_logging=False
+        )
+        rsi_period = getattr(getattr(strategy, "signal_generator", None), "rsi_period", None)
+        matrix_key = (rsi_period, settings["start_date"], settings["end_date"])
+        result = _worker["loop"].run_until_complete(engine.run(
+            user_id=UUID(int=0),
+            symbol=settings["symbol"],
+            timeframe=settings["timeframe"],
+            start_date=datetime.fromisoformat(settings["start_date"]),
+            end_date=datetime.fromisoformat(settings["end_date"]),
+            strategy_name=settings["strategy_name"],
+            strategy_params=params,
+            strategy_executor=strategy,
+            indicator_matrix=_worker["matrices"].get(matrix_key)
+        ))
+        _worker["matrices"].setdefault(matrix_key, engine.indicator_matrix)
+        row["metrics"] = {name: getattr(result, name) for name in SUMMARY_METRICS}
+    except Exception as e:
+        row["error"] = f"{type(e).__name__}: {e}"
+    return row
+
+
+class SweepPool:
+    """
+    Worker processes sharing one memory-mapped candle array.
+
+    The array is written once on enter; every worker rebuilds its candle
+    list from it and keeps it (and its indicator matrices) for all tasks
+    submitted through run().
+    """
+
+    def __init__(self, candles: List[Candle], sweep: Dict[str, Any], max_workers: int):
+        """
+        Initialize pool.
+
+        Args:
+            candles: Timestamp-sorted candles covering every task window
+                (plus warm-up)
+            sweep: Default task settings: symbol, timeframe, start_date,
+                end_date (ISO), strategy_name, initial_balance, fee_rate,
+                slippage_percent, symbol_info
+            max_workers: Worker processes
+        """
+        if not candles:
+            raise ValueError("No candles for the worker pool")
+        self.candles = candles
+        self.sweep = sweep
+        self.max_workers = max_workers
+        self._tmp_dir: Optional[str] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "SweepPool":
+        self._tmp_dir = tempfile.mkdtemp(prefix="grid_search_")
+        try:
+            data, columns = candles_to_array(self.candles)
+            array_path = os.path.join(self._tmp_dir, "candles.npy")
+            np.save(array_path, data)
+            del data
+            sweep = {**self.sweep, "columns": columns, "data_source": self.candles[0].data_source}
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(array_path, sweep, True)
+            )
+        except BaseException:
+            shutil.rmtree(self._tmp_dir, ignore_errors=True)
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def run(self, tasks: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Run tasks (see _run_task) and yield rows in completion order."""
+        if self._executor is None:
+            raise RuntimeError("SweepPool must be used as a context manager")
+        # 대기 중인 future 수를 제한하여 결과가 대략 제출 순서대로 나오도록 함
+        max_in_flight = self.max_workers * 4
+        remaining = iter(tasks)
+        in_flight = {self._executor.submit(_run_task, t) for t in itertools.islice(remaining, max_in_flight)}
+        while in_flight:
+            finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                yield future.result()
+            in_flight |= {self._executor.submit(_run_task, t) for t in itertools.islice(remaining, len(finished))}
+
+
+# ==================== Ranking ====================
+
+def rank_results(results: Iterable[Dict[str, Any]], rank_by: Sequence[str]) -> List[Dict[str, Any]]:
+    """
+    Sort summary rows by metrics.
+
+    Args:
+        rank_by: Metric names, best first. Prefix "-" to rank ascending
+            (e.g. "-total_fees_paid"). Later metrics break ties.
+            Failed or missing values sort last.
+    """
+    def sort_key(row):
+        metrics = row.get("metrics") or {}
+        key = []
+        for spec in rank_by:
+            ascending = spec.startswith("-")
+            value = metrics.get(spec.lstrip("-"))
+            if value is None or value != value:
+                key.append(float("inf"))
+            else:
+                key.append(value if ascending else -value)
+        return key
+
+    return sorted((r for r in results if "metrics" in r), key=sort_key)
+
+
+# ==================== Grid search ====================
+
+class GridSearch:
+    """Parallel parameter sweep over one symbol/timeframe/period."""
+
+    def __init__(
+        self,
+        symbol: str,
+        timeframe: str,
+        start_date: datetime,
+        end_date: datetime,
+        param_ranges: Dict[str, Any],
+        base_params: Optional[Dict[str, Any]] = None,
+        strategy_name: str = "hyperrsi",
+        rank_by: Sequence[str] = ("sharpe_ratio", "total_return_percent"),
+        min_trades: int = 1,
+        top_n: int = 20,
+        initial_balance: float = 10000.0,
+        fee_rate: float = 0.0005,
+        slippage_percent: float = 0.05,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        warmup_candles: int = 200,
+        combinations: Optional[List[Dict[str, Any]]] = None
+    ):
+        """
+        Initialize grid search.
+
+        Args:
+            param_ranges: Ranges per parameter (see expand_param_grid)
+            base_params: Fixed params applied to every combination
+            rank_by: Ranking metrics (see rank_results)
+            min_trades: Combinations with fewer trades are not ranked
+            top_n: Rows kept in the result's top list
+            max_workers: Worker processes (default: CPU count)
+            checkpoint_path: JSONL file for resumable results
+            warmup_candles: Extra candles loaded before start_date for
+                indicator history
+            combinations: Explicit combinations (overrides param_ranges)
+        """
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.start_date = start_date
+        self.end_date = end_date
+        self.param_ranges = param_ranges
+        self.base_params = dict(base_params or {})
+        self.strategy_name = strategy_name
+        self.rank_by = list(rank_by)
+        self.min_trades = min_trades
+        self.top_n = top_n
+        self.initial_balance = initial_balance
+        self.fee_rate = fee_rate
+        self.slippage_percent = slippage_percent
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.checkpoint_path = checkpoint_path
+        self.warmup_candles = warmup_candles
+        self.combinations = combinations if combinations is not None else expand_param_grid(param_ranges, base_params)
+
+    # ---------- checkpoint ----------
+
+    def _fingerprint(self) -> Dict[str, Any]:
+        return {
+            "version": CHECKPOINT_VERSION,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "strategy_name": self.strategy_name,
+            "initial_balance": self.initial_balance,
+            "fee_rate": self.fee_rate,
+            "slippage_percent": self.slippage_percent,
+        }
+
+    def load_checkpoint(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Completed rows from the checkpoint, keyed by params_key.
+
+        Failed rows are skipped so a resume retries those combinations.
+
+        Raises:
+            ValueError: Checkpoint belongs to a different sweep
+        """
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+        done: Dict[str, Dict[str, Any]] = {}
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    row = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단 시점에 잘린 마지막 줄
+                    logger.warning(f"Skipping truncated checkpoint line {line_no + 1}")
+                    continue
+                if line_no == 0 and "sweep" in row:
+                    if row["sweep"] != self._fingerprint():
+                        raise ValueError(f"Checkpoint {self.checkpoint_path} belongs to a different sweep")
+                    continue
+                if "error" in row:
+                    continue
+                done[row["key"]] = row
+        return done
+
+    def _open_checkpoint(self):
+        if not self.checkpoint_path:
+            return None
+        size = os.path.getsize(self.checkpoint_path) if os.path.exists(self.checkpoint_path) else 0
+        if size:
+            with open(self.checkpoint_path, "rb") as f:
+                f.seek(size - 1)
+                ends_with_newline = f.read(1) == b"\n"
+        f = open(self.checkpoint_path, "a", encoding="utf-8")
+        if not size:
+            f.write(json.dumps({"sweep": self._fingerprint()}) + "\n")
+        elif not ends_with_newline:
+            # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 줄바꿈 추가
+            f.write("\n")
+        f.flush()
+        return f
+
+    # ---------- run ----------
+
+    async def load_candles(self, data_provider: DataProvider) -> Tuple[List[Candle], Optional[dict]]:
+        """Load candles (with warm-up history) and symbol info once."""
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        load_start = self.start_date - timeframe_to_timedelta(self.timeframe) * self.warmup_candles
+        candles = await data_provider.get_candles(self.symbol, self.timeframe, load_start, self.end_date)
+        symbol_info = await data_provider.get_symbol_info(self.symbol)
+        return candles, symbol_info
+
+    async def run_async(
+        self,
+        data_provider: DataProvider,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """Load candles through data_provider, then run the sweep in a thread."""
+        candles, symbol_info = await self.load_candles(data_provider)
+        return await asyncio.to_thread(self.run, candles, symbol_info, progress_callback)
+
+    def run(
+        self,
+        candles: List[Candle],
+        symbol_info: Optional[dict] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run every combination not already in the checkpoint.
+
+        Args:
+            candles: Timestamp-sorted candles covering warm-up + test period
+            symbol_info: DataProvider.get_symbol_info() result
+            progress_callback: Called with (completed, total) after each row
+
+        Returns:
+            Summary with best params, top rows and counts
+        """
+        if not candles:
+            raise ValueError("No candles to run the sweep on")
+
+        started_at = datetime.utcnow()
+        done = self.load_checkpoint()
+        pending = [p for p in self.combinations if params_key(p) not in done]
+        total = len(self.combinations)
+        logger.info(
+            f"Grid search {self.symbol} {self.timeframe}: {total} combinations, "
+            f"{total - len(pending)} from checkpoint, {self.max_workers} workers"
+        )
+
+        checkpoint = self._open_checkpoint()
+        try:
+            if pending:
+                sweep = {**self._fingerprint(), "symbol_info": symbol_info}
+                with SweepPool(candles, sweep, self.max_workers) as pool:
+                    for row in pool.run({"params": p} for p in pending):
+                        done[row["key"]] = row
+                        if "error" in row:
+                            # 체크포인트에 남기지 않음 (재개 시 재시도)
+                            logger.warning(f"Combination failed: {row['params']} - {row['error']}")
+                        elif checkpoint:
+                            checkpoint.write(json.dumps(row, default=str) + "\n")
+                            checkpoint.flush()
+                        if progress_callback:
+                            progress_callback(len(done), total)
+        finally:
+            if checkpoint:
+                checkpoint.close()
+
+        return self._summarize(done, total, started_at)
+
+    def _summarize(self, done: Dict[str, Dict[str, Any]], total: int, started_at: datetime) -> Dict[str, Any]:
+        keys = {params_key(p) for p in self.combinations}
+        rows = [row for key, row in done.items() if key in keys]
+        eligible = [r for r in rows if "metrics" in r and (r["metrics"].get("total_trades") or 0) >= self.min_trades]
+        ranked = rank_results(eligible, self.rank_by)
+        completed_at = datetime.utcnow()
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "strategy_name": self.strategy_name,
+            "rank_by": self.rank_by,
+            "best_params": ranked[0]["params"] if ranked else None,
+            "best_metrics": ranked[0]["metrics"] if ranked else None,
+            "top_results": ranked[:self.top_n],
+            "total_combinations": total,
+            "completed_combinations": len(rows),
+            "failed_combinations": sum(1 for r in rows if "error" in r),
+            "started_at": started_at,
+            "completed_at": completed_at,
+            "execution_time_seconds": (completed_at - started_at).total_seconds(),
+        }
@@ -0,0 +1,136 @@
+"""
+Parameter optimizer.
+
+Maps an OptimizationRequest onto a GridSearch sweep. Supports exhaustive
+grid search and seeded random sampling of the grid (max_iterations).
+
+CLI:
+    python -m BACKTEST.optimization.parameter_optimizer request.json \
+        --checkpoint sweep.jsonl --workers 8
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from BACKTEST.api.schemas.request import OptimizationRequest
+from BACKTEST.optimization.grid_search import GridSearch, expand_param_grid
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+OPTIMIZATION_METHODS = ("grid_search", "random_search")
+
+
+class ParameterOptimizer:
+    """Runs OptimizationRequest sweeps."""
+
+    def __init__(
+        self,
+        request: OptimizationRequest,
+        base_params: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        seed: int = 0
+    ):
+        """
+        Initialize optimizer.
+
+        Args:
+            request: Optimization request (param_ranges, metric, method)
+            base_params: Fixed strategy params shared by every combination
+            max_workers: Worker processes (default: CPU count)
+            checkpoint_path: JSONL checkpoint for resume
+            seed: Sampling seed for random_search (keeps resume stable)
+        """
+        if request.optimization_method not in OPTIMIZATION_METHODS:
+            raise ValueError(
+                f"Unknown optimization method: {request.optimization_method}. "
+                f"Supported: {', '.join(OPTIMIZATION_METHODS)}"
+            )
+        self.request = request
+
+        combinations = expand_param_grid(request.param_ranges, base_params)
+        if request.optimization_method == "random_search" and len(combinations) > request.max_iterations:
+            combinations = random.Random(seed).sample(combinations, request.max_iterations)
+
+        self.grid_search = GridSearch(
+            symbol=request.symbol,
+            timeframe=request.timeframe,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            param_ranges=request.param_ranges,
+            base_params=base_params,
+            strategy_name=request.strategy_name,
+            rank_by=[request.optimization_metric],
+            initial_balance=request.initial_balance,
+            max_workers=max_workers,
+            checkpoint_path=checkpoint_path,
+            combinations=combinations
+        )
+
+    async def run(self, data_provider=None, progress_callback=None) -> Dict[str, Any]:
+        """
+        Run the sweep.
+
+        Returns:
+            dict compatible with OptimizationResultResponse
+        """
+        from BACKTEST.data import create_backtest_data_provider
+
+        provider = data_provider or create_backtest_data_provider()
+        try:
+            summary = await self.grid_search.run_async(provider, progress_callback)
+        finally:
+            if data_provider is None:
+                await provider.close()
+
+        best = summary["best_metrics"] or {}
+        metric = self.request.optimization_metric
+        return {
+            "optimization_id": uuid4(),
+            "optimization_method": self.request.optimization_method,
+            "optimization_metric": metric,
+            "best_params": summary["best_params"] or {},
+            "best_score": best.get(metric) or 0.0,
+            **{k: summary[k] for k in (
+                "symbol", "timeframe", "strategy_name", "total_combinations", "completed_combinations",
+                "started_at", "completed_at", "execution_time_seconds", "top_results",
+            )},
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a parameter sweep from an OptimizationRequest JSON file")
+    parser.add_argument("request", help="OptimizationRequest JSON (may include base_params)")
+    parser.add_argument("--checkpoint", help="JSONL checkpoint path (resume if it exists)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--output", help="Write the result JSON here")
+    args = parser.parse_args()
+
+    with open(args.request, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    base_params = payload.pop("base_params", None)
+    optimizer = ParameterOptimizer(
+        OptimizationRequest(**payload),
+        base_params=base_params,
+        max_workers=args.workers,
+        checkpoint_path=args.checkpoint
+    )
+
+    def progress(done: int, total: int) -> None:
+        if done == total or done % 50 == 0:
+            logger.info(f"Sweep progress: {done}/{total}")
+
+    result = asyncio.run(optimizer.run(progress_callback=progress))
+    logger.info(f"Best params ({result['optimization_metric']}={result['best_score']}): {result['best_params']}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, default=str, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
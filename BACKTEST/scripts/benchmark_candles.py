@@ -0,0 +1,64 @@
+"""
+Benchmark: pydantic Candle vs slotted CandleRecord.
+
+Measures load time (construction + validation) and memory per candle for a
+synthetic year of 1m candles shaped like TimescaleProvider rows.
+
+Usage:
+    python -m BACKTEST.scripts.benchmark_candles [--count 525600]
+"""
+
+import argparse
+import gc
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+from BACKTEST.models.candle import Candle, CandleRecord, validate_candle_batch
+
+
+def _rows(count: int):
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(count):
+        price = 40000.0 + (i % 500)
+        yield dict(
+            timestamp=start + timedelta(minutes=i), symbol="BTC-USDT-SWAP", timeframe="1m",
+            open=price, high=price + 10, low=price - 10, close=price + 1, volume=12.5,
+            rsi=50.0, atr=20.0, ema=price, sma=price, trend_state=0, auto_trend_state=0,
+            CYCLE_Bull=False, CYCLE_Bear=False, BB_State=0, data_source="candlesdb",
+        )
+
+
+def _measure(label: str, build, rows) -> None:
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    candles = build(rows)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<28} {elapsed:8.2f}s  {current / len(candles):8.0f} B/candle  "
+        f"{current / 2**20:8.1f} MiB total"
+    )
+
+
+def _records(rows):
+    records = [CandleRecord(**row) for row in rows]
+    validate_candle_batch(records)
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=525_600, help="Candles (default: one year of 1m)")
+    args = parser.parse_args()
+
+    rows = list(_rows(args.count))
+    print(f"{args.count} candles")
+    _measure("Candle (pydantic)", lambda rs: [Candle(**row) for row in rs], rows)
+    _measure("CandleRecord + batch check", _records, rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark: backtest result persistence throughput.
+
+Saves a synthetic result (one equity point per candle) to the configured
+PostgreSQL database (DATABASE_URL) and reports rows per second for:
+  - per-row INSERTs (previous BacktestRepository behaviour)
+  - BacktestRepository bulk insert ("rows" equity curve storage)
+  - BacktestRepository "compressed" equity curve storage
+Every saved run is deleted again afterwards.
+
+Requires migrations/backtest up to 006_add_equity_curve_compressed.sql.
+
+Usage:
+    python -m BACKTEST.scripts.benchmark_result_persistence [--snapshots 100000] [--trades 2000]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import text
+
+from BACKTEST.models.result import BacktestResult
+from BACKTEST.models.trade import ExitReason, Trade, TradeSide
+from BACKTEST.storage.backtest_repository import SNAPSHOT_COLUMNS, BacktestRepository
+from shared.database.session import DatabaseConfig
+
+
+def _result(snapshots: int, trades: int) -> BacktestResult:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    equity_curve = [
+        {
+            "timestamp": (start + timedelta(minutes=i)).isoformat(),
+            "balance": 10000.0 + i * 0.01,
+            "equity": 10000.0 + i * 0.011,
+            "cumulative_pnl": i * 0.01,
+        }
+        for i in range(snapshots)
+    ]
+    trade_list = [
+        Trade(
+            trade_number=i + 1, side=TradeSide.LONG if i % 2 else TradeSide.SHORT,
+            entry_timestamp=start + timedelta(minutes=10 * i), entry_price=40000.0 + i,
+            exit_timestamp=start + timedelta(minutes=10 * i + 5), exit_price=40010.0 + i,
+            exit_reason=ExitReason.TAKE_PROFIT, quantity=0.01, leverage=10,
+            pnl=1.0, pnl_percent=0.25, entry_fee=0.2, exit_fee=0.2, entry_rsi=30.0,
+        )
+        for i in range(trades)
+    ]
+    return BacktestResult(
+        id=uuid4(), user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="1m",
+        start_date=start, end_date=start + timedelta(minutes=snapshots),
+        strategy_name="hyperrsi", strategy_params={}, status="completed",
+        started_at=start, completed_at=start, initial_balance=10000.0, final_balance=10000.0,
+        total_trades=trades, trades=trade_list, equity_curve=equity_curve,
+    )
+
+
+async def _per_row_baseline(session, result: BacktestResult) -> None:
+    """Previous behaviour: one INSERT round trip per equity point."""
+    repository = BacktestRepository(session, equity_curve_storage="rows")
+    equity_curve, result.equity_curve = result.equity_curve, []
+    await repository.save(result)
+    query = text(
+        f"INSERT INTO backtest_balance_snapshots ({', '.join(SNAPSHOT_COLUMNS)}) VALUES "
+        f"({', '.join(':' + c for c in SNAPSHOT_COLUMNS)})"
+    )
+    for point in equity_curve:
+        await session.execute(query, {
+            "backtest_id": str(result.id),
+            "timestamp": datetime.fromisoformat(point["timestamp"]),
+            "balance": point["balance"],
+            "equity": point["equity"],
+            "cumulative_pnl": point["cumulative_pnl"],
+            "cumulative_trades": 0,
+        })
+    await session.commit()
+    result.equity_curve = equity_curve
+
+
+async def _run(label: str, save, snapshots: int, trades: int) -> None:
+    result = _result(snapshots, trades)
+    session_factory = DatabaseConfig.get_session_factory()
+    async with session_factory() as session:
+        started = time.perf_counter()
+        await save(session, result)
+        elapsed = time.perf_counter() - started
+        await session.execute(text("DELETE FROM backtest_runs WHERE id = :id"), {"id": str(result.id)})
+        await session.commit()
+    rows = snapshots + trades
+    print(f"{label:<24} {elapsed:8.2f}s  {rows / elapsed:12,.0f} rows/s")
+
+
+async def main_async(snapshots: int, trades: int) -> None:
+    print(f"{snapshots} equity points, {trades} trades")
+    await _run("per-row INSERT", _per_row_baseline, snapshots, trades)
+    await _run(
+        "bulk (rows)",
+        lambda session, result: BacktestRepository(session, equity_curve_storage="rows").save(result),
+        snapshots, trades
+    )
+    await _run(
+        "bulk (compressed curve)",
+        lambda session, result: BacktestRepository(session, equity_curve_storage="compressed").save(result),
+        snapshots, trades
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--snapshots", type=int, default=100_000, help="Equity curve points")
+    parser.add_argument("--trades", type=int, default=2_000, help="Trades")
+    args = parser.parse_args()
+    asyncio.run(main_async(args.snapshots, args.trades))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ Provides database access layer for backtest results using repository pattern.
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from uuid import UUID
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,31 +13,70 @@ import json
 
 from BACKTEST.models.result import BacktestResult
 from BACKTEST.models.trade import Trade, TradeSide, ExitReason
+from BACKTEST.storage.equity_codec import decode_equity_curve, encode_equity_curve
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 청크당 행 수 (COPY 배치 / 다중 VALUES 문)
+BULK_CHUNK_SIZE = 5000
+# PostgreSQL 바인드 파라미터 한도 (다중 VALUES 문)
+MAX_BIND_PARAMS = 32767
+
+EQUITY_CURVE_STORAGE_MODES = ("rows", "compressed")
+
+TRADE_COLUMNS = (
+    "backtest_id", "trade_number", "side",
+    "entry_timestamp", "entry_price", "entry_reason",
+    "exit_timestamp", "exit_price", "exit_reason",
+    "quantity", "leverage",
+    "pnl", "pnl_percent",
+    "entry_fee", "exit_fee",
+    "take_profit_price", "stop_loss_price", "trailing_stop_price",
+    "tp1_price", "tp2_price", "tp3_price",
+    "entry_rsi", "entry_atr",
+    "dca_count", "entry_history", "total_investment",
+    "is_partial_exit", "tp_level", "exit_ratio", "remaining_quantity",
+)
+
+SNAPSHOT_COLUMNS = (
+    "backtest_id", "timestamp", "balance", "equity",
+    "cumulative_pnl", "cumulative_trades",
+)
+
 
 class BacktestRepository:
     """Repository for backtest result persistence."""
 
-    def __init__(self, session: AsyncSession):
+    def __init__(self, session: AsyncSession, equity_curve_storage: Optional[str] = None):
         """
         Initialize repository with database session.
 
         Args:
             session: SQLAlchemy async session
+            equity_curve_storage: "rows" (backtest_balance_snapshots) or
+                "compressed" (backtest_runs.equity_curve_compressed).
+                Default: EQUITY_CURVE_STORAGE setting
         """
+        from BACKTEST.config import backtest_config
+
         self.session = session
+        self.equity_curve_storage = equity_curve_storage or backtest_config.EQUITY_CURVE_STORAGE
+        if self.equity_curve_storage not in EQUITY_CURVE_STORAGE_MODES:
+            raise ValueError(
+                f"Unknown equity curve storage: {self.equity_curve_storage}. "
+                f"Supported: {', '.join(EQUITY_CURVE_STORAGE_MODES)}"
+            )
 
     async def save(self, result: BacktestResult) -> UUID:
         """
         Save backtest result to database with transaction safety.
 
-        Saves to three tables:
+        Saves to three tables in one transaction:
         - backtest_runs (main result)
-        - backtest_trades (trade history)
-        - backtest_balance_snapshots (equity curve)
+        - backtest_trades (trade history, bulk insert)
+        - backtest_balance_snapshots (equity curve, bulk insert) or
+          backtest_runs.equity_curve_compressed in "compressed" mode
 
         Args:
             result: Backtest result to save
@@ -113,6 +152,45 @@ class BacktestRepository:
             logger.error(f"❌ Failed to save backtest result: {e}", exc_info=True)
             raise
 
+    async def _bulk_insert(self, table: str, columns: Sequence[str], rows: List[tuple]) -> None:
+        """
+        Insert rows in chunks inside the session's current transaction.
+
+        Uses COPY through the asyncpg connection when available, otherwise
+        multi-row INSERT ... VALUES statements.
+        """
+        connection = await self._asyncpg_connection()
+        if connection is not None:
+            for i in range(0, len(rows), BULK_CHUNK_SIZE):
+                await connection.copy_records_to_table(
+                    table, records=rows[i:i + BULK_CHUNK_SIZE], columns=list(columns)
+                )
+            return
+
+        chunk_size = min(BULK_CHUNK_SIZE, MAX_BIND_PARAMS // len(columns))
+        for i in range(0, len(rows), chunk_size):
+            chunk = rows[i:i + chunk_size]
+            values = ", ".join(
+                "(" + ", ".join(f":p{r}_{c}" for c in range(len(columns))) + ")"
+                for r in range(len(chunk))
+            )
+            params = {f"p{r}_{c}": value for r, row in enumerate(chunk) for c, value in enumerate(row)}
+            await self.session.execute(
+                text(f"INSERT INTO {table} ({', '.join(columns)}) VALUES {values}"),
+                params
+            )
+
+    async def _asyncpg_connection(self):
+        """Driver connection of the session when running on asyncpg (else None)."""
+        try:
+            import asyncpg
+        except ImportError:
+            return None
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        driver_connection = getattr(raw, "driver_connection", None)
+        return driver_connection if isinstance(driver_connection, asyncpg.Connection) else None
+
     async def _save_trades(self, backtest_id: UUID, trades: List[Trade]) -> None:
         """
         Save trade history to database.
@@ -121,67 +199,42 @@ class BacktestRepository:
             backtest_id: Parent backtest run ID
             trades: List of trades to save
         """
-        trade_query = text("""
-            INSERT INTO backtest_trades (
-                backtest_id, trade_number, side,
-                entry_timestamp, entry_price, entry_reason,
-                exit_timestamp, exit_price, exit_reason,
-                quantity, leverage,
-                pnl, pnl_percent,
-                entry_fee, exit_fee,
-                take_profit_price, stop_loss_price, trailing_stop_price,
-                tp1_price, tp2_price, tp3_price,
-                entry_rsi, entry_atr,
-                dca_count, entry_history, total_investment,
-                is_partial_exit, tp_level, exit_ratio, remaining_quantity
-            ) VALUES (
-                :backtest_id, :trade_number, :side,
-                :entry_timestamp, :entry_price, :entry_reason,
-                :exit_timestamp, :exit_price, :exit_reason,
-                :quantity, :leverage,
-                :pnl, :pnl_percent,
-                :entry_fee, :exit_fee,
-                :take_profit_price, :stop_loss_price, :trailing_stop_price,
-                :tp1_price, :tp2_price, :tp3_price,
-                :entry_rsi, :entry_atr,
-                :dca_count, :entry_history, :total_investment,
-                :is_partial_exit, :tp_level, :exit_ratio, :remaining_quantity
+        rows = [
+            (
+                str(backtest_id),
+                trade.trade_number,
+                trade.side.value if isinstance(trade.side, TradeSide) else trade.side,
+                trade.entry_timestamp,
+                trade.entry_price,
+                trade.entry_reason,
+                trade.exit_timestamp,
+                trade.exit_price,
+                trade.exit_reason.value if isinstance(trade.exit_reason, ExitReason) else trade.exit_reason,
+                trade.quantity,
+                trade.leverage,
+                trade.pnl,
+                trade.pnl_percent,
+                trade.entry_fee,
+                trade.exit_fee,
+                trade.take_profit_price,
+                trade.stop_loss_price,
+                trade.trailing_stop_price,
+                getattr(trade, 'tp1_price', None),
+                getattr(trade, 'tp2_price', None),
+                getattr(trade, 'tp3_price', None),
+                trade.entry_rsi,
+                trade.entry_atr,
+                trade.dca_count,
+                json.dumps(trade.entry_history) if trade.entry_history else None,
+                trade.total_investment,
+                trade.is_partial_exit,
+                trade.tp_level,
+                trade.exit_ratio,
+                trade.remaining_quantity,
             )
-        """)
-
-        for trade in trades:
-            await self.session.execute(trade_query, {
-                'backtest_id': str(backtest_id),
-                'trade_number': trade.trade_number,
-                'side': trade.side.value if isinstance(trade.side, TradeSide) else trade.side,
-                'entry_timestamp': trade.entry_timestamp,
-                'entry_price': trade.entry_price,
-                'entry_reason': trade.entry_reason,
-                'exit_timestamp': trade.exit_timestamp,
-                'exit_price': trade.exit_price,
-                'exit_reason': trade.exit_reason.value if isinstance(trade.exit_reason, ExitReason) else trade.exit_reason,
-                'quantity': trade.quantity,
-                'leverage': trade.leverage,
-                'pnl': trade.pnl,
-                'pnl_percent': trade.pnl_percent,
-                'entry_fee': trade.entry_fee,
-                'exit_fee': trade.exit_fee,
-                'take_profit_price': trade.take_profit_price,
-                'stop_loss_price': trade.stop_loss_price,
-                'trailing_stop_price': trade.trailing_stop_price,
-                'tp1_price': getattr(trade, 'tp1_price', None),
-                'tp2_price': getattr(trade, 'tp2_price', None),
-                'tp3_price': getattr(trade, 'tp3_price', None),
-                'entry_rsi': trade.entry_rsi,
-                'entry_atr': trade.entry_atr,
-                'dca_count': trade.dca_count,
-                'entry_history': json.dumps(trade.entry_history) if trade.entry_history else None,
-                'total_investment': trade.total_investment,
-                'is_partial_exit': trade.is_partial_exit,
-                'tp_level': trade.tp_level,
-                'exit_ratio': trade.exit_ratio,
-                'remaining_quantity': trade.remaining_quantity
-            })
+            for trade in trades
+        ]
+        await self._bulk_insert("backtest_trades", TRADE_COLUMNS, rows)
 
         logger.info(f"✅ Saved {len(trades)} trades for backtest {backtest_id}")
 
@@ -193,31 +246,30 @@ class BacktestRepository:
             backtest_id: Parent backtest run ID
             equity_curve: List of balance snapshots
         """
-        snapshot_query = text("""
-            INSERT INTO backtest_balance_snapshots (
-                backtest_id, timestamp, balance, equity,
-                cumulative_pnl, cumulative_trades
-            ) VALUES (
-                :backtest_id, :timestamp, :balance, :equity,
-                :cumulative_pnl, :cumulative_trades
+        if self.equity_curve_storage == "compressed":
+            await self.session.execute(
+                text("UPDATE backtest_runs SET equity_curve_compressed = :blob WHERE id = :id"),
+                {'id': str(backtest_id), 'blob': encode_equity_curve(equity_curve)}
             )
-        """)
+            logger.info(f"✅ Saved {len(equity_curve)} compressed snapshots for backtest {backtest_id}")
+            return
 
+        rows = []
         for snapshot in equity_curve:
             # Parse timestamp if it's a string
             timestamp = snapshot.get('timestamp')
             if isinstance(timestamp, str):
-                from datetime import datetime
                 timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
 
-            await self.session.execute(snapshot_query, {
-                'backtest_id': str(backtest_id),
-                'timestamp': timestamp,
-                'balance': snapshot.get('balance'),
-                'equity': snapshot.get('equity', snapshot.get('balance')),
-                'cumulative_pnl': snapshot.get('pnl', 0),
-                'cumulative_trades': snapshot.get('trade_number', 0)
-            })
+            rows.append((
+                str(backtest_id),
+                timestamp,
+                snapshot.get('balance'),
+                snapshot.get('equity', snapshot.get('balance')),
+                snapshot.get('cumulative_pnl', snapshot.get('pnl', 0)),
+                snapshot.get('trade_number', 0),
+            ))
+        await self._bulk_insert("backtest_balance_snapshots", SNAPSHOT_COLUMNS, rows)
 
         logger.info(f"✅ Saved {len(equity_curve)} snapshots for backtest {backtest_id}")
 
@@ -364,6 +416,16 @@ class BacktestRepository:
 
     async def _get_equity_curve(self, backtest_id: UUID) -> List[Dict[str, Any]]:
         """Get equity curve snapshots for a backtest run."""
+        if self.equity_curve_storage == "compressed":
+            result = await self.session.execute(
+                text("SELECT equity_curve_compressed FROM backtest_runs WHERE id = :id"),
+                {'id': str(backtest_id)}
+            )
+            blob = result.scalar()
+            # 압축 저장 이전에 저장된 실행은 스냅샷 테이블에서 조회
+            if blob is not None:
+                return decode_equity_curve(bytes(blob))
+
         snapshot_query = text("""
             SELECT
                 timestamp, balance, equity,
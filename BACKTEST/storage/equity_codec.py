@@ -0,0 +1,66 @@
+"""
+Compressed equity curve encoding.
+
+Packs an equity curve into one zlib-compressed NumPy structured array so a
+backtest run can store it in a single BYTEA column
+(backtest_runs.equity_curve_compressed) instead of one
+backtest_balance_snapshots row per point.
+"""
+
+import io
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import numpy as np
+
+EQUITY_CURVE_DTYPE = np.dtype([
+    ("timestamp", "<i8"),  # epoch microseconds (UTC)
+    ("balance", "<f8"),
+    ("equity", "<f8"),
+    ("pnl", "<f8"),
+    ("trade_number", "<i8"),
+])
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _timestamp_us(value: Any) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def encode_equity_curve(equity_curve: List[Dict[str, Any]]) -> bytes:
+    """Equity curve points (engine or repository shape) → compressed bytes."""
+    data = np.empty(len(equity_curve), dtype=EQUITY_CURVE_DTYPE)
+    for i, point in enumerate(equity_curve):
+        balance = point.get("balance")
+        data[i] = (
+            _timestamp_us(point["timestamp"]),
+            balance,
+            point.get("equity", balance),
+            point.get("cumulative_pnl", point.get("pnl", 0)) or 0,
+            point.get("trade_number", 0) or 0,
+        )
+    buf = io.BytesIO()
+    np.save(buf, data, allow_pickle=False)
+    return zlib.compress(buf.getvalue())
+
+
+def decode_equity_curve(blob: bytes) -> List[Dict[str, Any]]:
+    """Inverse of encode_equity_curve, in the repository's equity curve shape."""
+    data = np.load(io.BytesIO(zlib.decompress(blob)), allow_pickle=False)
+    return [
+        {
+            "timestamp": (_EPOCH + ts * _MICROSECOND).isoformat(),
+            "balance": balance,
+            "equity": equity,
+            "pnl": pnl,
+            "trade_number": trade_number,
+        }
+        for ts, balance, equity, pnl, trade_number in data.tolist()
+    ]
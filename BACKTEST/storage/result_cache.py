@@ -0,0 +1,208 @@
+"""
+Content-addressed backtest result cache.
+
+Results are stored in Redis (zlib-compressed JSON) under a SHA-256 of the
+canonical run request, the engine code version and the data watermark of
+the candle window (including the indicator warm-up bars). Newer or backfilled candles change the watermark, code
+changes change the code version, so stale entries are never hit; they
+simply expire (RESULT_CACHE_TTL_SECONDS).
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "backtest:result_cache"
+
+# 결과에 영향을 주는 코드 (엔진/전략/모델/지표/데이터 로딩)
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CODE_VERSION_PATHS = (
+    "BACKTEST/data",
+    "BACKTEST/engine",
+    "BACKTEST/strategies",
+    "BACKTEST/models",
+    "BACKTEST/analysis",
+    "BACKTEST/jobs/worker.py",
+    "shared/indicators",
+)
+
+
+@lru_cache(maxsize=1)
+def engine_code_version() -> str:
+    """SHA-256 over the source files that determine backtest results."""
+    digest = hashlib.sha256()
+    for relative in CODE_VERSION_PATHS:
+        path = os.path.join(_REPO_ROOT, relative)
+        if os.path.isfile(path):
+            files = [path]
+        else:
+            files = sorted(
+                os.path.join(root, name)
+                for root, dirs, names in os.walk(path)
+                if "tests" not in os.path.relpath(root, path).split(os.sep)
+                for name in names if name.endswith(".py")
+            )
+        for file in files:
+            digest.update(os.path.relpath(file, _REPO_ROOT).encode())
+            with open(file, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _canonical(value: Any) -> Any:
+    """JSON-stable form: sorted dicts, integral floats as ints, ISO datetimes."""
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in sorted(value.items(), key=lambda item: str(item[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def cache_key(request: Dict[str, Any], code_version: str, watermark: Dict[str, Any], generation: int = 0) -> str:
+    """
+    Canonical hash of one backtest run.
+
+    Args:
+        request: BacktestRunRequest fields in JSON mode (user_id ignored)
+        code_version: engine_code_version()
+        watermark: DataProvider.get_data_watermark() of the run window
+        generation: Invalidation counter of the symbol/timeframe
+    """
+    from BACKTEST.config import backtest_config
+
+    payload = {
+        "request": {k: v for k, v in request.items() if k != "user_id"},
+        "engine": {
+            "code_version": code_version,
+            "equity_sample_every": backtest_config.EQUITY_CURVE_SAMPLE_EVERY,
+            "equity_change_threshold": backtest_config.EQUITY_CURVE_CHANGE_THRESHOLD,
+        },
+        "watermark": watermark,
+        "generation": generation,
+    }
+    encoded = json.dumps(_canonical(payload), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class BacktestResultCache:
+    """Redis-backed result cache for identical backtest runs."""
+
+    def __init__(self, redis=None, data_provider=None, ttl_seconds: Optional[int] = None):
+        """
+        Initialize cache.
+
+        Args:
+            redis: Async Redis client returning bytes (default: shared
+                binary connection)
+            data_provider: Provider answering get_data_watermark()
+                (default: TimescaleProvider)
+            ttl_seconds: Entry lifetime (default: RESULT_CACHE_TTL_SECONDS)
+        """
+        from BACKTEST.config import backtest_config
+
+        self._redis = redis
+        self._data_provider = data_provider
+        self._own_provider = data_provider is None
+        self.ttl_seconds = ttl_seconds or backtest_config.RESULT_CACHE_TTL_SECONDS
+
+    async def _get_redis(self):
+        if self._redis is None:
+            from shared.database.redis import get_redis_binary
+            self._redis = await get_redis_binary()
+        return self._redis
+
+    @property
+    def data_provider(self):
+        if self._data_provider is None:
+            from BACKTEST.data.timescale_provider import TimescaleProvider
+            self._data_provider = TimescaleProvider()
+        return self._data_provider
+
+    async def close(self) -> None:
+        if self._own_provider and self._data_provider is not None:
+            await self._data_provider.close()
+
+    @staticmethod
+    def _generation_key(symbol: str, timeframe: str) -> str:
+        return f"{KEY_PREFIX}:generation:{symbol.upper()}:{timeframe}"
+
+    async def build_key(self, request: Dict[str, Any]) -> Optional[str]:
+        """
+        Cache key of a run request, or None when the data window has no
+        watermark (nothing to detect changes with, so do not cache).
+
+        The watermark covers the warm-up bars the engine loads before
+        start_date, so backfilled warm-up candles also change the key.
+        """
+        from BACKTEST.engine.backtest_engine import INDICATOR_WARMUP_BARS
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        # 전략의 과거 캔들 요청(최대 max_history + 10개)도 이 구간 안에 있음
+        warmup_start = (
+            _as_datetime(request["start_date"])
+            - timeframe_to_timedelta(request["timeframe"]) * INDICATOR_WARMUP_BARS
+        )
+        watermark = await self.data_provider.get_data_watermark(
+            request["symbol"],
+            request["timeframe"],
+            warmup_start,
+            _as_datetime(request["end_date"])
+        )
+        if not watermark:
+            return None
+        generation = await self.generation(request["symbol"], request["timeframe"])
+        return cache_key(request, engine_code_version(), watermark, generation)
+
+    async def generation(self, symbol: str, timeframe: str) -> int:
+        """Invalidation counter of a series (bumped by invalidate())."""
+        redis = await self._get_redis()
+        return int(await redis.get(self._generation_key(symbol, timeframe)) or 0)
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached BacktestResult dump (JSON mode) or None."""
+        redis = await self._get_redis()
+        blob = await redis.get(f"{KEY_PREFIX}:{key}")
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob))
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a BacktestResult dump (JSON mode)."""
+        redis = await self._get_redis()
+        blob = zlib.compress(json.dumps(result, separators=(",", ":"), default=str).encode())
+        await redis.set(f"{KEY_PREFIX}:{key}", blob, ex=self.ttl_seconds)
+
+    async def invalidate(self, symbol: str, timeframe: str) -> None:
+        """
+        Invalidate every cached run of a series (e.g. after indicators were
+        recalculated in place, which does not move the watermark).
+        """
+        redis = await self._get_redis()
+        await redis.incr(self._generation_key(symbol, timeframe))
+
+
+def _as_datetime(value) -> datetime:
+    return value if isinstance(value, datetime) else datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+_result_cache: Optional[BacktestResultCache] = None
+
+
+def get_result_cache() -> BacktestResultCache:
+    """Get the node-wide result cache (created on first use)."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = BacktestResultCache()
+    return _result_cache
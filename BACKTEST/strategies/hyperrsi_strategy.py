@@ -249,6 +249,9 @@ class HyperrsiStrategy(BaseStrategy):
         self.price_history: list[Candle] = []
         self.max_history = 100  # Keep last 100 candles
 
+        # Precomputed indicators for the whole run (set by backtest engine)
+        self.indicator_matrix = None
+
         # Data provider for loading historical data (set by backtest engine)
         self.data_provider = None
         self.symbol = None
@@ -273,6 +276,23 @@ class HyperrsiStrategy(BaseStrategy):
         self.timeframe = timeframe
         logger.info(f"Data provider set for {symbol} {timeframe}")
 
+    def set_indicator_matrix(self, indicator_matrix) -> None:
+        """
+        Set precomputed indicators for the run.
+
+        Matrix values replace the per-candle price_history computations when
+        a candle does not carry the indicator itself.
+
+        Args:
+            indicator_matrix: IndicatorMatrix or None to disable
+        """
+        self.indicator_matrix = indicator_matrix
+
+    def _matrix_value(self, name: str, candle: Candle, offset: int = 0) -> Optional[float]:
+        if self.indicator_matrix is None:
+            return None
+        return self.indicator_matrix.value(name, candle.timestamp, offset)
+
     async def _load_historical_data(self, current_candle: 'Candle', needed: int = 61):
         """
         Load historical data if price_history is insufficient.
@@ -300,18 +320,9 @@ class HyperrsiStrategy(BaseStrategy):
         )
 
         # Calculate start date for historical data
-        from datetime import timedelta
-
-        if self.timeframe == "1h":
-            start_date = current_candle.timestamp - timedelta(hours=missing + 10)
-        elif self.timeframe == "4h":
-            start_date = current_candle.timestamp - timedelta(hours=(missing + 10) * 4)
-        elif self.timeframe == "1d":
-            start_date = current_candle.timestamp - timedelta(days=missing + 10)
-        elif self.timeframe == "15m":
-            start_date = current_candle.timestamp - timedelta(minutes=(missing + 10) * 15)
-        else:
-            start_date = current_candle.timestamp - timedelta(days=missing + 10)
+        from shared.utils.time_helpers import timeframe_to_timedelta
+
+        start_date = current_candle.timestamp - timeframe_to_timedelta(self.timeframe) * (missing + 10)
 
         end_date = current_candle.timestamp
 
@@ -352,6 +363,10 @@ class HyperrsiStrategy(BaseStrategy):
         """
         import pandas as pd
 
+        rsi = self._matrix_value("rsi", current_candle)
+        if rsi is not None:
+            return rsi
+
         # Try to calculate with current history
         closes = pd.Series([c.close for c in self.price_history])
         rsi = self.signal_generator.calculate_rsi(closes, self.signal_generator.rsi_period)
@@ -380,6 +395,11 @@ class HyperrsiStrategy(BaseStrategy):
         """
         import pandas as pd
 
+        ema = self._matrix_value("ema", current_candle)
+        sma = self._matrix_value("sma", current_candle)
+        if ema is not None and sma is not None:
+            return ema, sma
+
         # Try to calculate with current history
         closes = pd.Series([c.close for c in self.price_history])
 
@@ -418,11 +438,12 @@ class HyperrsiStrategy(BaseStrategy):
         if len(self.price_history) > self.max_history:
             self.price_history.pop(0)
 
-        # Extract price data
-        closes = pd.Series([c.close for c in self.price_history])
-
         # Calculate RSI if not provided
-        if candle.rsi is None:
+        rsi = candle.rsi
+        if rsi is None:
+            rsi = self._matrix_value("rsi", candle)
+        if rsi is None:
+            closes = pd.Series([c.close for c in self.price_history])
             rsi = self.signal_generator.calculate_rsi(closes, self.signal_generator.rsi_period)
 
             if rsi is None:
@@ -438,8 +459,6 @@ class HyperrsiStrategy(BaseStrategy):
                 if rsi is None:
                     logger.warning(f"RSI calc failed after loading history (size: {len(self.price_history)})")
                     return TradingSignal(side=None, reason="RSI calculation failed")
-        else:
-            rsi = candle.rsi
 
         # Get previous RSI for '돌파' and '변곡돌파' modes
         previous_rsi = None
@@ -447,6 +466,8 @@ class HyperrsiStrategy(BaseStrategy):
             # Calculate previous RSI or use from previous candle
             if self.price_history[-2].rsi is not None:
                 previous_rsi = self.price_history[-2].rsi
+            elif self.indicator_matrix is not None:
+                previous_rsi = self._matrix_value("rsi", candle, offset=-1)
             else:
                 # Calculate from price history
                 prev_closes = pd.Series([c.close for c in self.price_history[:-1]])
@@ -456,6 +477,8 @@ class HyperrsiStrategy(BaseStrategy):
         atr = None
         if candle.atr is not None:
             atr = candle.atr
+        elif self.indicator_matrix is not None:
+            atr = self._matrix_value("atr", candle)
         else:
             # Calculate from price history
             if len(self.price_history) >= 15:  # Need at least 15 candles for ATR(14)
@@ -472,6 +495,8 @@ class HyperrsiStrategy(BaseStrategy):
             # ✅ Use DB trend_state if available (more reliable)
             if hasattr(candle, 'trend_state') and candle.trend_state is not None:
                 trend_state = candle.trend_state
+            elif self.indicator_matrix is not None:
+                trend_state = self.indicator_matrix.trend_state(candle.timestamp)
             else:
                 # Fallback: Calculate from price_history if DB value not available
                 candles_data = [{
@@ -998,4 +1023,5 @@ class HyperrsiStrategy(BaseStrategy):
     def reset(self) -> None:
         """Reset strategy state."""
         self.price_history.clear()
+        self.indicator_matrix = None
         logger.info("HyperrsiStrategy reset")
@@ -0,0 +1,104 @@
+"""Tests for bulk backtest result persistence."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from BACKTEST.models.result import BacktestResult
+from BACKTEST.models.trade import Trade, TradeSide
+from BACKTEST.storage.backtest_repository import BacktestRepository
+from BACKTEST.storage.equity_codec import decode_equity_curve, encode_equity_curve
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    """AsyncSession stand-in without an asyncpg connection (multi-row VALUES path)."""
+
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    async def connection(self):
+        async def get_raw_connection():
+            return SimpleNamespace(driver_connection=None)
+        return SimpleNamespace(get_raw_connection=get_raw_connection)
+
+    async def execute(self, statement, params=None):
+        self.statements.append((str(statement), params or {}))
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        pass
+
+
+def _result(snapshots=7000, trades=1500):
+    return BacktestResult(
+        id=uuid4(), user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="1m",
+        start_date=START, end_date=START + timedelta(minutes=snapshots),
+        strategy_name="hyperrsi", strategy_params={}, started_at=START,
+        initial_balance=10000.0, final_balance=10100.0,
+        trades=[
+            Trade(trade_number=i + 1, side=TradeSide.LONG, entry_timestamp=START, entry_price=100.0,
+                  quantity=1.0, leverage=10, entry_history=[{"price": 100.0}])
+            for i in range(trades)
+        ],
+        equity_curve=[
+            {"timestamp": (START + timedelta(minutes=i)).isoformat(), "balance": 10000.0 + i,
+             "equity": 10000.5 + i, "cumulative_pnl": float(i)}
+            for i in range(snapshots)
+        ],
+    )
+
+
+def _inserts(session, table):
+    return [params for sql, params in session.statements if sql.startswith(f"INSERT INTO {table} ")]
+
+
+async def test_bulk_insert_uses_chunked_multi_row_values():
+    session = RecordingSession()
+    result = _result()
+
+    await BacktestRepository(session, equity_curve_storage="rows").save(result)
+
+    snapshot_batches = _inserts(session, "backtest_balance_snapshots")
+    trade_batches = _inserts(session, "backtest_trades")
+    assert [len(p) // 6 for p in snapshot_batches] == [5000, 2000]
+    assert sum(len(p) for p in trade_batches) == 1500 * 30 and all(len(p) <= 32767 for p in trade_batches)
+    assert session.commits == 1
+    last = snapshot_batches[-1]
+    assert last["p1999_1"] == START + timedelta(minutes=6999) and last["p1999_4"] == 6999.0
+
+
+async def test_compressed_equity_curve_skips_snapshot_rows():
+    session = RecordingSession()
+    result = _result(snapshots=300, trades=2)
+
+    await BacktestRepository(session, equity_curve_storage="compressed").save(result)
+
+    assert not _inserts(session, "backtest_balance_snapshots")
+    (blob_params,) = [p for sql, p in session.statements if sql.startswith("UPDATE backtest_runs")]
+    curve = decode_equity_curve(blob_params["blob"])
+    assert len(curve) == 300
+    assert curve[-1] == {
+        "timestamp": (START + timedelta(minutes=299)).isoformat(),
+        "balance": 10299.0, "equity": 10299.5, "pnl": 299.0, "trade_number": 0,
+    }
+
+
+def test_equity_codec_round_trip_keeps_microseconds():
+    points = [{"timestamp": START + timedelta(microseconds=123457), "balance": 1.5, "pnl": -2.0, "trade_number": 3}]
+
+    (decoded,) = decode_equity_curve(encode_equity_curve(points))
+
+    assert datetime.fromisoformat(decoded["timestamp"]) == points[0]["timestamp"]
+    assert decoded["equity"] == 1.5 and decoded["pnl"] == -2.0 and decoded["trade_number"] == 3
+
+
+def test_unknown_storage_mode_is_rejected():
+    with pytest.raises(ValueError):
+        BacktestRepository(RecordingSession(), equity_curve_storage="parquet")
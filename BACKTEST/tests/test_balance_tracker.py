@@ -0,0 +1,72 @@
+"""Tests for BalanceTracker equity curve storage and sampling."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from BACKTEST.engine.balance_tracker import BalanceTracker, downsample_equity_curve, lttb_indices
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _feed(tracker, count=5000, close_every=700):
+    rng = np.random.default_rng(7)
+    for i, pnl in enumerate(rng.normal(0, 25, count).cumsum().tolist()):
+        if i and i % close_every == 0:
+            tracker.update_balance(pnl=5.0, fee=1.0)
+        tracker.add_snapshot(START + timedelta(minutes=i), "long", 1.0, pnl)
+
+
+def test_statistics_are_exact_under_sampling():
+    full, sampled = BalanceTracker(10000.0), BalanceTracker(10000.0, sample_every=50)
+    _feed(full)
+    _feed(sampled)
+
+    assert len(sampled.get_equity_curve()) < len(full.get_equity_curve()) // 10
+    assert sampled.get_statistics() == pytest.approx(full.get_statistics())
+
+
+def test_sampling_keeps_last_point_and_trade_closes():
+    tracker = BalanceTracker(10000.0, sample_every=1000)
+    _feed(tracker, count=2500, close_every=700)
+
+    curve = tracker.get_equity_curve()
+    timestamps = [point["timestamp"] for point in curve]
+    assert timestamps[0] == START.isoformat()
+    assert timestamps[-1] == (START + timedelta(minutes=2499)).isoformat()
+    for minute in (700, 1400, 2100):
+        assert (START + timedelta(minutes=minute)).isoformat() in timestamps
+    assert curve[-1]["balance"] == 10012.0
+
+
+def test_change_threshold_stores_large_moves():
+    tracker = BalanceTracker(1000.0, sample_every=100, change_threshold=0.01)
+    for i, upnl in enumerate([0.0, 1.0, 2.0, 15.0, 16.0, -1.0, -2.0]):
+        tracker.add_snapshot(START + timedelta(minutes=i), None, 0.0, upnl)
+
+    assert [point["equity"] for point in tracker.get_equity_curve()] == [1000.0, 1015.0, 999.0, 998.0]
+    assert tracker.snapshots[1].timestamp == START + timedelta(minutes=3)
+
+
+def test_lttb_keeps_endpoints_and_extremes():
+    x = np.arange(1000, dtype=np.int64)
+    y = np.sin(np.linspace(0, 6, 1000))
+    y[421] = 5.0
+
+    keep = lttb_indices(x, y, 50)
+
+    assert len(keep) == 50 and keep[0] == 0 and keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+    assert 421 in keep
+
+
+def test_equity_curve_max_points_and_stored_curve_downsampling():
+    tracker = BalanceTracker(10000.0)
+    _feed(tracker, count=3000)
+
+    curve = tracker.get_equity_curve(max_points=200)
+    stored = downsample_equity_curve(tracker.get_equity_curve(), 200)
+
+    assert len(curve) == 200 and curve == stored
+    assert len(tracker.get_equity_curve()) == 3000
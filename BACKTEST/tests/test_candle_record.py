@@ -0,0 +1,45 @@
+"""Tests for the slotted CandleRecord and batch validation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from BACKTEST.models import Candle, CandleRecord, to_candle_records, validate_candle_batch
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _record(i=0, **extra):
+    fields = dict(
+        timestamp=START + timedelta(minutes=i), symbol="BTC-USDT-SWAP", timeframe="1m",
+        open=100.0, high=101.0, low=99.0, close=100.5, volume=3.0, rsi=55.0, trend_state=2,
+    )
+    fields.update(extra)
+    return CandleRecord(**fields)
+
+
+def test_record_matches_model_fields():
+    record = _record(CYCLE_Bull=True)
+    model = Candle(**record.model_dump())
+
+    assert record.model_dump() == model.model_dump()
+    assert record.to_model().model_dump() == model.model_dump()
+    assert CandleRecord.from_model(model) == record
+    assert to_candle_records([model, record]) == [record, record]
+    assert not hasattr(record, "__dict__")
+
+
+def test_validate_candle_batch_accepts_valid_rows():
+    validate_candle_batch([_record(i) for i in range(10)] + [_record(10, rsi=None, trend_state=None)])
+
+
+@pytest.mark.parametrize("field,value", [
+    ("close", 0.0), ("volume", -1.0), ("rsi", 100.5), ("trend_state", 3), ("ema", -5.0), ("high", None),
+])
+def test_validate_candle_batch_rejects_what_candle_rejects(field, value):
+    records = [_record(i) for i in range(5)] + [_record(5, **{field: value})]
+
+    with pytest.raises(ValueError, match=field):
+        validate_candle_batch(records)
+    with pytest.raises(ValueError):
+        Candle(**records[-1].model_dump())
@@ -0,0 +1,111 @@
+"""Tests for the column-oriented chart series endpoint."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from BACKTEST.api.routes import backtest as backtest_routes
+from BACKTEST.data import CandleArrayProvider
+from BACKTEST.data.chart_series import bucket_seconds_for, decode_cursor, load_chart_page
+from BACKTEST.models.candle import Candle
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_candles(n=12):
+    return [
+        Candle(
+            timestamp=START + timedelta(minutes=5 * i), symbol="BTC-USDT-SWAP", timeframe="5m",
+            open=100.0 + i, high=110.0 + i, low=90.0 + i, close=105.0 + i, volume=1.0,
+            rsi=None if i == 0 else 40.0 + i, trend_state=i % 3 - 1, data_source="test",
+        )
+        for i in range(n)
+    ]
+
+
+class ChartProvider(CandleArrayProvider):
+    """In-memory provider with a data watermark."""
+
+    async def get_data_watermark(self, symbol, timeframe, start_date, end_date):
+        candles = await self.get_candles(symbol, timeframe, start_date, end_date)
+        return {"count": len(candles), "last": candles[-1].timestamp.isoformat() if candles else None}
+
+    async def close(self):
+        pass
+
+
+async def test_buckets_aggregate_ohlcv_and_indicators():
+    provider = CandleArrayProvider(_make_candles())
+    end = START + timedelta(minutes=55)
+    bucket = bucket_seconds_for("5m", START, end, max_points=4)
+
+    page = await load_chart_page(
+        provider, "BTC-USDT-SWAP", "5m", START, end, ["open", "high", "low", "close", "volume", "rsi"], bucket, 100
+    )
+
+    assert bucket == 900 and page["count"] == 4 and page["next_cursor"] is None
+    columns = page["columns"]
+    assert columns["timestamp"][1] == int((START + timedelta(minutes=15)).timestamp() * 1000)
+    assert columns["open"] == [100.0, 103.0, 106.0, 109.0]
+    assert columns["high"] == [112.0, 115.0, 118.0, 121.0]
+    assert columns["low"] == [90.0, 93.0, 96.0, 99.0]
+    assert columns["close"] == [107.0, 110.0, 113.0, 116.0]
+    assert columns["volume"] == [3.0, 3.0, 3.0, 3.0]
+    assert columns["rsi"] == [42.0, 45.0, 48.0, 51.0]
+
+
+async def test_cursor_pages_cover_range_once():
+    provider = CandleArrayProvider(_make_candles())
+    end = START + timedelta(minutes=55)
+    timestamps, start, pages = [], START, 0
+
+    while True:
+        page = await load_chart_page(provider, "BTC-USDT-SWAP", "5m", start, end, ["rsi", "trend_state"], None, 5)
+        timestamps += page["columns"]["timestamp"]
+        pages += 1
+        if page["next_cursor"] is None:
+            break
+        start, bucket = decode_cursor(page["next_cursor"])
+        assert bucket is None
+
+    assert pages == 3
+    assert timestamps == [int((START + timedelta(minutes=5 * i)).timestamp() * 1000) for i in range(12)]
+    assert page["columns"]["trend_state"] == [0, 1]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    candles = _make_candles()
+    monkeypatch.setattr(backtest_routes, "TimescaleProvider", lambda: ChartProvider(candles))
+
+    async def no_generation(symbol, timeframe):
+        return 0
+
+    monkeypatch.setattr(backtest_routes, "_series_generation", no_generation)
+    app = FastAPI()
+    app.include_router(backtest_routes.router, prefix="/backtest")
+    return TestClient(app)
+
+
+def test_series_route_revalidates_with_etag(client):
+    params = {
+        "symbol": "BTC-USDT-SWAP", "timeframe": "5m",
+        "from": START.isoformat(), "to": (START + timedelta(minutes=55)).isoformat(),
+        "columns": "close,rsi",
+    }
+
+    first = client.get("/backtest/candles/series", params=params)
+    assert first.status_code == 200
+    body = first.json()
+    assert list(body["columns"]) == ["timestamp", "close", "rsi"] and body["columns"]["rsi"][0] is None
+
+    etag = first.headers["etag"]
+    cached = client.get("/backtest/candles/series", params=params, headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.headers["etag"] == etag
+
+    other = client.get("/backtest/candles/series", params={**params, "max_points": 4}, headers={"If-None-Match": etag})
+    assert other.status_code == 200 and other.json()["bucket_seconds"] == 900
+
+    assert client.get("/backtest/candles/series", params={**params, "columns": "bogus"}).status_code == 400
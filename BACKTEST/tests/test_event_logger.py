@@ -0,0 +1,85 @@
+"""Tests for the ring-buffered event logger and phase profiler."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from BACKTEST.data import CandleArrayProvider
+from BACKTEST.engine import (
+    BacktestEngine,
+    EventLogger,
+    EventType,
+    EventVerbosity,
+    LazyMessage,
+    parse_verbosity,
+)
+from BACKTEST.models.candle import Candle
+from BACKTEST.strategies.hyperrsi_strategy import HyperrsiStrategy
+
+
+class CountingMessage(LazyMessage):
+    formatted = 0
+
+    def __str__(self):
+        CountingMessage.formatted += 1
+        return super().__str__()
+
+
+def test_messages_are_formatted_on_read_only():
+    events = EventLogger(max_events=3)
+    CountingMessage.formatted = 0
+
+    for i in range(5):
+        events.log_event(EventType.BALANCE_UPDATED, CountingMessage("balance {:.2f}", 100 + i), {"i": i})
+
+    assert CountingMessage.formatted == 0
+    # 링 버퍼: 가장 오래된 두 개가 밀려남
+    assert [e.message for e in events.get_events()] == ["balance 102.00", "balance 103.00", "balance 104.00"]
+    assert CountingMessage.formatted == 3
+    summary = events.get_event_summary()
+    assert summary["total_events"] == 3 and summary["dropped_events"] == 2
+    assert summary["event_counts"] == {"balance_updated": 5}
+
+
+def test_verbosity_per_event_type():
+    events = EventLogger(verbosity=parse_verbosity("trailing_stop_updated=count, balance_updated=off"))
+
+    events.log_event(EventType.TRAILING_STOP_UPDATED, "moved")
+    events.log_event(EventType.BALANCE_UPDATED, "ignored")
+    events.log_event(EventType.TREND_CHECK, "per-candle diagnostics are off by default")
+    events.log_event(EventType.POSITION_OPENED, "recorded")
+
+    assert [e.message for e in events.get_events()] == ["recorded"]
+    assert events.get_event_summary()["event_counts"] == {"trailing_stop_updated": 1, "position_opened": 1}
+    assert events.enabled(EventType.POSITION_OPENED, EventVerbosity.LOG)
+    assert not events.enabled(EventType.TREND_CHECK)
+    with pytest.raises(ValueError):
+        parse_verbosity("trend_check=loud")
+
+
+async def test_engine_reports_phase_timings():
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    candles = [
+        Candle(
+            timestamp=start + timedelta(minutes=5 * i), symbol="BTC-USDT-SWAP", timeframe="5m",
+            open=100.0, high=100.5, low=99.5, close=100.0 + (i % 7) * 0.1, volume=1.0,
+            rsi=20.0 if i % 25 == 0 else 50.0, atr=1.0, trend_state=0, data_source="test",
+        )
+        for i in range(300)
+    ]
+    params = {"entry_option": "rsi_only", "pyramiding_enabled": False, "use_sl": True, "stop_loss_percent": 0.5}
+    strategy = HyperrsiStrategy(params)
+    engine = BacktestEngine(CandleArrayProvider(candles), enable_event_logging=False, enable_profiling=True)
+
+    result = await engine.run(
+        user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=start + timedelta(minutes=5 * 100), end_date=candles[-1].timestamp,
+        strategy_name="hyperrsi", strategy_params=params, strategy_executor=strategy
+    )
+
+    timings = result.detailed_metrics["phase_timings"]
+    assert timings["candle"]["calls"] == 200 and timings["snapshot"]["calls"] == 200
+    assert timings["signal"]["calls"] > 0 and 0 < timings["signal"]["share"] < 1
+    # 실행이 끝나면 계측 래퍼는 제거됨
+    assert "generate_signal" not in vars(strategy) and "_process_candle" not in vars(engine)
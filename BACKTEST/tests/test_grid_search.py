@@ -0,0 +1,157 @@
+"""Tests for the parallel grid search."""
+
+import json
+import math
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from BACKTEST.engine import BacktestEngine
+from BACKTEST.models.candle import Candle
+from BACKTEST.optimization import CandleArrayProvider, GridSearch, expand_param_grid, rank_results
+from BACKTEST.optimization.grid_search import SUMMARY_METRICS, array_to_candles, candles_to_array
+from BACKTEST.strategies.hyperrsi_strategy import HyperrsiStrategy
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+BASE_PARAMS = {
+    "entry_option": "rsi_only", "pyramiding_enabled": False, "use_sl": True,
+    "use_tp1": True, "tp1_ratio": 100, "use_tp2": False, "use_tp3": False,
+}
+PARAM_RANGES = {"stop_loss_percent": [1.0, 2.0], "tp1_value": {"start": 1.0, "stop": 2.0, "step": 1.0}}
+
+
+def _make_candles(n=600):
+    candles = []
+    for i in range(n):
+        close = 100 + 8 * math.sin(i / 15) + 3 * math.sin(i / 4)
+        rsi = 50 + 45 * math.sin(i / 12)
+        candles.append(Candle(
+            timestamp=START + timedelta(minutes=5 * i),
+            symbol="BTC-USDT-SWAP",
+            timeframe="5m",
+            open=close - 0.2,
+            high=close + 0.5,
+            low=close - 0.5,
+            close=close,
+            volume=10.0,
+            rsi=rsi,
+            atr=1.0,
+            trend_state=0,
+            data_source="test",
+        ))
+    return candles
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return _make_candles()
+
+
+def _search(**extra):
+    return GridSearch(
+        symbol="BTC-USDT-SWAP",
+        timeframe="5m",
+        start_date=START + timedelta(minutes=5 * 100),
+        end_date=START + timedelta(minutes=5 * 599),
+        param_ranges=PARAM_RANGES,
+        base_params=BASE_PARAMS,
+        rank_by=["total_return_percent"],
+        min_trades=0,
+        max_workers=2,
+        **extra
+    )
+
+
+def test_expand_param_grid():
+    grid = expand_param_grid(PARAM_RANGES, BASE_PARAMS)
+
+    assert len(grid) == 4
+    assert grid[0] == {**BASE_PARAMS, "stop_loss_percent": 1.0, "tp1_value": 1.0}
+    assert {g["tp1_value"] for g in grid} == {1.0, 2.0}
+
+
+def test_candle_array_round_trip(candles):
+    data, columns = candles_to_array(candles[:5])
+    restored = array_to_candles(data, columns, "BTC-USDT-SWAP", "5m", "test")
+
+    assert [c.model_dump() for c in restored] == [c.model_dump() for c in candles[:5]]
+
+
+def test_rank_results_orders_and_skips_failures():
+    rows = [
+        {"key": "a", "metrics": {"sharpe_ratio": 1.0, "total_fees_paid": 5}},
+        {"key": "b", "metrics": {"sharpe_ratio": 2.0, "total_fees_paid": 9}},
+        {"key": "c", "metrics": {"sharpe_ratio": 2.0, "total_fees_paid": 3}},
+        {"key": "d", "metrics": {"sharpe_ratio": None, "total_fees_paid": 1}},
+        {"key": "e", "error": "ValueError"},
+    ]
+
+    ranked = rank_results(rows, ["sharpe_ratio", "-total_fees_paid"])
+
+    assert [r["key"] for r in ranked] == ["c", "b", "a", "d"]
+
+
+async def test_parallel_sweep_matches_sequential_run(candles, tmp_path):
+    search = _search(checkpoint_path=str(tmp_path / "sweep.jsonl"))
+
+    summary = search.run(candles)
+
+    assert summary["completed_combinations"] == 4 and summary["failed_combinations"] == 0
+    best = summary["top_results"][0]
+    assert best["metrics"]["total_trades"] > 0
+    returns = [r["metrics"]["total_return_percent"] for r in summary["top_results"]]
+    assert returns == sorted(returns, reverse=True) and len(set(returns)) > 1
+    engine = BacktestEngine(CandleArrayProvider(candles), enable_event_logging=False)
+    result = await engine.run(
+        user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=search.start_date, end_date=search.end_date,
+        strategy_name="hyperrsi", strategy_params=best["params"],
+        strategy_executor=HyperrsiStrategy(best["params"])
+    )
+    assert best["metrics"] == {name: getattr(result, name) for name in SUMMARY_METRICS}
+
+
+def test_resume_from_checkpoint(candles, tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    first = _search(checkpoint_path=str(path)).run(candles)
+
+    # 중단 상황: 마지막 결과 줄이 잘린 체크포인트
+    lines = path.read_text().splitlines()
+    path.write_text("\n".join(lines[:-1]) + "\n" + lines[-1][:10])
+
+    search = _search(checkpoint_path=str(path))
+    assert len(search.load_checkpoint()) == 3
+    resumed = search.run(candles)
+
+    assert resumed["best_params"] == first["best_params"]
+    assert resumed["completed_combinations"] == 4
+    assert len(search.load_checkpoint()) == 4
+
+
+def test_failed_combinations_are_retried_on_resume(candles, tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    _search(checkpoint_path=str(path)).run(candles)
+
+    # 이전 실행에서 실패한 조합이 체크포인트에 남아 있는 경우
+    lines = path.read_text().splitlines()
+    failed = json.loads(lines[-1])
+    lines[-1] = json.dumps({"key": failed["key"], "params": failed["params"], "error": "ValueError: boom"})
+    path.write_text("\n".join(lines) + "\n")
+
+    search = _search(checkpoint_path=str(path))
+    assert failed["key"] not in search.load_checkpoint()
+    resumed = search.run(candles)
+
+    assert resumed["completed_combinations"] == 4 and resumed["failed_combinations"] == 0
+    assert search.load_checkpoint()[failed["key"]]["metrics"] == failed["metrics"]
+
+
+def test_checkpoint_from_other_sweep_is_rejected(candles, tmp_path):
+    path = tmp_path / "sweep.jsonl"
+    _search(checkpoint_path=str(path)).run(candles)
+
+    other = _search(checkpoint_path=str(path))
+    other.fee_rate = 0.001
+    with pytest.raises(ValueError):
+        other.run(candles)
@@ -0,0 +1,93 @@
+"""Tests for the precomputed backtest indicator matrix."""
+
+import math
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pandas as pd
+import pytest
+
+from BACKTEST.engine import BacktestEngine, IndicatorMatrix
+from BACKTEST.models.candle import Candle
+from BACKTEST.optimization import CandleArrayProvider
+from BACKTEST.strategies.hyperrsi_strategy import HyperrsiStrategy
+from BACKTEST.strategies.signal_generator import SignalGenerator
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_candles(n=500):
+    """Candles without stored indicators (forces the fallback path)."""
+    candles = []
+    for i in range(n):
+        close = 100 + 8 * math.sin(i / 15) + 3 * math.sin(i / 4) + 0.02 * i
+        candles.append(Candle(
+            timestamp=START + timedelta(minutes=5 * i),
+            symbol="BTC-USDT-SWAP",
+            timeframe="5m",
+            open=close - 0.2,
+            high=close + 0.5,
+            low=close - 0.6,
+            close=close,
+            volume=10.0,
+            data_source="test",
+        ))
+    return candles
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return _make_candles()
+
+
+def test_matrix_has_no_lookahead(candles):
+    full = IndicatorMatrix.from_candles(candles, rsi_period=14, timeframe_minutes=5)
+
+    for n in (15, 120, 250, 333, len(candles)):
+        prefix = IndicatorMatrix.from_candles(candles[:n], rsi_period=14, timeframe_minutes=5)
+        for name in full.columns:
+            expected = full.value(name, candles[n - 1].timestamp)
+            actual = prefix.value(name, candles[n - 1].timestamp)
+            assert actual == pytest.approx(expected, nan_ok=True), (name, n)
+
+
+def test_matrix_matches_per_candle_calculation(candles):
+    matrix = IndicatorMatrix.from_candles(candles, rsi_period=9)
+
+    for i in (5, 9, 14, 30, 199, 480):
+        history = candles[:i + 1]
+        closes = pd.Series([c.close for c in history])
+        highs = pd.Series([c.high for c in history])
+        lows = pd.Series([c.low for c in history])
+        ts = candles[i].timestamp
+
+        assert matrix.value("rsi", ts) == pytest.approx(SignalGenerator.calculate_rsi(closes, 9))
+        assert matrix.value("atr", ts) == pytest.approx(SignalGenerator.calculate_atr(highs, lows, closes, 14))
+        ema = closes.ewm(span=7, adjust=False).mean().iloc[-1] if len(closes) >= 7 else None
+        sma = closes.rolling(window=20).mean().iloc[-1] if len(closes) >= 20 else None
+        assert matrix.value("ema", ts) == pytest.approx(ema)
+        assert matrix.value("sma", ts) == pytest.approx(sma, nan_ok=True)
+
+    assert matrix.value("rsi", candles[0].timestamp, offset=-1) is None
+    assert matrix.trend_state(candles[100].timestamp) == 0
+
+
+async def test_engine_uses_matrix_with_warmup(candles):
+    params = {
+        "entry_option": "rsi_only", "pyramiding_enabled": False, "use_sl": True, "stop_loss_percent": 2.0,
+        "use_tp1": True, "tp1_value": 1.0, "tp1_ratio": 100, "use_tp2": False, "use_tp3": False,
+    }
+    strategy = HyperrsiStrategy(params)
+    engine = BacktestEngine(CandleArrayProvider(candles), enable_event_logging=False)
+
+    result = await engine.run(
+        user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=candles[250].timestamp, end_date=candles[-1].timestamp,
+        strategy_name="hyperrsi", strategy_params=params, strategy_executor=strategy
+    )
+
+    matrix = engine.indicator_matrix
+    assert strategy.indicator_matrix is matrix
+    # 워밍업 구간이 포함되어 시작 캔들부터 RSI가 정의됨
+    assert len(matrix) == len(candles) and matrix.value("rsi", candles[250].timestamp) is not None
+    assert result.total_trades > 0
@@ -0,0 +1,73 @@
+"""Tests for the process-pool backtest job manager."""
+
+import time
+
+import pytest
+
+from BACKTEST.jobs import BacktestCancelledError, BacktestJobManager, JobLimitExceededError, JobStatus
+
+
+def fake_backtest_job(job_id, request, events, cancel_event, progress_interval):
+    """Stand-in for run_backtest_job: reports progress like the engine does."""
+    events.put({"job_id": job_id, "type": "started"})
+    total = request["candles"]
+    for processed in range(progress_interval, total + 1, progress_interval):
+        if cancel_event.is_set():
+            raise BacktestCancelledError(job_id)
+        time.sleep(request.get("delay", 0))
+        events.put({"job_id": job_id, "type": "progress", "processed": processed, "total": total, "trades": processed // 100})
+    if request.get("fail"):
+        raise ValueError("No data available for specified period")
+    return {"total_trades": total // 100, "symbol": request["symbol"]}
+
+
+@pytest.fixture
+async def manager():
+    manager = BacktestJobManager(max_workers=2, max_pending=3, progress_interval=100, job_fn=fake_backtest_job)
+    manager.start()
+    yield manager
+    manager.shutdown()
+
+
+def _request(**extra):
+    return {"symbol": "BTC-USDT-SWAP", "timeframe": "5m", "candles": 500, **extra}
+
+
+async def test_job_streams_progress_and_completes(manager):
+    job = manager.submit(_request(delay=0.02), persist=False)
+
+    snapshots = [snapshot async for snapshot in manager.subscribe(job.job_id)]
+
+    assert snapshots[-1]["status"] == JobStatus.COMPLETED.value
+    assert snapshots[-1]["processed"] == 500 and snapshots[-1]["trades"] == 5
+    assert any(s["status"] == JobStatus.RUNNING.value for s in snapshots)
+    assert job.result == {"total_trades": 5, "symbol": "BTC-USDT-SWAP"}
+
+
+async def test_failed_job_keeps_error_type(manager):
+    job = await manager.wait(manager.submit(_request(fail=True), persist=False).job_id)
+
+    assert job.status == JobStatus.FAILED
+    assert job.error_type == "ValueError"
+
+
+async def test_cancel_running_and_queued_jobs(manager):
+    jobs = [manager.submit(_request(candles=100_000, delay=0.01), persist=False) for _ in range(3)]
+
+    # 두 작업은 실행 중, 세 번째는 풀이 가득 차서 대기
+    for job in jobs:
+        assert manager.cancel(job.job_id)
+    finished = [await manager.wait(job.job_id) for job in jobs]
+
+    assert all(job.status == JobStatus.CANCELLED for job in finished)
+    assert not manager.cancel(jobs[0].job_id)
+
+
+async def test_pending_limit(manager):
+    jobs = [manager.submit(_request(candles=100_000, delay=0.01), persist=False) for _ in range(3)]
+
+    with pytest.raises(JobLimitExceededError):
+        manager.submit(_request(), persist=False)
+
+    for job in jobs:
+        manager.cancel(job.job_id)
@@ -0,0 +1,93 @@
+"""Tests for the local memory-mapped candle store."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from BACKTEST.data import CandleArrayProvider, LocalStoreProvider
+from BACKTEST.models.candle import CandleRecord
+
+START = datetime(2025, 1, 31, 12, tzinfo=timezone.utc)
+
+
+class CountingProvider(CandleArrayProvider):
+    """Source stand-in that records every fetched range."""
+
+    def __init__(self, candles):
+        super().__init__(candles)
+        self.calls = []
+
+    async def get_candles(self, symbol, timeframe, start_date, end_date, limit=None):
+        self.calls.append((start_date, end_date))
+        return await super().get_candles(symbol, timeframe, start_date, end_date, limit)
+
+
+def _make_candles(n=600):
+    candles = []
+    for i in range(n):
+        close = 100 + 5 * math.sin(i / 10)
+        candles.append(CandleRecord(
+            timestamp=START + timedelta(hours=i), symbol="BTC-USDT-SWAP", timeframe="1h",
+            open=close, high=close + 1, low=close - 1, close=close, volume=2.0,
+            rsi=50.0 if i % 7 else None, trend_state=(i % 5) - 2, CYCLE_Bull=i % 2 == 0,
+            data_source="candlesdb",
+        ))
+    return candles
+
+
+@pytest.fixture
+def source():
+    return CountingProvider(_make_candles())
+
+
+def _at(i):
+    return START + timedelta(hours=i)
+
+
+async def test_repeated_loads_read_local_files(source, tmp_path):
+    store = LocalStoreProvider(source, root_dir=str(tmp_path))
+
+    first = await store.get_candles("BTC-USDT-SWAP", "1h", _at(0), _at(400))
+    calls = len(source.calls)
+    second = await LocalStoreProvider(source, root_dir=str(tmp_path)).get_candles(
+        "BTC-USDT-SWAP", "1h", _at(10), _at(300)
+    )
+
+    # 2025-01 ~ 2025-02 두 개 월 파티션
+    assert calls == 2 and len(source.calls) == calls
+    assert [c.model_dump() for c in first] == [c.model_dump() for c in source.candles[:401]]
+    assert [c.model_dump() for c in second] == [c.model_dump() for c in source.candles[10:301]]
+
+
+async def test_only_missing_tail_is_fetched(source, tmp_path):
+    store = LocalStoreProvider(source, root_dir=str(tmp_path))
+    await store.get_candles("BTC-USDT-SWAP", "1h", _at(100), _at(200))
+    source.calls.clear()
+
+    candles = await store.get_candles("BTC-USDT-SWAP", "1h", _at(100), _at(250))
+
+    assert source.calls == [(_at(200) + timedelta(microseconds=1), _at(250))]
+    assert [c.timestamp for c in candles] == [_at(i) for i in range(100, 251)]
+
+
+async def test_candles_df_without_row_objects(source, tmp_path):
+    store = LocalStoreProvider(source, root_dir=str(tmp_path))
+
+    df = await store.get_candles_df("BTC-USDT-SWAP", "1h", _at(0), _at(20))
+
+    assert len(df) == 21 and df.index.name == "timestamp"
+    assert df["close"].tolist() == [c.close for c in source.candles[:21]]
+    assert df["rsi"].isna().tolist() == [c.rsi is None for c in source.candles[:21]]
+    assert str(df["trend_state"].dtype) == "Int64" and str(df["CYCLE_Bull"].dtype) == "boolean"
+    assert (df["data_source"] == "candlesdb").all()
+
+
+async def test_validate_data_availability(source, tmp_path):
+    store = LocalStoreProvider(source, root_dir=str(tmp_path))
+
+    result = await store.validate_data_availability("BTC-USDT-SWAP", "1h", _at(0), _at(100))
+    missing = await store.validate_data_availability("BTC-USDT-SWAP", "1h", _at(-50), _at(-10))
+
+    assert result["available"] and result["coverage"] >= 1.0
+    assert not missing["available"]
@@ -0,0 +1,117 @@
+"""Tests for vectorized backtest metrics (BACKTEST.analysis)."""
+
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from BACKTEST.analysis import (
+    TradeArrays,
+    calculate_performance_metrics,
+    drawdown_stats,
+    exposure,
+    rolling_returns,
+    trade_statistics,
+)
+from BACKTEST.models.result import BacktestResult
+from BACKTEST.models.trade import ExitReason, Trade, TradeSide
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+NS_MINUTE = 60 * 10**9
+
+
+def _trade(n, pnl, side=TradeSide.LONG, reason=ExitReason.TAKE_PROFIT, minutes=30, closed=True):
+    entry = START + timedelta(hours=n)
+    return Trade(
+        trade_number=n, side=side, entry_timestamp=entry, entry_price=100.0, quantity=1.0, leverage=10,
+        exit_timestamp=entry + timedelta(minutes=minutes) if closed else None,
+        exit_price=100.0 + pnl if closed else None, exit_reason=reason if closed else None,
+        pnl=pnl if closed else None, pnl_percent=pnl / 10 if closed else None,
+        entry_fee=0.1, exit_fee=0.1 if closed else 0.0,
+    )
+
+
+TRADES = [
+    _trade(1, 10.0), _trade(2, 5.0, TradeSide.SHORT), _trade(3, -4.0, reason=ExitReason.STOP_LOSS),
+    _trade(4, -2.0, TradeSide.SHORT, ExitReason.STOP_LOSS), _trade(5, -1.0, reason=ExitReason.STOP_LOSS),
+    _trade(6, 8.0, minutes=90), _trade(7, 0.0, closed=False),
+]
+
+
+def test_trade_statistics_match_result_metrics_and_streaks():
+    stats = trade_statistics(TradeArrays.from_trades(TRADES))
+
+    assert stats["total_trades"] == 6 and stats["winning_trades"] == 3 and stats["losing_trades"] == 3
+    assert stats["win_rate"] == 50.0
+    assert stats["profit_factor"] == pytest.approx(23 / 7)
+    assert stats["avg_trade_duration_minutes"] == pytest.approx(40.0)
+    assert stats["total_fees_paid"] == pytest.approx(1.2)
+    assert stats["max_consecutive_wins"] == 2 and stats["max_consecutive_losses"] == 3
+    assert stats["current_streak"] == 1
+
+    result = BacktestResult(
+        symbol="BTC-USDT-SWAP", timeframe="1h", start_date=START, end_date=START + timedelta(days=1),
+        strategy_params={}, started_at=START, initial_balance=1000.0, final_balance=1016.0, trades=TRADES,
+    )
+    result.calculate_metrics()
+    assert (result.avg_win, result.avg_loss, result.largest_loss) == (pytest.approx(23 / 3), pytest.approx(-7 / 3), -4.0)
+    assert result.total_return_percent == pytest.approx(1.6)
+    returns = np.array([1.0, 0.5, -0.4, -0.2, -0.1, 0.8])
+    assert result.calculate_sharpe_ratio() == pytest.approx(returns.mean() / returns.std())
+
+
+def test_breakdowns_by_side_and_exit_reason():
+    metrics = calculate_performance_metrics(TRADES, [], initial_balance=1000.0)
+
+    assert metrics["by_side"]["long"]["trades"] == 4 and metrics["by_side"]["short"]["total_pnl"] == 3.0
+    stop_loss = metrics["by_exit_reason"]["stop_loss"]
+    assert stop_loss == {"trades": 3, "winning_trades": 0, "win_rate": 0.0, "total_pnl": -7.0, "avg_pnl": pytest.approx(-7 / 3)}
+    assert metrics["by_exit_reason"]["take_profit"]["trades"] == 3
+    json.dumps(metrics)
+
+
+def test_drawdown_duration_and_rolling_returns():
+    timestamps = np.arange(8, dtype=np.int64) * NS_MINUTE
+    equity = np.array([100.0, 110.0, 99.0, 88.0, 105.0, 112.0, 100.0, 101.0])
+
+    stats = drawdown_stats(timestamps, equity)
+
+    assert stats["max_drawdown"] == -22.0
+    assert stats["max_drawdown_percent"] == pytest.approx(-20.0)
+    assert stats["max_drawdown_duration_seconds"] == 180.0
+    assert (stats["max_drawdown_peak_ns"], stats["max_drawdown_trough_ns"]) == (NS_MINUTE, 3 * NS_MINUTE)
+
+    rolling = rolling_returns(timestamps, equity, window_seconds=120)
+    assert np.isnan(rolling[:2]).all()
+    assert rolling[2] == pytest.approx(99 / 100 - 1) and rolling[7] == pytest.approx(101 / 112 - 1)
+
+
+def test_exposure_merges_overlapping_trades():
+    entry = np.array([0, 10, 15, 50]) * NS_MINUTE
+    exit_ = np.array([20, 12, 30, 60]) * NS_MINUTE
+
+    assert exposure(entry, exit_, 0, 100 * NS_MINUTE) == pytest.approx(0.4)
+    assert exposure(entry, exit_, 55 * NS_MINUTE, 65 * NS_MINUTE) == pytest.approx(0.5)
+
+
+def test_large_trade_arrays_stay_fast():
+    rng = np.random.default_rng(1)
+    n = 200_000
+    entry = np.sort(rng.integers(0, 10**6, n)) * NS_MINUTE
+    pnl = rng.normal(0.1, 5, n)
+    trades = TradeArrays(
+        entry_ns=entry, exit_ns=entry + 30 * NS_MINUTE, pnl=pnl, pnl_percent=pnl / 10,
+        fees=np.full(n, 0.1), side=rng.choice(np.array([1, -1], dtype=np.int8), n),
+        exit_reason=rng.integers(0, 5, n).astype(np.int16),
+    )
+    curve = {"timestamp": np.arange(n, dtype=np.int64) * 5 * NS_MINUTE, "equity": 10000 + pnl.cumsum()}
+
+    started = time.perf_counter()
+    metrics = calculate_performance_metrics(trades, curve, initial_balance=10000.0)
+    elapsed = time.perf_counter() - started
+
+    assert metrics["total_trades"] == n and metrics["calmar_ratio"] is not None
+    assert sum(side["trades"] for side in metrics["by_side"].values()) == n
+    assert elapsed < 2.0
@@ -0,0 +1,80 @@
+"""Tests for Monte Carlo robustness analysis."""
+
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from BACKTEST.analysis import MonteCarloCosts, bootstrap_trades
+from BACKTEST.models.trade import ExitReason, Trade, TradeSide
+from BACKTEST.tests.test_grid_search import BASE_PARAMS, START, _make_candles
+
+
+def _trades(pnls):
+    return [
+        Trade(
+            trade_number=i + 1, side=TradeSide.LONG, entry_timestamp=START + timedelta(hours=i),
+            entry_price=100.0, exit_timestamp=START + timedelta(hours=i, minutes=30), exit_price=101.0,
+            exit_reason=ExitReason.TAKE_PROFIT, quantity=1.0, leverage=10, pnl=pnl,
+            entry_fee=0.05, exit_fee=0.05,
+        )
+        for i, pnl in enumerate(pnls)
+    ]
+
+
+def test_bootstrap_identical_trades_is_exact():
+    result = bootstrap_trades(_trades([10.0] * 50), initial_balance=1000.0, n_paths=200, seed=1)
+
+    assert result["final_return_percent"]["min"] == result["final_return_percent"]["max"] == pytest.approx(50.0)
+    assert result["max_drawdown_percent"]["min"] == 0.0
+    assert result["probability_of_loss"] == 0.0
+
+
+def test_bootstrap_cost_resampling_shifts_pnl():
+    trades = _trades([1.0] * 10)
+
+    doubled_fees = bootstrap_trades(
+        trades, 1000.0, n_paths=10, fee_rate=0.0005, fee_rate_range=(0.001, 0.001), seed=1
+    )
+    more_slippage = bootstrap_trades(
+        trades, 1000.0, n_paths=10, slippage_percent=0.05, slippage_range=(0.15, 0.15), seed=1
+    )
+
+    # 거래당 수수료 0.1 추가 / 슬리피지 0.1% x (100 + 101) x 10 / 100 = 2.01 감소
+    assert doubled_fees["final_return_percent"]["mean"] == pytest.approx((10 - 1.0) / 10)
+    assert more_slippage["final_return_percent"]["mean"] == pytest.approx((10 - 20.1) / 10)
+
+
+def test_block_bootstrap_is_seeded_and_chunked(monkeypatch):
+    trades = _trades(np.random.default_rng(3).normal(1, 20, 300).tolist())
+
+    first = bootstrap_trades(trades, 10000.0, n_paths=500, block_size=5, seed=7)
+    again = bootstrap_trades(trades, 10000.0, n_paths=500, block_size=5, seed=7)
+    monkeypatch.setattr("BACKTEST.analysis.monte_carlo.MAX_MATRIX_ELEMENTS", 300 * 7)
+    chunked = bootstrap_trades(trades, 10000.0, n_paths=500, block_size=5, seed=7)
+
+    assert again == first
+    assert first["trades_per_path"] == 300 and 0 < first["probability_of_loss"] < 1
+    assert first["final_return_percent"]["p5"] < first["final_return_percent"]["p95"]
+    spread = first["final_return_percent"]["std"]
+    assert chunked["final_return_percent"]["mean"] == pytest.approx(first["final_return_percent"]["mean"], abs=spread / 2)
+
+
+def test_cost_scenarios_run_in_workers(tmp_path):
+    params = {**BASE_PARAMS, "stop_loss_percent": 1.0, "tp1_value": 1.0}
+    study = MonteCarloCosts(
+        symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=START + timedelta(minutes=500), end_date=START + timedelta(minutes=5 * 599),
+        strategy_params=params, fee_rate_range=(0.0, 0.002), slippage_range=(0.0, 0.2),
+        n_scenarios=3, seed=5, max_workers=2, results_path=str(tmp_path / "scenarios.jsonl"),
+    )
+
+    summary = study.run(_make_candles())
+
+    assert summary["failed_scenarios"] == 0
+    assert [row["scenario"] for row in summary["scenarios"]] == [0, 1, 2]
+    assert summary["scenarios"][1]["fee_rate"] == study.scenarios[1]["fee_rate"]
+    fees = sorted(summary["scenarios"], key=lambda r: r["fee_rate"])
+    assert fees[0]["metrics"]["total_fees_paid"] < fees[-1]["metrics"]["total_fees_paid"]
+    assert summary["metrics"]["final_balance"]["min"] <= summary["metrics"]["final_balance"]["max"]
+    assert len((tmp_path / "scenarios.jsonl").read_text().splitlines()) == 3
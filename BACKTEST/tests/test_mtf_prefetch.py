@@ -0,0 +1,82 @@
+"""Tests for the multi-timeframe candle prefetch."""
+
+import math
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from BACKTEST.data import CandleArrayProvider
+from BACKTEST.data.mtf_prefetch import prefetch_candles
+from BACKTEST.models.candle import Candle
+from shared.indicators import bucket_closes_np, mtf_close_minutes, resample_close_np
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def _make_candles(n=900):
+    candles = []
+    for i in range(n):
+        # 중간중간 빠진 캔들 (거래소 점검 등)
+        if i % 97 == 50:
+            continue
+        close = 100 + 5 * math.sin(i / 20) + math.sin(i / 3)
+        candles.append(Candle(
+            timestamp=START + timedelta(minutes=15 * i), symbol="BTC-USDT-SWAP", timeframe="15m",
+            open=close, high=close + 1, low=close - 1, close=close, volume=1.0, data_source="test",
+        ))
+    return candles
+
+
+class BucketProvider(CandleArrayProvider):
+    """Provider answering the bucket aggregate like the database would."""
+
+    def __init__(self, candles):
+        super().__init__(candles)
+        self.candle_calls = 0
+        self.bucket_calls = []
+
+    async def get_candles(self, symbol, timeframe, start_date, end_date, limit=None):
+        self.candle_calls += 1
+        return await super().get_candles(symbol, timeframe, start_date, end_date, limit)
+
+    async def get_bucket_closes(self, symbol, timeframe, start_date, end_date, bucket_minutes):
+        self.bucket_calls.append(list(bucket_minutes))
+        rows = [c for c in self.candles if start_date <= c.timestamp <= end_date]
+        close = np.array([c.close for c in rows])
+        seconds = np.array([int(c.timestamp.timestamp()) for c in rows])
+        return {m: bucket_closes_np(close, seconds, m) for m in bucket_minutes}
+
+
+async def test_one_query_splits_warmup_and_aligns_mtf_closes():
+    candles = _make_candles()
+    provider = BucketProvider(candles)
+    run_start = START + timedelta(minutes=15 * 400)
+
+    prefetched = await prefetch_candles(
+        provider, "BTC-USDT-SWAP", "15m", run_start, START + timedelta(minutes=15 * 899), warmup_bars=200
+    )
+
+    minutes = mtf_close_minutes(15)
+    assert provider.candle_calls == 1 and provider.bucket_calls == [sorted(set(minutes.values()))]
+    # 워밍업은 시간 범위로 로드하므로 빠진 캔들만큼 줄어듦
+    assert len(prefetched.warmup) == 198 and prefetched.candles[0].timestamp == run_start
+    assert prefetched.warmup[0].timestamp == START + timedelta(minutes=15 * 200)
+
+    history = prefetched.history
+    close = np.array([c.close for c in history])
+    seconds = np.array([int(c.timestamp.timestamp()) for c in history])
+    assert set(prefetched.mtf_closes) == set(minutes)
+    for name, target_minutes in minutes.items():
+        np.testing.assert_array_equal(prefetched.mtf_closes[name], resample_close_np(close, seconds, target_minutes))
+
+
+async def test_in_memory_fallback_matches_aggregate():
+    candles = _make_candles()
+    args = ("BTC-USDT-SWAP", "15m", START + timedelta(minutes=15 * 300), START + timedelta(minutes=15 * 800))
+
+    aggregated = await prefetch_candles(BucketProvider(candles), *args, warmup_bars=100)
+    in_memory = await prefetch_candles(CandleArrayProvider(candles), *args, warmup_bars=100)
+
+    assert [c.timestamp for c in in_memory.history] == [c.timestamp for c in aggregated.history]
+    for name, values in aggregated.mtf_closes.items():
+        np.testing.assert_array_equal(in_memory.mtf_closes[name], values)
@@ -0,0 +1,134 @@
+"""Tests for the multi-symbol portfolio engine."""
+
+import math
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from BACKTEST.data.data_provider import DataProvider
+from BACKTEST.engine import BacktestEngine, PortfolioEngine, PortfolioLeg, combine_equity_arrays
+from BACKTEST.models.candle import Candle
+from BACKTEST.optimization import CandleArrayProvider
+from BACKTEST.strategies.hyperrsi_strategy import HyperrsiStrategy
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+PARAMS = {
+    "entry_option": "rsi_only", "pyramiding_enabled": False, "use_sl": True, "stop_loss_percent": 2.0,
+    "use_tp1": True, "tp1_value": 1.0, "tp1_ratio": 100, "use_tp2": False, "use_tp3": False,
+}
+RUN_START = START + timedelta(minutes=5 * 100)
+RUN_END = START + timedelta(minutes=5 * 499)
+
+
+def _make_candles(symbol, phase=0.0, offset_minutes=0, n=500):
+    candles = []
+    for i in range(n):
+        close = 100 + 8 * math.sin(i / 15 + phase) + 3 * math.sin(i / 4)
+        candles.append(Candle(
+            timestamp=START + timedelta(minutes=5 * i + offset_minutes),
+            symbol=symbol, timeframe="5m",
+            open=close - 0.2, high=close + 0.5, low=close - 0.5, close=close, volume=10.0,
+            rsi=50 + 45 * math.sin(i / 12 + phase), atr=1.0, trend_state=0, data_source="test",
+        ))
+    return candles
+
+
+class MultiSymbolProvider(DataProvider):
+    """In-memory provider over one candle list per symbol."""
+
+    def __init__(self, candles_by_symbol):
+        self.providers = {s: CandleArrayProvider(c) for s, c in candles_by_symbol.items()}
+
+    async def get_candles(self, symbol, timeframe, start_date, end_date, limit=None):
+        return await self.providers[symbol].get_candles(symbol, timeframe, start_date, end_date, limit)
+
+    async def get_candles_df(self, symbol, timeframe, start_date, end_date, limit=None):
+        return await self.providers[symbol].get_candles_df(symbol, timeframe, start_date, end_date, limit)
+
+    async def validate_data_availability(self, symbol, timeframe, start_date, end_date):
+        return await self.providers[symbol].validate_data_availability(symbol, timeframe, start_date, end_date)
+
+    async def get_latest_timestamp(self, symbol, timeframe):
+        return await self.providers[symbol].get_latest_timestamp(symbol, timeframe)
+
+    async def get_symbol_info(self, symbol):
+        return None
+
+
+@pytest.fixture(scope="module")
+def candles_by_symbol():
+    return {
+        "BTC-USDT-SWAP": _make_candles("BTC-USDT-SWAP"),
+        "ETH-USDT-SWAP": _make_candles("ETH-USDT-SWAP", phase=1.3, offset_minutes=1),
+    }
+
+
+async def _single_run(candles, initial_balance):
+    engine = BacktestEngine(CandleArrayProvider(candles), initial_balance=initial_balance, enable_event_logging=False)
+    return await engine.run(
+        user_id=uuid4(), symbol=candles[0].symbol, timeframe="5m", start_date=RUN_START, end_date=RUN_END,
+        strategy_name="hyperrsi", strategy_params=PARAMS, strategy_executor=HyperrsiStrategy(PARAMS)
+    )
+
+
+async def test_shared_capital_merges_streams_into_one_balance(candles_by_symbol):
+    engine = PortfolioEngine(MultiSymbolProvider(candles_by_symbol), initial_balance=20000.0)
+    legs = [PortfolioLeg(symbol, PARAMS) for symbol in candles_by_symbol]
+
+    summary = await engine.run(uuid4(), legs, "5m", RUN_START, RUN_END)
+
+    results = summary["results"]
+    assert all(r.total_trades > 0 for r in results.values())
+    realized = sum(r.final_balance - r.initial_balance for r in results.values())
+    assert summary["final_balance"] == pytest.approx(20000.0 + realized)
+    # 두 심볼의 캔들 시각이 달라 합쳐진 곡선은 양쪽 시각을 모두 포함 (ETH 마지막 캔들은 구간 밖)
+    assert len(summary["equity_curve"]) == 400 + 399
+    assert summary["total_trades"] == sum(r.total_trades for r in results.values())
+
+    # 자본이 충분하면 각 심볼은 단독 실행과 동일하게 거래
+    alone = await _single_run(candles_by_symbol["BTC-USDT-SWAP"], 10000.0)
+    btc = results["BTC-USDT-SWAP"]
+    assert btc.final_balance - btc.initial_balance == pytest.approx(alone.final_balance - alone.initial_balance)
+
+
+async def test_shared_capital_limits_entries_by_free_margin():
+    same = {s: _make_candles(s) for s in ("BTC-USDT-SWAP", "ETH-USDT-SWAP")}
+    engine = PortfolioEngine(MultiSymbolProvider(same), initial_balance=150.0, slippage_percent=0.0)
+    legs = [PortfolioLeg(symbol, {**PARAMS, "stop_loss_percent": 0.1}) for symbol in same]
+
+    # 두 심볼이 같은 캔들에서 진입하는 짧은 구간
+    summary = await engine.run(uuid4(), legs, "5m", RUN_START, RUN_START + timedelta(minutes=10))
+
+    first, second = (summary["results"][s].trades[0] for s in same)
+    assert first.entry_timestamp == second.entry_timestamp
+    # 첫 심볼이 100 USDT 증거금을 쓰고 남은 50 USDT의 95%로 진입
+    assert second.quantity == pytest.approx(first.quantity * 47.5 / 100, rel=0.01)
+
+
+async def test_independent_legs_run_in_parallel(candles_by_symbol):
+    engine = PortfolioEngine(
+        MultiSymbolProvider(candles_by_symbol), initial_balance=30000.0, share_capital=False, max_workers=2
+    )
+    legs = [PortfolioLeg("BTC-USDT-SWAP", PARAMS, weight=2), PortfolioLeg("ETH-USDT-SWAP", PARAMS, weight=1)]
+
+    summary = await engine.run(uuid4(), legs, "5m", RUN_START, RUN_END, equity_curve_points=50)
+
+    assert summary["allocations"] == {"BTC-USDT-SWAP": 20000.0, "ETH-USDT-SWAP": 10000.0}
+    btc = summary["results"]["BTC-USDT-SWAP"]
+    alone = await _single_run(candles_by_symbol["BTC-USDT-SWAP"], 20000.0)
+    assert btc.final_balance == pytest.approx(alone.final_balance) and btc.total_trades == alone.total_trades
+    assert summary["final_balance"] == pytest.approx(sum(r.final_balance for r in summary["results"].values()))
+    assert len(summary["equity_curve"]) == 50
+
+
+def test_combine_equity_arrays_carries_values_forward():
+    a = {"timestamp": np.array([0, 10]), "balance": np.array([100.0, 110.0]), "equity": np.array([101.0, 110.0])}
+    b = {"timestamp": np.array([5]), "balance": np.array([50.0]), "equity": np.array([45.0])}
+
+    combined = combine_equity_arrays([a, b], [100.0, 60.0])
+
+    assert combined["timestamp"].tolist() == [0, 5, 10]
+    assert combined["equity"].tolist() == [161.0, 146.0, 155.0]
+    assert combined["balance"].tolist() == [160.0, 150.0, 160.0]
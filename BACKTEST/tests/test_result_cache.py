@@ -0,0 +1,90 @@
+"""Tests for the content-addressed backtest result cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fakeredis import aioredis
+
+from BACKTEST.engine.backtest_engine import INDICATOR_WARMUP_BARS
+from BACKTEST.storage.result_cache import BacktestResultCache
+
+REQUEST = {
+    "symbol": "BTC-USDT-SWAP",
+    "timeframe": "1h",
+    "start_date": "2025-01-01T00:00:00Z",
+    "end_date": "2025-02-01T00:00:00Z",
+    "strategy_name": "hyperrsi",
+    "strategy_params": {"rsi_period": 14, "leverage": 10.0},
+    "initial_balance": 10000.0,
+    "user_id": "a",
+}
+
+
+class FakeProvider:
+    def __init__(self, watermark):
+        self.watermark = watermark
+        self.windows = []
+
+    async def get_data_watermark(self, symbol, timeframe, start, end):
+        self.windows.append((start, end))
+        return self.watermark
+
+    async def close(self):
+        pass
+
+
+def _cache(watermark={"count": 744, "first": "2025-01-01T00:00:00", "last": "2025-01-31T23:00:00"}):
+    return BacktestResultCache(redis=aioredis.FakeRedis(), data_provider=FakeProvider(dict(watermark)))
+
+
+@pytest.mark.asyncio
+async def test_key_is_canonical_and_ignores_user():
+    cache = _cache()
+    reordered = {
+        **{k: REQUEST[k] for k in reversed(list(REQUEST))},
+        "strategy_params": {"leverage": 10, "rsi_period": 14},
+        "initial_balance": 10000,
+        "user_id": "b",
+    }
+
+    key = await cache.build_key(REQUEST)
+
+    assert key is not None and key == await cache.build_key(reordered)
+    assert key != await cache.build_key({**REQUEST, "strategy_params": {"rsi_period": 21, "leverage": 10}})
+
+
+@pytest.mark.asyncio
+async def test_data_change_and_invalidate_change_key():
+    cache = _cache()
+    key = await cache.build_key(REQUEST)
+
+    cache.data_provider.watermark["count"] += 1
+    backfilled = await cache.build_key(REQUEST)
+    assert backfilled != key
+
+    await cache.invalidate("btc-usdt-swap", "1h")
+    assert await cache.build_key(REQUEST) not in (key, backfilled)
+
+
+@pytest.mark.asyncio
+async def test_watermark_window_includes_warmup_bars():
+    cache = _cache()
+
+    await cache.build_key(REQUEST)
+
+    start, end = cache.data_provider.windows[-1]
+    assert start == datetime(2025, 1, 1, tzinfo=timezone.utc) - timedelta(hours=INDICATOR_WARMUP_BARS)
+    assert end == datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_missing_watermark():
+    cache = _cache()
+    key = await cache.build_key(REQUEST)
+    result = {"symbol": "BTC-USDT-SWAP", "trades": [{"pnl": 1.5}], "sharpe_ratio": None}
+
+    assert await cache.get(key) is None
+    await cache.set(key, result)
+    assert await cache.get(key) == result
+
+    assert await _cache(watermark={}).build_key(REQUEST) is None
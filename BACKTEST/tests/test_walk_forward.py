@@ -0,0 +1,62 @@
+"""Tests for walk-forward analysis."""
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+
+from BACKTEST.analysis import WalkForward, walk_forward_folds
+from BACKTEST.engine import BacktestEngine
+from BACKTEST.optimization import CandleArrayProvider
+from BACKTEST.optimization.grid_search import SUMMARY_METRICS
+from BACKTEST.strategies.hyperrsi_strategy import HyperrsiStrategy
+from BACKTEST.tests.test_grid_search import BASE_PARAMS, PARAM_RANGES, START, _make_candles
+
+BAR = timedelta(minutes=5)
+
+
+def test_rolling_and_anchored_folds():
+    end = START + timedelta(days=10)
+
+    rolling = walk_forward_folds(START, end, timedelta(days=4), timedelta(days=2))
+    anchored = walk_forward_folds(START, end, timedelta(days=4), timedelta(days=2), anchored=True)
+
+    assert len(rolling) == 3
+    assert rolling[1].in_sample_start == START + timedelta(days=2)
+    assert rolling[1].out_of_sample_start == START + timedelta(days=6)
+    assert rolling[1].in_sample_end < rolling[1].out_of_sample_start
+    assert rolling[-1].out_of_sample_end < end
+    assert [f.in_sample_start for f in anchored] == [START] * 3
+    with pytest.raises(ValueError):
+        walk_forward_folds(START, end, timedelta(0), timedelta(days=1))
+
+
+async def test_walk_forward_out_of_sample_matches_sequential_run(tmp_path):
+    candles = _make_candles(800)
+    analysis = WalkForward(
+        symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=START + 100 * BAR, end_date=START + 799 * BAR,
+        param_ranges=PARAM_RANGES, base_params=BASE_PARAMS,
+        in_sample=300 * BAR, out_of_sample=150 * BAR,
+        rank_by=["total_return_percent"], min_trades=0, max_workers=2,
+        results_path=str(tmp_path / "folds.jsonl"),
+    )
+
+    summary = analysis.run(candles)
+
+    assert summary["total_folds"] == 2 and summary["scored_folds"] == 2
+    assert len((tmp_path / "folds.jsonl").read_text().splitlines()) == 2
+    fold = summary["folds"][1]
+    assert fold["in_sample_combinations"] == 4 and fold["in_sample_failed"] == 0
+
+    engine = BacktestEngine(CandleArrayProvider(candles), enable_event_logging=False)
+    result = await engine.run(
+        user_id=uuid4(), symbol="BTC-USDT-SWAP", timeframe="5m",
+        start_date=analysis.folds[1].out_of_sample_start, end_date=analysis.folds[1].out_of_sample_end,
+        strategy_name="hyperrsi", strategy_params=fold["best_params"],
+        strategy_executor=HyperrsiStrategy(fold["best_params"])
+    )
+    assert fold["out_of_sample_metrics"] == {name: getattr(result, name) for name in SUMMARY_METRICS}
+    assert summary["out_of_sample"]["total_trades"] == sum(
+        f["out_of_sample_metrics"]["total_trades"] for f in summary["folds"]
+    )
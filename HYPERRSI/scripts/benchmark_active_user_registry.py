@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: active_symbols 키스페이스 SCAN vs 활성 사용자 인덱스
+
+전용 Redis DB에 사용자 N명(사용자당 활성 심볼 1~3개, 대부분 비활성 키와 섞임)을
+생성하고, Beat 주기마다 실행되는 활성 사용자 조회 두 방식의 소요 시간과
+Redis 라운드트립 수를 비교합니다.
+
+- scan: _get_multi_symbol_active_users()와 같은 키별 순차 조회
+- registry: ActiveUserRegistry.get_runnable_entries()
+
+실행 방법:
+    python -m HYPERRSI.scripts.benchmark_active_user_registry --redis-url redis://localhost:6379/15 --flush
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from redis.asyncio import Redis
+
+from HYPERRSI.src.services.active_user_registry import (
+    REDIS_KEY_ACTIVE_SYMBOLS,
+    REDIS_KEY_SYMBOL_PRESET_ID,
+    REDIS_KEY_SYMBOL_TASK_RUNNING,
+    REDIS_KEY_SYMBOL_TIMEFRAME,
+    get_active_user_registry,
+)
+
+SYMBOLS = ("BTC-USDT-SWAP", "ETH-USDT-SWAP", "SOL-USDT-SWAP")
+
+
+class CountingRedis(Redis):
+    """명령 라운드트립 수 집계 (파이프라인 execute는 1회로 계산)"""
+
+    round_trips = 0
+
+    async def execute_command(self, *args, **options):
+        CountingRedis.round_trips += 1
+        return await super().execute_command(*args, **options)
+
+    def pipeline(self, transaction=True, shard_hint=None):
+        pipe = super().pipeline(transaction, shard_hint)
+        execute = pipe.execute
+
+        async def counted(*args, **kwargs):
+            CountingRedis.round_trips += 1
+            return await execute(*args, **kwargs)
+
+        pipe.execute = counted
+        return pipe
+
+
+async def seed(redis: Redis, users: int, noise: int) -> None:
+    """사용자/심볼 키와 비활성 키 생성 후 인덱스 구축"""
+    pipe = redis.pipeline(transaction=False)
+    for i in range(users):
+        okx_uid = str(500000000000 + i)
+        for symbol in SYMBOLS[: 1 + i % 3]:
+            pipe.sadd(REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid=okx_uid), symbol)
+            pipe.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol), "1m")
+            pipe.set(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol), "default")
+            if i % 10 == 0:
+                pipe.hset(
+                    REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid=okx_uid, symbol=symbol),
+                    mapping={"status": "running", "started_at": str(time.time())}
+                )
+        for j in range(noise):
+            pipe.set(f"user:{okx_uid}:noise:{j}", "x")
+        if i % 500 == 499:
+            await pipe.execute()
+    await pipe.execute()
+    await get_active_user_registry().reconcile(redis)
+
+
+async def scan_active_users(redis: Redis) -> list:
+    """기존 방식: SCAN + 키별 순차 SMEMBERS/HGETALL/GET"""
+    active = []
+    async for key in redis.scan_iter(match="user:*:active_symbols", count=100):
+        okx_uid = key.split(":")[1]
+        for symbol in await redis.smembers(key):
+            state = await redis.hgetall(REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid=okx_uid, symbol=symbol))
+            if state and state.get("status") == "running":
+                continue
+            timeframe = await redis.get(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol))
+            preset_id = await redis.get(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol))
+            if timeframe:
+                active.append((okx_uid, symbol, timeframe, preset_id))
+    return active
+
+
+async def registry_active_users(redis: Redis) -> list:
+    entries = await get_active_user_registry().get_runnable_entries(redis)
+    return [(e["okx_uid"], e["symbol"], e["timeframe"], e["preset_id"]) for e in entries]
+
+
+async def measure(label: str, fetch, redis: Redis, repeat: int) -> list:
+    timings, result = [], []
+    CountingRedis.round_trips = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = await fetch(redis)
+        timings.append(time.perf_counter() - started)
+    print(
+        f"{label:>9}: median {statistics.median(timings) * 1000:8.1f} ms, "
+        f"round trips/call {CountingRedis.round_trips // repeat:6d}, entries {len(result)}"
+    )
+    return sorted(result)
+
+
+async def main_async(args) -> None:
+    redis = CountingRedis.from_url(args.redis_url, decode_responses=True)
+    try:
+        if await redis.dbsize():
+            if not args.flush:
+                raise SystemExit(f"{args.redis_url} 가 비어 있지 않음 - 전용 DB를 지정하거나 --flush 사용")
+            await redis.flushdb()
+
+        started = time.perf_counter()
+        await seed(redis, args.users, args.noise)
+        print(f"seed: {args.users} users, {await redis.dbsize()} keys in {time.perf_counter() - started:.1f}s")
+
+        scanned = await measure("scan", scan_active_users, redis, args.repeat)
+        indexed = await measure("registry", registry_active_users, redis, args.repeat)
+        print("results match" if scanned == indexed else "RESULTS DIFFER")
+    finally:
+        if args.flush:
+            await redis.flushdb()
+        await redis.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="활성 사용자 조회 벤치마크")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15", help="전용 Redis DB URL")
+    parser.add_argument("--users", type=int, default=10000, help="사용자 수")
+    parser.add_argument("--noise", type=int, default=5, help="사용자당 비활성 키 수")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 반복 횟수")
+    parser.add_argument("--flush", action="store_true", help="DB가 비어 있지 않으면 비우고 종료 시에도 비움")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
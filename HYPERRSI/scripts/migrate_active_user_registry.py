@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+활성 사용자 인덱스 마이그레이션 스크립트
+
+기존 user:{okx_uid}:active_symbols 키에서 활성 사용자 인덱스
+(trading:registry:*)를 1회 구축합니다. 이미 구축된 경우 차이만 반영합니다.
+Beat의 reconcile_active_user_registry 태스크와 같은 작업이므로 여러 번 실행해도 안전합니다.
+
+실행 방법:
+    python -m HYPERRSI.scripts.migrate_active_user_registry
+
+옵션:
+    --dry-run: 실제 변경 없이 원본/인덱스 항목 수만 확인
+"""
+
+import argparse
+import asyncio
+
+from HYPERRSI.src.services.active_user_registry import get_active_user_registry
+from shared.database.redis_patterns import RedisTimeout, redis_context
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+async def run_migration(dry_run: bool = False) -> dict:
+    """
+    인덱스 구축 실행
+
+    Returns:
+        {"entries", "added", "removed"} (dry-run이면 {"entries", "indexed"})
+    """
+    registry = get_active_user_registry()
+
+    async with redis_context(timeout=RedisTimeout.SLOW_OPERATION) as redis:
+        if dry_run:
+            source = await registry._scan_source_entries(redis)
+            indexed = await registry.get_entries(redis)
+            return {"entries": len(source), "indexed": len(indexed)}
+        return await registry.reconcile(redis)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="활성 사용자 인덱스 마이그레이션")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="실제 변경 없이 원본/인덱스 항목 수만 확인"
+    )
+    args = parser.parse_args()
+
+    result = asyncio.run(run_migration(dry_run=args.dry_run))
+    if args.dry_run:
+        print(f"원본 활성 항목: {result['entries']}, 인덱스 항목: {result['indexed']}")
+    else:
+        print(f"인덱스 구축 완료: 총 {result['entries']}, 추가/갱신 {result['added']}, 제거 {result['removed']}")
+
+
+if __name__ == "__main__":
+    main()
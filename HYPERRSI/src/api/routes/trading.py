@@ -29,6 +29,7 @@ from HYPERRSI.src.api.routes.trading_docs import (
 from HYPERRSI.src.bot.telegram_message import send_telegram_message
 from HYPERRSI.src.core.celery_task import celery_app
 from HYPERRSI.src.core.error_handler import ErrorCategory, handle_critical_error
+from HYPERRSI.src.services.active_user_registry import get_active_user_registry
 from HYPERRSI.src.services.multi_symbol_service import (
     multi_symbol_service,
     MaxSymbolsReachedError,
@@ -1176,8 +1177,9 @@ async def stop_all_running_users():
                                 except Exception as del_err:
                                     logger.warning(f"키 삭제 중 오류 발생 (key: {key_to_del}): {str(del_err)}")
 
-                            # active_symbols에서 제거
+                            # active_symbols 및 활성 사용자 인덱스에서 제거
                             await redis.srem(f"user:{okx_uid}:active_symbols", symbol)
+                            await get_active_user_registry().unregister(okx_uid, symbol, redis=redis)
 
                             logger.debug(f"사용자 {okx_uid}, 심볼 {symbol}의 Redis 상태 초기화 완료")
                         except Exception as redis_err:
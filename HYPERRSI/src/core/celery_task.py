@@ -126,6 +126,10 @@ beat_schedule = {
         'task': 'trading_tasks.check_and_execute_trading',
         'schedule': 5.0,  # 5초마다 실행
     },
+    'reconcile-active-user-registry': {
+        'task': 'trading_tasks.reconcile_active_user_registry',
+        'schedule': 300.0,  # 5분마다 활성 사용자 인덱스 정합성 복구
+    },
     'cleanup-old-logs': {
         'task': 'maintenance_tasks.cleanup_old_logs',
         'schedule': crontab(hour=3, minute=0),  # 매일 새벽 3시 실행
@@ -3,30 +3,55 @@
 """
 CandlesDB Writer
 PostgreSQL에 캔들 데이터 저장 (dual-write with Redis)
+
+upsert_candles()는 바로 쓰지 않고 (symbol, timeframe)별 dirty 집합에 넣습니다.
+- 마지막으로 기록한 값과 같은 행은 건너뜀 (변경/신규 행만 기록)
+- 같은 캔들의 여러 갱신은 마지막 값 하나로 합쳐짐
+- 백그라운드 스레드가 flush_interval마다 모든 시리즈를 한 트랜잭션으로 기록
+  (테이블별 execute_values 한 번, 타임프레임은 같은 테이블에 묶음)
 """
 
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 
 import psycopg2
+from prometheus_client import Counter, Histogram
 from psycopg2.extras import execute_values
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+FLUSH_ROWS = Histogram(
+    'candlesdb_flush_rows',
+    'Candle rows written per CandlesDB flush',
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000, 3000, 10000),
+)
+FLUSH_SERIES = Histogram(
+    'candlesdb_flush_series',
+    'Series (symbol x timeframe) coalesced into one CandlesDB flush',
+    buckets=(1, 2, 3, 5, 10, 20, 50),
+)
+CANDLE_ROWS = Counter(
+    'candlesdb_rows_total',
+    'Candle rows offered to the CandlesDB writer',
+    ['result'],
+)
+
 
 class CandlesDBWriter:
     """CandlesDB PostgreSQL Writer with connection pooling"""
 
     def __init__(self):
         """Initialize connection pool"""
-        self.pool: SimpleConnectionPool | None = None
+        self.pool: ThreadedConnectionPool | None = None
         self.enabled = False
 
         # 모니터링 카운터
@@ -39,6 +64,25 @@ class CandlesDBWriter:
         self.max_retries = 3
         self.retry_delay_base = 1  # 초
         self.health_check_interval = 60  # 60초마다 health check
+        self.flush_interval = 1.0  # 초
+        self.max_pending_rows = 5000  # 이 이상 쌓이면 즉시 flush
+        self.track_rows = 4000  # 시리즈별로 기억할 마지막 기록 행 수
+
+        # dirty 집합: (table, timeframe) → {time: row}
+        self._pending: dict[tuple[str, str], dict[datetime, tuple]] = {}
+        # 마지막으로 기록한 행 및 high-water mark
+        self._flushed: dict[tuple[str, str], OrderedDict[datetime, tuple]] = {}
+        self._high_water: dict[tuple[str, str], datetime] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._flush_thread: threading.Thread | None = None
+        self._stopping = False
+
+        # flush 통계
+        self.skipped_count = 0
+        self.flush_count = 0
+        self.last_flush_rows = 0
 
         self._init_pool()
 
@@ -53,7 +97,7 @@ class CandlesDBWriter:
             candles_user = settings.CANDLES_USER
             candles_password = settings.CANDLES_PASSWORD
 
-            self.pool = SimpleConnectionPool(
+            self.pool = ThreadedConnectionPool(
                 minconn=1,
                 maxconn=10,
                 host=candles_host,
@@ -82,7 +126,13 @@ class CandlesDBWriter:
             self.pool.putconn(conn)
 
     def close_pool(self):
-        """Close all connections in pool"""
+        """남은 dirty 행을 기록한 뒤 flush 스레드와 pool 종료"""
+        self._stopping = True
+        self._flush_event.set()
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=self.flush_interval * 5)
+        if self.enabled and self._pending:
+            self.flush()
         if self.pool:
             self.pool.closeall()
             logger.info("CandlesDB connection pool closed")
@@ -271,56 +321,56 @@ class CandlesDBWriter:
             int(candle.get("bb_state") or candle.get("BB_State") or 0) if (candle.get("bb_state") is not None or candle.get("BB_State") is not None) else None,  # bb_state
         )
 
-    def _do_upsert(self, table_name: str, timeframe_str: str, rows: list[tuple]) -> bool:
+    @staticmethod
+    def _upsert_query(table_name: str) -> str:
+        """ON CONFLICT UPDATE upsert 쿼리"""
+        return f"""
+            INSERT INTO {table_name} (
+                time, timeframe, open, high, low, close, volume,
+                rsi14, atr, ema7, ma20, trend_state, auto_trend_state,
+                cycle_bull, cycle_bear, bb_state
+            )
+            VALUES %s
+            ON CONFLICT (time, timeframe)
+            DO UPDATE SET
+                open = EXCLUDED.open,
+                high = EXCLUDED.high,
+                low = EXCLUDED.low,
+                close = EXCLUDED.close,
+                volume = EXCLUDED.volume,
+                rsi14 = EXCLUDED.rsi14,
+                atr = EXCLUDED.atr,
+                ema7 = EXCLUDED.ema7,
+                ma20 = EXCLUDED.ma20,
+                trend_state = EXCLUDED.trend_state,
+                auto_trend_state = EXCLUDED.auto_trend_state,
+                cycle_bull = EXCLUDED.cycle_bull,
+                cycle_bear = EXCLUDED.cycle_bear,
+                bb_state = EXCLUDED.bb_state;
+        """
+
+    def _do_upsert(self, rows_by_table: dict[str, list[tuple]]) -> bool:
         """
         실제 upsert 작업 수행 (retry 가능)
 
+        모든 테이블을 한 연결/한 트랜잭션으로 기록
+
         Args:
-            table_name: Table name
-            timeframe_str: Timeframe string
-            rows: Rows to upsert
+            rows_by_table: table name → rows
 
         Returns:
             Success flag
         """
         conn = None
+        cur = None
         try:
             conn = self.get_connection()
             cur = conn.cursor()
 
-            # Upsert query with ON CONFLICT UPDATE
-            upsert_query = f"""
-                INSERT INTO {table_name} (
-                    time, timeframe, open, high, low, close, volume,
-                    rsi14, atr, ema7, ma20, trend_state, auto_trend_state,
-                    cycle_bull, cycle_bear, bb_state
-                )
-                VALUES %s
-                ON CONFLICT (time, timeframe)
-                DO UPDATE SET
-                    open = EXCLUDED.open,
-                    high = EXCLUDED.high,
-                    low = EXCLUDED.low,
-                    close = EXCLUDED.close,
-                    volume = EXCLUDED.volume,
-                    rsi14 = EXCLUDED.rsi14,
-                    atr = EXCLUDED.atr,
-                    ema7 = EXCLUDED.ema7,
-                    ma20 = EXCLUDED.ma20,
-                    trend_state = EXCLUDED.trend_state,
-                    auto_trend_state = EXCLUDED.auto_trend_state,
-                    cycle_bull = EXCLUDED.cycle_bull,
-                    cycle_bear = EXCLUDED.cycle_bear,
-                    bb_state = EXCLUDED.bb_state;
-            """
-
-            # Execute batch upsert
-            execute_values(cur, upsert_query, rows)
+            for table_name, rows in rows_by_table.items():
+                # Execute batch upsert (한 번의 round trip)
+                execute_values(cur, self._upsert_query(table_name), rows, page_size=max(len(rows), 1))
             conn.commit()
-
-            logger.debug(
-                f"✅ CandlesDB upsert: {table_name} ({timeframe_str}) - {len(rows)} candles"
-            )
             return True
 
         except Exception as e:
@@ -330,14 +380,15 @@ class CandlesDBWriter:
 
         finally:
             if conn:
-                cur.close()
+                if cur:
+                    cur.close()
                 self.put_connection(conn)
 
     def upsert_candles(
         self, symbol: str, timeframe_minutes: int, candles: list[dict[str, Any]]
     ) -> bool:
         """
-        캔들 데이터를 DB에 upsert (insert or update) with retry
+        변경/신규 캔들을 dirty 집합에 추가 (백그라운드 flush로 DB에 upsert)
 
         Args:
             symbol: OKX symbol (e.g., "BTC-USDT-SWAP")
@@ -345,7 +396,7 @@ class CandlesDBWriter:
             candles: List of candle dicts
 
         Returns:
-            Success flag
+            Success flag (대기열 추가 여부)
         """
         if not self.enabled or not candles:
             return False
@@ -353,43 +404,130 @@ class CandlesDBWriter:
         table_name = self.normalize_symbol(symbol)
         timeframe_str = self.convert_timeframe(timeframe_minutes)
 
-        try:
-            # Prepare rows for batch insert
-            rows = []
-            for candle in candles:
+        # Prepare rows
+        rows = []
+        for candle in candles:
+            try:
+                row = self.convert_candle_to_db_row(candle, timeframe_str)
+                rows.append(row)
+            except Exception as e:
+                logger.warning(f"Failed to convert candle: {candle} - {e}")
+                continue
+
+        if not rows:
+            logger.warning(f"No valid rows to insert for {table_name}")
+            return False
+
+        dirty = self._mark_dirty((table_name, timeframe_str), rows)
+        CANDLE_ROWS.labels(result="skipped").inc(len(rows) - dirty)
+        self._ensure_flush_thread()
+        return True
+
+    def _mark_dirty(self, series: tuple[str, str], rows: list[tuple]) -> int:
+        """마지막 기록값/대기값과 다른 행만 dirty 집합에 추가, 추가된 수 반환"""
+        with self._lock:
+            pending = self._pending.setdefault(series, {})
+            flushed = self._flushed.get(series, {})
+            dirty = 0
+            for row in rows:
+                key = row[0]
+                current = pending[key] if key in pending else flushed.get(key)
+                if current == row:
+                    continue
+                pending[key] = row
+                dirty += 1
+            if not pending:
+                del self._pending[series]
+            self.skipped_count += len(rows) - dirty
+            pending_rows = sum(len(p) for p in self._pending.values())
+
+        if pending_rows >= self.max_pending_rows:
+            self._flush_event.set()
+        return dirty
+
+    def _ensure_flush_thread(self):
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._stopping = False
+            self._flush_thread = threading.Thread(
+                target=self._flush_loop, name="candlesdb-flush", daemon=True
+            )
+            self._flush_thread.start()
+
+    def _flush_loop(self):
+        """flush_interval마다 (또는 대기 행이 많으면 즉시) dirty 행 기록"""
+        while not self._stopping:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            if self._stopping:
+                break
+            if self.enabled and self._pending:
                 try:
-                    row = self.convert_candle_to_db_row(candle, timeframe_str)
-                    rows.append(row)
+                    self.flush()
                 except Exception as e:
-                    logger.warning(f"Failed to convert candle: {candle} - {e}")
-                    continue
+                    logger.error(f"❌ CandlesDB flush loop error: {e}")
+
+    def flush(self) -> bool:
+        """
+        대기 중인 dirty 행을 한 트랜잭션으로 기록
 
-            if not rows:
-                logger.warning(f"No valid rows to insert for {table_name}")
+        실패한 행은 다시 대기열에 넣어 다음 flush에서 재시도 (그 사이 더 새 값이 들어왔으면 새 값 유지)
+
+        Returns:
+            Success flag
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return True
+
+            rows_by_table: dict[str, list[tuple]] = {}
+            for (table_name, _), rows in batch.items():
+                rows_by_table.setdefault(table_name, []).extend(rows.values())
+            row_count = sum(len(rows) for rows in batch.values())
+
+            try:
+                self._retry_operation(self._do_upsert, rows_by_table)
+            except Exception as e:
+                with self._lock:
+                    for series, rows in batch.items():
+                        pending = self._pending.setdefault(series, {})
+                        for key, row in rows.items():
+                            pending.setdefault(key, row)
+                self.failure_count += row_count
+                self.last_failure_time = time.time()
+                CANDLE_ROWS.labels(result="failed").inc(row_count)
+                logger.error(
+                    f"❌ CandlesDB flush failed: {len(batch)} series, {row_count} rows - {e} "
+                    f"(success: {self.success_count}, failures: {self.failure_count})"
+                )
                 return False
 
-            # Retry upsert operation with exponential backoff
-            self._retry_operation(self._do_upsert, table_name, timeframe_str, rows)
+            with self._lock:
+                for series, rows in batch.items():
+                    flushed = self._flushed.setdefault(series, OrderedDict())
+                    for key, row in rows.items():
+                        flushed[key] = row
+                        flushed.move_to_end(key)
+                    while len(flushed) > self.track_rows:
+                        flushed.popitem(last=False)
+                    newest = max(rows)
+                    if series not in self._high_water or newest > self._high_water[series]:
+                        self._high_water[series] = newest
 
             # 성공 카운터 증가
-            self.success_count += len(rows)
-            logger.info(
-                f"✅ CandlesDB upsert: {table_name} ({timeframe_str}) - {len(rows)} candles "
+            self.success_count += row_count
+            self.flush_count += 1
+            self.last_flush_rows = row_count
+            FLUSH_ROWS.observe(row_count)
+            FLUSH_SERIES.observe(len(batch))
+            CANDLE_ROWS.labels(result="written").inc(row_count)
+            logger.debug(
+                f"✅ CandlesDB flush: {len(batch)} series, {row_count} candles "
                 f"(success: {self.success_count}, failures: {self.failure_count})"
             )
             return True
 
-        except Exception as e:
-            # 실패 카운터 증가
-            self.failure_count += len(candles)
-            self.last_failure_time = time.time()
-
-            logger.error(
-                f"❌ CandlesDB upsert failed: {table_name} ({timeframe_str}) - {e} "
-                f"(success: {self.success_count}, failures: {self.failure_count})"
-            )
-            return False
-
     def upsert_single_candle(
         self, symbol: str, timeframe_minutes: int, candle: dict[str, Any]
     ) -> bool:
@@ -425,6 +563,13 @@ class CandlesDBWriter:
             ),
             "last_failure_time": self.last_failure_time,
             "last_health_check": self.last_health_check,
+            "skipped_count": self.skipped_count,
+            "flush_count": self.flush_count,
+            "last_flush_rows": self.last_flush_rows,
+            "pending_rows": sum(len(rows) for rows in self._pending.values()),
+            "high_water": {
+                f"{table}:{tf}": ts.isoformat() for (table, tf), ts in self._high_water.items()
+            },
         }
         return stats
 
@@ -436,7 +581,10 @@ class CandlesDBWriter:
             f"enabled={stats['enabled']}, "
             f"success={stats['success_count']}, "
             f"failure={stats['failure_count']}, "
-            f"rate={stats['success_rate']:.1f}%"
+            f"rate={stats['success_rate']:.1f}%, "
+            f"skipped={stats['skipped_count']}, "
+            f"flushes={stats['flush_count']}, "
+            f"pending={stats['pending_rows']}"
         )
 
 
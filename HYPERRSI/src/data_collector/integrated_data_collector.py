@@ -14,8 +14,16 @@ import redis
 
 from HYPERRSI.src.config import OKX_API_KEY, OKX_PASSPHRASE, OKX_SECRET_KEY
 from HYPERRSI.src.core.config import settings
+from HYPERRSI.src.trading.bar_events import publish_bar_close
 from HYPERRSI.src.trading.models import get_auto_trend_timeframe
-from shared.indicators import compute_all_indicators, add_auto_trend_state_to_candles
+from shared.database.candle_store import (
+    CSV_FORMAT,
+    keep_existing_merge,
+    read_candles,
+    read_last_candle,
+    upsert_candles,
+)
+from shared.indicators import StreamingIndicatorState, add_auto_trend_state_to_candles, compute_all_indicators
 from shared.logging import get_logger
 
 # 로깅 설정
@@ -29,6 +37,15 @@ TF_MAP = {1: '1m', 3: '3m', 5: '5m', 15: '15m', 30: '30m', 60: '1h', 240: '4h'}
 MAX_CANDLE_LEN = 3000
 POLLING_CANDLES = 10  # 한 번에 폴링할 캔들 수 (바 종료 시점에 최신 몇 개만 확인)
 MIN_CANDLES_FOR_INDICATORS = 199  # 지표 계산에 필요한 최소 캔들 수 (SMA200은 인덱스 199부터 정확하게 계산됨)
+INDICATOR_STATE_TTL = 60 * 60 * 24 * 3  # 증분 지표 상태 체크포인트 TTL (3일)
+COLLECTOR_IO_WORKERS = 8  # API 요청 동시 실행 수
+COLLECTOR_CPU_WORKERS = 1  # 지표 계산/저장 워커 (순수 Python 연산이라 GIL 때문에 늘려도 이득 없음)
+OKX_CANDLE_REQUESTS_PER_SEC = 15  # OKX 캔들 API 한도(40회/2초)보다 보수적으로 설정
+OKX_CANDLE_REQUEST_BURST = 20
+BAR_CLOSE_DELAY = 2.0  # 바 경계 이후 마감 캔들 조회까지 대기(초)
+SCHEDULER_METRICS_KEY = "collector:scheduler_metrics"
+# auto_trend_state 관련 필드 (상위 TF 리샘플링에 의존하므로 바 마감 시에만 재계산)
+AUTO_TREND_FIELDS = ("auto_trend_state", "cycle_bull", "cycle_bear", "bb_state", "bb_state_mtf")
 
 # 역매핑 생성 (ex: '1m' -> 1)
 REVERSE_TF_MAP = {v: k for k, v in TF_MAP.items()}
@@ -79,7 +96,18 @@ initial_data_loaded = threading.Event()
 last_candle_timestamps: dict[str, int] = {}
 last_check_times: dict[str, float] = {}
 
-from shared.utils.time_helpers import align_timestamp, calculate_update_interval, is_bar_end
+# (심볼:타임프레임)별 증분 지표 상태
+indicator_states: dict[str, StreamingIndicatorState] = {}
+
+from shared.utils.time_helpers import align_timestamp, calculate_update_interval
+
+from HYPERRSI.src.data_collector.polling_scheduler import PollingScheduler, RateLimiter, SeriesJob
+
+# OKX 캔들 API 전역 요청 예산 (모든 스레드 공유)
+api_rate_limiter = RateLimiter(rate=OKX_CANDLE_REQUESTS_PER_SEC, capacity=OKX_CANDLE_REQUEST_BURST)
+
+# 폴링 스케줄러 (polling_worker에서 생성, 지표 조회용)
+polling_scheduler: PollingScheduler | None = None
 
 # CandlesDB Writer
 from HYPERRSI.src.data_collector.candlesdb_writer import get_candlesdb_writer
@@ -99,22 +127,177 @@ def _get_candles_from_redis_for_auto_trend(symbol: str, tf_str: str) -> list:
     """
     key = f"candles_with_indicators:{symbol}:{tf_str}"
     try:
-        existing_list = redis_client.lrange(key, 0, -1)
-        candles = []
-        for item in existing_list:
-            try:
-                item_str = item.decode('utf-8') if isinstance(item, bytes) else item
-                obj = json.loads(item_str)
-                if "timestamp" in obj and "close" in obj:
-                    candles.append(obj)
-            except Exception:
-                pass
-        return candles
+        return [c for c in read_candles(redis_client, key) if "close" in c]
     except Exception as e:
         logger.warning(f"Redis에서 auto_trend 캔들 가져오기 실패: {symbol} {tf_str} - {e}")
         return []
 
 
+def _add_human_time(candle):
+    """UTC/한국 시간 문자열 추가"""
+    utc_dt = datetime.fromtimestamp(candle["timestamp"], UTC)
+    seoul_tz = pytz.timezone("Asia/Seoul")
+    dt_seoul = utc_dt.replace(tzinfo=pytz.utc).astimezone(seoul_tz)
+    candle["human_time"] = utc_dt.strftime("%Y-%m-%d %H:%M:%S")
+    candle["human_time_kr"] = dt_seoul.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _save_indicator_state(symbol, tf_str, state):
+    """증분 지표 상태를 Redis에 체크포인트"""
+    try:
+        redis_client.set(
+            f"indicator_state:{symbol}:{tf_str}",
+            json.dumps(state.to_dict()),
+            ex=INDICATOR_STATE_TTL
+        )
+    except Exception as e:
+        logger.warning(f"지표 상태 체크포인트 저장 실패: {symbol} {tf_str} - {e}")
+
+
+def _load_indicator_state(symbol, tf_str):
+    """메모리 → Redis 체크포인트 순으로 증분 지표 상태 조회 (없으면 None)"""
+    state_key = f"{symbol}:{tf_str}"
+    state = indicator_states.get(state_key)
+    if state is not None:
+        return state
+
+    try:
+        raw = redis_client.get(f"indicator_state:{symbol}:{tf_str}")
+        if raw:
+            state = StreamingIndicatorState.from_dict(json.loads(raw))
+            indicator_states[state_key] = state
+            logger.info(f"지표 상태 체크포인트 복원: {symbol} {tf_str} (마지막: {state.last_timestamp})")
+            return state
+    except Exception as e:
+        logger.warning(f"지표 상태 체크포인트 복원 실패, 재구성 필요: {symbol} {tf_str} - {e}")
+    return None
+
+
+def _reset_indicator_state(symbol, tf_str):
+    """전체 재계산 후 증분 상태 무효화 (다음 갱신 때 캔들 리스트로 재구성)"""
+    indicator_states.pop(f"{symbol}:{tf_str}", None)
+    try:
+        redis_client.delete(f"indicator_state:{symbol}:{tf_str}")
+    except Exception as e:
+        logger.warning(f"지표 상태 체크포인트 삭제 실패: {symbol} {tf_str} - {e}")
+
+
+def _rebuild_indicator_state(symbol, tf_str, extra_candles):
+    """
+    candles:{symbol}:{tf} 전체 + extra_candles로 증분 상태를 처음부터 재구성
+
+    Returns:
+        (state, rows): rows는 extra_candles 타임스탬프의 지표 포함 캔들
+    """
+    candle_map = {c["timestamp"]: c for c in read_candles(redis_client, f"candles:{symbol}:{tf_str}")}
+    for candle in extra_candles:
+        candle_map[candle["timestamp"]] = candle
+
+    sorted_ts = sorted(candle_map.keys())
+    wanted = {c["timestamp"] for c in extra_candles}
+    first_wanted = min(wanted, default=float("inf"))
+    state = StreamingIndicatorState.from_candles([candle_map[ts] for ts in sorted_ts if ts < first_wanted])
+    rows = []
+    for ts in sorted_ts:
+        if ts >= first_wanted:
+            values = state.update(candle_map[ts])
+            if ts in wanted:
+                rows.append({**candle_map[ts], **values})
+
+    indicator_states[f"{symbol}:{tf_str}"] = state
+    _save_indicator_state(symbol, tf_str, state)
+    logger.info(f"지표 상태 재구성 완료: {symbol} {tf_str} ({len(sorted_ts)}개 캔들)")
+    return state, rows
+
+
+def _advance_indicator_state(symbol, timeframe, candles):
+    """
+    캔들(과거->현재)을 증분 지표 상태에 적용
+
+    - 마지막 바와 같은 timestamp → replace_last (진행 중인 캔들 갱신/확정)
+    - 바로 다음 바 → update
+    - 이미 지난 바 → 무시 (확정된 값 유지)
+    - 바가 비어 있음(갭) 또는 상태 없음 → 캔들 리스트로 재구성
+
+    Returns:
+        적용된 캔들별 지표 포함 dict 리스트 (compute_all_indicators 결과와 같은 키)
+    """
+    tf_str = TF_MAP.get(timeframe, "1m")
+    step = timeframe * 60
+    candles = sorted(candles, key=lambda c: c["timestamp"])
+    if not candles:
+        return []
+
+    state = _load_indicator_state(symbol, tf_str)
+    if state is None or state.last_timestamp is None:
+        _, rows = _rebuild_indicator_state(symbol, tf_str, candles)
+        return rows
+
+    rows = []
+    appended = False
+    for candle in candles:
+        ts = candle["timestamp"]
+        last_ts = state.last_timestamp
+        if ts < last_ts:
+            continue
+        if ts == last_ts:
+            values = state.replace_last(candle)
+        elif ts <= last_ts + step:
+            values = state.update(candle)
+            appended = True
+        else:
+            logger.info(f"지표 상태 갭 감지, 재구성: {symbol} {tf_str} (상태: {last_ts}, 캔들: {ts})")
+            _, rows = _rebuild_indicator_state(symbol, tf_str, candles)
+            return rows
+        rows.append({**candle, **values})
+
+    if appended:
+        # 새 바가 추가될 때만 체크포인트 (틱마다 저장하지 않음)
+        _save_indicator_state(symbol, tf_str, state)
+    return rows
+
+
+def _merge_indicator_row(existing, row, previous):
+    """
+    candles_with_indicators 병합 규칙 (candle_store merge 콜백)
+
+    - 같은 timestamp 항목이 있으면 병합 (확정 바는 진행 중 표시 제거)
+    - 새 바는 auto_trend 필드가 없으면 직전 항목 값을 이어받음
+    - auto_trend 필드만 있는 행은 기존 항목이 없으면 건너뜀
+    """
+    if existing is not None:
+        merged = {**existing, **row}
+        if "is_current" not in row:
+            merged.pop("is_current", None)
+            merged.pop("update_time", None)
+            merged.pop("update_time_kr", None)
+        return merged
+    if "close" not in row:
+        return None
+    for field in AUTO_TREND_FIELDS:
+        if field not in row and previous and field in previous:
+            row[field] = previous[field]
+    return row
+
+
+def _write_indicator_rows(symbol, tf_str, rows):
+    """
+    candles_with_indicators 리스트에 바뀐 바만 기록 (전체 재작성 없음)
+
+    Returns:
+        실제로 저장된 캔들 dict 리스트 (CandlesDB 반영용)
+    """
+    if not rows:
+        return []
+    return upsert_candles(
+        redis_client,
+        f"candles_with_indicators:{symbol}:{tf_str}",
+        rows,
+        max_len=MAX_CANDLE_LEN,
+        merge=_merge_indicator_row,
+    )
+
+
 def fetch_latest_candles(symbol, timeframe, limit=POLLING_CANDLES, include_current=False):
     """
     최신 캔들 데이터 가져오기
@@ -218,6 +401,7 @@ def _fetch_ohlcv_with_retry(symbol, tf_str, limit, since):
         try:
             params = {'instType': 'SWAP'}
             logger.debug(f"API 요청: symbol={symbol}, timeframe={tf_str.lower()}, limit={limit}, since={since}")
+            api_rate_limiter.acquire()
 
             if since is None:
                 ohlcvs = exchange.fetch_ohlcv(
@@ -323,9 +507,9 @@ def check_and_fill_gap(symbol, timeframe):
     try:
         # Redis에서 기존 캔들 가져오기
         candle_key = f"candles:{symbol}:{tf_str}"
-        existing_data = redis_client.lrange(candle_key, 0, -1)
+        last_existing = read_last_candle(redis_client, candle_key)
         
-        if not existing_data:
+        if not last_existing:
             logger.warning(f"기존 데이터 없음, 갭 체크 불가: {key}")
             return
         
@@ -337,17 +521,8 @@ def check_and_fill_gap(symbol, timeframe):
             
         latest_ts = latest_candles[0]["timestamp"]
         
-        # 기존 데이터의 마지막 타임스탬프 찾기
-        existing_map = {}
-        for item in existing_data:
-            # Redis returns bytes, decode to string first
-            item_str = item.decode('utf-8') if isinstance(item, bytes) else item
-            parts = item_str.split(",")
-            ts = int(parts[0])
-            existing_map[ts] = parts
-        
-        existing_ts = sorted(existing_map.keys())
-        last_existing_ts = existing_ts[-1] if existing_ts else 0
+        # 기존 데이터의 마지막 타임스탬프 (리스트는 timestamp 정렬 상태)
+        last_existing_ts = last_existing["timestamp"]
         
         # 갭 체크
         tf_minutes = timeframe
@@ -378,6 +553,50 @@ def check_and_fill_gap(symbol, timeframe):
             metadata={"timeframe": tf_str, "component": "integrated_data_collector.check_and_fill_gap"}
         )
 
+def _fetch_gap_candles(symbol, timeframe, from_ts, to_ts):
+    """갭 구간 캔들 조회 (API 요청만 수행, 저장하지 않음)"""
+    tf_str = TF_MAP.get(timeframe, "1m")
+    key = f"{symbol}:{tf_str}"
+
+    # 갭이 너무 큰 경우 제한
+    tf_minutes = timeframe
+    expected_candles = (to_ts - from_ts) // (tf_minutes * 60)
+
+    if expected_candles > 1000:
+        logger.warning(f"갭이 너무 큽니다 ({expected_candles}개 캔들), 최대 1000개만 요청: {key}")
+        from_ts = to_ts - (1000 * tf_minutes * 60)
+
+    # API로 갭 데이터 가져오기
+    params = {'instType': 'SWAP'}
+    api_rate_limiter.acquire()
+    ohlcvs = exchange.fetch_ohlcv(
+        symbol,
+        timeframe=tf_str.lower(),
+        since=(from_ts + 1) * 1000,  # +1초 해서 마지막 캔들 중복 방지
+        limit=1000,
+        params=params
+    )
+
+    gap_candles = []
+    for row in ohlcvs:
+        ts, o, h, l, c, v = row
+        aligned_ts = align_timestamp(ts, timeframe) // 1000
+
+        # 볼륨이 0인 캔들 제외
+        if v == 0:
+            continue
+
+        gap_candles.append({
+            "timestamp": aligned_ts,
+            "open": float(o),
+            "high": float(h),
+            "low": float(l),
+            "close": float(c),
+            "volume": float(v)
+        })
+    return gap_candles
+
+
 def fill_gap(symbol, timeframe, from_ts, to_ts):
     """데이터 갭 채우기"""
     tf_str = TF_MAP.get(timeframe, "1m")
@@ -385,42 +604,8 @@ def fill_gap(symbol, timeframe, from_ts, to_ts):
     
     try:
         logger.info(f"갭 채우기 시작: {key} - {datetime.fromtimestamp(from_ts)} ~ {datetime.fromtimestamp(to_ts)}")
-        
-        # 갭이 너무 큰 경우 제한
-        tf_minutes = timeframe
-        expected_candles = (to_ts - from_ts) // (tf_minutes * 60)
-        
-        if expected_candles > 1000:
-            logger.warning(f"갭이 너무 큽니다 ({expected_candles}개 캔들), 최대 1000개만 요청: {key}")
-            from_ts = to_ts - (1000 * tf_minutes * 60)
-        
-        # API로 갭 데이터 가져오기
-        params = {'instType': 'SWAP'}
-        ohlcvs = exchange.fetch_ohlcv(
-            symbol,
-            timeframe=tf_str.lower(),
-            since=(from_ts + 1) * 1000,  # +1초 해서 마지막 캔들 중복 방지
-            limit=1000,
-            params=params
-        )
-        
-        gap_candles = []
-        for row in ohlcvs:
-            ts, o, h, l, c, v = row
-            aligned_ts = align_timestamp(ts, timeframe) // 1000
-            
-            # 볼륨이 0인 캔들 제외
-            if v == 0:
-                continue
-                
-            gap_candles.append({
-                "timestamp": aligned_ts,
-                "open": float(o),
-                "high": float(h),
-                "low": float(l),
-                "close": float(c),
-                "volume": float(v)
-            })
+
+        gap_candles = _fetch_gap_candles(symbol, timeframe, from_ts, to_ts)
         
         if not gap_candles:
             logger.warning(f"갭 데이터 없음: {key}")
@@ -443,6 +628,54 @@ def fill_gap(symbol, timeframe, from_ts, to_ts):
             metadata={"timeframe": tf_str, "from_ts": from_ts, "to_ts": to_ts, "component": "integrated_data_collector.fill_gap"}
         )
 
+
+def fetch_bar_close_candles(symbol, timeframe):
+    """
+    바 마감 시 조회 (스케줄러 I/O 단계)
+
+    최신 캔들과, 저장된 마지막 캔들 이후 갭이 있으면 갭 캔들까지 함께 조회합니다.
+    저장/지표 계산은 하지 않습니다.
+    """
+    tf_str = TF_MAP.get(timeframe, "1m")
+    candles = fetch_latest_candles(symbol, timeframe, limit=POLLING_CANDLES)
+    if not candles:
+        return None
+
+    # 갭 체크: 저장된 리스트는 timestamp 정렬 상태이므로 마지막 항목만 확인
+    last_existing = read_last_candle(redis_client, f"candles:{symbol}:{tf_str}")
+    if last_existing:
+        last_existing_ts = last_existing["timestamp"]
+        oldest_fetched_ts = candles[0]["timestamp"]
+        expected_interval = timeframe * 60
+        if (oldest_fetched_ts - last_existing_ts) > expected_interval * 1.5:
+            logger.info(
+                f"캔들 갭 발견: {symbol}:{tf_str} - "
+                f"마지막 기존: {datetime.fromtimestamp(last_existing_ts)}, "
+                f"조회 시작: {datetime.fromtimestamp(oldest_fetched_ts)}"
+            )
+            gap_candles = _fetch_gap_candles(symbol, timeframe, last_existing_ts, oldest_fetched_ts)
+            known = {c["timestamp"] for c in candles}
+            candles = sorted(
+                [c for c in gap_candles if c["timestamp"] not in known] + candles,
+                key=lambda c: c["timestamp"]
+            )
+    return candles
+
+
+def process_bar_close_candles(symbol, timeframe, candles):
+    """바 마감 캔들 저장 및 지표 갱신 (스케줄러 CPU 단계)"""
+    written = update_candle_data(symbol, timeframe, candles)
+    if not written:
+        return
+
+    # 지표 기록 이후에 바 마감 이벤트 발행 (트레이딩 워커가 새 바를 읽도록)
+    tf_str = TF_MAP.get(timeframe, "1m")
+    try:
+        publish_bar_close(redis_client, symbol, tf_str, candles[-1])
+    except Exception as e:
+        logger.warning(f"바 마감 이벤트 발행 실패: {symbol} {tf_str} - {e}")
+
+
 def update_candle_data(symbol, timeframe, new_candles, warm_up_count=0):
     """
     캔들 데이터 업데이트
@@ -452,111 +685,44 @@ def update_candle_data(symbol, timeframe, new_candles, warm_up_count=0):
         timeframe: 타임프레임
         new_candles: 새 캔들 리스트
         warm_up_count: 지표 계산용 warm-up 캔들 개수 (이 개수만큼은 저장하지 않음)
+
+    Returns:
+        증분 경로에서 candles_with_indicators에 저장된 캔들 리스트 (그 외 None)
     """
     tf_str = TF_MAP.get(timeframe, "1m")
     key = f"candles:{symbol}:{tf_str}"
 
     try:
-        # 기존 캔들 데이터 가져오기
-        existing = redis_client.lrange(key, 0, -1)
-        candle_map = {}
-
-        # 기존 데이터 파싱
-        for item in existing:
-            # Redis returns bytes, decode to string first
-            item_str = item.decode('utf-8') if isinstance(item, bytes) else item
-            parts = item_str.split(",")
-            ts = int(parts[0])
-            candle_map[ts] = parts
-
-        # 새 캔들 데이터 병합
-        for candle in new_candles:
-            ts = candle["timestamp"]
-            cndl_str_list = [
-                str(ts),
-                str(candle["open"]),
-                str(candle["high"]),
-                str(candle["low"]),
-                str(candle["close"]),
-                str(candle["volume"]),
-            ]
-            candle_map[ts] = cndl_str_list
-
-        # 정렬
-        sorted_ts = sorted(candle_map.keys())
+        # 새 캔들만 timestamp 기준으로 병합 (warm-up 포함 길이 유지)
+        upsert_candles(redis_client, key, new_candles, max_len=MAX_CANDLE_LEN + warm_up_count, fmt=CSV_FORMAT)
+        candles = read_candles(redis_client, key)
 
         # warm_up_count가 지정된 경우, 처음 해당 개수만큼 제외 (지표 계산용으로만 사용)
-        if warm_up_count > 0 and len(sorted_ts) > warm_up_count:
+        if warm_up_count > 0 and len(candles) > warm_up_count:
             logger.info(f"Warm-up 데이터 제외: {symbol} {tf_str} - 처음 {warm_up_count}개 캔들은 지표 계산용으로만 사용")
             # 나중에 지표 계산 후 제외할 것이므로 여기서는 전체 유지
 
-        # 최대 MAX_CANDLE_LEN개만 유지 (warm_up 제외하기 전)
-        if len(sorted_ts) > MAX_CANDLE_LEN + warm_up_count:
-            sorted_ts = sorted_ts[-(MAX_CANDLE_LEN + warm_up_count):]
-
-        final_list = [",".join(candle_map[ts]) for ts in sorted_ts]
-
-        # Redis에 저장
-        pipe = redis_client.pipeline()
-        pipe.delete(key)
-        for row_str in final_list:
-            pipe.rpush(key, row_str)
-        pipe.execute()
-        
         # 인디케이터 계산 및 저장
         # 병합 후 데이터가 부족하면 API에서 추가로 가져오기
-        if len(sorted_ts) < MIN_CANDLES_FOR_INDICATORS:
-            logger.info(f"병합 후 데이터 부족, API에서 추가 캔들 로드: {symbol} {tf_str} (현재: {len(sorted_ts)}개, 필요: {MIN_CANDLES_FOR_INDICATORS}개)")
+        if len(candles) < MIN_CANDLES_FOR_INDICATORS:
+            logger.info(f"병합 후 데이터 부족, API에서 추가 캔들 로드: {symbol} {tf_str} (현재: {len(candles)}개, 필요: {MIN_CANDLES_FOR_INDICATORS}개)")
 
             # API에서 충분한 캔들 가져오기
             api_candles = fetch_latest_candles(symbol, timeframe, limit=MIN_CANDLES_FOR_INDICATORS)
 
             if api_candles and len(api_candles) >= MIN_CANDLES_FOR_INDICATORS:
-                # 새로 가져온 캔들 병합
-                for candle in api_candles:
-                    ts = candle["timestamp"]
-                    cndl_str_list = [
-                        str(ts),
-                        str(candle["open"]),
-                        str(candle["high"]),
-                        str(candle["low"]),
-                        str(candle["close"]),
-                        str(candle["volume"]),
-                    ]
-                    candle_map[ts] = cndl_str_list
-
-                # 다시 정렬
-                sorted_ts = sorted(candle_map.keys())
-                if len(sorted_ts) > MAX_CANDLE_LEN:
-                    sorted_ts = sorted_ts[-MAX_CANDLE_LEN:]
-
-                final_list = [",".join(candle_map[ts]) for ts in sorted_ts]
-
-                # Redis에 저장
-                pipe = redis_client.pipeline()
-                pipe.delete(key)
-                for row_str in final_list:
-                    pipe.rpush(key, row_str)
-                pipe.execute()
-
-                logger.info(f"API에서 추가 캔들 로드 완료: {symbol} {tf_str} (총 {len(sorted_ts)}개)")
+                upsert_candles(redis_client, key, api_candles, max_len=MAX_CANDLE_LEN, fmt=CSV_FORMAT)
+                candles = read_candles(redis_client, key)
+                logger.info(f"API에서 추가 캔들 로드 완료: {symbol} {tf_str} (총 {len(candles)}개)")
             else:
                 logger.warning(f"API에서도 충분한 캔들을 가져올 수 없음: {symbol} {tf_str} (API: {len(api_candles) if api_candles else 0}개)")
                 return
 
-        # 이제 충분한 데이터가 있으므로 지표 계산
-        # 캔들 객체 리스트 생성
-        candles = []
-        for ts in sorted_ts:
-            parts = candle_map[ts]
-            candles.append({
-                "timestamp": int(parts[0]),
-                "open": float(parts[1]),
-                "high": float(parts[2]),
-                "low": float(parts[3]),
-                "close": float(parts[4]),
-                "volume": float(parts[5])
-            })
+        if warm_up_count == 0:
+            # 증분 경로: 새 캔들만 지표 상태에 적용하고 리스트 끝부분만 갱신
+            return _update_indicators_incremental(symbol, timeframe, candles, new_candles)
+
+        # 이제 충분한 데이터가 있으므로 지표 계산 (초기 로드: 전체 계산)
 
         # 인디케이터 계산 (전체 데이터로 계산)
         candles_with_ind = compute_all_indicators(candles, rsi_period=14, atr_period=14)
@@ -593,6 +759,9 @@ def update_candle_data(symbol, timeframe, new_candles, warm_up_count=0):
         # 인디케이터 포함 캔들 저장
         save_candles_with_indicators(symbol, tf_str, candles_with_ind)
 
+        # 증분 상태는 다음 갱신 때 새 캔들 리스트로 재구성
+        _reset_indicator_state(symbol, tf_str)
+
         logger.debug(f"캔들 데이터 업데이트 완료: {symbol} {tf_str} - 총 {len(candles_with_ind)}개 캔들 (warm-up {warm_up_count}개 제외)")
     
     except Exception as e:
@@ -607,41 +776,63 @@ def update_candle_data(symbol, timeframe, new_candles, warm_up_count=0):
             metadata={"timeframe": tf_str, "component": "integrated_data_collector.update_candle_data"}
         )
 
+def _update_indicators_incremental(symbol, timeframe, candles, new_candles):
+    """
+    바 마감 시 지표 갱신 (update_candle_data의 증분 경로)
+
+    지표는 증분 상태로 새 캔들만 계산하고, auto_trend_state는 상위 TF 리샘플링에
+    의존해 증분 계산이 불가능하므로 캔들 리스트 전체로 계산하여 새 캔들에만 반영합니다.
+    """
+    tf_str = TF_MAP.get(timeframe, "1m")
+    new_ts = {c["timestamp"] for c in new_candles}
+
+    rows = _advance_indicator_state(symbol, timeframe, [c for c in candles if c["timestamp"] in new_ts])
+
+    # auto_trend_state (Pine Script '자동' 모드용)
+    auto_fields = {}
+    auto_trend_tf_str = get_auto_trend_timeframe(tf_str)
+    auto_trend_candles = _get_candles_from_redis_for_auto_trend(symbol, auto_trend_tf_str)
+    if auto_trend_candles and len(auto_trend_candles) >= 30:
+        trend_candles = add_auto_trend_state_to_candles(
+            [dict(c) for c in candles], auto_trend_candles, current_timeframe_minutes=timeframe
+        )
+        for cndl in trend_candles:
+            if cndl["timestamp"] in new_ts:
+                auto_fields[cndl["timestamp"]] = {field: cndl[field] for field in AUTO_TREND_FIELDS}
+    else:
+        # auto_trend 캔들이 부족하면 0으로 설정
+        auto_fields = {ts: {"auto_trend_state": 0} for ts in new_ts}
+        logger.debug(f"auto_trend 캔들 부족, auto_trend_state=0으로 설정: {symbol} {tf_str}")
+
+    # 이미 확정된 바는 auto_trend 필드만 갱신
+    row_ts = {row["timestamp"] for row in rows}
+    rows += [{"timestamp": ts, **fields} for ts, fields in auto_fields.items() if ts not in row_ts]
+    for row in rows:
+        row.update(auto_fields.get(row["timestamp"], {}))
+        if "close" in row:
+            _add_human_time(row)
+    rows.sort(key=lambda r: r["timestamp"])
+
+    written = _write_indicator_rows(symbol, tf_str, rows)
+
+    # CandlesDB에도 저장 (실패해도 Redis는 영향 없음)
+    if candlesdb_writer.enabled and written:
+        try:
+            candlesdb_writer.upsert_candles(symbol, timeframe, written)
+        except Exception as db_e:
+            logger.warning(f"CandlesDB 저장 실패 (Redis는 성공): {symbol} {tf_str} - {db_e}")
+
+    logger.debug(f"캔들 지표 증분 업데이트 완료: {symbol} {tf_str} - {len(written)}개 캔들 갱신")
+    return written
+
+
 def save_candles_with_indicators(symbol, tf_str, candles_with_ind):
     """인디케이터가 포함된 캔들 데이터 저장"""
     key = f"candles_with_indicators:{symbol}:{tf_str}"
 
     try:
-        # 기존 데이터 가져오기
-        existing_list = redis_client.lrange(key, 0, -1)
-        candle_map = {}
-
-        for item in existing_list:
-            try:
-                obj = json.loads(item)
-                if "timestamp" in obj:
-                    candle_map[obj["timestamp"]] = obj
-            except Exception as e:
-                pass
-
-        # 새 데이터 병합 (기존 데이터는 덮어쓰지 않음 - warm-up으로 계산된 정확한 데이터 보존)
-        for cndl in candles_with_ind:
-            ts = cndl["timestamp"]
-            if ts not in candle_map:  # 새로운 timestamp만 추가
-                candle_map[ts] = cndl
-
-        # 정렬 후 저장 (최대 MAX_CANDLE_LEN개만 유지)
-        sorted_ts = sorted(candle_map.keys())
-        if len(sorted_ts) > MAX_CANDLE_LEN:
-            sorted_ts = sorted_ts[-MAX_CANDLE_LEN:]
-
-        # Redis에 저장
-        with redis_client.pipeline() as pipe:
-            pipe.delete(key)
-            for ts in sorted_ts:
-                row_json = json.dumps(candle_map[ts])
-                pipe.rpush(key, row_json)
-            pipe.execute()
+        # 새로운 timestamp만 추가 (기존 데이터는 덮어쓰지 않음 - warm-up으로 계산된 정확한 데이터 보존)
+        upsert_candles(redis_client, key, candles_with_ind, max_len=MAX_CANDLE_LEN, merge=keep_existing_merge)
 
         # CandlesDB에도 저장 (비동기적으로, 실패해도 Redis는 영향 없음)
         if candlesdb_writer.enabled:
@@ -649,9 +840,8 @@ def save_candles_with_indicators(symbol, tf_str, candles_with_ind):
                 # timeframe 변환 (tf_str: "1m", "15m", "1h" 등 → minutes)
                 timeframe_minutes = REVERSE_TF_MAP.get(tf_str, 1)  # 기본값 1분
 
-                # 새로 추가된 캔들만 CandlesDB에 저장
-                new_candles = [candle_map[ts] for ts in sorted_ts]
-                candlesdb_writer.upsert_candles(symbol, timeframe_minutes, new_candles)
+                # Writer가 마지막 기록값과 비교해 변경/신규 행만 기록
+                candlesdb_writer.upsert_candles(symbol, timeframe_minutes, read_candles(redis_client, key))
             except Exception as db_e:
                 logger.warning(f"CandlesDB 저장 실패 (Redis는 성공): {symbol} {tf_str} - {db_e}")
 
@@ -708,20 +898,7 @@ def fetch_initial_data():
 
             # 현재 캔들 데이터 가져오기
             candles_key = f"candles_with_indicators:{symbol}:{tf_str}"
-            existing_list = redis_client.lrange(candles_key, 0, -1)
-
-            if not existing_list:
-                continue
-
-            # 캔들 파싱
-            candles = []
-            for item in existing_list:
-                try:
-                    item_str = item.decode('utf-8') if isinstance(item, bytes) else item
-                    obj = json.loads(item_str)
-                    candles.append(obj)
-                except Exception:
-                    pass
+            candles = read_candles(redis_client, candles_key)
 
             if not candles:
                 continue
@@ -738,12 +915,8 @@ def fetch_initial_data():
                 )
                 logger.info(f"auto_trend_state 재계산 완료: {key} (auto_trend_tf: {auto_trend_tf_str})")
 
-                # Redis에 업데이트
-                with redis_client.pipeline() as pipe:
-                    pipe.delete(candles_key)
-                    for cndl in candles:
-                        pipe.rpush(candles_key, json.dumps(cndl))
-                    pipe.execute()
+                # Redis에 업데이트 (auto_trend 값이 바뀐 바만 기록)
+                upsert_candles(redis_client, candles_key, candles, max_len=MAX_CANDLE_LEN)
 
                 # CandlesDB에도 업데이트
                 if candlesdb_writer.enabled:
@@ -764,19 +937,29 @@ def fetch_initial_data():
 
 
 
+def fetch_current_candles(symbol, timeframe):
+    """진행 중 캔들 조회 (스케줄러 I/O 단계, limit=2로 현재 + 직전 캔들 확보)"""
+    recent_candles = fetch_latest_candles(symbol, timeframe, limit=2, include_current=True)
+    if not recent_candles:
+        tf_str = TF_MAP.get(timeframe, "1m")
+        logger.warning(f"현재 캔들 가져오기 실패: {symbol}:{tf_str}")
+        return None
+    return recent_candles
+
+
 def update_current_candle(symbol, timeframe):
     """현재 진행 중인 캔들 업데이트"""
+    recent_candles = fetch_current_candles(symbol, timeframe)
+    if recent_candles:
+        process_current_candles(symbol, timeframe, recent_candles)
+
+
+def process_current_candles(symbol, timeframe, recent_candles):
+    """조회된 최근 캔들에서 진행 중인 캔들을 찾아 저장 (스케줄러 CPU 단계)"""
     tf_str = TF_MAP.get(timeframe, "1m")
     key = f"{symbol}:{tf_str}"
     
     try:
-        # 현재 진행 중인 캔들 가져오기 (limit=2로 설정하여 현재 + 직전 캔들 확보)
-        recent_candles = fetch_latest_candles(symbol, timeframe, limit=2, include_current=True)
-        
-        if not recent_candles:
-            logger.warning(f"현재 캔들 가져오기 실패: {key}")
-            return
-        
         # 현재 진행 중인 캔들 찾기 (마지막 캔들이 현재 진행 중일 가능성이 높음)
         current_candle = None
         current_time = int(time.time())
@@ -809,7 +992,7 @@ def update_current_candle(symbol, timeframe):
         redis_client.set(latest_key, json.dumps(current_candle))
         
         # 인디케이터 포함 버전도 업데이트
-        update_current_candle_with_indicators(symbol, timeframe, current_candle)
+        update_current_candle_with_indicators(symbol, timeframe, current_candle, recent_candles)
     
     except Exception as e:
         logger.error(f"현재 캔들 업데이트 중 오류: {key} - {e}", exc_info=True)
@@ -823,16 +1006,19 @@ def update_current_candle(symbol, timeframe):
             metadata={"timeframe": tf_str, "component": "integrated_data_collector.update_current_candle"}
         )
 
-def update_current_candle_with_indicators(symbol, timeframe, current_candle):
-    """현재 진행 중인 캔들에 인디케이터 계산하여 업데이트"""
+def update_current_candle_with_indicators(symbol, timeframe, current_candle, recent_candles=None):
+    """
+    현재 진행 중인 캔들에 인디케이터 계산하여 업데이트
+
+    증분 지표 상태에 진행 중인 캔들만 적용하므로 틱당 비용이 캔들 개수와 무관합니다.
+    recent_candles에 직전 완료 캔들이 있으면 먼저 확정값으로 반영합니다.
+    auto_trend_state는 바 마감 시 계산된 직전 캔들 값을 이어받습니다.
+    """
     tf_str = TF_MAP.get(timeframe, "1m")
-    key = f"candles_with_indicators:{symbol}:{tf_str}"
 
     try:
-        # 기존 캔들 데이터 가져오기
         candle_key = f"candles:{symbol}:{tf_str}"
-        existing_data = redis_client.lrange(candle_key, 0, -1)
-        existing_count = len(existing_data) if existing_data else 0
+        existing_count = redis_client.llen(candle_key)
 
         # Redis에 데이터가 부족하면 API에서 추가로 가져오기
         if existing_count < MIN_CANDLES_FOR_INDICATORS:
@@ -848,133 +1034,61 @@ def update_current_candle_with_indicators(symbol, timeframe, current_candle):
             # API에서 가져온 데이터를 Redis에 저장 (지표는 나중에 계산)
             update_candle_data(symbol, timeframe, api_candles)
 
-            # Redis에서 다시 가져오기
-            existing_data = redis_client.lrange(candle_key, 0, -1)
-            existing_count = len(existing_data) if existing_data else 0
-
+            existing_count = redis_client.llen(candle_key)
             if existing_count < MIN_CANDLES_FOR_INDICATORS:
                 logger.warning(f"Redis 업데이트 후에도 데이터 부족: {symbol} {tf_str} (현재: {existing_count}개)")
                 return
 
             logger.info(f"API에서 캔들 로드 완료: {symbol} {tf_str} ({existing_count}개)")
-        
-        # 캔들 객체 리스트 생성
-        candles = []
-        for item in existing_data:
-            # Redis returns bytes, decode to string first
-            item_str = item.decode('utf-8') if isinstance(item, bytes) else item
-            parts = item_str.split(",")
-            ts = int(parts[0])
-            candles.append({
-                "timestamp": ts,
-                "open": float(parts[1]),
-                "high": float(parts[2]),
-                "low": float(parts[3]),
-                "close": float(parts[4]),
-                "volume": float(parts[5])
-            })
-        
-        # 현재 캔들 추가 또는 업데이트
+
+        # 직전 완료 캔들(확정값) + 현재 캔들을 증분 상태에 적용
         current_ts = current_candle["timestamp"]
-        found = False
-        
-        for i, candle in enumerate(candles):
-            if candle["timestamp"] == current_ts:
-                candles[i] = current_candle
-                found = True
-                break
-        
-        if not found:
-            candles.append(current_candle)
-            candles.sort(key=lambda x: x["timestamp"])
-        
-        # 인디케이터 계산
-        candles_with_ind = compute_all_indicators(candles, rsi_period=14, atr_period=14)
+        bars = [c for c in (recent_candles or []) if c["timestamp"] < current_ts]
+        bars.append(current_candle)
+        rows = _advance_indicator_state(symbol, timeframe, bars)
 
-        # auto_trend_state 추가 (Pine Script '자동' 모드용)
-        auto_trend_tf_str = get_auto_trend_timeframe(tf_str)
-        auto_trend_candles = _get_candles_from_redis_for_auto_trend(symbol, auto_trend_tf_str)
-        if auto_trend_candles and len(auto_trend_candles) >= 30:
-            candles_with_ind = add_auto_trend_state_to_candles(
-                candles_with_ind,
-                auto_trend_candles,
-                current_timeframe_minutes=timeframe
-            )
-        else:
-            # auto_trend 캔들이 부족하면 0으로 설정
-            for cndl in candles_with_ind:
-                cndl["auto_trend_state"] = 0
+        current_with_ind = rows[-1] if rows and rows[-1]["timestamp"] == current_ts else None
+        if not current_with_ind:
+            logger.warning(f"현재 캔들의 인디케이터 계산 결과를 찾을 수 없음: {symbol} {tf_str}")
+            return
 
-        # 기존 인디케이터 데이터 로드
-        existing_ind_list = redis_client.lrange(key, 0, -1)
-        candle_ind_map = {}
-        
-        for item in existing_ind_list:
-            try:
-                obj = json.loads(item)
-                if "timestamp" in obj:
-                    candle_ind_map[obj["timestamp"]] = obj
-            except Exception as e:
-                pass
-        
-        # 새 인디케이터 데이터 병합
-        for candle in candles_with_ind:
-            ts = candle["timestamp"]
-            
-            # 한국 시간 추가
-            utc_dt = datetime.fromtimestamp(ts, UTC)
-            seoul_tz = pytz.timezone("Asia/Seoul")
-            dt_seoul = utc_dt.replace(tzinfo=pytz.utc).astimezone(seoul_tz)
-            candle["human_time"] = utc_dt.strftime("%Y-%m-%d %H:%M:%S")
-            candle["human_time_kr"] = dt_seoul.strftime("%Y-%m-%d %H:%M:%S")
-            
-            # 현재 진행 중인 캔들인 경우 업데이트 시간 추가
-            if ts == current_ts:
-                utc_now = datetime.now(UTC)
-                seoul_now = utc_now.astimezone(seoul_tz)
-                candle["update_time"] = utc_now.strftime("%Y-%m-%d %H:%M:%S")
-                candle["update_time_kr"] = seoul_now.strftime("%Y-%m-%d %H:%M:%S")
-                candle["is_current"] = True
-            
-            candle_ind_map[ts] = candle
-        
-        # 정렬 후 저장 (최대 MAX_CANDLE_LEN개만 유지)
-        sorted_ts = sorted(candle_ind_map.keys())
-        if len(sorted_ts) > MAX_CANDLE_LEN:
-            sorted_ts = sorted_ts[-MAX_CANDLE_LEN:]
-        
-        # Redis에 저장
-        with redis_client.pipeline() as pipe:
-            pipe.delete(key)
-            for ts in sorted_ts:
-                row_json = json.dumps(candle_ind_map[ts])
-                pipe.rpush(key, row_json)
-            pipe.execute()
-        
-        # 현재 캔들의 인디케이터 값 찾기
-        current_with_ind = candle_ind_map.get(current_ts)
+        for row in rows:
+            row.pop("is_current", None)
+            row.pop("update_time", None)
+            row.pop("update_time_kr", None)
+            _add_human_time(row)
 
-        if current_with_ind:
-            # 현재 캔들 별도 저장
-            current_ind_key = f"current_candle_with_indicators:{symbol}:{tf_str}"
-            redis_client.set(current_ind_key, json.dumps(current_with_ind))
+        # 현재 진행 중인 캔들 업데이트 시간 추가
+        seoul_tz = pytz.timezone("Asia/Seoul")
+        utc_now = datetime.now(UTC)
+        seoul_now = utc_now.astimezone(seoul_tz)
+        current_with_ind["update_time"] = utc_now.strftime("%Y-%m-%d %H:%M:%S")
+        current_with_ind["update_time_kr"] = seoul_now.strftime("%Y-%m-%d %H:%M:%S")
+        current_with_ind["is_current"] = True
 
-            # 최신 캔들 키도 업데이트
-            latest_ind_key = f"latest_with_indicators:{symbol}:{tf_str}"
-            redis_client.set(latest_ind_key, json.dumps(current_with_ind))
+        # 리스트 끝부분만 갱신 (auto_trend 필드는 기존/직전 항목에서 이어받음)
+        written = _write_indicator_rows(symbol, tf_str, rows)
+        if written and written[-1]["timestamp"] == current_ts:
+            current_with_ind = written[-1]
 
-            # CandlesDB에도 현재 캔들 업데이트 (실시간 upsert)
-            if candlesdb_writer.enabled:
-                try:
-                    timeframe_minutes = REVERSE_TF_MAP.get(tf_str, 1)
-                    candlesdb_writer.upsert_single_candle(symbol, timeframe_minutes, current_with_ind)
-                except Exception as db_e:
-                    logger.debug(f"CandlesDB 현재 캔들 업데이트 실패: {symbol} {tf_str} - {db_e}")
+        # 현재 캔들 별도 저장
+        current_ind_key = f"current_candle_with_indicators:{symbol}:{tf_str}"
+        redis_client.set(current_ind_key, json.dumps(current_with_ind))
+
+        # 최신 캔들 키도 업데이트
+        latest_ind_key = f"latest_with_indicators:{symbol}:{tf_str}"
+        redis_client.set(latest_ind_key, json.dumps(current_with_ind))
+
+        # CandlesDB에도 현재 캔들 업데이트 (실시간 upsert)
+        if candlesdb_writer.enabled:
+            try:
+                timeframe_minutes = REVERSE_TF_MAP.get(tf_str, 1)
+                candlesdb_writer.upsert_single_candle(symbol, timeframe_minutes, current_with_ind)
+            except Exception as db_e:
+                logger.debug(f"CandlesDB 현재 캔들 업데이트 실패: {symbol} {tf_str} - {db_e}")
+
+        logger.debug(f"현재 진행 캔들 인디케이터 업데이트 완료: {symbol} {tf_str}")
 
-            logger.debug(f"현재 진행 캔들 인디케이터 업데이트 완료: {symbol} {tf_str}")
-        else:
-            logger.warning(f"현재 캔들의 인디케이터 계산 결과를 찾을 수 없음: {symbol} {tf_str}")
-    
     except Exception as e:
         logger.error(f"현재 캔들 인디케이터 업데이트 중 오류: {symbol} {tf_str} - {e}", exc_info=True)
         # errordb 로깅
@@ -998,12 +1112,20 @@ def polling_worker():
         initial_data_loaded.wait()
         logger.info("초기 데이터 로드 완료 확인, 폴링 시작")
 
-        # 초기화
-        for symbol in SYMBOLS:
-            for timeframe in TIMEFRAMES:
-                tf_str = TF_MAP.get(timeframe, "1m")
-                key = f"{symbol}:{tf_str}"
-                last_check_times[key] = 0
+        # 심볼 × 타임프레임 시리즈를 마감 시각 기반 스케줄러로 동시 폴링
+        global polling_scheduler
+        polling_scheduler = PollingScheduler(
+            [(symbol, timeframe) for symbol in SYMBOLS for timeframe in TIMEFRAMES],
+            bar_close_job=SeriesJob(fetch_bar_close_candles, process_bar_close_candles),
+            live_job=SeriesJob(fetch_current_candles, process_current_candles),
+            live_interval=calculate_update_interval,
+            io_workers=COLLECTOR_IO_WORKERS,
+            cpu_workers=COLLECTOR_CPU_WORKERS,
+            bar_close_delay=BAR_CLOSE_DELAY,
+            shutdown_event=shutdown_event,
+        )
+        scheduler_thread = threading.Thread(target=polling_scheduler.run, name="polling-scheduler", daemon=True)
+        scheduler_thread.start()
 
         # Health Check 타이머
         last_health_check = time.time()
@@ -1066,45 +1188,20 @@ def polling_worker():
                         f"failure={redis_failure_count}, "
                         f"rate={success_rate:.1f}%"
                     )
-            
-            for symbol in SYMBOLS:
-                for timeframe in TIMEFRAMES:
-                    tf_str = TF_MAP.get(timeframe, "1m")
-                    key = f"{symbol}:{tf_str}"
-                    
-                    # 각 타임프레임별 업데이트 주기 계산
-                    update_interval = calculate_update_interval(timeframe)
-                    
-                    # 마지막 체크 시간 이후 충분한 시간이 지났는지 확인
-                    last_check = last_check_times.get(key, 0)
-                    
-                    # 바 종료 시점 체크
-                    if is_bar_end(current_time, timeframe):
-                        # 바 종료 시점에는 완료된 캔들 업데이트 (5초 간격으로 체크)
-                        if current_time - last_check >= 5:
-                            logger.debug(f"바 종료 감지: {key} - 데이터 폴링 시작")
-                            
-                            # 최신 캔들 100개 가져오기
-                            candles = fetch_latest_candles(symbol, timeframe, limit=POLLING_CANDLES)
-                            
-                            if candles:
-                                # 갭 체크 및 데이터 업데이트
-                                check_and_fill_gap(symbol, timeframe)
-                                update_candle_data(symbol, timeframe, candles)
-                            
-                            # 마지막 체크 시간 업데이트
-                            last_check_times[key] = current_time
-                    else:
-                        # 일반 시점에는 타임프레임별 계산된 간격으로 현재 진행 중인 캔들 업데이트
-                        if current_time - last_check >= update_interval:
-                            logger.debug(f"현재 진행 캔들 업데이트 실행: {key} (간격: {update_interval}초)")
-                            update_current_candle(symbol, timeframe)
-                            
-                            # 마지막 체크 시간 업데이트
-                            last_check_times[key] = current_time
-            
-            # 잠시 대기 (CPU 사용량 줄이기)
-            time.sleep(1)
+
+                    # 스케줄러 통계 로그 및 스냅샷 저장
+                    polling_scheduler.log_stats()
+                    try:
+                        redis_client.set(SCHEDULER_METRICS_KEY, json.dumps(polling_scheduler.metrics()))
+                    except Exception as e:
+                        logger.warning(f"스케줄러 메트릭 저장 실패: {e}")
+
+            # 스케줄러 스레드가 예기치 않게 종료되면 워커도 종료 (프로세스 재시작에 맡김)
+            if not scheduler_thread.is_alive():
+                raise RuntimeError("폴링 스케줄러 스레드가 예기치 않게 종료됨")
+
+            # 잠시 대기 (종료 신호 시 즉시 해제)
+            shutdown_event.wait(1)
     
     except Exception as e:
         logger.error(f"폴링 워커 오류: {e}", exc_info=True)
@@ -1117,8 +1214,17 @@ def polling_worker():
             metadata={"component": "integrated_data_collector.polling_worker"}
         )
     finally:
+        if polling_scheduler is not None:
+            polling_scheduler.stop()
         logger.info("폴링 워커 종료")
 
+
+def get_scheduler_metrics():
+    """폴링 스케줄러의 시리즈별 지연/실행 통계 (스케줄러 미시작 시 None)"""
+    if polling_scheduler is None:
+        return None
+    return polling_scheduler.metrics()
+
 def main():
     """메인 함수"""
     try:
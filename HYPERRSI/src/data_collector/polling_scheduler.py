@@ -0,0 +1,331 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# src/data_collector/polling_scheduler.py
+
+"""
+시리즈(심볼 × 타임프레임)별 폴링 스케줄러
+
+polling_worker의 순차 루프 대신 시리즈마다 다음 실행 시각(deadline)을 관리하고,
+API 호출(I/O)은 제한된 워커 풀에서, 지표 계산(CPU)은 별도 풀에서 실행합니다.
+
+- 바 마감 작업이 진행 중 캔들 갱신보다 우선 (같은 시각이면 마감이 먼저)
+- 한 시리즈는 동시에 하나의 작업만 실행 (in_flight)
+- 모든 OHLCV 요청은 전역 RateLimiter 토큰을 소비
+- 시리즈별 지연(lag) 지표: 바 마감 처리 완료까지 걸린 시간, 대기열 지연 등
+"""
+
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from prometheus_client import Counter, Histogram
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+BAR_CLOSE = "bar_close"
+LIVE = "live"
+# 같은 시각이면 바 마감 작업을 먼저 실행
+_PRIORITY = {BAR_CLOSE: 0, LIVE: 1}
+
+SERIES_LAG = Histogram(
+    'collector_series_lag_seconds',
+    'Delay between a series deadline and completion of its polling job',
+    ['timeframe', 'kind'],
+    buckets=(0.5, 1, 2, 3, 5, 10, 20, 30, 60, 120),
+)
+SERIES_JOBS = Counter(
+    'collector_series_jobs_total',
+    'Polling jobs executed by the collector scheduler',
+    ['timeframe', 'kind', 'result'],
+)
+
+
+class RateLimiter:
+    """
+    스레드 안전 토큰 버킷
+
+    rate: 초당 보충 토큰 수, capacity: 최대 버스트
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> bool:
+        """토큰을 얻을 때까지 대기 (timeout 초과 시 False)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return True
+                wait = (tokens - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+@dataclass
+class SeriesState:
+    """시리즈별 스케줄 및 지연 지표"""
+    symbol: str
+    timeframe: int
+    next_bar_close: float = 0.0
+    next_live: float = 0.0
+    in_flight: bool = False
+    runs: int = 0
+    failures: int = 0
+    last_error: Optional[str] = None
+    last_bar_close_lag: Optional[float] = None
+    max_bar_close_lag: float = 0.0
+    last_live_lag: Optional[float] = None
+    last_io_seconds: Optional[float] = None
+    last_cpu_seconds: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.symbol}:{self.timeframe}"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "in_flight": self.in_flight,
+            "runs": self.runs,
+            "failures": self.failures,
+            "last_error": self.last_error,
+            "last_bar_close_lag": self.last_bar_close_lag,
+            "max_bar_close_lag": self.max_bar_close_lag,
+            "last_live_lag": self.last_live_lag,
+            "last_io_seconds": self.last_io_seconds,
+            "last_cpu_seconds": self.last_cpu_seconds,
+            "next_bar_close": self.next_bar_close,
+            "next_live": self.next_live,
+        }
+
+
+@dataclass
+class SeriesJob:
+    """
+    시리즈 작업 정의
+
+    fetch(symbol, timeframe) -> data  : I/O (API 요청), I/O 풀에서 실행
+    process(symbol, timeframe, data)  : Redis 저장/지표 계산, CPU 풀에서 실행
+    fetch가 None을 반환하면 process는 건너뜁니다.
+    """
+    fetch: Callable[[str, int], Any]
+    process: Callable[[str, int, Any], None]
+
+
+@dataclass(order=True)
+class _Entry:
+    due: float
+    priority: int
+    seq: int
+    kind: str = field(compare=False)
+    key: str = field(compare=False)
+    deadline: float = field(compare=False)
+
+
+class PollingScheduler:
+    """
+    deadline 기반 멀티 시리즈 폴링 스케줄러
+
+    Args:
+        series: (symbol, timeframe) 목록
+        bar_close_job: 바 마감 시 실행할 작업
+        live_job: 진행 중 캔들 갱신 작업
+        live_interval: timeframe → 진행 중 캔들 갱신 주기(초)
+        io_workers: API 요청 동시 실행 수
+        cpu_workers: 지표 계산 동시 실행 수
+        bar_close_delay: 바 경계 이후 마감 작업까지 대기(초, 거래소 확정 대기)
+        shutdown_event: 종료 신호
+    """
+
+    def __init__(
+        self,
+        series: list[tuple[str, int]],
+        bar_close_job: SeriesJob,
+        live_job: SeriesJob,
+        live_interval: Callable[[int], float],
+        io_workers: int = 8,
+        cpu_workers: int = 1,
+        bar_close_delay: float = 2.0,
+        shutdown_event: Optional[threading.Event] = None,
+    ):
+        self.jobs = {BAR_CLOSE: bar_close_job, LIVE: live_job}
+        self.live_interval = live_interval
+        self.bar_close_delay = bar_close_delay
+        self.shutdown_event = shutdown_event or threading.Event()
+
+        self.series: dict[str, SeriesState] = {}
+        for symbol, timeframe in series:
+            state = SeriesState(symbol=symbol, timeframe=timeframe)
+            self.series[state.key] = state
+
+        self._io_pool = ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="collector-io")
+        self._cpu_pool = ThreadPoolExecutor(max_workers=cpu_workers, thread_name_prefix="collector-cpu")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._heap: list[_Entry] = []
+        self._seq = 0
+
+    # ------------------------------------------------------------------
+    # 스케줄 계산
+    # ------------------------------------------------------------------
+    def _next_bar_close(self, timeframe: int, now: float) -> float:
+        """now 이후 첫 바 경계 + bar_close_delay"""
+        period = timeframe * 60
+        boundary = (int(now - self.bar_close_delay) // period + 1) * period
+        return boundary + self.bar_close_delay
+
+    def _push(self, due: float, kind: str, key: str, deadline: Optional[float] = None) -> None:
+        """시리즈/종류별로 항상 하나의 예약만 힙에 존재"""
+        self._seq += 1
+        heapq.heappush(self._heap, _Entry(due, _PRIORITY[kind], self._seq, kind, key,
+                                          due if deadline is None else deadline))
+
+    def _schedule_initial(self, now: float) -> None:
+        with self._lock:
+            for key, state in self.series.items():
+                state.next_bar_close = self._next_bar_close(state.timeframe, now)
+                state.next_live = now
+                self._push(state.next_bar_close, BAR_CLOSE, key)
+                self._push(state.next_live, LIVE, key)
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    def run(self) -> None:
+        """종료 신호까지 디스패치 루프 실행 (블로킹)"""
+        logger.info(f"폴링 스케줄러 시작: {len(self.series)}개 시리즈")
+        self._schedule_initial(time.time())
+        try:
+            while not self.shutdown_event.is_set():
+                wait = self._dispatch_due(time.time())
+                self._wakeup.wait(timeout=wait)
+                self._wakeup.clear()
+        finally:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+            logger.info("폴링 스케줄러 종료")
+
+    def stop(self) -> None:
+        self.shutdown_event.set()
+        self._wakeup.set()
+
+    def _dispatch_due(self, now: float) -> float:
+        """기한이 된 작업을 제출하고 다음 기한까지 남은 시간 반환 (최대 1초)"""
+        with self._lock:
+            while self._heap and self._heap[0].due <= now:
+                entry = heapq.heappop(self._heap)
+                state = self.series[entry.key]
+                if state.in_flight:
+                    if entry.kind == LIVE:
+                        # 진행 중 캔들 갱신은 다음 주기에 합쳐도 되므로 건너뜀
+                        state.next_live = now + self.live_interval(state.timeframe)
+                        self._push(state.next_live, LIVE, entry.key)
+                    else:
+                        # 바 마감은 원래 기한을 유지한 채 잠시 후 재시도
+                        self._push(now + 0.2, BAR_CLOSE, entry.key, deadline=entry.deadline)
+                    continue
+                state.in_flight = True
+                self._io_pool.submit(self._run_io, state, entry.kind, entry.deadline)
+            if not self._heap:
+                return 1.0
+            return max(0.0, min(1.0, self._heap[0].due - now))
+
+    def _run_io(self, state: SeriesState, kind: str, deadline: float) -> None:
+        started = time.time()
+        try:
+            data = self.jobs[kind].fetch(state.symbol, state.timeframe)
+        except Exception as e:
+            self._finish(state, kind, deadline, started, error=e)
+            return
+        state.last_io_seconds = time.time() - started
+        if data is None:
+            self._finish(state, kind, deadline, started)
+            return
+        try:
+            self._cpu_pool.submit(self._run_cpu, state, kind, deadline, started, data)
+        except RuntimeError as e:
+            # 종료 중 (풀이 닫힘)
+            self._finish(state, kind, deadline, started, error=e)
+
+    def _run_cpu(self, state: SeriesState, kind: str, deadline: float, started: float, data: Any) -> None:
+        cpu_started = time.time()
+        try:
+            self.jobs[kind].process(state.symbol, state.timeframe, data)
+        except Exception as e:
+            self._finish(state, kind, deadline, started, error=e)
+            return
+        state.last_cpu_seconds = time.time() - cpu_started
+        self._finish(state, kind, deadline, started)
+
+    def _finish(self, state: SeriesState, kind: str, deadline: float, started: float,
+                error: Optional[Exception] = None) -> None:
+        now = time.time()
+        lag = now - deadline
+        tf_label = str(state.timeframe)
+        SERIES_LAG.labels(timeframe=tf_label, kind=kind).observe(max(lag, 0.0))
+        SERIES_JOBS.labels(timeframe=tf_label, kind=kind, result="error" if error else "ok").inc()
+
+        with self._lock:
+            state.runs += 1
+            if error is not None:
+                state.failures += 1
+                state.last_error = str(error)
+                logger.error(f"폴링 작업 실패: {state.symbol} {state.timeframe}m ({kind}) - {error}")
+            if kind == BAR_CLOSE:
+                # 마감 지연은 바 경계 기준 (bar_close_delay 포함)
+                state.last_bar_close_lag = lag + self.bar_close_delay
+                state.max_bar_close_lag = max(state.max_bar_close_lag, state.last_bar_close_lag)
+                state.next_bar_close = self._next_bar_close(state.timeframe, now)
+                self._push(state.next_bar_close, BAR_CLOSE, state.key)
+            else:
+                state.last_live_lag = started - deadline
+                state.next_live = now + self.live_interval(state.timeframe)
+                self._push(state.next_live, LIVE, state.key)
+            state.in_flight = False
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # 지표
+    # ------------------------------------------------------------------
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        """시리즈별 지연/실행 지표 스냅샷"""
+        with self._lock:
+            return {key: state.to_dict() for key, state in self.series.items()}
+
+    def log_stats(self) -> None:
+        """지연이 가장 큰 시리즈 위주로 통계 로그"""
+        snapshot = self.metrics()
+        lags = [m["last_bar_close_lag"] for m in snapshot.values() if m["last_bar_close_lag"] is not None]
+        failures = sum(m["failures"] for m in snapshot.values())
+        if not lags:
+            logger.info(f"📊 Scheduler Stats: series={len(snapshot)}, 바 마감 기록 없음, failures={failures}")
+            return
+        worst = max(snapshot.values(), key=lambda m: m["max_bar_close_lag"])
+        logger.info(
+            f"📊 Scheduler Stats: series={len(snapshot)}, "
+            f"bar_close_lag avg={sum(lags) / len(lags):.2f}s max={max(lags):.2f}s, "
+            f"worst={worst['symbol']} {worst['timeframe']}m ({worst['max_bar_close_lag']:.2f}s), "
+            f"failures={failures}"
+        )
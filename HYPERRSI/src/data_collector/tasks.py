@@ -13,6 +13,7 @@ from HYPERRSI.src.config import get_settings
 from HYPERRSI.src.core.config import settings
 from HYPERRSI.src.trading.models import get_timeframe, get_auto_trend_timeframe
 
+from shared.database.candle_store import CSV_FORMAT, read_candles, upsert_candles
 # shared indicators에서 가져옴
 from shared.indicators import compute_all_indicators, add_auto_trend_state_to_candles
 from shared.logging import get_logger
@@ -147,23 +148,7 @@ def _get_candles_from_redis(symbol: str, tf_str: str):
     """
     key = f"candles:{symbol}:{tf_str}"
     try:
-        candle_strs = redis_client.lrange(key, 0, -1)
-        if not candle_strs:
-            return []
-
-        candles = []
-        for candle_str in candle_strs:
-            parts = candle_str.split(',')
-            if len(parts) >= 6:
-                candles.append({
-                    "timestamp": int(parts[0]),
-                    "open": float(parts[1]),
-                    "high": float(parts[2]),
-                    "low": float(parts[3]),
-                    "close": float(parts[4]),
-                    "volume": float(parts[5])
-                })
-        return candles
+        return read_candles(redis_client, key)
     except Exception as e:
         logger.error(f"Error loading candles from Redis: {symbol} {tf_str} - {e}")
         return []
@@ -428,47 +413,12 @@ def save_candles_to_redis(symbol: str, timeframe: int, new_candles: list) -> Non
     """
     - new_candles: [{timestamp, open, high, low, close, volume}, ...] (과거->현재)
     - 키: "candles:{symbol}:{tf}"
-    - 1) Redis에서 기존 데이터 전부 가져옴
-    - 2) {ts: [ts, open, high, ...]} dict로 변환해 중복 덮어쓰기
-    - 3) timestamp 정렬 → rpush
-    - 4) ltrim으로 3000개 유지
+    - timestamp 기준으로 바뀐 바만 LSET/RPUSH (전체 재작성 없음)
+    - ltrim으로 3000개 유지
     """
     tf_str = get_timeframe(timeframe)
     key = f"candles:{symbol}:{tf_str}"
-    existing = redis_client.lrange(key, 0, -1)
-    candle_map = {}
-
-    # 기존 데이터 로드
-    for item in existing:
-        # "ts,open,high,low,close,vol" 형태
-        parts = item.split(",")
-        ts = int(parts[0])
-        candle_map[ts] = parts
-
-    # 새 데이터 병합
-    for cndl in new_candles:
-        ts = cndl["timestamp"]
-        # 직렬화
-        cndl_str_list = [
-            str(ts),
-            str(cndl["open"]),
-            str(cndl["high"]),
-            str(cndl["low"]),
-            str(cndl["close"]),
-            str(cndl["volume"]),
-        ]
-        candle_map[ts] = cndl_str_list
-
-    # 정렬 후 rpush
-    sorted_ts = sorted(candle_map.keys())
-    final_list = [",".join(candle_map[ts]) for ts in sorted_ts]
-
-    pipe = redis_client.pipeline()
-    pipe.delete(key)
-    for row_str in final_list:
-        pipe.rpush(key, row_str)
-    pipe.ltrim(key, -MAX_CANDLE_LEN, -1)
-    pipe.execute()
+    upsert_candles(redis_client, key, new_candles, max_len=MAX_CANDLE_LEN, fmt=CSV_FORMAT)
 
 ################################################################################
 # (B) Raw 캔들에 인디케이터를 합쳐서, 별도 key에 저장
@@ -480,34 +430,7 @@ def save_candles_with_indicators_to_redis(symbol: str, timeframe: int, candles_w
     """
     tf_str = get_timeframe(timeframe)
     key = f"candles_with_indicators:{symbol}:{tf_str}"
-
-    existing_list = redis_client.lrange(key, 0, -1)
-    candle_map = {}
-
-    for item in existing_list:
-        try:
-            obj = json.loads(item)
-            if "timestamp" in obj:
-                candle_map[obj["timestamp"]] = obj
-        except Exception as e:
-            pass
-
-    # 새 데이터 덮어쓰기
-    for cndl in candles_with_ind:
-        ts = cndl["timestamp"]
-        candle_map[ts] = cndl
-
-    # 정렬 후 저장
-    sorted_ts = sorted(candle_map.keys())
-    if len(sorted_ts) > MAX_CANDLE_LEN:
-        sorted_ts = sorted_ts[-MAX_CANDLE_LEN:]
-
-    pipe = redis_client.pipeline()
-    pipe.delete(key)
-    for ts in sorted_ts:
-        row_json = json.dumps(candle_map[ts])
-        pipe.rpush(key, row_json)
-    pipe.execute()
+    upsert_candles(redis_client, key, candles_with_ind, max_len=MAX_CANDLE_LEN)
 
 ###############################################################################
 # 6) Celery 태스크: 최대 3000개까지 가져와 Redis에 저장
@@ -621,23 +544,9 @@ def update_symbol_latest_candle(symbol):
                 current_timeframe_minutes=tf
             )
 
-            # 5. Redis 저장
-            pipe = redis_client.pipeline()
+            # 5. Redis 저장: 마지막 캔들 교체 + 새로 추가된 캔들만 기록
             new_len = len(updated_candles)
-
-            # (a) 만약 기존 배열 대비 길이가 같으면 마지막 캔들만 갱신(lset)
-            #     길이가 길어졌다면, = (새 캔들 추가), 그 새 캔들을 rpush.
-            if new_len == old_len:
-                # 기존 마지막 인덱스를 덮어쓰기
-                pipe.lset(key, -1, json.dumps(updated_candles[-1]))
-            else:
-                # 새 캔들이 1개 이상 추가되었으니 rpush
-                # (혹은 중간에 여러 개 캔들이 벌어져 있을 수도 있으니 반복문으로 추가 가능)
-                for i in range(old_len, new_len):
-                    pipe.rpush(key, json.dumps(updated_candles[i]))
-                pipe.ltrim(key, -MAX_CANDLE_LEN, -1)
-
-            pipe.execute()
+            upsert_candles(redis_client, key, updated_candles[min(old_len, new_len - 1):], max_len=MAX_CANDLE_LEN)
 
         return True
         
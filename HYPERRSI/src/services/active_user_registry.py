@@ -0,0 +1,346 @@
+# src/services/active_user_registry.py
+"""
+Active User Registry - 활성 트레이딩 (사용자, 심볼) 인덱스
+
+Beat 주기마다 전체 키스페이스를 SCAN하는 대신, 시작/중지 시점에 갱신되는
+인덱스에서 실행 대상을 조회합니다. 비용은 전체 키 수가 아니라 활성 심볼 수에 비례합니다.
+
+키 구조:
+    trading:registry:entries              HASH  "{okx_uid}:{symbol}" → {"timeframe", "preset_id"} JSON
+    trading:registry:user:{okx_uid}       SET   사용자의 활성 심볼
+    trading:registry:symbol:{symbol}      SET   심볼을 트레이딩 중인 사용자
+    trading:registry:migrated             STRING 기존 키 → 인덱스 1회 마이그레이션 완료 표시
+
+user:{okx_uid}:active_symbols와 심볼별 timeframe/preset_id 키가 원본(SSOT)이며,
+인덱스는 MultiSymbolService의 시작/중지 트랜잭션 안에서 함께 갱신됩니다.
+인덱스를 거치지 않는 쓰기는 주기적인 reconcile()이 바로잡습니다.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from redis import WatchError
+
+from shared.database.redis_patterns import RedisTimeout, redis_context
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+REGISTRY_ENTRIES = "trading:registry:entries"
+REGISTRY_USER_SYMBOLS = "trading:registry:user:{okx_uid}"
+REGISTRY_SYMBOL_USERS = "trading:registry:symbol:{symbol}"
+REGISTRY_MIGRATED = "trading:registry:migrated"
+
+# 원본 키 (multi_symbol_service.py / trading_tasks.py와 동일)
+REDIS_KEY_ACTIVE_SYMBOLS = "user:{okx_uid}:active_symbols"
+REDIS_KEY_SYMBOL_TIMEFRAME = "user:{okx_uid}:symbol:{symbol}:timeframe"
+REDIS_KEY_SYMBOL_PRESET_ID = "user:{okx_uid}:symbol:{symbol}:preset_id"
+REDIS_KEY_SYMBOL_TASK_RUNNING = "user:{okx_uid}:symbol:{symbol}:task_running"
+
+# 이 시간(초)보다 오래된 심볼 태스크 실행 상태는 비정상 종료로 간주
+STALE_TASK_SECONDS = 30
+
+# reconcile() 도중 시작/중지가 겹쳤을 때 재시도 횟수
+MAX_RECONCILE_RETRIES = 5
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+def _entry_field(okx_uid: str, symbol: str) -> str:
+    return f"{okx_uid}:{symbol}"
+
+
+def _split_field(field: str) -> Tuple[str, str]:
+    okx_uid, _, symbol = field.partition(":")
+    return okx_uid, symbol
+
+
+class ActiveUserRegistry:
+    """활성 (사용자, 심볼, 타임프레임, 프리셋) 인덱스"""
+
+    # ==================== 갱신 (시작/중지) ====================
+
+    def stage_register(
+        self,
+        pipe,
+        okx_uid: str,
+        symbol: str,
+        timeframe: str,
+        preset_id: Optional[str] = None
+    ) -> None:
+        """
+        심볼 등록 명령을 파이프라인에 추가
+
+        호출자가 원본 키 쓰기와 같은 MULTI/EXEC 트랜잭션에 담아 실행합니다.
+        """
+        pipe.hset(
+            REGISTRY_ENTRIES,
+            _entry_field(okx_uid, symbol),
+            json.dumps({"timeframe": timeframe, "preset_id": preset_id})
+        )
+        pipe.sadd(REGISTRY_USER_SYMBOLS.format(okx_uid=okx_uid), symbol)
+        pipe.sadd(REGISTRY_SYMBOL_USERS.format(symbol=symbol), okx_uid)
+
+    def stage_unregister(self, pipe, okx_uid: str, symbol: str) -> None:
+        """심볼 제거 명령을 파이프라인에 추가"""
+        pipe.hdel(REGISTRY_ENTRIES, _entry_field(okx_uid, symbol))
+        pipe.srem(REGISTRY_USER_SYMBOLS.format(okx_uid=okx_uid), symbol)
+        pipe.srem(REGISTRY_SYMBOL_USERS.format(symbol=symbol), okx_uid)
+
+    async def register(
+        self,
+        okx_uid: str,
+        symbol: str,
+        timeframe: str,
+        preset_id: Optional[str] = None,
+        redis=None
+    ) -> None:
+        """심볼 등록 (단독 트랜잭션)"""
+        async with self._redis(redis) as client:
+            pipe = client.pipeline(transaction=True)
+            self.stage_register(pipe, okx_uid, symbol, timeframe, preset_id)
+            await pipe.execute()
+
+    async def unregister(self, okx_uid: str, symbol: str, redis=None) -> None:
+        """심볼 제거 (단독 트랜잭션)"""
+        async with self._redis(redis) as client:
+            pipe = client.pipeline(transaction=True)
+            self.stage_unregister(pipe, okx_uid, symbol)
+            await pipe.execute()
+
+    # ==================== 조회 ====================
+
+    async def get_entries(self, redis=None) -> List[Dict[str, Any]]:
+        """
+        등록된 모든 (사용자, 심볼) 항목 - HGETALL 1회
+
+        Returns:
+            [{"okx_uid", "symbol", "timeframe", "preset_id"}, ...]
+        """
+        async with self._redis(redis) as client:
+            raw = await client.hgetall(REGISTRY_ENTRIES)
+        return self._parse_entries(raw)
+
+    async def get_runnable_entries(self, redis=None, stale_after: int = STALE_TASK_SECONDS) -> List[Dict[str, Any]]:
+        """
+        새 트레이딩 사이클을 등록할 항목 (심볼 태스크가 실행 중이 아닌 항목)
+
+        라운드트립: 인덱스 HGETALL 1회 + 심볼별 task_running HGETALL 파이프라인 1회.
+        오래된 실행 상태가 있으면 정리 명령 파이프라인 1회가 추가됩니다.
+        """
+        async with self._redis(redis) as client:
+            pipe = client.pipeline(transaction=False)
+            pipe.hgetall(REGISTRY_ENTRIES)
+            pipe.exists(REGISTRY_MIGRATED)
+            raw, migrated = await pipe.execute()
+            if not migrated:
+                # 인덱스 도입 후 첫 조회: 기존 키에서 1회 구축
+                await self.reconcile(client)
+                raw = await client.hgetall(REGISTRY_ENTRIES)
+
+            entries = self._parse_entries(raw)
+            if not entries:
+                return []
+
+            pipe = client.pipeline(transaction=False)
+            for entry in entries:
+                pipe.hgetall(REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid=entry["okx_uid"], symbol=entry["symbol"]))
+            task_states = await pipe.execute()
+
+            now = datetime.now().timestamp()
+            runnable, stale_keys = [], []
+            for entry, state in zip(entries, task_states):
+                state = {_decode(k): _decode(v) for k, v in (state or {}).items()}
+                if state.get("status") == "running":
+                    if "started_at" not in state:
+                        continue
+                    try:
+                        if now - float(state["started_at"]) <= stale_after:
+                            continue
+                    except (ValueError, TypeError):
+                        pass
+                    logger.warning(f"[{entry['okx_uid']}] {entry['symbol']} 오래된 태스크 상태 초기화 ({stale_after}초 초과)")
+                    stale_keys.append(
+                        REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid=entry["okx_uid"], symbol=entry["symbol"])
+                    )
+                runnable.append(entry)
+
+            if stale_keys:
+                await client.delete(*stale_keys)
+            return runnable
+
+    async def get_symbol_users(self, symbol: str, redis=None) -> Set[str]:
+        """심볼을 트레이딩 중인 사용자"""
+        async with self._redis(redis) as client:
+            return {_decode(uid) for uid in await client.smembers(REGISTRY_SYMBOL_USERS.format(symbol=symbol))}
+
+    # ==================== 정합성 ====================
+
+    async def reconcile(self, redis=None) -> Dict[str, int]:
+        """
+        원본 키(active_symbols, timeframe, preset_id)를 스캔하여 인덱스를 맞춤
+
+        시작/중지 트랜잭션을 거치지 않은 쓰기(관리 스크립트, 수동 수정 등)를
+        바로잡는 주기 작업이자 1회 마이그레이션입니다. 마지막에 마이그레이션
+        완료 표시를 남깁니다.
+
+        Returns:
+            {"entries": 원본 항목 수, "added": 추가/갱신, "removed": 제거}
+        """
+        async with self._redis(redis) as client:
+            for attempt in range(MAX_RECONCILE_RETRIES):
+                try:
+                    expected, added, removed = await self._reconcile_once(client)
+                    break
+                except WatchError:
+                    if attempt == MAX_RECONCILE_RETRIES - 1:
+                        raise
+                    await asyncio.sleep(0.1 * (attempt + 1))
+
+        if added or removed:
+            logger.info(f"활성 사용자 인덱스 정합성 복구: 추가/갱신 {added}, 제거 {removed} (총 {len(expected)})")
+        return {"entries": len(expected), "added": added, "removed": removed}
+
+    async def _reconcile_once(self, client) -> Tuple[Dict[str, Dict[str, Any]], int, int]:
+        """
+        reconcile() 1회 시도
+
+        스캔은 원자적이지 않으므로 인덱스 HASH를 WATCH한 뒤 스캔합니다. 인덱스를 거치는
+        시작/중지(add_symbol/remove_symbol)는 같은 트랜잭션에서 HASH를 갱신하므로, 스캔
+        도중 등록된 심볼을 지우는 대신 EXEC가 취소되고(WatchError) 다시 시도합니다.
+
+        Raises:
+            WatchError: 스캔 도중 인덱스가 바뀐 경우
+        """
+        async with client.pipeline(transaction=True) as pipe:
+            await pipe.watch(REGISTRY_ENTRIES)
+            expected = await self._scan_source_entries(client)
+            current = {
+                _entry_field(entry["okx_uid"], entry["symbol"]): entry
+                for entry in self._parse_entries(await pipe.hgetall(REGISTRY_ENTRIES))
+            }
+
+            # 사용자/심볼 SET에만 남은 항목
+            users = {entry["okx_uid"] for entry in expected.values()}
+            symbols = {entry["symbol"] for entry in expected.values()}
+            orphan_sets = []
+            async for key in client.scan_iter(match="trading:registry:user:*", count=500):
+                key = _decode(key)
+                if key.rsplit(":", 1)[-1] not in users:
+                    orphan_sets.append(key)
+            async for key in client.scan_iter(match="trading:registry:symbol:*", count=500):
+                key = _decode(key)
+                if key.split(":", 3)[-1] not in symbols:
+                    orphan_sets.append(key)
+
+            pipe.multi()
+            added = removed = 0
+            for field, entry in expected.items():
+                known = current.get(field)
+                if known is None or (known["timeframe"], known["preset_id"]) != (entry["timeframe"], entry["preset_id"]):
+                    self.stage_register(pipe, entry["okx_uid"], entry["symbol"], entry["timeframe"], entry["preset_id"])
+                    added += 1
+            for field in current.keys() - expected.keys():
+                self.stage_unregister(pipe, *_split_field(field))
+                removed += 1
+            if orphan_sets:
+                pipe.delete(*orphan_sets)
+            pipe.set(REGISTRY_MIGRATED, str(datetime.now().timestamp()))
+            await pipe.execute()
+        return expected, added, removed
+
+    async def _scan_source_entries(self, client) -> Dict[str, Dict[str, Any]]:
+        """원본 키에서 활성 항목 구축 (SCAN + 파이프라인 조회)"""
+        active: List[Tuple[str, str]] = []
+        async for key in client.scan_iter(match="user:*:active_symbols", count=500):
+            key_parts = _decode(key).split(':')
+            if len(key_parts) != 3 or key_parts[2] != 'active_symbols':
+                continue
+            active.append((key_parts[1], None))
+
+        pipe = client.pipeline(transaction=False)
+        for okx_uid, _ in active:
+            pipe.smembers(REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid=okx_uid))
+        pairs = [
+            (okx_uid, _decode(symbol))
+            for (okx_uid, _), symbols in zip(active, await pipe.execute())
+            for symbol in symbols
+        ]
+
+        pipe = client.pipeline(transaction=False)
+        for okx_uid, symbol in pairs:
+            pipe.get(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol))
+            pipe.get(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol))
+        values = await pipe.execute()
+
+        entries = {}
+        for index, (okx_uid, symbol) in enumerate(pairs):
+            timeframe, preset_id = _decode(values[2 * index]), _decode(values[2 * index + 1])
+            if not timeframe:
+                # 기존 스캔과 동일: 타임프레임이 없으면 실행 대상 아님
+                continue
+            entries[_entry_field(okx_uid, symbol)] = {
+                "okx_uid": okx_uid,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                "preset_id": preset_id,
+            }
+        return entries
+
+    # ==================== 내부 ====================
+
+    @staticmethod
+    def _parse_entries(raw: Dict[Any, Any]) -> List[Dict[str, Any]]:
+        entries = []
+        for field, value in (raw or {}).items():
+            okx_uid, symbol = _split_field(_decode(field))
+            try:
+                data = json.loads(_decode(value))
+            except (TypeError, ValueError):
+                logger.warning(f"활성 사용자 인덱스 항목 파싱 실패: {field}")
+                continue
+            entries.append({
+                "okx_uid": okx_uid,
+                "symbol": symbol,
+                "timeframe": data.get("timeframe"),
+                "preset_id": data.get("preset_id"),
+            })
+        entries.sort(key=lambda entry: (entry["okx_uid"], entry["symbol"]))
+        return entries
+
+    @staticmethod
+    def _redis(redis):
+        """주어진 클라이언트를 그대로 쓰거나 새 redis_context를 엶"""
+        if redis is not None:
+            return _BorrowedClient(redis)
+        return redis_context(timeout=RedisTimeout.SLOW_OPERATION)
+
+
+class _BorrowedClient:
+    """이미 열린 클라이언트를 async with로 넘기기 위한 래퍼 (닫지 않음)"""
+
+    def __init__(self, client):
+        self.client = client
+
+    async def __aenter__(self):
+        return self.client
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+_registry: Optional[ActiveUserRegistry] = None
+
+
+def get_active_user_registry() -> ActiveUserRegistry:
+    """ActiveUserRegistry 싱글톤"""
+    global _registry
+    if _registry is None:
+        _registry = ActiveUserRegistry()
+    return _registry
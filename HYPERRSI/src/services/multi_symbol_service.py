@@ -10,6 +10,7 @@ import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
+from HYPERRSI.src.services.active_user_registry import get_active_user_registry
 from shared.config import settings as app_settings
 from shared.database.redis_patterns import redis_context, RedisTimeout
 from shared.logging import get_logger
@@ -154,34 +155,29 @@ class MultiSymbolService:
             elif len(active_list) >= self.max_symbols:
                 raise MaxSymbolsReachedError(active_list, self.max_symbols)
 
-            # 심볼 추가
-            await redis.sadd(active_key, symbol)
-
-            # 심볼별 설정 저장
-            await redis.set(
-                REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol),
-                timeframe
-            )
-            await redis.set(
-                REDIS_KEY_SYMBOL_STATUS.format(okx_uid=okx_uid, symbol=symbol),
-                "running"
-            )
-            await redis.set(
+            if not preset_id:
+                # 인덱스에는 기존 프리셋을 유지
+                preset_id = await redis.get(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol))
+                preset_id = preset_id.decode('utf-8') if isinstance(preset_id, bytes) else preset_id
+                stored_preset = None
+            else:
+                stored_preset = preset_id
+
+            # 심볼 추가 + 심볼별 설정 + 활성 사용자 인덱스를 한 트랜잭션으로
+            pipe = redis.pipeline(transaction=True)
+            pipe.sadd(active_key, symbol)
+            pipe.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol), timeframe)
+            pipe.set(REDIS_KEY_SYMBOL_STATUS.format(okx_uid=okx_uid, symbol=symbol), "running")
+            pipe.set(
                 REDIS_KEY_SYMBOL_STARTED_AT.format(okx_uid=okx_uid, symbol=symbol),
                 str(datetime.now().timestamp())
             )
-
-            if preset_id:
-                await redis.set(
-                    REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol),
-                    preset_id
-                )
-
+            if stored_preset:
+                pipe.set(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol), stored_preset)
             if task_id:
-                await redis.set(
-                    REDIS_KEY_SYMBOL_TASK_ID.format(okx_uid=okx_uid, symbol=symbol),
-                    task_id
-                )
+                pipe.set(REDIS_KEY_SYMBOL_TASK_ID.format(okx_uid=okx_uid, symbol=symbol), task_id)
+            get_active_user_registry().stage_register(pipe, okx_uid, symbol, timeframe, preset_id)
+            await pipe.execute()
 
             logger.info(f"[{okx_uid}] 심볼 추가: {symbol}, timeframe={timeframe}, preset={preset_id}")
             return True
@@ -203,10 +199,7 @@ class MultiSymbolService:
         async with redis_context(timeout=RedisTimeout.NORMAL_OPERATION) as redis:
             active_key = REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid=okx_uid)
 
-            # 심볼 제거
-            await redis.srem(active_key, symbol)
-
-            # 심볼별 키 삭제
+            # 심볼별 키
             keys_to_delete = [
                 REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol),
                 REDIS_KEY_SYMBOL_STATUS.format(okx_uid=okx_uid, symbol=symbol),
@@ -216,11 +209,12 @@ class MultiSymbolService:
                 REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid=okx_uid, symbol=symbol),
             ]
 
-            for key in keys_to_delete:
-                try:
-                    await redis.delete(key)
-                except Exception as e:
-                    logger.warning(f"[{okx_uid}] 키 삭제 중 오류 (무시됨): {key}, {e}")
+            # 심볼 제거 + 키 삭제 + 활성 사용자 인덱스를 한 트랜잭션으로
+            pipe = redis.pipeline(transaction=True)
+            pipe.srem(active_key, symbol)
+            pipe.delete(*keys_to_delete)
+            get_active_user_registry().stage_unregister(pipe, okx_uid, symbol)
+            await pipe.execute()
 
             logger.info(f"[{okx_uid}] 심볼 제거: {symbol}")
             return True
@@ -0,0 +1,130 @@
+"""Unit Tests for the active user registry
+
+Checks that start/stop updates keep the registry index in step, that
+reconcile() rebuilds it from the source keys, and that a symbol started
+while reconcile() is scanning is not unregistered.
+
+Run tests:
+    pytest HYPERRSI/src/services/tests/test_active_user_registry.py -v
+"""
+
+import json
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from HYPERRSI.src.services.active_user_registry import (
+    REDIS_KEY_ACTIVE_SYMBOLS,
+    REDIS_KEY_SYMBOL_PRESET_ID,
+    REDIS_KEY_SYMBOL_TASK_RUNNING,
+    REDIS_KEY_SYMBOL_TIMEFRAME,
+    REGISTRY_ENTRIES,
+    REGISTRY_MIGRATED,
+    REGISTRY_SYMBOL_USERS,
+    REGISTRY_USER_SYMBOLS,
+    ActiveUserRegistry,
+)
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+async def _start_symbol(redis, registry, okx_uid, symbol, timeframe="1m", preset_id=None):
+    """MultiSymbolService.add_symbol()과 같은 트랜잭션 (원본 키 + 인덱스)"""
+    pipe = redis.pipeline(transaction=True)
+    pipe.sadd(REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid=okx_uid), symbol)
+    pipe.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid=okx_uid, symbol=symbol), timeframe)
+    if preset_id:
+        pipe.set(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid=okx_uid, symbol=symbol), preset_id)
+    registry.stage_register(pipe, okx_uid, symbol, timeframe, preset_id)
+    await pipe.execute()
+
+
+async def test_register_and_unregister(redis):
+    registry = ActiveUserRegistry()
+
+    await registry.register("u1", "BTC-USDT-SWAP", "1m", "p1", redis=redis)
+    await registry.register("u2", "BTC-USDT-SWAP", "5m", redis=redis)
+
+    assert await registry.get_entries(redis) == [
+        {"okx_uid": "u1", "symbol": "BTC-USDT-SWAP", "timeframe": "1m", "preset_id": "p1"},
+        {"okx_uid": "u2", "symbol": "BTC-USDT-SWAP", "timeframe": "5m", "preset_id": None},
+    ]
+    assert await registry.get_symbol_users("BTC-USDT-SWAP", redis) == {"u1", "u2"}
+
+    await registry.unregister("u1", "BTC-USDT-SWAP", redis=redis)
+
+    assert [e["okx_uid"] for e in await registry.get_entries(redis)] == ["u2"]
+    assert await registry.get_symbol_users("BTC-USDT-SWAP", redis) == {"u2"}
+    assert not await redis.exists(REGISTRY_USER_SYMBOLS.format(okx_uid="u1"))
+
+
+async def test_reconcile_rebuilds_from_source_keys(redis):
+    registry = ActiveUserRegistry()
+    # 인덱스를 거치지 않은 원본 쓰기
+    await redis.sadd(REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid="u1"), "BTC-USDT-SWAP", "ETH-USDT-SWAP")
+    await redis.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid="u1", symbol="BTC-USDT-SWAP"), "15m")
+    await redis.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid="u1", symbol="ETH-USDT-SWAP"), "1m")
+    await redis.set(REDIS_KEY_SYMBOL_PRESET_ID.format(okx_uid="u1", symbol="ETH-USDT-SWAP"), "p9")
+    # 타임프레임이 바뀐 항목, 원본이 사라진 항목, SET에만 남은 항목
+    await registry.register("u1", "BTC-USDT-SWAP", "1m", redis=redis)
+    await registry.register("gone", "SOL-USDT-SWAP", "1m", redis=redis)
+    await redis.sadd(REGISTRY_SYMBOL_USERS.format(symbol="XRP-USDT-SWAP"), "ghost")
+
+    stats = await registry.reconcile(redis)
+
+    assert stats == {"entries": 2, "added": 2, "removed": 1}
+    assert await registry.get_entries(redis) == [
+        {"okx_uid": "u1", "symbol": "BTC-USDT-SWAP", "timeframe": "15m", "preset_id": None},
+        {"okx_uid": "u1", "symbol": "ETH-USDT-SWAP", "timeframe": "1m", "preset_id": "p9"},
+    ]
+    assert not await redis.exists(REGISTRY_USER_SYMBOLS.format(okx_uid="gone"))
+    assert not await redis.exists(REGISTRY_SYMBOL_USERS.format(symbol="SOL-USDT-SWAP"))
+    assert not await redis.exists(REGISTRY_SYMBOL_USERS.format(symbol="XRP-USDT-SWAP"))
+    assert await redis.exists(REGISTRY_MIGRATED)
+    assert await registry.reconcile(redis) == {"entries": 2, "added": 0, "removed": 0}
+
+
+async def test_symbol_started_during_reconcile_scan_is_kept(monkeypatch, redis):
+    registry = ActiveUserRegistry()
+    await _start_symbol(redis, registry, "u1", "BTC-USDT-SWAP")
+    scan = registry._scan_source_entries
+    scans = []
+
+    async def racing_scan(client):
+        entries = await scan(client)
+        scans.append(len(entries))
+        if len(scans) == 1:
+            # 스캔이 끝난 뒤 EXEC 전에 다른 사용자가 시작
+            await _start_symbol(redis, registry, "u2", "ETH-USDT-SWAP")
+        return entries
+
+    monkeypatch.setattr(registry, "_scan_source_entries", racing_scan)
+    stats = await registry.reconcile(redis)
+
+    assert scans == [1, 2]
+    assert stats == {"entries": 2, "added": 0, "removed": 0}
+    assert await redis.hexists(REGISTRY_ENTRIES, "u2:ETH-USDT-SWAP")
+    assert await registry.get_symbol_users("ETH-USDT-SWAP", redis) == {"u2"}
+
+
+async def test_runnable_entries_migrate_once_and_skip_running(redis):
+    registry = ActiveUserRegistry()
+    await redis.sadd(REDIS_KEY_ACTIVE_SYMBOLS.format(okx_uid="u1"), "BTC-USDT-SWAP", "ETH-USDT-SWAP")
+    for symbol in ("BTC-USDT-SWAP", "ETH-USDT-SWAP"):
+        await redis.set(REDIS_KEY_SYMBOL_TIMEFRAME.format(okx_uid="u1", symbol=symbol), "1m")
+    await redis.hset(
+        REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid="u1", symbol="BTC-USDT-SWAP"),
+        mapping={"status": "running", "started_at": str(datetime.now().timestamp())}
+    )
+    stale_key = REDIS_KEY_SYMBOL_TASK_RUNNING.format(okx_uid="u1", symbol="ETH-USDT-SWAP")
+    await redis.hset(stale_key, mapping={"status": "running", "started_at": "0"})
+
+    runnable = await registry.get_runnable_entries(redis)
+
+    assert [entry["symbol"] for entry in runnable] == ["ETH-USDT-SWAP"]
+    assert not await redis.exists(stale_key)
+    assert json.loads(await redis.hget(REGISTRY_ENTRIES, "u1:BTC-USDT-SWAP"))["timeframe"] == "1m"
@@ -24,9 +24,11 @@ from billiard.exceptions import SoftTimeLimitExceeded, TimeLimitExceeded
 
 from HYPERRSI.src.bot.telegram_message import send_telegram_message
 from HYPERRSI.src.core.celery_task import celery_app
+from HYPERRSI.src.services.active_user_registry import get_active_user_registry
 from HYPERRSI.src.trading.execute_trading_logic import execute_trading_logic
 from HYPERRSI.src.trading.services.order_utils import InsufficientMarginError
 from HYPERRSI.src.utils.error_logger import log_error_to_db
+from shared.config import settings as app_settings
 from shared.database.redis_helper import get_redis_client  # Legacy - deprecated
 from shared.database.redis_patterns import redis_context, RedisTimeout
 from shared.database.redis_migration import get_redis_context
@@ -535,9 +537,37 @@ async def get_active_trading_users():
     두 모드 모두 후방 호환성을 위해 지원됩니다.
     """
     # 심볼별 상태 관리로 완전 전환 - 레거시 모드 제거
+    if app_settings.ACTIVE_USER_REGISTRY_ENABLED:
+        try:
+            return await _get_registry_active_users()
+        except Exception as e:
+            # 인덱스 조회 실패 시 키스페이스 스캔으로 대체
+            logger.error(f"활성 사용자 인덱스 조회 오류, 스캔으로 대체: {str(e)}")
     return await _get_multi_symbol_active_users()
 
 
+async def _get_registry_active_users() -> List[Dict[str, Any]]:
+    """
+    활성 사용자 인덱스 조회 (SCAN 없음)
+
+    인덱스 HGETALL 1회와 심볼별 실행 상태 파이프라인 1회로
+    _get_multi_symbol_active_users()와 같은 결과를 반환합니다.
+    """
+    async with get_redis_context(user_id="_system_scan_", timeout=RedisTimeout.SLOW_OPERATION) as redis:
+        entries = await get_active_user_registry().get_runnable_entries(redis)
+
+    return [
+        {
+            'okx_uid': entry['okx_uid'],
+            'symbol': entry['symbol'],
+            'timeframe': entry['timeframe'],
+            'preset_id': entry['preset_id'],
+            'multi_symbol_mode': True
+        }
+        for entry in entries
+    ]
+
+
 async def _get_multi_symbol_active_users() -> List[Dict[str, Any]]:
     """
     멀티심볼 모드용 활성 사용자 스캔
@@ -1084,7 +1114,13 @@ def check_and_execute_trading():
     """
     Beat으로 주기적으로 실행되는 태스크.
     활성 사용자를 확인하고(OKX UID 기준), 필요한 경우 트레이딩 태스크를 등록
+
+    상주 트레이딩 워커(TRADING_WORKER_ENABLED)가 정기 사이클을 맡는 경우 건너뜀
     """
+    if app_settings.TRADING_WORKER_ENABLED:
+        logger.debug("⏭️ 상주 트레이딩 워커 사용 중 - Beat 사이클 등록 건너뜀")
+        return
+
     try:
         # 활성 사용자 목록 가져오기 - 직접 이벤트 루프 관리
         active_users = run_async(get_active_trading_users()) # 내부 로직에서 okx_uid 반환
@@ -1179,6 +1215,24 @@ def check_and_execute_trading():
         )
         traceback.print_exc()
 
+@celery_app.task(name='trading_tasks.reconcile_active_user_registry', ignore_result=True)
+def reconcile_active_user_registry():
+    """
+    Beat으로 주기적으로 실행되는 활성 사용자 인덱스 정합성 복구 태스크.
+    시작/중지 경로를 거치지 않은 active_symbols 변경을 인덱스에 반영
+    """
+    try:
+        stats = run_async(get_active_user_registry().reconcile())
+        logger.debug(f"활성 사용자 인덱스 정합성 확인: {stats}")
+    except Exception as e:
+        logger.error(f"reconcile_active_user_registry 태스크 실행 중 오류: {str(e)}", exc_info=True)
+        log_error_to_db(
+            error=e,
+            error_type="ActiveUserRegistryReconcileError",
+            severity="WARNING",
+            metadata={"component": "trading_tasks.reconcile_active_user_registry"}
+        )
+
 @celery_app.task(name='trading_tasks.execute_trading_cycle', bind=True, max_retries=3, time_limit=120, soft_time_limit=90)
 def execute_trading_cycle(
     self: Any,
@@ -1280,7 +1334,9 @@ async def _execute_trading_cycle(
     timeframe: str,
     restart: bool = False,
     execution_mode: str = "api_direct",
-    signal_token: Optional[str] = None
+    signal_token: Optional[str] = None,
+    cycle_delay: float = 1.0,
+    first_cycle: Optional[bool] = None
 ) -> Dict[str, Any]:
     """
     실제 비동기 트레이딩 로직 (OKX UID 기반)
@@ -1295,29 +1351,35 @@ async def _execute_trading_cycle(
         restart: 재시작 여부
         execution_mode: 실행 모드 ("api_direct" 또는 "signal_bot")
         signal_token: Signal Bot 토큰 (signal_bot 모드일 때 필수)
+        cycle_delay: 사이클 완료 후 락을 쥔 채 대기할 시간(초). 상주 워커는
+            자체 스케줄로 간격을 두므로 0을 전달
+        first_cycle: 세션 시작, 기존 락/쿨다운 삭제 수행 여부 (None이면 restart와 동일).
+            상주 워커는 restart=True(정상 사이클 의미)와 first_cycle=False를 전달
 
     세션 관리:
-    - restart=True: 새 세션 시작 (PostgreSQL에 기록)
+    - first_cycle=True: 새 세션 시작 (PostgreSQL에 기록)
     - 트레이딩 종료 시: 세션 종료 기록
     """
     # 상태 추적 변수
     success = False
     error_message: Optional[str] = None
     session_id: Optional[int] = None
+    if first_cycle is None:
+        first_cycle = restart
 
     try:
         # 1. 태스크 실행 상태를 True로 설정 (60초 만료 - Beat 주기보다 충분히 길게)
         # 멀티심볼 모드: symbol 전달하여 심볼별 상태도 설정
         await set_task_running(okx_uid, True, expiry=60, symbol=symbol)
 
-        # 2. 세션 시작 (restart=True일 때만, PostgreSQL SSOT)
-        if restart:
-            session_id = await _start_session_if_needed(okx_uid, symbol, timeframe, restart)
+        # 2. 세션 시작 (first_cycle=True일 때만, PostgreSQL SSOT)
+        if first_cycle:
+            session_id = await _start_session_if_needed(okx_uid, symbol, timeframe, first_cycle)
 
         lock_key = REDIS_KEY_USER_LOCK.format(okx_uid=okx_uid, symbol=symbol, timeframe=timeframe)
 
         # 재시작 모드이거나 첫 실행일 경우 기존 락 삭제
-        if restart:
+        if first_cycle:
             try:
                 # 이벤트 루프가 열려있는지 확인
                 try:
@@ -1349,7 +1411,7 @@ async def _execute_trading_cycle(
 
             try:
                 # 쿨다운 키 삭제 - 첫 실행에서 쿨다운 무시를 위해
-                if restart:
+                if first_cycle:
                     # Operations: EXISTS + DELETE for cooldown keys - within migration context
                     async with get_redis_context(user_id=str(okx_uid), timeout=RedisTimeout.NORMAL_OPERATION) as redis:
                         for direction in ["long", "short"]:
@@ -1382,7 +1444,7 @@ async def _execute_trading_cycle(
                     retry_count = 0
                     while retry_count < 3:
                         try:
-                            is_running = await check_if_running(okx_uid)
+                            is_running = await check_if_symbol_running(okx_uid, symbol)
                             break
                         except Exception as check_err:
                             logger.warning(f"[{okx_uid}] 상태 확인 실패 (시도 {retry_count+1}/3): {str(check_err)}")
@@ -1404,7 +1466,8 @@ async def _execute_trading_cycle(
                     )
 
                     # 다음 사이클까지 작은 지연 추가
-                    await asyncio.sleep(1)
+                    if cycle_delay:
+                        await asyncio.sleep(cycle_delay)
 
                     # 성공 상태 기록
                     success = True
@@ -1538,6 +1601,36 @@ async def _execute_trading_cycle(
             except Exception as session_err:
                 logger.error(f"[{okx_uid}] 세션 종료 처리 실패 (무시됨): {session_err}")
 
+async def run_trading_cycle(
+    okx_uid: str,
+    symbol: str,
+    timeframe: str,
+    task_id: str,
+    execution_mode: str = "api_direct",
+    signal_token: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    정기 트레이딩 사이클 1회 실행 (상주 워커용)
+
+    Beat이 등록하던 사이클과 같이 restart=True로 트레이딩 로직을 실행합니다
+    (execute_trading_logic은 restart=False일 때만 주문 취소, 레버리지 설정,
+    포지션 상태 초기화 같은 시작 처리를 함). 세션 시작과 기존 락/쿨다운 삭제는
+    시작 사이클에서만 필요하므로 하지 않으며, 간격은 호출자가 스케줄하므로
+    사이클 후 대기하지 않습니다.
+
+    Args:
+        okx_uid: 사용자 OKX UID
+        symbol: 거래 심볼
+        timeframe: 타임프레임
+        task_id: 로그/실행 기록용 실행 주체 ID
+        execution_mode: 실행 모드 ("api_direct" 또는 "signal_bot")
+        signal_token: Signal Bot 토큰 (signal_bot 모드일 때 필수)
+    """
+    return await _execute_trading_cycle(
+        okx_uid, task_id, symbol, timeframe, restart=True,
+        execution_mode=execution_mode, signal_token=signal_token, cycle_delay=0, first_cycle=False
+    )
+
 # 애플리케이션 종료 시 이벤트 루프 정리 함수
 def cleanup_event_loop():
     """
@@ -0,0 +1,129 @@
+# bar_events.py
+"""
+바 마감 이벤트 스트림
+
+데이터 수집기는 바 마감 캔들의 지표를 candles_with_indicators에 기록한 직후
+(심볼, 타임프레임)별 Redis Stream에 바 마감 이벤트를 추가합니다. 상주 트레이딩
+워커는 컨슈머 그룹으로 이벤트를 읽어 해당 시리즈를 트레이딩하는 (사용자, 심볼)
+사이클만 즉시 실행합니다.
+
+스트림:
+    stream:bar_close:{symbol}:{tf_str}
+        symbol, timeframe, timestamp(바 시작), close_time(바 마감), close, published_at
+
+컨슈머 그룹(BAR_CLOSE_GROUP)은 워커 샤드마다 하나이며, 이벤트는 그룹 안의 한 워커에게만
+전달됩니다. 이벤트는 사이클 실행 트리거일 뿐이므로 트리거 직후 ACK하고, 놓친 이벤트는
+워커의 주기적 안전 점검 사이클이 보완합니다.
+"""
+
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from shared.logging import get_logger
+from shared.utils.time_helpers import timeframe_to_seconds
+
+logger = get_logger(__name__)
+
+BAR_CLOSE_STREAM = "stream:bar_close:{symbol}:{tf_str}"
+BAR_CLOSE_GROUP = "trading-worker"
+# 스트림당 보관 이벤트 수 (근사 MAXLEN)
+BAR_CLOSE_STREAM_MAXLEN = 1000
+
+BarCloseEvent = Tuple[str, str, Dict[str, str]]
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+def bar_close_stream(symbol: str, tf_str: str) -> str:
+    return BAR_CLOSE_STREAM.format(symbol=symbol, tf_str=tf_str)
+
+
+def publish_bar_close(redis_client, symbol: str, tf_str: str, candle: Dict[str, Any]) -> str:
+    """
+    바 마감 이벤트 추가 (수집기의 동기 Redis 클라이언트 사용)
+
+    Args:
+        redis_client: 동기 Redis 클라이언트
+        symbol: 심볼
+        tf_str: 타임프레임 문자열 ('1m', '1h' 등)
+        candle: 마감된 캔들 (timestamp는 바 시작 시각, 초 단위)
+
+    Returns:
+        스트림 메시지 ID
+    """
+    timestamp = int(candle["timestamp"])
+    fields = {
+        "symbol": symbol,
+        "timeframe": tf_str,
+        "timestamp": timestamp,
+        "close_time": timestamp + timeframe_to_seconds(tf_str),
+        "close": candle.get("close", ""),
+        "published_at": f"{time.time():.3f}",
+    }
+    return redis_client.xadd(
+        bar_close_stream(symbol, tf_str), fields, maxlen=BAR_CLOSE_STREAM_MAXLEN, approximate=True
+    )
+
+
+class BarCloseConsumer:
+    """컨슈머 그룹 기반 바 마감 이벤트 리더 (비동기 Redis 클라이언트)"""
+
+    def __init__(self, consumer: str, group: str = BAR_CLOSE_GROUP, block_ms: int = 1000, count: int = 100):
+        self.consumer = consumer
+        self.group = group
+        self.block_ms = block_ms
+        self.count = count
+        self._groups: set = set()
+
+    async def ensure_groups(self, redis, streams: Iterable[str]) -> None:
+        """스트림별 컨슈머 그룹 생성 (처음 보는 스트림만, 새 이벤트부터 읽음)"""
+        for stream in streams:
+            if stream in self._groups:
+                continue
+            try:
+                await redis.xgroup_create(stream, self.group, id="$", mkstream=True)
+            except Exception as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._groups.add(stream)
+
+    async def read(self, redis, streams: Iterable[str]) -> List[BarCloseEvent]:
+        """
+        새 이벤트 읽기 (최대 block_ms 대기)
+
+        Returns:
+            [(stream, message_id, fields), ...]
+        """
+        streams = list(streams)
+        if not streams:
+            return []
+        await self.ensure_groups(redis, streams)
+        response = await redis.xreadgroup(
+            self.group, self.consumer, {stream: ">" for stream in streams},
+            count=self.count, block=self.block_ms
+        )
+        events = []
+        for stream, messages in response or []:
+            for message_id, fields in messages:
+                events.append((
+                    _decode(stream),
+                    _decode(message_id),
+                    {_decode(k): _decode(v) for k, v in (fields or {}).items()},
+                ))
+        return events
+
+    async def ack(self, redis, events: List[BarCloseEvent]) -> None:
+        """처리한 이벤트 ACK (스트림별 1회)"""
+        by_stream: Dict[str, List[str]] = {}
+        for stream, message_id, _ in events:
+            by_stream.setdefault(stream, []).append(message_id)
+        if not by_stream:
+            return
+        pipe = redis.pipeline(transaction=False)
+        for stream, ids in by_stream.items():
+            pipe.xack(stream, self.group, *ids)
+        await pipe.execute()
@@ -0,0 +1,162 @@
+# cycle_context.py
+"""
+트레이딩 사이클 Redis 상태 스냅샷
+
+execute_trading_logic 한 번의 실행이 필요로 하는 Redis 값을 단계별로 한 번의
+파이프라인으로 읽고, 쓰기는 모아 두었다가 사이클 종료 시 한 번에 반영합니다.
+
+라운드트립:
+    load()            상태 + 설정 + 마지막 캔들 + 알림 플래그     (monitor_orders 이전)
+    load_position()   상태(갱신) + 최근 캔들 + 최소 수량 + 포지션 방향 + 출력 시각
+                                                                  (monitor_orders 이후)
+    refresh_status()  상태(갱신)                                  (포지션 처리 이후)
+    flush()           모아 둔 쓰기 + 상태(갱신)                    (사이클 종료)
+
+상태 키는 사용자 중지 요청이 언제든 바뀌므로 외부 작업(주문 모니터링,
+포지션 처리) 이후에는 반드시 다시 읽고, 그 사이의 연속 확인은 캐시 값을 사용합니다.
+신호 계산에 쓰는 최근 캔들도 주문 모니터링 동안 갱신될 수 있으므로 load_position()에서
+다시 읽습니다 (load()의 마지막 캔들은 캔들 데이터 존재 확인용).
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from shared.database.candle_store import decode_candles, read_candles_async, stage_read_candles
+
+REDIS_KEY_SYMBOL_STATUS = "user:{user_id}:symbol:{symbol}:status"
+REDIS_KEY_USER_SETTINGS = "user:{user_id}:settings"
+REDIS_KEY_CANDLE_ALERT = "candle_data_alert_sent:{user_id}:{symbol}:{tf_str}"
+REDIS_KEY_MIN_SUSTAIN_SIZE = "user:{user_id}:position:{symbol}:min_sustain_contract_size"
+REDIS_KEY_MAIN_DIRECTION = "user:{user_id}:position:{symbol}:main_position_direction"
+REDIS_KEY_LAST_PRINT_TIME = "user:{user_id}:last_position_print_time"
+CANDLE_KEY = "candles_with_indicators:{symbol}:{tf_str}"
+
+
+def _decode(value):
+    if isinstance(value, bytes):
+        return value.decode('utf-8')
+    return value
+
+
+class TradingCycleContext:
+    """한 트레이딩 사이클 동안의 Redis 값 캐시와 쓰기 버퍼"""
+
+    def __init__(self, redis, user_id: str, symbol: str, tf_str: str, candle_count: int = 14):
+        self.redis = redis
+        self.user_id = user_id
+        self.symbol = symbol
+        self.tf_str = tf_str
+        self.candle_count = candle_count
+
+        self.status_key = REDIS_KEY_SYMBOL_STATUS.format(user_id=user_id, symbol=symbol)
+        self.candle_key = CANDLE_KEY.format(symbol=symbol, tf_str=tf_str)
+        self.alert_key = REDIS_KEY_CANDLE_ALERT.format(user_id=user_id, symbol=symbol, tf_str=tf_str)
+        self.last_print_key = REDIS_KEY_LAST_PRINT_TIME.format(user_id=user_id)
+
+        self.status: Optional[str] = None
+        self.settings_str: Optional[str] = None
+        self.candles: List[Dict[str, Any]] = []
+        self.candle_alert_sent = False
+        self.min_sustain_contract_size: Optional[str] = None
+        self.main_position_direction: Optional[str] = None
+        self.last_print_time: Optional[str] = None
+
+        self.round_trips = 0
+        self._writes: List[Tuple[str, tuple]] = []
+
+    @property
+    def is_running(self) -> bool:
+        """캐시된 심볼 상태가 running인지"""
+        return self.status == "running"
+
+    @property
+    def last_candle(self) -> Optional[Dict[str, Any]]:
+        return self.candles[-1] if self.candles else None
+
+    # ==================== 읽기 ====================
+
+    async def load(self) -> "TradingCycleContext":
+        """사이클 시작 스냅샷: 상태, 사용자 설정, 마지막 캔들, 캔들 알림 플래그"""
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.status_key)
+        pipe.get(REDIS_KEY_USER_SETTINGS.format(user_id=self.user_id))
+        pipe.exists(self.alert_key)
+        pipelined_candles = stage_read_candles(pipe, self.candle_key, count=1)
+        values = await self._execute(pipe)
+
+        self.status = _decode(values[0])
+        self.settings_str = _decode(values[1])
+        self.candle_alert_sent = bool(values[2])
+        self.candles = await self._candles(values[3] if pipelined_candles else None, count=1)
+        return self
+
+    async def load_position(self) -> Optional[str]:
+        """
+        주문 모니터링 이후 스냅샷: 상태(무효화 지점), 최근 캔들(candle_count개),
+        최소 유지 수량, 메인 포지션 방향, 마지막 포지션 출력 시각
+
+        Returns:
+            갱신된 심볼 상태
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.get(self.status_key)
+        pipe.get(REDIS_KEY_MIN_SUSTAIN_SIZE.format(user_id=self.user_id, symbol=self.symbol))
+        pipe.get(REDIS_KEY_MAIN_DIRECTION.format(user_id=self.user_id, symbol=self.symbol))
+        pipe.get(self.last_print_key)
+        pipelined_candles = stage_read_candles(pipe, self.candle_key, count=self.candle_count)
+        values = await self._execute(pipe)
+
+        self.status = _decode(values[0])
+        self.min_sustain_contract_size = _decode(values[1])
+        self.main_position_direction = _decode(values[2])
+        self.last_print_time = _decode(values[3])
+        self.candles = await self._candles(values[4] if pipelined_candles else None, count=self.candle_count)
+        return self.status
+
+    async def refresh_status(self) -> Optional[str]:
+        """심볼 상태 다시 읽기 (외부 작업 이후의 무효화 지점)"""
+        self.status = _decode(await self.redis.get(self.status_key))
+        self.round_trips += 1
+        return self.status
+
+    # ==================== 쓰기 ====================
+
+    def set(self, key: str, value: Any) -> None:
+        """SET을 사이클 종료 시점까지 보류"""
+        self._writes.append(("set", (key, value)))
+
+    def setex(self, key: str, seconds: int, value: Any) -> None:
+        """SETEX를 사이클 종료 시점까지 보류"""
+        self._writes.append(("setex", (key, seconds, value)))
+
+    async def flush(self, refresh_status: bool = True) -> Optional[str]:
+        """
+        보류한 쓰기를 한 번에 반영하고, 같은 라운드트립에서 상태를 다시 읽음
+
+        Returns:
+            refresh_status면 갱신된 심볼 상태, 아니면 캐시된 상태
+        """
+        writes, self._writes = self._writes, []
+        if not writes and not refresh_status:
+            return self.status
+
+        pipe = self.redis.pipeline(transaction=False)
+        for command, args in writes:
+            getattr(pipe, command)(*args)
+        if refresh_status:
+            pipe.get(self.status_key)
+        values = await self._execute(pipe)
+        if refresh_status:
+            self.status = _decode(values[-1])
+        return self.status
+
+    async def _candles(self, items, count: int) -> List[Dict[str, Any]]:
+        """파이프라인 LRANGE 결과 변환, 없으면(컬럼형 캐시) 따로 읽음"""
+        if items is not None:
+            return decode_candles(items)
+        # 컬럼형 캐시는 binary 클라이언트로 따로 읽음
+        self.round_trips += 1
+        return await read_candles_async(self.redis, self.candle_key, count=count)
+
+    async def _execute(self, pipe) -> list:
+        self.round_trips += 1
+        return await pipe.execute()
@@ -0,0 +1,160 @@
+# cycle_scheduler.py
+"""
+트레이딩 사이클 스케줄링 도구
+
+- TimerWheel: (사용자, 심볼)별 다음 사이클 시각을 관리하는 해시 타이머 휠
+- CycleMetrics: 사이클 지연(latency)과 예정 시각 대비 시작 지연(jitter) 집계
+
+상주 트레이딩 워커(trading_worker.py)가 사용합니다.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional, Tuple
+
+
+class TimerWheel:
+    """
+    해시 타이머 휠
+
+    시간을 tick 단위 슬롯으로 나누고, 각 타이머를 만료 tick의 슬롯에 넣습니다.
+    advance()는 지난 tick의 슬롯만 확인하므로 비용이 전체 타이머 수가 아니라
+    만료된 타이머 수에 비례합니다. 키마다 타이머는 하나이며, 다시 schedule()하면
+    이전 타이머는 무시됩니다.
+    """
+
+    def __init__(self, tick: float = 0.1, slots: int = 512, clock: Callable[[], float] = time.monotonic):
+        if tick <= 0 or slots <= 0:
+            raise ValueError("tick and slots must be positive")
+        self.tick = tick
+        self.slots = slots
+        self.clock = clock
+        self._origin = clock()
+        self._current = 0  # 마지막으로 처리한 tick
+        self._wheel: List[List[Tuple[int, Hashable, float]]] = [[] for _ in range(slots)]
+        self._deadlines: Dict[Hashable, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def deadline(self, key: Hashable) -> Optional[float]:
+        return self._deadlines.get(key)
+
+    def schedule(self, key: Hashable, delay: float) -> float:
+        """
+        delay초 뒤에 key 타이머 설정 (기존 타이머 대체)
+
+        Returns:
+            만료 시각 (clock 기준)
+        """
+        return self.schedule_at(key, self.clock() + max(delay, 0.0))
+
+    def schedule_at(self, key: Hashable, deadline: float) -> float:
+        """절대 시각(clock 기준)에 key 타이머 설정 (기존 타이머 대체)"""
+        target = max(math.ceil((deadline - self._origin) / self.tick), self._current + 1)
+        self._wheel[target % self.slots].append((target, key, deadline))
+        self._deadlines[key] = deadline
+        return deadline
+
+    def cancel(self, key: Hashable) -> bool:
+        """타이머 취소 (슬롯의 항목은 해당 tick 처리 시 버려짐)"""
+        return self._deadlines.pop(key, None) is not None
+
+    def advance(self, now: Optional[float] = None) -> List[Tuple[Hashable, float]]:
+        """
+        현재 시각까지 만료된 타이머 반환
+
+        Returns:
+            [(key, 예정 만료 시각), ...] (만료 순서)
+        """
+        now = self.clock() if now is None else now
+        now_tick = math.floor((now - self._origin) / self.tick)
+        if now_tick <= self._current:
+            return []
+
+        due = []
+        # 한 바퀴 이상 지났으면 모든 슬롯을 한 번씩만 확인
+        for offset in range(1, min(now_tick - self._current, self.slots) + 1):
+            index = (self._current + offset) % self.slots
+            bucket = self._wheel[index]
+            if not bucket:
+                continue
+            remaining = []
+            for entry in bucket:
+                target, key, deadline = entry
+                if target > now_tick:
+                    remaining.append(entry)  # 다음 바퀴
+                elif self._deadlines.get(key) == deadline:
+                    del self._deadlines[key]
+                    due.append((key, deadline))
+            self._wheel[index] = remaining
+        self._current = now_tick
+        due.sort(key=lambda item: item[1])
+        return due
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class CycleMetrics:
+    """
+    트레이딩 사이클 지표
+
+    최근 window개 사이클의 지연/지터 분포와 누적 결과 수를 유지합니다.
+    - latency: 사이클 실행 시간
+    - jitter: 예정 시각 대비 실제 시작 지연 (동시 실행 한도 대기 포함)
+    - bar_close: 바 마감 시각부터 그 바로 트리거된 사이클 완료까지 (이벤트 기반 모드)
+    """
+
+    def __init__(self, window: int = 2048):
+        self._latency: Deque[float] = deque(maxlen=window)
+        self._jitter: Deque[float] = deque(maxlen=window)
+        self._bar_close: Deque[float] = deque(maxlen=window)
+        self.events = 0
+        self.results: Dict[str, int] = {}
+        self.overruns = 0
+        self.started_at = time.time()
+
+    def record(self, latency: float, jitter: float, status: str, overrun: bool = False) -> None:
+        self._latency.append(latency)
+        self._jitter.append(max(jitter, 0.0))
+        self.results[status] = self.results.get(status, 0) + 1
+        if overrun:
+            self.overruns += 1
+
+    def record_bar_close(self, latency: float) -> None:
+        self._bar_close.append(max(latency, 0.0))
+        self.events += 1
+
+    @staticmethod
+    def _distribution(values: Deque[float]) -> Dict[str, float]:
+        ordered = sorted(values)
+        return {
+            "p50_ms": round(_percentile(ordered, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(ordered, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(ordered, 0.99) * 1000, 1),
+            "max_ms": round((ordered[-1] if ordered else 0.0) * 1000, 1),
+        }
+
+    def snapshot(self, **extra: Any) -> Dict[str, Any]:
+        """현재 지표 (JSON 직렬화 가능)"""
+        return {
+            "cycles": sum(self.results.values()),
+            "results": dict(self.results),
+            "overruns": self.overruns,
+            "window": len(self._latency),
+            "latency": self._distribution(self._latency),
+            "jitter": self._distribution(self._jitter),
+            "bar_close_events": self.events,
+            "bar_close": self._distribution(self._bar_close),
+            "uptime_seconds": int(time.time() - self.started_at),
+            **extra,
+        }
@@ -13,8 +13,10 @@ from HYPERRSI.src.bot.telegram_message import send_telegram_message
 from HYPERRSI.src.core.error_handler import ErrorCategory, handle_critical_error
 from HYPERRSI.src.core.logger import log_bot_error, log_bot_start, log_bot_stop, setup_error_logger
 from HYPERRSI.src.services.redis_service import RedisService
+from HYPERRSI.src.trading.cycle_context import TradingCycleContext
 from HYPERRSI.src.trading.models import get_timeframe, get_auto_trend_timeframe
 from HYPERRSI.src.trading.services.get_current_price import get_current_price
+from HYPERRSI.src.trading.signal_stage import resolve_signals
 from HYPERRSI.src.trading.trading_service import TradingService
 from HYPERRSI.src.trading.utils.position_handler import handle_existing_position, handle_no_position
 from HYPERRSI.src.trading.utils.trading_utils import (
@@ -110,6 +112,7 @@ async def execute_trading_logic(
           2) RSI/트랜드 체크 -> 포지션 분기처리
         """
         trading_service = None
+        cycle = None
         #print("execute_trading_logic 호출")
     
         # 원본 user_id를 telegram_id로 저장 (텔레그램 메시지 전송용)
@@ -419,8 +422,9 @@ async def execute_trading_logic(
 
             #print(f"레버리지: {leverage}, 현재 레버리지: {current_leverage}")
             is_hedge_mode, tdMode = await trading_service.get_position_mode(user_id, symbol)
-            # 심볼별 상태 확인
-            is_running = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
+            # 사이클 스냅샷: 심볼 상태, 설정, 최근 캔들을 한 번에 조회
+            cycle = await TradingCycleContext(redis, user_id, symbol, get_timeframe(timeframe)).load()
+            is_running = cycle.status
             if not restart:
                 try:
                     if leverage > 1.0 and current_leverage != leverage:
@@ -479,19 +483,15 @@ async def execute_trading_logic(
                 #print("설정 업데이트 호출")
                 tf_str = get_timeframe(timeframe)
                 current_price = await get_current_price(symbol, tf_str)
-                settings_str = await redis.get(f"user:{user_id}:settings")
-                candle_key = f"candles_with_indicators:{symbol}:{tf_str}"
-                raw_data = await redis.lindex(candle_key, -1)
-                if not raw_data:
+                settings_str = cycle.settings_str
+                candle_data = cycle.last_candle
+                if not candle_data:
                     # 15분에 한 번만 알림을 보내도록 제한
-                    alert_key = f"candle_data_alert_sent:{user_id}:{symbol}:{tf_str}"
-                    already_sent = await redis.get(alert_key)
-                    if not already_sent:
+                    if not cycle.candle_alert_sent:
                         await send_telegram_message("⚠️ 캔들 데이터를 찾을 수 없습니다.\n관리자에게 문의해주세요.", user_id, debug=True )
                         # 15분(900초) 동안 알림 재전송 방지
-                        await redis.setex(alert_key, 3600, "1")
+                        cycle.setex(cycle.alert_key, 3600, "1")
                     return
-                candle_data = json.loads(raw_data)
                 #print("atr_value: ", atr_value)
                 if settings_str:
                     try:
@@ -503,10 +503,7 @@ async def execute_trading_logic(
                     logger.error(f"설정을 찾을 수 없음: user_id={user_id}")
                     return
                 #print("설정 업데이트 완료")
-                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                # 바이트 문자열을 디코딩
-                if isinstance(trading_status, bytes):
-                    trading_status = trading_status.decode('utf-8')
+                trading_status = cycle.status
                 if trading_status != "running":
                     logger.info(f"[{user_id}] 트레이딩 중지 감지. telegram_id: {telegram_id}")
                     # 메시지 전송 (OKX UID 사용)
@@ -517,14 +514,6 @@ async def execute_trading_logic(
                         user_id  # 여기서 user_id는 이미 OKX UID로 변환됨
                     )
                     return
-                #=======================================
-                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                if isinstance(trading_status, bytes):
-                    trading_status = trading_status.decode('utf-8')
-                if trading_status != "running":
-                    logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {trading_status}")
-                    return
-                #=======================================
                 # --- (1) 주문 상태 모니터링(폴링) ---
                 try:
                     start_time = datetime.now()
@@ -554,61 +543,41 @@ async def execute_trading_logic(
                     )
 
                 # --- (2) RSI / 트랜드 분석 ---
-                tf_str = get_timeframe(timeframe)
-                redis_key = f"candles_with_indicators:{symbol}:{tf_str}"
-                #print(f"[{user_id}] redis_key: {redis_key}")
-                # 여러 캔들 데이터를 가져옵니다 (최소 마지막 14개)
-                raw_data_list = await redis.lrange(redis_key, -14, -1)
-                #print(f"[{user_id}] raw_data_list: {raw_data_list}") #<-- 1h 정상 작동
-                if not raw_data_list or len(raw_data_list) < 2:  # 최소 2개 이상의 데이터가 필요
-                    raw_data = await redis.lindex(redis_key, -1)
-                    if not raw_data:
-                        # 15분에 한 번만 알림을 보내도록 제한
-                        alert_key = f"candle_data_alert_sent:{user_id}:{symbol}:{tf_str}"
-                        already_sent = await redis.get(alert_key)
-                        if not already_sent:
-                            await send_telegram_message("⚠️ 캔들 데이터를 찾을 수 없습니다.\n관리자에게 문의해주세요.", user_id, debug=True)
-                            # 15분(900초) 동안 알림 재전송 방지
-                            await redis.setex(alert_key, 3600, "1")
-                        return
-
                 #=======================================
-                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                if isinstance(trading_status, bytes):
-                    trading_status = trading_status.decode('utf-8')
+                # 무효화 지점: 주문 모니터링 이후 상태, 최근 캔들(최소 마지막 14개),
+                # 포지션 관련 키를 다시 조회
+                trading_status = await cycle.load_position()
                 if trading_status != "running":
                     logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {trading_status}")
                     return
                 #=======================================
-                # 모든 캔들에서 RSI 값 추출
+                recent_candles = cycle.candles
+                if not recent_candles:
+                    # 주문 모니터링 중 캔들 꼬리가 비었음 - 15분에 한 번만 알림
+                    logger.warning(f"[{user_id}] {symbol}/{tf_str} 최근 캔들 데이터 없음 - 사이클 중단")
+                    if not cycle.candle_alert_sent:
+                        await send_telegram_message("⚠️ 캔들 데이터를 찾을 수 없습니다.\n관리자에게 문의해주세요.", user_id, debug=True)
+                        # 15분(900초) 동안 알림 재전송 방지
+                        cycle.setex(cycle.alert_key, 3600, "1")
+                    return
+                # 모든 캔들에서 RSI 값 추출 (최소 2개 이상의 데이터가 필요)
                 rsi_values = []
-                for raw_data in raw_data_list:
-                    candle_data = json.loads(raw_data)
+                for candle_data in recent_candles:
                     if 'rsi' in candle_data and candle_data['rsi'] is not None:
                         rsi_values.append(candle_data['rsi'])
                             # RSI 값이 충분하지 않은 경우 처리
                 if len(rsi_values) < 2:
+                    logger.warning(f"[{user_id}] {symbol}/{tf_str} RSI 데이터 부족 (캔들 {len(recent_candles)}개, RSI {len(rsi_values)}개) - 사이클 중단")
                     await send_telegram_message("⚠️ 충분한 RSI 데이터가 없습니다.\n관리자에게 문의해주세요.", user_id, debug=True)
                     return
-                candle_data = json.loads(raw_data)
+                candle_data = recent_candles[-1]
                 current_rsi = candle_data['rsi']
                 #print("current_rsi: ", current_rsi)
-                # 트렌드 타임프레임: '자동'이면 그대로 전달, 수동이면 해당 타임프레임 사용
-                trend_timeframe = user_settings['trend_timeframe']
-
-                rsi_signals = await trading_service.check_rsi_signals(
-                    rsi_values,
-                    {
-                        'entry_option': user_settings['entry_option'],
-                        'rsi_oversold': user_settings['rsi_oversold'],
-                        'rsi_overbought': user_settings['rsi_overbought']
-                    }
-                )
-                #print("rsi_signals: ", rsi_signals)
-                analysis = await calculator.analyze_market_state_from_redis(
-                    symbol,
-                    str(timeframe),
-                    trend_timeframe  # '자동', '15m', '30m' 등을 그대로 전달
+                # 같은 심볼/타임프레임/신호 설정의 사용자끼리 캔들 갱신당 한 번만 계산
+                # (실패하거나 비활성화되면 사용자별 계산)
+                rsi_signals, analysis = await resolve_signals(
+                    redis, calculator, symbol, timeframe, user_settings, recent_candles,
+                    shared=app_settings.SHARED_SIGNAL_STAGE_ENABLED, user_id=user_id
                 )
                 current_state = analysis['trend_state']
                 # --- (3) 포지션 분기 ---
@@ -616,8 +585,7 @@ async def execute_trading_logic(
             
                 if current_position:  # 포지션이 있는 경우
                     try:
-                        min_size_key = f"user:{user_id}:position:{symbol}:min_sustain_contract_size"
-                        min_sustain_contract_size = await redis.get(min_size_key)
+                        min_sustain_contract_size = cycle.min_sustain_contract_size
                         if min_sustain_contract_size is None:
                             min_sustain_contract_size = 0.01
             
@@ -673,17 +641,15 @@ async def execute_trading_logic(
                         )
                         await send_telegram_message(f"⚠️ 포지션 청산 오류: {str(e)}", user_id, debug=True)
                 # 마지막 포지션 출력 시간 체크
-                last_print_key = f"user:{user_id}:last_position_print_time"
-                last_print_time = await redis.get(last_print_key)
+                last_print_time = cycle.last_print_time
                 current_time = int(time.time())
             
                 if not last_print_time or (current_time - int(last_print_time)) >= 300:  # 300초 = 5분
                     logger.debug(f"Current Position : {current_position}")
-                    await redis.set(last_print_key, str(current_time))
+                    cycle.set(cycle.last_print_key, str(current_time))
             
-                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                if isinstance(trading_status, bytes):
-                    trading_status = trading_status.decode('utf-8')
+                # 무효화 지점: 최소 수량 청산(close_position) 이후
+                trading_status = await cycle.refresh_status()
                 if trading_status != "running":
                     logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {trading_status}")
                     return
@@ -694,9 +660,8 @@ async def execute_trading_logic(
                         symbol, timeframe,
                         current_rsi, rsi_signals, current_state
                     )
-                    trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                    if isinstance(trading_status, bytes):
-                        trading_status = trading_status.decode('utf-8')
+                    # 무효화 지점: 포지션 진입 처리 이후
+                    trading_status = await cycle.refresh_status()
                     if trading_status is None:
                         logger.info(f"⚠️Not FOUND [{user_id}] Trading Status!!. Trading Status :  {trading_status}")
                         await send_telegram_message(f"⚠️Not FOUND [{user_id}] Trading Status!!. Trading Status :  {trading_status}", user_id, debug=True)
@@ -707,8 +672,7 @@ async def execute_trading_logic(
                 else:
                     try:
                         #print("포지션이 있다고 출력 됨.")
-                        main_position_direction_key = f"user:{user_id}:position:{symbol}:main_position_direction"
-                        direction = await redis.get(main_position_direction_key)
+                        direction = cycle.main_position_direction
                         if direction is None:
                             direction = "any"
                         await handle_existing_position(
@@ -716,9 +680,8 @@ async def execute_trading_logic(
                             symbol, timeframe,
                             current_position, current_rsi, rsi_signals, current_state, side = direction
                         )
-                        trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                        if isinstance(trading_status, bytes):
-                            trading_status = trading_status.decode('utf-8')
+                        # 무효화 지점: 기존 포지션 처리 이후
+                        trading_status = await cycle.refresh_status()
                         if trading_status != "running":
                             logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {trading_status}")
                             return
@@ -766,11 +729,8 @@ async def execute_trading_logic(
                 logger.debug(f"[{user_id}] 트레이딩 로직 루프 완료. 현재 RSI: {current_rsi}, 현재 상태: {current_state}") # 디버깅용
 
                 #=======================================
-                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-                if isinstance(trading_status, bytes):
-                    trading_status = trading_status.decode('utf-8')
-                if trading_status != "running":
-                    logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {trading_status}")
+                if not cycle.is_running:
+                    logger.info(f"[{user_id}] 트레이딩 중지 상태 감지: {cycle.status}")
                     return
                 #=======================================
             end_time_loop = datetime.now()
@@ -803,10 +763,13 @@ async def execute_trading_logic(
                 await trading_service.close()
                 #print("trading_service 종료")
         
-            # 심볼별 트레이딩 종료 여부 확인 및 로그 기록
-            trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
-            if isinstance(trading_status, bytes):
-                trading_status = trading_status.decode('utf-8')
+            # 보류한 쓰기 반영 + 심볼별 트레이딩 종료 여부 확인 (한 번의 라운드트립)
+            if cycle is not None:
+                trading_status = await cycle.flush()
+            else:
+                trading_status = await redis.get(f"user:{user_id}:symbol:{symbol}:status")
+                if isinstance(trading_status, bytes):
+                    trading_status = trading_status.decode('utf-8')
             if trading_status == "stopped":
                 # 가장 먼저 로그를 기록
                 log_bot_stop(user_id=user_id, symbol=symbol, reason="사용자 요청 또는 시스템에 의한 종료")
@@ -14,6 +14,7 @@ import pandas as pd
 
 from HYPERRSI.src.trading.models import get_timeframe
 from HYPERRSI.src.trading.services.get_current_price import get_current_price
+from shared.database.candle_store import read_candles_async, read_last_candle_async
 from shared.database.redis_helper import get_redis_client
 from shared.logging import get_logger
 from shared.utils import safe_float
@@ -31,6 +32,96 @@ def __getattr__(name):
     raise AttributeError(f"module has no attribute {name}")
 
 
+def evaluate_rsi_signals(rsi_values: list, rsi_settings: dict) -> dict:
+    """
+    RSI 신호 확인 로직 (사용자 무관 순수 함수)
+
+    공유 신호 단계(signal_stage)와 MarketDataService.check_rsi_signals가 함께 사용합니다.
+    """
+    try:
+        # RSI 값 유효성 검사
+        if not rsi_values or len(rsi_values) < 2:
+            logger.warning("충분한 RSI 데이터가 없습니다.")
+            return {
+                'rsi': None,
+                'is_oversold': False,
+                'is_overbought': False
+            }
+
+        # 현재 RSI와 이전 RSI 값
+        current_rsi = rsi_values[-1]
+        previous_rsi = rsi_values[-2]
+
+        # 진입 옵션에 따른 처리
+        entry_option = rsi_settings.get('entry_option', '')
+        rsi_oversold = rsi_settings['rsi_oversold']
+        rsi_overbought = rsi_settings['rsi_overbought']
+
+        ## 디버깅: RSI 설정 로그
+        #logger.info(f"🔍 RSI 신호 체크:")
+        #logger.info(f"  - entry_option: '{entry_option}'")
+        #logger.info(f"  - rsi_oversold: {rsi_oversold}")
+        #logger.info(f"  - rsi_overbought: {rsi_overbought}")
+        #logger.info(f"  - previous_rsi: {previous_rsi:.3f}")
+        #logger.info(f"  - current_rsi: {current_rsi:.3f}")
+
+        is_oversold = False
+        is_overbought = False
+
+        if entry_option == '돌파':
+            # 롱: crossunder the rsi_oversold
+            is_oversold = previous_rsi > rsi_oversold and current_rsi <= rsi_oversold
+
+            # 숏: crossunder the rsi_overbought
+            is_overbought = previous_rsi < rsi_overbought and current_rsi >= rsi_overbought
+        elif entry_option == '변곡':
+            # 롱: oversold 영역에서 RSI 상승 시작 (방향 전환)
+            is_oversold = ((previous_rsi < rsi_oversold) or (current_rsi < rsi_oversold)) and current_rsi > previous_rsi
+
+            # 숏: overbought 영역에서 RSI 하락 시작 (방향 전환)
+            is_overbought = ((previous_rsi > rsi_overbought) or (current_rsi > rsi_overbought)) and current_rsi < previous_rsi
+
+        elif entry_option == '변곡돌파':
+            # 롱: oversold 위로 crossover (oversold 돌파)
+            is_oversold = current_rsi >= rsi_oversold and previous_rsi < rsi_oversold
+
+            # 숏: overbought 아래로 crossunder (overbought 돌파)
+            is_overbought = current_rsi <= rsi_overbought and previous_rsi > rsi_overbought
+
+        elif entry_option == '초과':
+            # 롱: current_rsi < rsi_oversold
+            is_oversold = current_rsi < rsi_oversold
+            # 숏: current_rsi > rsi_overbought
+            is_overbought = current_rsi > rsi_overbought
+
+        else:
+            # 기본 동작 (기존 코드와 동일)
+            is_oversold = current_rsi < rsi_oversold
+            is_overbought = current_rsi > rsi_overbought
+
+        # 디버깅: 결과 로그
+        #logger.info(f"🎯 RSI 신호 결과: is_oversold: {is_oversold}, is_overbought: {is_overbought}")
+        if entry_option == '돌파':
+            logger.info(f"  - '돌파' 조건: 롱(oversold): prev({previous_rsi:.3f}) > {rsi_oversold} and curr({current_rsi:.3f}) <= {rsi_oversold}")
+            logger.info(f"    숏(overbought): prev({previous_rsi:.3f}) < {rsi_overbought} and curr({current_rsi:.3f}) >= {rsi_overbought}")
+        elif entry_option == '변곡돌파':
+            logger.info(f"  - '변곡돌파': 롱(oversold): curr({current_rsi:.3f}) < {rsi_oversold} and prev({previous_rsi:.3f}) >= {rsi_oversold}")
+            logger.info(f"    숏(overbought): curr({current_rsi:.3f}) > {rsi_overbought} and prev({previous_rsi:.3f}) <= {rsi_overbought}")
+
+        return {
+            'rsi': current_rsi,
+            'is_oversold': is_oversold,
+            'is_overbought': is_overbought
+        }
+    except Exception as e:
+        logger.error(f"RSI 신호 확인 중 오류 발생: {str(e)}", exc_info=True)
+        return {
+            'rsi': None,
+            'is_oversold': False,
+            'is_overbought': False
+        }
+
+
 class MarketDataService:
     """시장 데이터 조회 및 인디케이터 서비스"""
 
@@ -51,9 +142,8 @@ class MarketDataService:
             redis = await get_redis_client()
             tf_str = get_timeframe(timeframe)
             candle_key = f"candles_with_indicators:{symbol}:{tf_str}"
-            candle_data = await redis.lindex(candle_key, -1)
-            if candle_data:
-                candle_json = json.loads(candle_data)
+            candle_json = await read_last_candle_async(redis, candle_key)
+            if candle_json:
                 atr_value = float(candle_json.get('atr14', 0.0))
                 if atr_value is None or atr_value <= current_price * 0.001:
                     atr_value = current_price * 0.001
@@ -70,18 +160,18 @@ class MarketDataService:
             redis = await get_redis_client()
             tf_str = get_timeframe(timeframe)
             candles_key = f"candles_with_indicators:{symbol}:{tf_str}"
-            cached_data = await redis.lrange(candles_key, -limit, -1)
+            cached_data = await read_candles_async(redis, candles_key, count=limit)
             if cached_data:
                 df = pd.DataFrame([
                     {
-                        'timestamp': pd.to_datetime(json.loads(item)['timestamp'], unit='s'),
-                        'open': float(json.loads(item)['open']),
-                        'high': float(json.loads(item)['high']),
-                        'low': float(json.loads(item)['low']),
-                        'close': float(json.loads(item)['close']),
-                        'volume': float(json.loads(item)['volume'])
+                        'timestamp': pd.to_datetime(candle['timestamp'], unit='s'),
+                        'open': float(candle['open']),
+                        'high': float(candle['high']),
+                        'low': float(candle['low']),
+                        'close': float(candle['close']),
+                        'volume': float(candle['volume'])
                     }
-                    for item in cached_data
+                    for candle in cached_data
                 ])
                 if not df.empty:
                     df.set_index('timestamp', inplace=True)
@@ -97,88 +187,7 @@ class MarketDataService:
 
     async def check_rsi_signals(self, rsi_values: list, rsi_settings: dict) -> dict:
         """RSI 신호 확인 로직"""
-        try:
-            # RSI 값 유효성 검사
-            if not rsi_values or len(rsi_values) < 2:
-                logger.warning("충분한 RSI 데이터가 없습니다.")
-                return {
-                    'rsi': None,
-                    'is_oversold': False,
-                    'is_overbought': False
-                }
-
-            # 현재 RSI와 이전 RSI 값
-            current_rsi = rsi_values[-1]
-            previous_rsi = rsi_values[-2]
-
-            # 진입 옵션에 따른 처리
-            entry_option = rsi_settings.get('entry_option', '')
-            rsi_oversold = rsi_settings['rsi_oversold']
-            rsi_overbought = rsi_settings['rsi_overbought']
-
-            ## 디버깅: RSI 설정 로그
-            #logger.info(f"🔍 RSI 신호 체크:")
-            #logger.info(f"  - entry_option: '{entry_option}'")
-            #logger.info(f"  - rsi_oversold: {rsi_oversold}")
-            #logger.info(f"  - rsi_overbought: {rsi_overbought}")
-            #logger.info(f"  - previous_rsi: {previous_rsi:.3f}")
-            #logger.info(f"  - current_rsi: {current_rsi:.3f}")
-
-            is_oversold = False
-            is_overbought = False
-
-            if entry_option == '돌파':
-                # 롱: crossunder the rsi_oversold
-                is_oversold = previous_rsi > rsi_oversold and current_rsi <= rsi_oversold
-
-                # 숏: crossunder the rsi_overbought
-                is_overbought = previous_rsi < rsi_overbought and current_rsi >= rsi_overbought
-            elif entry_option == '변곡':
-                # 롱: oversold 영역에서 RSI 상승 시작 (방향 전환)
-                is_oversold = ((previous_rsi < rsi_oversold) or (current_rsi < rsi_oversold)) and current_rsi > previous_rsi
-
-                # 숏: overbought 영역에서 RSI 하락 시작 (방향 전환)
-                is_overbought = ((previous_rsi > rsi_overbought) or (current_rsi > rsi_overbought)) and current_rsi < previous_rsi
-
-            elif entry_option == '변곡돌파':
-                # 롱: oversold 위로 crossover (oversold 돌파)
-                is_oversold = current_rsi >= rsi_oversold and previous_rsi < rsi_oversold
-
-                # 숏: overbought 아래로 crossunder (overbought 돌파)
-                is_overbought = current_rsi <= rsi_overbought and previous_rsi > rsi_overbought
-
-            elif entry_option == '초과':
-                # 롱: current_rsi < rsi_oversold
-                is_oversold = current_rsi < rsi_oversold
-                # 숏: current_rsi > rsi_overbought
-                is_overbought = current_rsi > rsi_overbought
-
-            else:
-                # 기본 동작 (기존 코드와 동일)
-                is_oversold = current_rsi < rsi_oversold
-                is_overbought = current_rsi > rsi_overbought
-
-            # 디버깅: 결과 로그
-            #logger.info(f"🎯 RSI 신호 결과: is_oversold: {is_oversold}, is_overbought: {is_overbought}")
-            if entry_option == '돌파':
-                logger.info(f"  - '돌파' 조건: 롱(oversold): prev({previous_rsi:.3f}) > {rsi_oversold} and curr({current_rsi:.3f}) <= {rsi_oversold}")
-                logger.info(f"    숏(overbought): prev({previous_rsi:.3f}) < {rsi_overbought} and curr({current_rsi:.3f}) >= {rsi_overbought}")
-            elif entry_option == '변곡돌파':
-                logger.info(f"  - '변곡돌파': 롱(oversold): curr({current_rsi:.3f}) < {rsi_oversold} and prev({previous_rsi:.3f}) >= {rsi_oversold}")
-                logger.info(f"    숏(overbought): curr({current_rsi:.3f}) > {rsi_overbought} and prev({previous_rsi:.3f}) <= {rsi_overbought}")
-
-            return {
-                'rsi': current_rsi,
-                'is_oversold': is_oversold,
-                'is_overbought': is_overbought
-            }
-        except Exception as e:
-            logger.error(f"RSI 신호 확인 중 오류 발생: {str(e)}", exc_info=True)
-            return {
-                'rsi': None,
-                'is_oversold': False,
-                'is_overbought': False
-            }
+        return evaluate_rsi_signals(rsi_values, rsi_settings)
 
     async def get_contract_info(
         self,
@@ -0,0 +1,277 @@
+# signal_stage.py
+"""
+공유 심볼 신호 단계
+
+같은 심볼/타임프레임을 트레이딩하는 사용자들은 매 사이클 같은 캔들을 읽고 같은
+RSI/트렌드 조건을 평가합니다. 이 단계는 (심볼, 타임프레임, 신호 설정 해시)별로
+신호를 캔들 갱신마다 한 번만 계산해 간단한 레코드로 Redis에 게시하고,
+사용자 사이클은 레코드를 읽어 사용자별 수량/포지션 로직에만 사용합니다.
+
+레코드 키:
+    signal:{symbol}:{tf}:{settings_hash}          RSI 신호 + 시장 상태 (설정별)
+    signal:market:{symbol}:{tf}:{trend_tf}        시장 상태 (트렌드 타임프레임별, 설정 간 공유)
+
+레코드는 마지막 캔들의 지문(timestamp, close, rsi)과 함께 저장되며, 지문이
+바뀌면(새 봉 또는 진행 중인 봉 갱신) 다시 계산됩니다. 같은 프로세스의 사이클끼리는
+메모리 캐시와 키별 락으로 Redis 조회와 중복 계산도 생략합니다. 키별 락은 대기 중인
+사이클이 있는 동안 유지되므로 같은 키를 두 사이클이 동시에 계산하지 않습니다.
+
+SHARED_SIGNAL_STAGE_ENABLED=True일 때만 사용되며, 기본값(False)에서는 사이클마다
+사용자별로 계산합니다(compute_user_signals).
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from HYPERRSI.src.trading.models import get_timeframe
+from HYPERRSI.src.trading.modules.market_data_service import evaluate_rsi_signals
+from shared.logging import get_logger
+from shared.utils.time_helpers import timeframe_to_seconds
+
+logger = get_logger(__name__)
+
+REDIS_KEY_SIGNAL = "signal:{symbol}:{tf_str}:{settings_hash}"
+REDIS_KEY_MARKET_STATE = "signal:market:{symbol}:{tf_str}:{trend_key}"
+
+# 사용자 설정 중 신호에 영향을 주는 항목
+SIGNAL_SETTING_KEYS = ("entry_option", "rsi_oversold", "rsi_overbought", "trend_timeframe")
+
+
+def signal_settings_hash(settings: Dict[str, Any]) -> str:
+    """신호 설정 해시 (같은 해시의 사용자는 같은 신호를 받음)"""
+    payload = json.dumps({key: settings.get(key) for key in SIGNAL_SETTING_KEYS}, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:12]
+
+
+def candle_fingerprint(candle: Dict[str, Any]) -> str:
+    """마지막 캔들 지문 - 새 봉과 진행 중인 봉의 갱신을 모두 구분"""
+    return f"{candle.get('timestamp')}:{candle.get('close')}:{candle.get('rsi')}"
+
+
+def _jsonable(value: Any) -> Any:
+    """numpy 스칼라(bool_, int64 등)를 파이썬 값으로 변환"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _trend_key(trend_timeframe: Optional[str]) -> str:
+    if trend_timeframe and str(trend_timeframe).lower() in ("auto", "자동"):
+        return "auto"
+    return get_timeframe(trend_timeframe) if trend_timeframe else "-"
+
+
+class SymbolSignalStage:
+    """(심볼, 타임프레임, 설정 해시)별 공유 신호 계산/게시"""
+
+    def __init__(self, local_size: int = 4096):
+        self.local_size = local_size
+        self._local: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._lock_users: Dict[str, int] = {}
+        self.stats = {"local": 0, "redis": 0, "computed": 0}
+
+    async def get_signal(
+        self,
+        redis,
+        calculator,
+        symbol: str,
+        timeframe: str,
+        settings: Dict[str, Any],
+        recent_candles: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        사이클에 필요한 공유 신호
+
+        Args:
+            redis: Redis 클라이언트
+            calculator: 시장 상태 계산에 사용할 TrendStateCalculator
+            symbol: 심볼
+            timeframe: 타임프레임
+            settings: 사용자 설정 (SIGNAL_SETTING_KEYS 사용)
+            recent_candles: 사이클 스냅샷의 최근 캔들 (RSI 값 2개 이상)
+
+        Returns:
+            {"fingerprint", "rsi", "rsi_signals", "market_state", "computed_at"}
+        """
+        tf_str = get_timeframe(timeframe)
+        fingerprint = candle_fingerprint(recent_candles[-1])
+        key = REDIS_KEY_SIGNAL.format(symbol=symbol, tf_str=tf_str, settings_hash=signal_settings_hash(settings))
+
+        record = self._get_local(key, fingerprint)
+        if record is not None:
+            self.stats["local"] += 1
+            return record
+
+        async with self._key_lock(key):
+            # 락 대기 중 다른 사이클이 계산했을 수 있음
+            record = self._get_local(key, fingerprint)
+            if record is not None:
+                self.stats["local"] += 1
+                return record
+
+            record = await self._get_published(redis, key, fingerprint)
+            if record is not None:
+                self.stats["redis"] += 1
+            else:
+                rsi_values = [c["rsi"] for c in recent_candles if c.get("rsi") is not None]
+                rsi_signals = evaluate_rsi_signals(rsi_values, {
+                    "entry_option": settings.get("entry_option"),
+                    "rsi_oversold": settings["rsi_oversold"],
+                    "rsi_overbought": settings["rsi_overbought"],
+                })
+                market_state = await self._get_market_state(
+                    redis, calculator, symbol, timeframe, settings.get("trend_timeframe"), fingerprint
+                )
+                record = {
+                    "fingerprint": fingerprint,
+                    "rsi": rsi_values[-1],
+                    "rsi_signals": rsi_signals,
+                    "market_state": market_state,
+                    "computed_at": time.time(),
+                }
+                await self._publish(redis, key, record, timeframe)
+                self.stats["computed"] += 1
+            self._put_local(key, record)
+        return record
+
+    async def _get_market_state(
+        self,
+        redis,
+        calculator,
+        symbol: str,
+        timeframe: str,
+        trend_timeframe: Optional[str],
+        fingerprint: str
+    ) -> Dict[str, Any]:
+        """트렌드 시장 상태 (신호 설정이 달라도 트렌드 타임프레임이 같으면 공유)"""
+        key = REDIS_KEY_MARKET_STATE.format(
+            symbol=symbol, tf_str=get_timeframe(timeframe), trend_key=_trend_key(trend_timeframe)
+        )
+        async with self._key_lock(key):
+            record = self._get_local(key, fingerprint) or await self._get_published(redis, key, fingerprint)
+            if record is None:
+                state = await calculator.analyze_market_state_from_redis(symbol, str(timeframe), trend_timeframe)
+                record = {"fingerprint": fingerprint, "state": state}
+                await self._publish(redis, key, record, timeframe)
+            self._put_local(key, record)
+        return record["state"]
+
+    @asynccontextmanager
+    async def _key_lock(self, key: str) -> AsyncIterator[None]:
+        """키별 락 (보유/대기 중인 사이클이 없을 때만 제거)"""
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._lock_users[key] = self._lock_users.get(key, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._lock_users[key] -= 1
+            if not self._lock_users[key]:
+                del self._lock_users[key]
+                del self._locks[key]
+
+    # ==================== 캐시 ====================
+
+    def _get_local(self, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        record = self._local.get(key)
+        if record is None or record["fingerprint"] != fingerprint:
+            return None
+        self._local.move_to_end(key)
+        return record
+
+    def _put_local(self, key: str, record: Dict[str, Any]) -> None:
+        self._local[key] = record
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_size:
+            self._local.popitem(last=False)
+
+    @staticmethod
+    async def _get_published(redis, key: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        raw = await redis.get(key)
+        if not raw:
+            return None
+        try:
+            record = json.loads(raw)
+        except (TypeError, ValueError):
+            return None
+        return record if record.get("fingerprint") == fingerprint else None
+
+    @staticmethod
+    async def _publish(redis, key: str, record: Dict[str, Any], timeframe: str) -> None:
+        # 봉 두 개 동안 유지 (갱신이 멈춘 심볼의 레코드는 자연 만료)
+        ttl = max(timeframe_to_seconds(get_timeframe(timeframe)) * 2, 60)
+        try:
+            await redis.set(key, json.dumps(record, default=_jsonable), ex=ttl)
+        except Exception as e:
+            logger.warning(f"공유 신호 게시 실패 (계산 결과는 사용): {key} - {e}")
+
+
+_stage: Optional[SymbolSignalStage] = None
+
+
+async def compute_user_signals(
+    calculator,
+    symbol: str,
+    timeframe: str,
+    settings: Dict[str, Any],
+    recent_candles: List[Dict[str, Any]]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    사용자별 신호 계산 (공유 단계를 거치지 않음)
+
+    Returns:
+        (rsi_signals, market_state)
+    """
+    rsi_values = [c["rsi"] for c in recent_candles if c.get("rsi") is not None]
+    rsi_signals = evaluate_rsi_signals(rsi_values, {
+        "entry_option": settings.get("entry_option"),
+        "rsi_oversold": settings["rsi_oversold"],
+        "rsi_overbought": settings["rsi_overbought"],
+    })
+    # 트렌드 타임프레임: '자동'이면 그대로 전달, 수동이면 해당 타임프레임 사용
+    market_state = await calculator.analyze_market_state_from_redis(
+        symbol, str(timeframe), settings.get("trend_timeframe")
+    )
+    return rsi_signals, market_state
+
+
+async def resolve_signals(
+    redis,
+    calculator,
+    symbol: str,
+    timeframe: str,
+    settings: Dict[str, Any],
+    recent_candles: List[Dict[str, Any]],
+    shared: bool = True,
+    user_id: Optional[str] = None
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    사이클의 RSI 신호와 시장 상태
+
+    shared=True이면 공유 신호 단계를 사용하고, 조회/계산이 실패하면 사용자별 계산으로
+    대체합니다.
+
+    Returns:
+        (rsi_signals, market_state)
+    """
+    if shared:
+        try:
+            record = await get_signal_stage().get_signal(redis, calculator, symbol, timeframe, settings, recent_candles)
+            return record["rsi_signals"], record["market_state"]
+        except Exception as e:
+            logger.warning(f"[{user_id}] 공유 신호 조회 실패, 개별 계산으로 대체: {str(e)}")
+    return await compute_user_signals(calculator, symbol, timeframe, settings, recent_candles)
+
+
+def get_signal_stage() -> SymbolSignalStage:
+    """SymbolSignalStage 싱글톤 (프로세스 단위 메모리 캐시 공유)"""
+    global _stage
+    if _stage is None:
+        _stage = SymbolSignalStage()
+    return _stage
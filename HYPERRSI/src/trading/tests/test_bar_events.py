@@ -0,0 +1,109 @@
+"""Unit Tests for the bar-close event stream
+
+Checks that publish_bar_close appends the expected fields to the
+per-series stream and that BarCloseConsumer reads new events through its
+consumer group and acknowledges them, so they are not delivered again.
+
+Run tests:
+    pytest HYPERRSI/src/trading/tests/test_bar_events.py -v
+"""
+
+import fakeredis
+import pytest
+
+from HYPERRSI.src.trading.bar_events import (
+    BAR_CLOSE_GROUP,
+    BarCloseConsumer,
+    bar_close_stream,
+    publish_bar_close,
+)
+
+BTC_STREAM = bar_close_stream("BTC-USDT-SWAP", "1m")
+ETH_STREAM = bar_close_stream("ETH-USDT-SWAP", "1m")
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def publisher(server):
+    # 수집기는 동기 클라이언트로 게시
+    return fakeredis.FakeRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture
+def redis(server):
+    return fakeredis.FakeAsyncRedis(server=server)
+
+
+def _consumer(name="w1", group=BAR_CLOSE_GROUP):
+    return BarCloseConsumer(consumer=name, group=group, block_ms=10)
+
+
+def test_publish_appends_bar_close_fields(publisher):
+    message_id = publish_bar_close(publisher, "BTC-USDT-SWAP", "1m", {"timestamp": 600, "close": 101.5})
+
+    assert BTC_STREAM == "stream:bar_close:BTC-USDT-SWAP:1m"
+    [(stored_id, fields)] = publisher.xrange(BTC_STREAM)
+    assert stored_id == message_id
+    assert fields["symbol"] == "BTC-USDT-SWAP" and fields["timeframe"] == "1m"
+    assert fields["timestamp"] == "600" and fields["close_time"] == "660"
+    assert fields["close"] == "101.5" and float(fields["published_at"]) > 0
+
+
+async def test_consumer_reads_only_new_events(publisher, redis):
+    publish_bar_close(publisher, "BTC-USDT-SWAP", "1m", {"timestamp": 0, "close": 1.0})
+    consumer = _consumer()
+
+    # 그룹 생성 전의 이벤트는 읽지 않음
+    assert await consumer.read(redis, [BTC_STREAM, ETH_STREAM]) == []
+
+    btc_id = publish_bar_close(publisher, "BTC-USDT-SWAP", "1m", {"timestamp": 60, "close": 2.0})
+    eth_id = publish_bar_close(publisher, "ETH-USDT-SWAP", "1m", {"timestamp": 60, "close": 3.0})
+    events = await consumer.read(redis, [BTC_STREAM, ETH_STREAM])
+
+    assert sorted((stream, message_id) for stream, message_id, _ in events) == sorted(
+        [(BTC_STREAM, btc_id), (ETH_STREAM, eth_id)]
+    )
+    fields = {stream: fields for stream, _, fields in events}
+    assert fields[BTC_STREAM]["close_time"] == "120" and fields[ETH_STREAM]["close"] == "3.0"
+    assert await consumer.read(redis, [BTC_STREAM, ETH_STREAM]) == []
+
+
+async def test_ack_clears_pending_events(publisher, redis):
+    consumer = _consumer()
+    await consumer.ensure_groups(redis, [BTC_STREAM, ETH_STREAM])
+    for ts in (60, 120):
+        publish_bar_close(publisher, "BTC-USDT-SWAP", "1m", {"timestamp": ts})
+    publish_bar_close(publisher, "ETH-USDT-SWAP", "1m", {"timestamp": 60})
+
+    events = await consumer.read(redis, [BTC_STREAM, ETH_STREAM])
+    assert len(events) == 3
+    assert (await redis.xpending(BTC_STREAM, BAR_CLOSE_GROUP))["pending"] == 2
+
+    await consumer.ack(redis, events)
+
+    assert (await redis.xpending(BTC_STREAM, BAR_CLOSE_GROUP))["pending"] == 0
+    assert (await redis.xpending(ETH_STREAM, BAR_CLOSE_GROUP))["pending"] == 0
+    await consumer.ack(redis, [])
+
+
+async def test_events_are_split_within_group_and_copied_across_groups(publisher, redis):
+    first, second = _consumer("w1"), _consumer("w2")
+    other_shard = _consumer("w3", group=f"{BAR_CLOSE_GROUP}:1")
+    for consumer in (first, second, other_shard):
+        await consumer.ensure_groups(redis, [BTC_STREAM])
+    # 이미 만든 그룹은 다시 만들지 않음 (BUSYGROUP 무시)
+    await BarCloseConsumer(consumer="w4").ensure_groups(redis, [BTC_STREAM])
+
+    publish_bar_close(publisher, "BTC-USDT-SWAP", "1m", {"timestamp": 60})
+
+    delivered = await first.read(redis, [BTC_STREAM]) + await second.read(redis, [BTC_STREAM])
+    assert len(delivered) == 1
+    assert len(await other_shard.read(redis, [BTC_STREAM])) == 1
+
+
+async def test_read_without_streams_does_not_touch_redis():
+    assert await _consumer().read(None, []) == []
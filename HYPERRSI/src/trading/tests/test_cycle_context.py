@@ -0,0 +1,139 @@
+"""Unit Tests for the per-cycle Redis snapshot
+
+Checks that TradingCycleContext batches a cycle's reads into pipelined
+round trips, re-reads the candle tail after order monitoring, and keeps
+buffered writes until flush() (which execute_trading_logic calls from its
+finally block, so early returns still persist them).
+
+Run tests:
+    pytest HYPERRSI/src/trading/tests/test_cycle_context.py -v
+"""
+
+import json
+
+import fakeredis
+import pytest
+
+from HYPERRSI.src.trading.cycle_context import TradingCycleContext
+from shared.database import candle_store
+
+USER = "u1"
+SYMBOL = "BTC-USDT-SWAP"
+CANDLE_KEY = f"candles_with_indicators:{SYMBOL}:1m"
+STATUS_KEY = f"user:{USER}:symbol:{SYMBOL}:status"
+
+
+def _candle(ts, rsi=50.0):
+    return {"timestamp": ts, "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0, "rsi": rsi}
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis(server):
+    return fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+
+
+@pytest.fixture(autouse=True)
+def list_reads(monkeypatch):
+    monkeypatch.setattr(candle_store, "_columnar_read_enabled", lambda: False)
+
+
+async def _seed(redis, count=20):
+    await redis.set(STATUS_KEY, "running")
+    await redis.set(f"user:{USER}:settings", json.dumps({"leverage": 10}))
+    await redis.rpush(CANDLE_KEY, *[json.dumps(_candle(ts * 60)) for ts in range(count)])
+
+
+def _context(redis):
+    return TradingCycleContext(redis, USER, SYMBOL, "1m")
+
+
+async def test_load_pipelines_cycle_start_reads(redis):
+    await _seed(redis)
+
+    cycle = await _context(redis).load()
+
+    assert cycle.round_trips == 1
+    assert cycle.is_running
+    assert json.loads(cycle.settings_str) == {"leverage": 10}
+    assert not cycle.candle_alert_sent
+    assert cycle.last_candle["timestamp"] == 19 * 60
+
+
+async def test_load_position_rereads_candles_after_monitoring(redis):
+    await _seed(redis)
+    await redis.set(f"user:{USER}:position:{SYMBOL}:main_position_direction", "long")
+    cycle = await _context(redis).load()
+
+    # 주문 모니터링 중 새 캔들이 마감됨
+    await redis.rpush(CANDLE_KEY, json.dumps(_candle(20 * 60, rsi=25.0)))
+    status = await cycle.load_position()
+
+    assert status == "running" and cycle.round_trips == 2
+    assert [c["timestamp"] for c in cycle.candles] == [ts * 60 for ts in range(7, 21)]
+    assert cycle.candles[-1]["rsi"] == 25.0
+    assert cycle.main_position_direction == "long"
+    assert cycle.min_sustain_contract_size is None
+
+
+async def test_columnar_candles_are_read_separately(monkeypatch, server):
+    monkeypatch.setattr(candle_store, "_columnar_read_enabled", lambda: True)
+    monkeypatch.setattr(candle_store, "_columnar_write_enabled", lambda: True)
+    candle_store.upsert_candles(
+        fakeredis.FakeRedis(server=server), CANDLE_KEY, [_candle(ts * 60) for ts in range(20)], max_len=100
+    )
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    await redis.set(STATUS_KEY, "running")
+
+    cycle = await _context(redis).load()
+    await cycle.load_position()
+
+    assert cycle.status == "running"
+    assert cycle.round_trips == 4
+    assert len(cycle.candles) == 14 and cycle.candles[-1]["timestamp"] == 19 * 60
+
+
+async def test_flush_applies_buffered_writes_and_refreshes_status(redis):
+    await _seed(redis)
+    cycle = await _context(redis).load()
+
+    cycle.set(cycle.last_print_key, "123")
+    cycle.setex(cycle.alert_key, 3600, "1")
+    assert await redis.get(cycle.last_print_key) is None
+    await redis.set(STATUS_KEY, "stopped")
+    assert cycle.is_running
+
+    status = await cycle.flush()
+
+    assert status == "stopped" and cycle.round_trips == 2
+    assert await redis.get(cycle.last_print_key) == "123"
+    assert 0 < await redis.ttl(cycle.alert_key) <= 3600
+    assert await cycle.flush(refresh_status=False) == "stopped" and cycle.round_trips == 2
+
+
+async def test_flush_in_finally_persists_early_return_writes(redis):
+    await redis.set(STATUS_KEY, "running")
+
+    async def run_cycle():
+        # execute_trading_logic의 캔들 없음 → 알림 후 return 경로
+        cycle = None
+        try:
+            cycle = await _context(redis).load()
+            if cycle.last_candle is None:
+                if not cycle.candle_alert_sent:
+                    cycle.setex(cycle.alert_key, 3600, "1")
+                return cycle
+            raise AssertionError("캔들이 없어야 함")
+        finally:
+            if cycle is not None:
+                await cycle.flush()
+
+    first = await run_cycle()
+    second = await run_cycle()
+
+    assert not first.candle_alert_sent
+    assert second.candle_alert_sent
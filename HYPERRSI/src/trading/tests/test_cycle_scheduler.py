@@ -0,0 +1,133 @@
+"""Unit Tests for the trading cycle scheduling tools
+
+Checks TimerWheel expiry order, cancel/reschedule semantics and slot
+wraparound against a fake clock, and the CycleMetrics snapshot.
+
+Run tests:
+    pytest HYPERRSI/src/trading/tests/test_cycle_scheduler.py -v
+"""
+
+import pytest
+
+from HYPERRSI.src.trading.cycle_scheduler import CycleMetrics, TimerWheel
+
+
+class FakeClock:
+    def __init__(self, now=100.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def _wheel(clock, tick=1.0, slots=8):
+    return TimerWheel(tick=tick, slots=slots, clock=clock)
+
+
+def test_advance_returns_due_timers_in_deadline_order(clock):
+    wheel = _wheel(clock)
+    wheel.schedule("b", 3)
+    wheel.schedule("a", 2)
+    wheel.schedule("c", 5)
+
+    assert wheel.advance(clock.now + 1) == []
+    assert wheel.advance(clock.now + 3) == [("a", 102.0), ("b", 103.0)]
+    assert len(wheel) == 1 and "c" in wheel
+    assert wheel.advance(clock.now + 5) == [("c", 105.0)]
+    assert len(wheel) == 0
+
+
+def test_cancel_drops_pending_timer(clock):
+    wheel = _wheel(clock)
+    wheel.schedule("a", 2)
+    wheel.schedule("b", 2)
+
+    assert wheel.cancel("a")
+    assert not wheel.cancel("a")
+    assert wheel.advance(clock.now + 2) == [("b", 102.0)]
+
+
+def test_reschedule_replaces_previous_timer(clock):
+    wheel = _wheel(clock)
+    wheel.schedule("a", 2)
+    wheel.schedule_at("a", 104.0)
+
+    assert wheel.deadline("a") == 104.0
+    assert wheel.advance(clock.now + 2) == []
+    assert wheel.advance(clock.now + 4) == [("a", 104.0)]
+    # 이전 타이머는 다시 나오지 않음
+    assert wheel.advance(clock.now + 20) == []
+
+
+def test_past_deadline_fires_on_next_advance(clock):
+    wheel = _wheel(clock)
+    wheel.advance(clock.now + 3)
+    wheel.schedule_at("late", clock.now + 1)
+
+    assert wheel.advance(clock.now + 4) == [("late", 101.0)]
+
+
+def test_timers_beyond_one_rotation_wait_for_their_tick(clock):
+    wheel = _wheel(clock, slots=8)
+    wheel.schedule("far", 20)
+    wheel.schedule("near", 4)
+
+    assert wheel.advance(clock.now + 12) == [("near", 104.0)]
+    assert wheel.advance(clock.now + 19) == []
+    assert wheel.advance(clock.now + 20) == [("far", 120.0)]
+
+
+def test_advance_across_several_rotations_returns_all_due(clock):
+    wheel = _wheel(clock, tick=0.5, slots=4)
+    for i in range(10):
+        wheel.schedule(i, i + 0.3)
+
+    due = wheel.advance(clock.now + 50)
+
+    assert [key for key, _ in due] == list(range(10))
+    assert len(wheel) == 0
+
+
+def test_invalid_wheel_parameters():
+    with pytest.raises(ValueError):
+        TimerWheel(tick=0)
+    with pytest.raises(ValueError):
+        TimerWheel(slots=0)
+
+
+def test_cycle_metrics_snapshot():
+    metrics = CycleMetrics(window=100)
+    for i in range(1, 101):
+        metrics.record(i / 100, -1.0 if i == 1 else i / 1000, "success" if i % 10 else "error", overrun=i > 98)
+    metrics.record_bar_close(2.5)
+    metrics.record_bar_close(-1.0)
+
+    snapshot = metrics.snapshot(worker_id="w1", active_entries=3)
+
+    assert snapshot["cycles"] == 100
+    assert snapshot["results"] == {"success": 90, "error": 10}
+    assert snapshot["overruns"] == 2
+    assert snapshot["window"] == 100
+    assert snapshot["latency"] == {"p50_ms": 500.0, "p95_ms": 950.0, "p99_ms": 990.0, "max_ms": 1000.0}
+    # 예정보다 일찍 시작한 사이클의 지터는 0으로 기록
+    assert snapshot["jitter"]["p50_ms"] == 50.0 and min(metrics._jitter) == 0.0
+    assert snapshot["bar_close_events"] == 2
+    assert snapshot["bar_close"]["max_ms"] == 2500.0 and snapshot["bar_close"]["p50_ms"] == 0.0
+    assert snapshot["worker_id"] == "w1" and snapshot["active_entries"] == 3
+
+
+def test_cycle_metrics_window_keeps_recent_cycles():
+    metrics = CycleMetrics(window=3)
+    for latency in (10.0, 1.0, 2.0, 3.0):
+        metrics.record(latency, 0.0, "success")
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["cycles"] == 4 and snapshot["window"] == 3
+    assert snapshot["latency"]["max_ms"] == 3000.0
+    assert CycleMetrics().snapshot()["latency"]["p95_ms"] == 0.0
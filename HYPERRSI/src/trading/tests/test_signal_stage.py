@@ -0,0 +1,213 @@
+"""Unit Tests for the shared symbol signal stage
+
+Checks that SymbolSignalStage computes a signal once per candle fingerprint
+and settings hash, round-trips records through Redis between processes,
+shares market state across signal settings, never computes one key twice
+concurrently, and that resolve_signals returns the same rsi_signals and
+market_state as the per-user computation it falls back to.
+
+Run tests:
+    pytest HYPERRSI/src/trading/tests/test_signal_stage.py -v
+"""
+
+import asyncio
+import json
+
+import fakeredis
+import numpy as np
+import pytest
+
+from HYPERRSI.src.trading import signal_stage
+from HYPERRSI.src.trading.signal_stage import (
+    SymbolSignalStage,
+    candle_fingerprint,
+    compute_user_signals,
+    resolve_signals,
+    signal_settings_hash,
+)
+
+SYMBOL = "BTC-USDT-SWAP"
+SETTINGS = {"entry_option": "돌파", "rsi_oversold": 30, "rsi_overbought": 70, "trend_timeframe": "15m", "leverage": 10}
+
+
+class FakeCalculator:
+    """TrendStateCalculator 대체 - 트렌드 타임프레임별 호출 수 기록"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+
+    async def analyze_market_state_from_redis(self, symbol, timeframe, trend_timeframe=None):
+        self.calls.append((symbol, timeframe, trend_timeframe))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        # 실제 계산기처럼 numpy 스칼라가 섞인 결과
+        return {"trend_state": np.int64(2 if trend_timeframe == "15m" else -1), "is_uptrend": np.bool_(True)}
+
+
+def _candles(rsi_values, start=0, close=100.0):
+    return [
+        {"timestamp": (start + i) * 60, "close": close, "rsi": rsi}
+        for i, rsi in enumerate(rsi_values)
+    ]
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def stage(monkeypatch):
+    stage = SymbolSignalStage()
+    monkeypatch.setattr(signal_stage, "_stage", stage)
+    return stage
+
+
+def test_settings_hash_ignores_non_signal_settings():
+    assert signal_settings_hash(SETTINGS) == signal_settings_hash({**SETTINGS, "leverage": 50, "investment": 100})
+    assert signal_settings_hash(SETTINGS) != signal_settings_hash({**SETTINGS, "rsi_oversold": 25})
+    assert candle_fingerprint(_candles([40.0])[0]) != candle_fingerprint(_candles([41.0])[0])
+
+
+async def test_same_fingerprint_reuses_record(redis, stage):
+    calculator = FakeCalculator()
+    candles = _candles([35.0, 29.0])
+
+    first = await stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, candles)
+    second = await stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, list(candles))
+
+    assert second is first
+    assert stage.stats == {"local": 1, "redis": 0, "computed": 1}
+    assert len(calculator.calls) == 1
+
+    # 진행 중인 봉의 RSI가 바뀌면 다시 계산
+    updated = await stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, _candles([35.0, 31.0]))
+
+    assert updated["fingerprint"] != first["fingerprint"]
+    assert stage.stats["computed"] == 2 and len(calculator.calls) == 2
+
+
+async def test_published_record_round_trips_through_redis(redis, stage):
+    candles = _candles([np.float64(35.0), np.float64(29.0)])
+    computed = await stage.get_signal(redis, FakeCalculator(), SYMBOL, "1m", SETTINGS, candles)
+
+    key = signal_stage.REDIS_KEY_SIGNAL.format(symbol=SYMBOL, tf_str="1m", settings_hash=signal_settings_hash(SETTINGS))
+    assert 0 < await redis.ttl(key) <= 120
+    assert await redis.exists(signal_stage.REDIS_KEY_MARKET_STATE.format(symbol=SYMBOL, tf_str="1m", trend_key="15m"))
+
+    # 다른 프로세스의 단계는 계산하지 않고 Redis 레코드 사용
+    other = SymbolSignalStage()
+    calculator = FakeCalculator()
+    loaded = await other.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, candles)
+
+    assert other.stats == {"local": 0, "redis": 1, "computed": 0}
+    assert calculator.calls == []
+    assert loaded == json.loads(json.dumps(computed, default=signal_stage._jsonable))
+    assert loaded["rsi_signals"] == {"rsi": 29.0, "is_oversold": True, "is_overbought": False}
+    assert loaded["market_state"] == {"trend_state": 2, "is_uptrend": True}
+
+
+async def test_stale_published_record_is_recomputed(redis, stage):
+    await stage.get_signal(redis, FakeCalculator(), SYMBOL, "1m", SETTINGS, _candles([35.0, 29.0]))
+
+    other = SymbolSignalStage()
+    record = await other.get_signal(redis, FakeCalculator(), SYMBOL, "1m", SETTINGS, _candles([29.0, 35.0], start=1))
+
+    assert other.stats == {"local": 0, "redis": 0, "computed": 1}
+    assert record["rsi_signals"]["is_oversold"] is False
+
+
+async def test_users_are_grouped_by_settings_hash(redis, stage):
+    calculator = FakeCalculator()
+    candles = _candles([35.0, 29.0])
+    same = {**SETTINGS, "leverage": 3}
+    stricter = {**SETTINGS, "rsi_oversold": 25}
+    other_trend = {**SETTINGS, "trend_timeframe": "1h"}
+
+    base = await stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, candles)
+    assert await stage.get_signal(redis, calculator, SYMBOL, "1m", same, candles) is base
+    strict = await stage.get_signal(redis, calculator, SYMBOL, "1m", stricter, candles)
+    trend = await stage.get_signal(redis, calculator, SYMBOL, "1m", other_trend, candles)
+
+    assert stage.stats["computed"] == 3
+    assert base["rsi_signals"]["is_oversold"] and not strict["rsi_signals"]["is_oversold"]
+    # 시장 상태는 트렌드 타임프레임이 같으면 신호 설정이 달라도 공유
+    assert calculator.calls == [(SYMBOL, "1m", "15m"), (SYMBOL, "1m", "1h")]
+    assert strict["market_state"] is base["market_state"]
+    assert trend["market_state"]["trend_state"] == -1
+
+
+async def test_concurrent_cycles_compute_once(redis, stage):
+    calculator = FakeCalculator(delay=0.01)
+    candles = _candles([35.0, 29.0])
+
+    records = await asyncio.gather(*[
+        stage.get_signal(redis, calculator, SYMBOL, "1m", {**SETTINGS, "leverage": i}, candles) for i in range(10)
+    ])
+
+    assert all(record is records[0] for record in records)
+    assert stage.stats["computed"] == 1 and len(calculator.calls) == 1
+    assert stage._locks == {} and stage._lock_users == {}
+
+
+async def test_lock_is_kept_while_cycles_wait(redis, stage):
+    calculator = FakeCalculator(delay=0.01)
+    old, new = _candles([35.0, 29.0]), _candles([29.0, 28.0], start=1)
+    tasks = []
+
+    def start_late_cycle(_):
+        # 첫 사이클이 락을 놓은 직후, 대기 중이던 사이클이 계산하는 동안 도착
+        tasks.append(asyncio.ensure_future(stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, new)))
+
+    first = asyncio.ensure_future(stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, old))
+    first.add_done_callback(start_late_cycle)
+    waiting = asyncio.ensure_future(stage.get_signal(redis, calculator, SYMBOL, "1m", SETTINGS, new))
+    await asyncio.gather(first, waiting)
+    late = await tasks[0]
+
+    assert late is waiting.result()
+    assert stage.stats["computed"] == 2
+    assert stage._locks == {} and stage._lock_users == {}
+
+
+@pytest.mark.parametrize("entry_option", ["돌파", "변곡", "변곡돌파", "초과", ""])
+@pytest.mark.parametrize("rsi_values", [[35.0, 29.0], [29.0, 31.0], [65.0, 72.0], [75.0, 69.0], [50.0, 50.0, 50.0]])
+async def test_shared_signals_match_per_user_computation(redis, stage, entry_option, rsi_values):
+    settings = {**SETTINGS, "entry_option": entry_option}
+    candles = _candles(rsi_values)
+
+    shared = await resolve_signals(redis, FakeCalculator(), SYMBOL, "1m", settings, candles)
+    per_user = await compute_user_signals(FakeCalculator(), SYMBOL, "1m", settings, candles)
+    # 다른 프로세스가 Redis 레코드를 읽은 경우도 동일
+    published = await resolve_signals(redis, FakeCalculator(), SYMBOL, "1m", settings, candles)
+
+    assert shared == per_user
+    assert published == per_user
+
+
+async def test_falls_back_to_per_user_computation(stage):
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+    calculator = FakeCalculator()
+    candles = _candles([35.0, 29.0])
+
+    rsi_signals, market_state = await resolve_signals(BrokenRedis(), calculator, SYMBOL, "1m", SETTINGS, candles)
+
+    assert (rsi_signals, market_state) == await compute_user_signals(FakeCalculator(), SYMBOL, "1m", SETTINGS, candles)
+    assert stage.stats["computed"] == 0
+    assert calculator.calls == [(SYMBOL, "1m", "15m")]
+
+
+async def test_disabled_stage_computes_per_user(redis, stage):
+    calculator = FakeCalculator()
+    candles = _candles([35.0, 29.0])
+
+    await resolve_signals(redis, calculator, SYMBOL, "1m", SETTINGS, candles, shared=False)
+    await resolve_signals(redis, calculator, SYMBOL, "1m", SETTINGS, candles, shared=False)
+
+    assert len(calculator.calls) == 2
+    assert stage.stats == {"local": 0, "redis": 0, "computed": 0}
+    assert await redis.keys("signal:*") == []
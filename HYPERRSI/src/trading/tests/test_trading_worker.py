@@ -0,0 +1,395 @@
+"""Unit Tests for the long-lived trading worker
+
+Checks how TradingWorker turns active-user index entries into timer wheel
+schedules (including the per-instance shard filter), how _run_cycle
+reschedules an entry after its cycle (and which restart semantics reach
+execute_trading_logic), and how bar-close events are
+dispatched to the matching series only (re-running in-flight cycles once
+they finish). The registry and the cycle coroutine are replaced with
+in-memory fakes; bar-close streams use fakeredis.
+
+Run tests:
+    pytest HYPERRSI/src/trading/tests/test_trading_worker.py -v
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import fakeredis
+import pytest
+
+from HYPERRSI.src.tasks import trading_tasks
+from HYPERRSI.src.trading import trading_worker
+from HYPERRSI.src.trading.bar_events import BAR_CLOSE_GROUP, bar_close_stream, publish_bar_close
+from HYPERRSI.src.trading.trading_worker import TradingWorker, shard_of
+
+
+def _entry(okx_uid, symbol, timeframe="1m"):
+    return {"okx_uid": okx_uid, "symbol": symbol, "timeframe": timeframe}
+
+
+class FakeRegistry:
+    def __init__(self, entries):
+        self.entries = list(entries)
+
+    async def get_entries(self):
+        return list(self.entries)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = FakeRegistry([])
+    monkeypatch.setattr(trading_worker, "get_active_user_registry", lambda: registry)
+    return registry
+
+
+@pytest.fixture
+def cycles(monkeypatch):
+    calls = []
+    results = {}
+
+    async def run_trading_cycle(okx_uid, symbol, timeframe, task_id):
+        calls.append((okx_uid, symbol, timeframe, task_id))
+        result = results.get((okx_uid, symbol), {"status": "success"})
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    monkeypatch.setattr(trading_worker, "run_trading_cycle", run_trading_cycle)
+    run_trading_cycle.calls = calls
+    run_trading_cycle.results = results
+    return run_trading_cycle
+
+
+def _worker(**kwargs):
+    options = dict(cycle_interval=5.0, max_concurrency=4, event_driven=False, shard_index=0, shard_count=1)
+    options.update(kwargs)
+    return TradingWorker(**options)
+
+
+async def test_refresh_schedules_new_entries_and_cancels_removed(registry):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP"), _entry("u2", "BTC-USDT-SWAP"), _entry("u1", "ETH-USDT-SWAP", "15m")]
+
+    await worker.refresh_entries()
+
+    assert len(worker.wheel) == 3
+    now = time.monotonic()
+    for key in worker._entries:
+        # 키별 오프셋은 사이클 간격 안에서 분산
+        assert now - 1 <= worker.wheel.deadline(key) <= now + worker.cycle_interval
+    assert worker._series == {
+        ("BTC-USDT-SWAP", "1m"): {("u1", "BTC-USDT-SWAP"), ("u2", "BTC-USDT-SWAP")},
+        ("ETH-USDT-SWAP", "15m"): {("u1", "ETH-USDT-SWAP")},
+    }
+
+    deadline = worker.wheel.deadline(("u1", "BTC-USDT-SWAP"))
+    registry.entries = registry.entries[:1] + [_entry("u3", "SOL-USDT-SWAP")]
+    await worker.refresh_entries()
+
+    assert set(worker._entries) == {("u1", "BTC-USDT-SWAP"), ("u3", "SOL-USDT-SWAP")}
+    assert ("u2", "BTC-USDT-SWAP") not in worker.wheel
+    assert ("u1", "ETH-USDT-SWAP") not in worker.wheel
+    # 기존 항목의 일정은 유지
+    assert worker.wheel.deadline(("u1", "BTC-USDT-SWAP")) == deadline
+
+
+async def test_shards_partition_entries(registry):
+    registry.entries = [_entry(f"u{i}", symbol) for i in range(40) for symbol in ("BTC-USDT-SWAP", "ETH-USDT-SWAP")]
+    workers = [_worker(shard_index=index, shard_count=3) for index in range(3)]
+
+    for worker in workers:
+        await worker.refresh_entries()
+
+    owned = [set(worker._entries) for worker in workers]
+    assert all(owned)
+    assert sum(len(keys) for keys in owned) == len(registry.entries)
+    assert set().union(*owned) == {(e["okx_uid"], e["symbol"]) for e in registry.entries}
+    for index, keys in enumerate(owned):
+        assert all(shard_of(key, 3) == index for key in keys)
+        assert len(workers[index].wheel) == len(keys)
+    assert workers[1].consumer.group != workers[2].consumer.group
+
+
+def test_shard_index_must_be_within_count():
+    with pytest.raises(ValueError):
+        _worker(shard_index=2, shard_count=2)
+    assert _worker(shard_index=1, shard_count=2).owns(("u1", "BTC-USDT-SWAP")) == (shard_of(("u1", "BTC-USDT-SWAP"), 2) == 1)
+
+
+async def test_run_cycle_keeps_fixed_interval(registry, cycles):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP", "1H")]
+    await worker.refresh_entries()
+    key = ("u1", "BTC-USDT-SWAP")
+    deadline = time.monotonic()
+
+    await worker._run_cycle(key, deadline)
+
+    assert cycles.calls == [("u1", "BTC-USDT-SWAP", "1H", f"worker:{worker.worker_id}")]
+    assert worker.wheel.deadline(key) == deadline + worker.cycle_interval
+    snapshot = worker.metrics_snapshot()
+    assert snapshot["results"] == {"success": 1} and snapshot["overruns"] == 0
+    assert snapshot["shard"] == "0/1"
+
+
+async def test_overrun_reschedules_immediately(registry, cycles):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+    key = ("u1", "BTC-USDT-SWAP")
+    cycles.results[key] = {"status": "skipped"}
+    deadline = time.monotonic() - 3 * worker.cycle_interval
+
+    await worker._run_cycle(key, deadline)
+    after = time.monotonic()
+
+    assert deadline + worker.cycle_interval < worker.wheel.deadline(key) <= after
+    assert worker.metrics.overruns == 1
+    assert worker.metrics.results == {"skipped": 1}
+
+
+async def test_failed_cycle_is_still_rescheduled(registry, cycles):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+    key = ("u1", "BTC-USDT-SWAP")
+    cycles.results[key] = RuntimeError("exchange down")
+    deadline = time.monotonic()
+
+    await worker._run_cycle(key, deadline)
+
+    assert worker.metrics.results == {"error": 1}
+    assert worker.wheel.deadline(key) == deadline + worker.cycle_interval
+
+
+async def test_removed_or_stopping_entries_are_not_rescheduled(registry, cycles):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP"), _entry("u2", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+
+    registry.entries = registry.entries[1:]
+    await worker.refresh_entries()
+    await worker._run_cycle(("u1", "BTC-USDT-SWAP"), time.monotonic())
+
+    assert cycles.calls == []
+    assert ("u1", "BTC-USDT-SWAP") not in worker.wheel
+    assert worker.metrics.results == {}
+
+    worker.stop()
+    # 만료되어 휠에서 꺼낸 상태로 실행
+    worker.wheel.cancel(("u2", "BTC-USDT-SWAP"))
+    await worker._run_cycle(("u2", "BTC-USDT-SWAP"), time.monotonic())
+
+    assert cycles.calls == []
+    assert ("u2", "BTC-USDT-SWAP") not in worker.wheel
+
+
+async def test_tick_loop_runs_due_entries_once(registry, cycles):
+    worker = _worker(tick=0.01)
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+    key = ("u1", "BTC-USDT-SWAP")
+    worker.wheel.schedule(key, 0)
+
+    loop_task = asyncio.create_task(worker._tick_loop())
+    await asyncio.sleep(0.1)
+    worker.stop()
+    await loop_task
+    await worker._drain()
+
+    assert cycles.calls == [("u1", "BTC-USDT-SWAP", "1m", f"worker:{worker.worker_id}")]
+    assert worker._inflight == {}
+
+
+@pytest.fixture
+def trading_logic(monkeypatch):
+    """실제 run_trading_cycle을 fakeredis와 기록용 execute_trading_logic으로 실행"""
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    calls = []
+    sessions = []
+
+    @asynccontextmanager
+    async def get_redis_context(user_id=None, timeout=None):
+        yield redis
+
+    async def execute_trading_logic(**kwargs):
+        calls.append(kwargs)
+
+    async def start_session(*args):
+        sessions.append(args)
+
+    monkeypatch.setattr(trading_tasks, "get_redis_context", get_redis_context)
+    monkeypatch.setattr(trading_tasks, "execute_trading_logic", execute_trading_logic)
+    monkeypatch.setattr(trading_tasks, "_start_session_if_needed", start_session)
+    execute_trading_logic.redis = redis
+    execute_trading_logic.calls = calls
+    execute_trading_logic.sessions = sessions
+    return execute_trading_logic
+
+
+async def test_worker_cycle_runs_logic_with_steady_state_semantics(registry, trading_logic):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+    redis = trading_logic.redis
+    await redis.set("user:u1:cooldown:BTC-USDT-SWAP:long", "1")
+
+    await worker._run_cycle(("u1", "BTC-USDT-SWAP"), time.monotonic())
+
+    # restart=False이면 execute_trading_logic이 미체결 주문 취소와 포지션 상태 초기화를 수행
+    assert [call["restart"] for call in trading_logic.calls] == [True]
+    assert trading_logic.calls[0]["symbol"] == "BTC-USDT-SWAP" and trading_logic.calls[0]["timeframe"] == "1m"
+    assert worker.metrics.results == {"success": 1}
+    # 시작 사이클 전용 처리는 하지 않음
+    assert trading_logic.sessions == []
+    assert await redis.get("user:u1:cooldown:BTC-USDT-SWAP:long") == "1"
+    assert not await redis.exists(trading_tasks.REDIS_KEY_USER_LOCK.format(okx_uid="u1", symbol="BTC-USDT-SWAP", timeframe="1m"))
+
+
+async def test_worker_cycle_does_not_break_held_lock(registry, trading_logic):
+    worker = _worker()
+    registry.entries = [_entry("u1", "BTC-USDT-SWAP")]
+    await worker.refresh_entries()
+    lock_key = trading_tasks.REDIS_KEY_USER_LOCK.format(okx_uid="u1", symbol="BTC-USDT-SWAP", timeframe="1m")
+    await trading_logic.redis.set(lock_key, "celery", ex=60)
+
+    await worker._run_cycle(("u1", "BTC-USDT-SWAP"), time.monotonic())
+
+    assert trading_logic.calls == []
+    assert worker.metrics.results == {"skipped": 1}
+    assert await trading_logic.redis.get(lock_key) == "celery"
+
+
+# ==================== 바 마감 이벤트 ====================
+
+SERIES_ENTRIES = [
+    _entry("u1", "BTC-USDT-SWAP", "1m"),
+    _entry("u2", "BTC-USDT-SWAP", "1m"),
+    _entry("u3", "ETH-USDT-SWAP", "1m"),
+    _entry("u4", "SOL-USDT-SWAP", "5m"),
+]
+
+
+def _event(symbol, tf_str, close_time, message_id="1-0"):
+    return (bar_close_stream(symbol, tf_str), message_id, {"symbol": symbol, "timeframe": tf_str, "close_time": str(close_time)})
+
+
+async def _event_worker(registry, **kwargs):
+    worker = _worker(event_driven=True, sweep_interval=60.0, **kwargs)
+    registry.entries = list(SERIES_ENTRIES)
+    await worker.refresh_entries()
+    # 안전 점검 일정은 비우고 이벤트로 예약된 항목만 확인
+    for key in list(worker._entries):
+        worker.wheel.cancel(key)
+    return worker
+
+
+async def test_dispatch_schedules_only_matching_series(registry):
+    worker = await _event_worker(registry)
+    now = time.time()
+
+    triggered = worker.dispatch_events([
+        _event("BTC-USDT-SWAP", "1m", now - 2),
+        _event("BTC-USDT-SWAP", "1m", now - 5, "2-0"),
+        _event("SOL-USDT-SWAP", "1m", now),
+        _event("XRP-USDT-SWAP", "1m", now),
+    ])
+
+    assert triggered == 4
+    assert set(worker.wheel._deadlines) == {("u1", "BTC-USDT-SWAP"), ("u2", "BTC-USDT-SWAP")}
+    assert worker.wheel.deadline(("u1", "BTC-USDT-SWAP")) <= time.monotonic()
+    # 여러 바가 밀려 있으면 가장 이른 마감 기준
+    assert worker._bar_closes == {("u1", "BTC-USDT-SWAP"): now - 5, ("u2", "BTC-USDT-SWAP"): now - 5}
+
+
+async def test_dispatch_without_close_time_uses_now(registry):
+    worker = await _event_worker(registry)
+    before = time.time()
+
+    worker.dispatch_events([("stream", "1-0", {"symbol": "SOL-USDT-SWAP", "timeframe": "5m"})])
+
+    assert set(worker.wheel._deadlines) == {("u4", "SOL-USDT-SWAP")}
+    assert worker._bar_closes[("u4", "SOL-USDT-SWAP")] >= before
+
+
+async def test_inflight_cycle_reruns_after_it_finishes(registry, monkeypatch):
+    worker = await _event_worker(registry)
+    key = ("u3", "ETH-USDT-SWAP")
+    release = asyncio.Event()
+    calls = []
+
+    async def run_trading_cycle(okx_uid, symbol, timeframe, task_id):
+        calls.append(symbol)
+        await release.wait()
+        return {"status": "success"}
+
+    monkeypatch.setattr(trading_worker, "run_trading_cycle", run_trading_cycle)
+    worker._inflight[key] = asyncio.create_task(worker._run_cycle(key, time.monotonic()))
+    await asyncio.sleep(0)
+
+    close_time = time.time() - 1
+    assert worker.dispatch_events([_event("ETH-USDT-SWAP", "1m", close_time)]) == 1
+    # 실행 중에는 예약하지 않고 마감 시각만 기록
+    assert key not in worker.wheel and worker._bar_closes[key] == close_time
+
+    release.set()
+    await worker._inflight[key]
+    finished = time.monotonic()
+
+    assert key not in worker._inflight
+    assert worker.wheel.deadline(key) <= finished
+    assert worker.metrics.events == 0
+
+    # 다시 실행된 사이클이 바 마감부터의 지연을 기록
+    for due_key, deadline in worker.wheel.advance(finished + worker.tick):
+        await worker._run_cycle(due_key, deadline)
+
+    assert calls == ["ETH-USDT-SWAP", "ETH-USDT-SWAP"]
+    assert worker.metrics.events == 1 and key not in worker._bar_closes
+    assert worker.wheel.deadline(key) > finished + worker.sweep_interval / 2
+
+
+async def test_event_loop_dispatches_published_bar_closes(registry, monkeypatch):
+    server = fakeredis.FakeServer()
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    publisher = fakeredis.FakeRedis(server=server, decode_responses=True)
+
+    @asynccontextmanager
+    async def redis_context(timeout=None):
+        yield redis
+
+    monkeypatch.setattr(trading_worker, "redis_context", redis_context)
+    worker = await _event_worker(registry)
+    worker.consumer.block_ms = 10
+    read = worker.consumer.read
+    dispatched = asyncio.Event()
+
+    async def read_and_yield(redis, streams):
+        if worker.wheel:
+            # 이전 반복의 디스패치와 ACK가 끝남 - Redis 명령 사이에서 취소되도록 대기
+            dispatched.set()
+            await asyncio.Event().wait()
+        events = await read(redis, streams)
+        # fakeredis는 block 동안 대기하지 않으므로 실제 Redis처럼 이벤트 루프에 양보
+        await asyncio.sleep(0.001)
+        return events
+
+    monkeypatch.setattr(worker.consumer, "read", read_and_yield)
+    streams = [bar_close_stream(symbol, tf_str) for symbol, tf_str in worker._series]
+    await worker.consumer.ensure_groups(redis, streams)
+
+    publish_bar_close(publisher, "ETH-USDT-SWAP", "1m", {"timestamp": 600, "close": 1.0})
+    publish_bar_close(publisher, "SOL-USDT-SWAP", "1m", {"timestamp": 600, "close": 1.0})
+    loop_task = asyncio.create_task(worker._event_loop())
+    await asyncio.wait_for(dispatched.wait(), timeout=5)
+    loop_task.cancel()
+    await asyncio.gather(loop_task, return_exceptions=True)
+
+    assert set(worker.wheel._deadlines) == {("u3", "ETH-USDT-SWAP")}
+    assert worker._bar_closes == {("u3", "ETH-USDT-SWAP"): 660.0}
+    for stream in streams:
+        assert (await redis.xpending(stream, BAR_CLOSE_GROUP))["pending"] == 0
+    # 구독하지 않는 시리즈(SOL 1m)의 스트림은 읽지 않음
+    assert await redis.xinfo_groups(bar_close_stream("SOL-USDT-SWAP", "1m")) == []
@@ -0,0 +1,364 @@
+# trading_worker.py
+"""
+상주 트레이딩 워커
+
+Celery Beat이 5초마다 활성 사용자를 조회하고 사이클마다 태스크를 등록하는 대신,
+하나의 asyncio 이벤트 루프에서 (사용자, 심볼)별 사이클을 타이머 휠로 스케줄링합니다.
+이벤트 루프가 프로세스 수명 동안 유지되므로 Redis 연결 풀, 거래소 클라이언트 풀,
+사용자별 TradingService 인스턴스도 사이클 사이에 재사용됩니다.
+
+- 실행 대상: 활성 사용자 인덱스(ActiveUserRegistry)를 주기적으로 반영
+- 사이클 본문: trading_tasks.run_trading_cycle (Beat 정기 사이클과 같은 restart=True 의미, 락/실행 기록 동일)
+- 샤딩: 인스턴스가 여럿이면 (사용자, 심볼)을 crc32(키) % TRADING_WORKER_SHARD_COUNT로 나눠
+  TRADING_WORKER_SHARD_INDEX에 해당하는 항목만 실행
+- 지표: 사이클 지연/지터를 trading:worker:metrics:{worker_id}에 주기적으로 기록
+- 이벤트 기반 모드(TRADING_EVENT_DRIVEN_ENABLED): 바 마감 이벤트 스트림(bar_events.py)을
+  컨슈머 그룹으로 읽어 해당 (심볼, 타임프레임)의 사이클만 즉시 실행하고, 정기 사이클은
+  안전 점검 간격(TRADING_SAFETY_SWEEP_INTERVAL)으로 줄임. 바 마감부터 사이클 완료까지의
+  지연은 trading_bar_close_to_cycle_seconds 히스토그램과 워커 지표에 기록
+
+Celery는 시작(restart) 사이클, 정합성 복구, 유지보수 같은 비정기 작업에만 사용됩니다.
+TRADING_WORKER_ENABLED=True이면 Beat의 check_and_execute_trading은 사이클을 등록하지 않습니다.
+
+실행 방법:
+    python -m HYPERRSI.src.trading.trading_worker
+    TRADING_WORKER_SHARD_COUNT=2 TRADING_WORKER_SHARD_INDEX=1 python -m HYPERRSI.src.trading.trading_worker
+"""
+
+import asyncio
+import json
+import os
+import signal
+import socket
+import time
+import zlib
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from prometheus_client import Counter, Histogram
+
+from HYPERRSI.src.services.active_user_registry import get_active_user_registry
+from HYPERRSI.src.tasks.trading_tasks import run_trading_cycle
+from HYPERRSI.src.trading.bar_events import BAR_CLOSE_GROUP, BarCloseConsumer, BarCloseEvent, bar_close_stream
+from HYPERRSI.src.trading.cycle_scheduler import CycleMetrics, TimerWheel
+from HYPERRSI.src.trading.models import get_timeframe
+from shared.config import settings as app_settings
+from shared.database.redis_patterns import RedisTimeout, redis_context
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+REDIS_KEY_WORKER_METRICS = "trading:worker:metrics:{worker_id}"
+
+# Celery execute_trading_cycle의 soft_time_limit과 동일
+CYCLE_TIMEOUT_SECONDS = 90
+
+EntryKey = Tuple[str, str]
+SeriesKey = Tuple[str, str]
+
+BAR_CLOSE_TO_CYCLE = Histogram(
+    'trading_bar_close_to_cycle_seconds',
+    'Delay between a bar close and completion of the trading cycle it triggered',
+    ['timeframe'],
+    buckets=(1, 2, 3, 5, 7.5, 10, 15, 20, 30, 60),
+)
+BAR_CLOSE_EVENTS = Counter(
+    'trading_bar_close_events_total',
+    'Bar-close events consumed by the trading worker',
+    ['timeframe'],
+)
+
+
+def shard_of(key: EntryKey, shard_count: int) -> int:
+    """(사용자, 심볼)이 속한 워커 샤드 번호"""
+    return zlib.crc32(f"{key[0]}:{key[1]}".encode()) % shard_count
+
+
+class TradingWorker:
+    """(사용자, 심볼)별 트레이딩 사이클을 실행하는 상주 워커"""
+
+    def __init__(
+        self,
+        cycle_interval: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        refresh_interval: float = 5.0,
+        metrics_interval: float = 10.0,
+        tick: float = 0.1,
+        event_driven: Optional[bool] = None,
+        sweep_interval: Optional[float] = None,
+        shard_index: Optional[int] = None,
+        shard_count: Optional[int] = None
+    ):
+        self.cycle_interval = cycle_interval or app_settings.TRADING_WORKER_CYCLE_INTERVAL
+        self.event_driven = app_settings.TRADING_EVENT_DRIVEN_ENABLED if event_driven is None else event_driven
+        self.sweep_interval = sweep_interval or app_settings.TRADING_SAFETY_SWEEP_INTERVAL
+        self.refresh_interval = refresh_interval
+        self.metrics_interval = metrics_interval
+        self.tick = tick
+        self.max_concurrency = max_concurrency or app_settings.TRADING_WORKER_MAX_CONCURRENCY
+        self.shard_count = shard_count or app_settings.TRADING_WORKER_SHARD_COUNT
+        self.shard_index = app_settings.TRADING_WORKER_SHARD_INDEX if shard_index is None else shard_index
+        if not 0 <= self.shard_index < self.shard_count:
+            raise ValueError(f"shard_index must be in [0, {self.shard_count}), got {self.shard_index}")
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self.wheel = TimerWheel(tick=tick)
+        self.metrics = CycleMetrics()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._entries: Dict[EntryKey, Dict[str, Any]] = {}
+        self._inflight: Dict[EntryKey, asyncio.Task] = {}
+        self._stopping = asyncio.Event()
+
+        # 이벤트 기반 모드: (심볼, 타임프레임)별 구독 항목, 항목별 대기 중인 바 마감 시각
+        # 같은 시리즈를 여러 샤드가 구독할 수 있으므로 샤드마다 컨슈머 그룹을 따로 사용
+        group = BAR_CLOSE_GROUP if self.shard_count == 1 else f"{BAR_CLOSE_GROUP}:{self.shard_index}"
+        self.consumer = BarCloseConsumer(consumer=self.worker_id, group=group)
+        self._series: Dict[SeriesKey, Set[EntryKey]] = {}
+        self._bar_closes: Dict[EntryKey, float] = {}
+
+    @property
+    def schedule_interval(self) -> float:
+        """정기 사이클 간격 (이벤트 기반 모드에서는 안전 점검 간격)"""
+        return self.sweep_interval if self.event_driven else self.cycle_interval
+
+    # ==================== 수명 주기 ====================
+
+    async def run(self) -> None:
+        """
+        워커 실행 (stop() 또는 SIGINT/SIGTERM까지)
+
+        trading_tasks 임포트 시 등록되는 Celery용 SIGTERM 핸들러는 여기서
+        이벤트 루프 핸들러로 대체되어, 종료 시 실행 중인 사이클을 마무리합니다.
+        """
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                pass
+
+        mode = f"바 마감 이벤트 + 안전 점검 {self.sweep_interval}초" if self.event_driven else f"간격 {self.cycle_interval}초"
+        logger.info(
+            f"트레이딩 워커 시작: {self.worker_id}, 샤드 {self.shard_index}/{self.shard_count}, "
+            f"{mode}, 동시 실행 {self.max_concurrency}"
+        )
+        if not app_settings.TRADING_WORKER_ENABLED:
+            logger.warning("TRADING_WORKER_ENABLED=False: Beat도 사이클을 등록합니다 (락으로 중복 실행은 방지됨)")
+        try:
+            # 인덱스 도입 전 데이터가 있으면 먼저 구축
+            await get_active_user_registry().reconcile()
+        except Exception as e:
+            logger.error(f"활성 사용자 인덱스 정합성 확인 실패: {str(e)}")
+
+        background = [
+            asyncio.create_task(self._refresh_loop()),
+            asyncio.create_task(self._metrics_loop()),
+        ]
+        if self.event_driven:
+            background.append(asyncio.create_task(self._event_loop()))
+        try:
+            await self._tick_loop()
+        finally:
+            for task in background:
+                task.cancel()
+            await asyncio.gather(*background, return_exceptions=True)
+            await self._drain()
+            await self._publish_metrics()
+            logger.info(f"트레이딩 워커 종료: {self.worker_id}, {self.metrics.snapshot()}")
+
+    def stop(self) -> None:
+        """새 사이클 시작을 멈추고 실행 중인 사이클이 끝나면 종료"""
+        if not self._stopping.is_set():
+            logger.info("트레이딩 워커 종료 요청 수신")
+            self._stopping.set()
+
+    async def _drain(self, timeout: float = CYCLE_TIMEOUT_SECONDS) -> None:
+        if not self._inflight:
+            return
+        logger.info(f"실행 중인 사이클 {len(self._inflight)}개 완료 대기")
+        done, pending = await asyncio.wait(list(self._inflight.values()), timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+    # ==================== 스케줄링 ====================
+
+    async def _tick_loop(self) -> None:
+        while not self._stopping.is_set():
+            for key, deadline in self.wheel.advance():
+                if key in self._entries and key not in self._inflight:
+                    self._inflight[key] = asyncio.create_task(self._run_cycle(key, deadline))
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.tick)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await self.refresh_entries()
+            except Exception as e:
+                logger.error(f"활성 사용자 인덱스 조회 오류: {str(e)}")
+            await asyncio.sleep(self.refresh_interval)
+
+    def owns(self, key: EntryKey) -> bool:
+        """이 워커의 샤드가 담당하는 (사용자, 심볼)인지 여부"""
+        return self.shard_count == 1 or shard_of(key, self.shard_count) == self.shard_index
+
+    async def refresh_entries(self) -> None:
+        """활성 사용자 인덱스 중 담당 샤드 항목을 스케줄에 반영 (추가/제거/타임프레임 변경)"""
+        entries = await get_active_user_registry().get_entries()
+        current: Dict[EntryKey, Dict[str, Any]] = {}
+        for e in entries:
+            key = (e["okx_uid"], e["symbol"])
+            if self.owns(key):
+                current[key] = e
+
+        removed: Set[EntryKey] = self._entries.keys() - current.keys()
+        for key in removed:
+            self.wheel.cancel(key)
+            self._bar_closes.pop(key, None)
+        for key, entry in current.items():
+            if key not in self._entries and key not in self._inflight:
+                # 같은 시각에 몰리지 않도록 키별로 간격 안에서 분산
+                offset = (zlib.crc32(f"{key[0]}:{key[1]}".encode()) % 1000) / 1000 * self.schedule_interval
+                self.wheel.schedule(key, offset)
+        if removed or current.keys() - self._entries.keys():
+            logger.info(f"워커 스케줄 갱신: 활성 {len(current)}, 제거 {len(removed)}")
+
+        series: Dict[SeriesKey, Set[EntryKey]] = {}
+        for key, entry in current.items():
+            series.setdefault((entry["symbol"], get_timeframe(entry["timeframe"])), set()).add(key)
+        self._entries = current
+        self._series = series
+
+    # ==================== 바 마감 이벤트 ====================
+
+    async def _event_loop(self) -> None:
+        while True:
+            streams = [bar_close_stream(symbol, tf_str) for symbol, tf_str in self._series]
+            if not streams:
+                await asyncio.sleep(self.refresh_interval)
+                continue
+            try:
+                async with redis_context(timeout=RedisTimeout.FAST_OPERATION) as redis:
+                    events = await self.consumer.read(redis, streams)
+                    if events:
+                        self.dispatch_events(events)
+                        await self.consumer.ack(redis, events)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"바 마감 이벤트 조회 오류: {str(e)}")
+                await asyncio.sleep(1.0)
+
+    def dispatch_events(self, events: List[BarCloseEvent]) -> int:
+        """
+        바 마감 이벤트로 해당 시리즈의 사이클을 즉시 예약
+
+        실행 중인 사이클은 끝난 직후 한 번 더 실행됩니다.
+
+        Returns:
+            예약된 (사용자, 심볼) 수
+        """
+        triggered = 0
+        for _, _, fields in events:
+            tf_str = fields.get("timeframe", "")
+            BAR_CLOSE_EVENTS.labels(timeframe=tf_str).inc()
+            try:
+                close_time = float(fields["close_time"])
+            except (KeyError, TypeError, ValueError):
+                close_time = time.time()
+            for key in self._series.get((fields.get("symbol"), tf_str), ()):
+                # 여러 바가 밀려 있으면 가장 이른 마감 기준으로 지연 측정
+                self._bar_closes[key] = min(self._bar_closes.get(key, close_time), close_time)
+                if key not in self._inflight:
+                    self.wheel.schedule(key, 0)
+                triggered += 1
+        return triggered
+
+    async def _run_cycle(self, key: EntryKey, deadline: float) -> None:
+        okx_uid, symbol = key
+        status = "error"
+        async with self._semaphore:
+            started = time.monotonic()
+            entry = self._entries.get(key)
+            bar_close = self._bar_closes.pop(key, None)
+            try:
+                if entry is None or self._stopping.is_set():
+                    status = "cancelled"
+                    return
+                result = await asyncio.wait_for(
+                    run_trading_cycle(okx_uid, symbol, entry["timeframe"], task_id=f"worker:{self.worker_id}"),
+                    timeout=CYCLE_TIMEOUT_SECONDS
+                )
+                status = (result or {}).get("status", "success")
+            except asyncio.TimeoutError:
+                status = "timeout"
+                logger.error(f"[{okx_uid}] {symbol} 트레이딩 사이클 타임아웃 ({CYCLE_TIMEOUT_SECONDS}초)")
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            except Exception as e:
+                # run_trading_cycle이 이미 기록함
+                logger.debug(f"[{okx_uid}] {symbol} 트레이딩 사이클 오류: {str(e)}")
+            finally:
+                finished = time.monotonic()
+                next_deadline = deadline + self.schedule_interval
+                overrun = next_deadline < finished
+                if status != "cancelled":
+                    self.metrics.record(finished - started, started - deadline, status, overrun=overrun)
+                    if bar_close is not None and entry is not None:
+                        latency = time.time() - bar_close
+                        self.metrics.record_bar_close(latency)
+                        BAR_CLOSE_TO_CYCLE.labels(timeframe=get_timeframe(entry["timeframe"])).observe(max(latency, 0.0))
+                self._inflight.pop(key, None)
+                if key in self._entries and not self._stopping.is_set():
+                    if key in self._bar_closes:
+                        # 실행 중에 새 바 마감 이벤트가 도착함
+                        self.wheel.schedule_at(key, finished)
+                    else:
+                        # 고정 간격 유지, 사이클이 간격을 넘기면 바로 다음 사이클
+                        self.wheel.schedule_at(key, max(next_deadline, finished))
+
+    # ==================== 지표 ====================
+
+    async def _metrics_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            await self._publish_metrics()
+
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        return self.metrics.snapshot(
+            worker_id=self.worker_id,
+            shard=f"{self.shard_index}/{self.shard_count}",
+            active_entries=len(self._entries),
+            scheduled=len(self.wheel),
+            inflight=len(self._inflight),
+            cycle_interval=self.schedule_interval,
+            event_driven=self.event_driven,
+        )
+
+    async def _publish_metrics(self) -> None:
+        snapshot = self.metrics_snapshot()
+        logger.info(
+            f"워커 지표: 사이클 {snapshot['cycles']}, 활성 {snapshot['active_entries']}, "
+            f"지연 p95 {snapshot['latency']['p95_ms']}ms, 지터 p95 {snapshot['jitter']['p95_ms']}ms, "
+            f"초과 {snapshot['overruns']}"
+            + (f", 바 마감→사이클 p95 {snapshot['bar_close']['p95_ms']}ms" if self.event_driven else "")
+        )
+        try:
+            async with redis_context(timeout=RedisTimeout.FAST_OPERATION) as redis:
+                await redis.set(
+                    REDIS_KEY_WORKER_METRICS.format(worker_id=self.worker_id),
+                    json.dumps(snapshot),
+                    ex=max(int(self.metrics_interval * 6), 60)
+                )
+        except Exception as e:
+            logger.warning(f"워커 지표 기록 실패: {str(e)}")
+
+
+async def main() -> None:
+    await TradingWorker().run()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
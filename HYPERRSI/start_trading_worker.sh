@@ -0,0 +1,32 @@
+#!/bin/bash
+
+# 상주 트레이딩 워커 시작 스크립트
+# Celery Beat 대신 정기 트레이딩 사이클을 실행합니다. Beat도 사이클 등록을 멈추도록
+# .env에 TRADING_WORKER_ENABLED=true를 설정하세요.
+# (Celery 워커/Beat은 시작 사이클, 정합성 복구, 유지보수 작업을 위해 계속 실행)
+#
+# 인스턴스를 여러 개 실행하려면 인스턴스마다 샤드를 지정하세요. 각 인스턴스는
+# crc32("{okx_uid}:{symbol}") % SHARD_COUNT == SHARD_INDEX인 항목만 실행합니다.
+#   ./start_trading_worker.sh 0 2   # 샤드 0/2
+#   ./start_trading_worker.sh 1 2   # 샤드 1/2
+# 인자를 생략하면 .env의 TRADING_WORKER_SHARD_INDEX/TRADING_WORKER_SHARD_COUNT
+# (기본 0/1, 단일 인스턴스)를 사용합니다.
+
+# 인코딩 설정 (한글 로그 깨짐 방지)
+export LANG=ko_KR.UTF-8
+export LC_ALL=ko_KR.UTF-8
+export PYTHONIOENCODING=utf-8
+
+# 프로젝트 루트로 이동
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
+cd "$PROJECT_ROOT" || exit 1
+
+if [ -n "$1" ]; then
+    export TRADING_WORKER_SHARD_INDEX="$1"
+    export TRADING_WORKER_SHARD_COUNT="${2:?shard count required with shard index}"
+fi
+
+echo "Starting trading worker from $(pwd) (shard ${TRADING_WORKER_SHARD_INDEX:-0}/${TRADING_WORKER_SHARD_COUNT:-1})"
+
+exec python -m HYPERRSI.src.trading.trading_worker
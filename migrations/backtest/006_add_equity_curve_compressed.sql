@@ -0,0 +1,11 @@
+-- ============================================
+-- 압축 Equity Curve 컬럼 추가
+-- ============================================
+-- EQUITY_CURVE_STORAGE=compressed 일 때 backtest_balance_snapshots 행 대신
+-- zlib 압축된 NumPy 배열(timestamp, balance, equity, pnl, trade_number)을 저장
+-- (BACKTEST/storage/equity_codec.py)
+
+ALTER TABLE backtest_runs
+ADD COLUMN IF NOT EXISTS equity_curve_compressed BYTEA;
+
+COMMENT ON COLUMN backtest_runs.equity_curve_compressed IS '압축 Equity Curve (NULL이면 backtest_balance_snapshots 사용)';
@@ -356,6 +356,16 @@ class Settings(BaseSettings):
         description="Comma-separated user IDs for targeted migration testing"
     )
 
+    # Columnar candle cache (candles_columnar:*) - dual-write migration
+    CANDLE_COLUMNAR_WRITE: bool = Field(
+        default=True,
+        description="candles_with_indicators 저장 시 컬럼형 바이너리 캐시도 함께 기록"
+    )
+    CANDLE_COLUMNAR_READ: bool = Field(
+        default=False,
+        description="캔들 리더가 컬럼형 캐시를 우선 사용 (없으면 JSON 리스트로 대체)"
+    )
+
     # Multi-Symbol Trading Feature Flags
     PRESET_SYSTEM_ENABLED: bool = Field(
         default=True,
@@ -371,6 +381,50 @@ class Settings(BaseSettings):
         le=999,
         description="사용자당 최대 동시 트레이딩 심볼 수"
     )
+    ACTIVE_USER_REGISTRY_ENABLED: bool = Field(
+        default=True,
+        description="Beat의 활성 사용자 조회에 인덱스 사용 (False면 active_symbols 키스페이스 SCAN)"
+    )
+
+    SHARED_SIGNAL_STAGE_ENABLED: bool = Field(
+        default=False,
+        description="RSI/트렌드 신호를 (심볼, 타임프레임, 신호 설정)별로 한 번만 계산해 사용자 간 공유 (기본은 사용자별 계산)"
+    )
+
+    # Long-lived Trading Worker
+    TRADING_WORKER_ENABLED: bool = Field(
+        default=False,
+        description="정기 트레이딩 사이클을 Celery Beat 대신 상주 asyncio 워커가 실행"
+    )
+    TRADING_WORKER_CYCLE_INTERVAL: float = Field(
+        default=5.0,
+        gt=0,
+        description="(사용자, 심볼)별 트레이딩 사이클 간격(초)"
+    )
+    TRADING_WORKER_MAX_CONCURRENCY: int = Field(
+        default=64,
+        ge=1,
+        description="워커 프로세스당 동시 실행 사이클 수"
+    )
+    TRADING_WORKER_SHARD_COUNT: int = Field(
+        default=1,
+        ge=1,
+        description="워커 인스턴스 수. (사용자, 심볼)을 crc32 해시로 나눠 인스턴스별로 담당"
+    )
+    TRADING_WORKER_SHARD_INDEX: int = Field(
+        default=0,
+        ge=0,
+        description="이 워커 인스턴스가 담당하는 샤드 번호 (0 ~ TRADING_WORKER_SHARD_COUNT-1)"
+    )
+    TRADING_EVENT_DRIVEN_ENABLED: bool = Field(
+        default=False,
+        description="워커가 바 마감 이벤트 스트림으로 사이클을 실행 (정기 사이클은 안전 점검 간격으로 축소)"
+    )
+    TRADING_SAFETY_SWEEP_INTERVAL: float = Field(
+        default=60.0,
+        gt=0,
+        description="이벤트 기반 모드에서 (사용자, 심볼)별 안전 점검 사이클 간격(초)"
+    )
 
     # ============================================================================
     # Validation
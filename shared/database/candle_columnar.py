@@ -0,0 +1,607 @@
+"""
+Columnar binary cache for candles_with_indicators
+
+`candles_with_indicators:{symbol}:{tf}` JSON 리스트와 같은 데이터를 시리즈당 Redis 값 하나에
+컬럼 단위 바이너리로 저장합니다. 최근 N개만 필요한 리더는 GETRANGE로 필요한 컬럼의 끝부분만
+읽고, np.frombuffer로 복사 없이 배열로 해석합니다.
+
+키:
+    candles_columnar:{symbol}:{tf}       완료된 바 (blob)
+    candles_columnar_tail:{symbol}:{tf}  진행 중인 바 1개 (같은 형식, 작은 blob)
+
+형식 (little-endian):
+    header  : magic(4s) version(H) reserved(H) n_rows(I) n_cols(H) header_len(I)
+              + 컬럼마다 name_len(B) name(utf-8) dtype(1s)
+              + 8바이트 정렬 패딩
+    columns : 컬럼 순서대로 n_rows * itemsize 바이트, 각 블록 8바이트 정렬
+
+dtype: 'q' int64 (timestamp), 'd' float64, 'b' int8 (상태 값), '?' bool
+None은 float 컬럼에서 NaN으로 저장되며 레코드로 변환할 때 다시 None이 됩니다.
+문자열 필드(human_time 등)는 저장하지 않습니다.
+
+완료된 바 쓰기는 헤더와 꼬리 몇 행만 읽고 WATCH + MULTI 안에서 Lua 스크립트로 꼬리만
+교체하므로, 여러 작성자(collector, tasks)가 같은 시리즈를 써도 변경이 유실되지 않습니다.
+
+JSON 리스트가 원본이며, 마이그레이션 기간에는 candle_store가 두 형식을 함께 기록합니다
+(settings.CANDLE_COLUMNAR_WRITE). 리더는 settings.CANDLE_COLUMNAR_READ일 때 이 캐시를 우선
+사용하고, 없거나 해석할 수 없으면 JSON 리스트로 대체합니다.
+"""
+
+import math
+import struct
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from redis.exceptions import ResponseError, WatchError
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+LIST_PREFIX = "candles_with_indicators:"
+BLOB_PREFIX = "candles_columnar:"
+TAIL_PREFIX = "candles_columnar_tail:"
+
+MAGIC = b"TBCC"
+FORMAT_VERSION = 1
+
+_FIXED_HEADER = struct.Struct("<4sHHIHI")
+# 헤더 1차 조회 크기 (컬럼 수십 개 기준 충분, 부족하면 한 번 더 읽음)
+HEADER_PROBE_BYTES = 2048
+# 진행 중인 바 tail 키 TTL (가장 긴 타임프레임보다 길게)
+TAIL_TTL = 6 * 60 * 60
+# 헤더가 바뀌는 동시 쓰기와 겹쳤을 때 부분 읽기 재시도 횟수
+MAX_READ_RETRIES = 3
+# 진행 중인 바 표시 (tail 키에만 기록됨)
+LIVE_FLAG = "is_current"
+
+DTYPES = {"q": np.dtype("<i8"), "d": np.dtype("<f8"), "b": np.dtype("i1"), "?": np.dtype("?")}
+
+# 정수 상태 컬럼 (그 외 숫자는 float64)
+INT8_COLUMNS = frozenset({"trend_state", "BB_State", "auto_trend_state", "bb_state", "bb_state_mtf"})
+
+Columns = Dict[str, np.ndarray]
+
+
+def blob_key(list_key: str) -> Optional[str]:
+    """candles_with_indicators 키 → 컬럼형 blob 키 (대상이 아니면 None)"""
+    if not list_key.startswith(LIST_PREFIX):
+        return None
+    return BLOB_PREFIX + list_key[len(LIST_PREFIX):]
+
+
+def tail_key(list_key: str) -> Optional[str]:
+    """candles_with_indicators 키 → 진행 중인 바 tail 키 (대상이 아니면 None)"""
+    if not list_key.startswith(LIST_PREFIX):
+        return None
+    return TAIL_PREFIX + list_key[len(LIST_PREFIX):]
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+# ==================== Encoding ====================
+
+def _column_code(name: str, values: Sequence[Any]) -> Optional[str]:
+    if name == "timestamp":
+        return "q"
+    present = [v for v in values if v is not None]
+    if not present:
+        return "d"
+    if all(isinstance(v, bool) for v in present):
+        return "?"
+    if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in present):
+        return "b" if name in INT8_COLUMNS else "d"
+    # 문자열 등은 저장하지 않음
+    return None
+
+
+def rows_to_columns(rows: Sequence[Dict[str, Any]]) -> Columns:
+    """캔들 dict 리스트(timestamp 오름차순) → 컬럼 배열"""
+    names: Dict[str, None] = {}
+    for row in rows:
+        for name in row:
+            names.setdefault(name, None)
+
+    columns: Columns = {}
+    for name in names:
+        values = [row.get(name) for row in rows]
+        code = _column_code(name, values)
+        if code is None:
+            continue
+        if code == "d":
+            columns[name] = np.array([math.nan if v is None else v for v in values], dtype=DTYPES["d"])
+        elif code == "?":
+            columns[name] = np.array([bool(v) for v in values], dtype=DTYPES["?"])
+        else:
+            columns[name] = np.array([0 if v is None else int(v) for v in values], dtype=DTYPES[code])
+    return columns
+
+
+def _code_of(dtype: np.dtype) -> str:
+    for code, candidate in DTYPES.items():
+        if dtype == candidate:
+            return code
+    raise ValueError(f"지원하지 않는 dtype: {dtype}")
+
+
+def _pack_header(descriptors: Sequence[Tuple[str, str]], n_rows: int) -> bytes:
+    """(컬럼명, dtype 코드) 목록 → 패딩 포함 헤더"""
+    encoded = []
+    for name, code in descriptors:
+        raw = name.encode("utf-8")
+        encoded.append(struct.pack("<B", len(raw)) + raw + code.encode("ascii"))
+    body_len = _FIXED_HEADER.size + sum(len(d) for d in encoded)
+    header_len = _align(body_len)
+    return b"".join([
+        _FIXED_HEADER.pack(MAGIC, FORMAT_VERSION, 0, n_rows, len(descriptors), header_len),
+        *encoded,
+        b"\0" * (header_len - body_len),
+    ])
+
+
+def _column_bytes(array: np.ndarray) -> bytes:
+    return np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes()
+
+
+def pack_columns(columns: Columns) -> bytes:
+    """컬럼 배열 → blob (timestamp 컬럼 필수)"""
+    if "timestamp" not in columns:
+        raise ValueError("timestamp 컬럼이 필요합니다")
+    n_rows = len(columns["timestamp"])
+    for name, array in columns.items():
+        if len(array) != n_rows:
+            raise ValueError(f"컬럼 길이 불일치: {name}")
+
+    parts = [_pack_header([(name, _code_of(array.dtype)) for name, array in columns.items()], n_rows)]
+    for array in columns.values():
+        data = _column_bytes(array)
+        parts.append(data)
+        parts.append(b"\0" * (_align(len(data)) - len(data)))
+    return b"".join(parts)
+
+
+class ColumnarHeader:
+    """파싱된 blob 헤더 (컬럼별 데이터 오프셋 포함)"""
+
+    __slots__ = ("n_rows", "header_len", "columns")
+
+    def __init__(self, n_rows: int, header_len: int, columns: List[Tuple[str, np.dtype, int]]):
+        self.n_rows = n_rows
+        self.header_len = header_len
+        # (name, dtype, data offset)
+        self.columns = columns
+
+
+def parse_header(buf: bytes) -> ColumnarHeader:
+    """
+    blob 앞부분 → 헤더
+
+    Raises:
+        ValueError: 형식/버전 불일치, 또는 buf가 헤더 전체를 담지 못한 경우
+    """
+    if len(buf) < _FIXED_HEADER.size:
+        raise ValueError("헤더가 잘렸습니다")
+    magic, version, _, n_rows, n_cols, header_len = _FIXED_HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("컬럼형 캔들 blob이 아닙니다")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 컬럼형 캔들 버전: {version}")
+    if len(buf) < header_len:
+        raise ValueError("헤더가 잘렸습니다")
+
+    pos = _FIXED_HEADER.size
+    offset = header_len
+    columns = []
+    for _ in range(n_cols):
+        name_len = buf[pos]
+        name = bytes(buf[pos + 1:pos + 1 + name_len]).decode("utf-8")
+        code = chr(buf[pos + 1 + name_len])
+        pos += name_len + 2
+        dtype = DTYPES[code]
+        columns.append((name, dtype, offset))
+        offset += _align(n_rows * dtype.itemsize)
+    return ColumnarHeader(n_rows, header_len, columns)
+
+
+def unpack_columns(buf: bytes, count: Optional[int] = None, names: Optional[Sequence[str]] = None) -> Columns:
+    """
+    blob 전체 → 컬럼 배열 (np.frombuffer, 복사 없음 / 읽기 전용)
+
+    Args:
+        count: 최근 N개 행만 (None이면 전체)
+        names: 읽을 컬럼 (None이면 전체)
+    """
+    header = parse_header(buf)
+    start = header.n_rows - min(count, header.n_rows) if count else 0
+    wanted = set(names) if names is not None else None
+    columns: Columns = {}
+    for name, dtype, offset in header.columns:
+        if wanted is not None and name not in wanted and name != "timestamp":
+            continue
+        columns[name] = np.frombuffer(
+            buf, dtype=dtype, count=header.n_rows - start, offset=offset + start * dtype.itemsize
+        )
+    return columns
+
+
+def columns_to_records(columns: Columns) -> List[Dict[str, Any]]:
+    """컬럼 배열 → 캔들 dict 리스트 (float NaN은 None)"""
+    if not columns:
+        return []
+    lists = {}
+    for name, array in columns.items():
+        values = array.tolist()
+        if array.dtype.kind == "f":
+            values = [None if v != v else v for v in values]
+        lists[name] = values
+    names = list(lists)
+    records = [dict(zip(names, row)) for row in zip(*lists.values())]
+    if LIVE_FLAG in lists:
+        # JSON 리스트에서 is_current는 진행 중인 바에만 존재
+        for record in records:
+            if not record[LIVE_FLAG]:
+                del record[LIVE_FLAG]
+    return records
+
+
+# ==================== Merge ====================
+
+def _empty_like(dtype: np.dtype, n: int) -> np.ndarray:
+    if dtype.kind == "f":
+        return np.full(n, math.nan, dtype=dtype)
+    return np.zeros(n, dtype=dtype)
+
+
+def merge_columns(base: Columns, new: Columns, max_len: int) -> Columns:
+    """
+    timestamp 기준 병합 (같은 timestamp는 new 값, 없는 컬럼은 NaN/0으로 채움)
+
+    base/new 모두 timestamp 오름차순이어야 함
+    """
+    if not base or len(base.get("timestamp", ())) == 0:
+        merged = dict(new)
+    else:
+        base_ts = base["timestamp"]
+        new_ts = new["timestamp"]
+        all_ts = np.union1d(base_ts, new_ts)
+        base_idx = np.searchsorted(all_ts, base_ts)
+        new_idx = np.searchsorted(all_ts, new_ts)
+        merged = {}
+        for name in list(base) + [n for n in new if n not in base]:
+            dtype = (base.get(name) if name in base else new[name]).dtype
+            out = _empty_like(dtype, len(all_ts))
+            if name in base:
+                out[base_idx] = base[name]
+            if name in new:
+                out[new_idx] = new[name].astype(dtype, copy=False)
+            merged[name] = out
+        merged["timestamp"] = all_ts.astype(DTYPES["q"])
+    if len(merged["timestamp"]) > max_len:
+        merged = {name: array[-max_len:] for name, array in merged.items()}
+    return merged
+
+
+# ==================== Write ====================
+
+# 꼬리 교체/추가: 컬럼마다 기존 [drop, keep) 행 + 새 꼬리 바이트 + 8바이트 정렬 패딩
+# ARGV: drop, keep, 새 헤더, (컬럼 데이터 오프셋, itemsize, 꼬리 바이트) * 컬럼 수
+# WATCH + MULTI 안에서 실행되므로 blob은 클라이언트가 읽은 상태 그대로임
+_REPLACE_TAIL_SCRIPT = """
+local blob = redis.call('GET', KEYS[1])
+if not blob then
+    return 0
+end
+local drop = tonumber(ARGV[1])
+local keep = tonumber(ARGV[2])
+local parts = {ARGV[3]}
+for i = 4, #ARGV, 3 do
+    local offset = tonumber(ARGV[i])
+    local size = tonumber(ARGV[i + 1])
+    local tail = ARGV[i + 2]
+    local len = (keep - drop) * size + #tail
+    parts[#parts + 1] = string.sub(blob, offset + drop * size + 1, offset + keep * size)
+    parts[#parts + 1] = tail
+    parts[#parts + 1] = string.rep(string.char(0), (8 - len % 8) % 8)
+end
+redis.call('SET', KEYS[1], table.concat(parts))
+return 1
+"""
+
+# 동시 쓰기와 충돌했을 때 재시도 횟수
+MAX_WRITE_RETRIES = 5
+
+
+def _conform(columns: Columns, header: ColumnarHeader) -> Optional[Columns]:
+    """새 행을 blob 컬럼 순서/dtype에 맞춤 (blob에 없는 컬럼이 있으면 None)"""
+    names = {name for name, _, _ in header.columns}
+    if any(name not in names for name in columns):
+        return None
+    n = len(columns["timestamp"])
+    return {
+        name: columns[name].astype(dtype, copy=False) if name in columns else _empty_like(dtype, n)
+        for name, dtype, _ in header.columns
+    }
+
+
+def _plan_tail_write(pipe, b_key: str, new: Columns, max_len: int):
+    """
+    blob 꼬리만 바꾸는 쓰기 계획 (WATCH 중인 pipe로 헤더와 꼬리만 읽음)
+
+    Returns:
+        Lua 스크립트 ARGV, 꼬리 경로로 처리할 수 없으면 None
+        (blob 없음/손상, 새 컬럼, 꼬리 창보다 오래된 행 삽입)
+    """
+    probe = pipe.getrange(b_key, 0, HEADER_PROBE_BYTES - 1)
+    if not probe:
+        return None
+    try:
+        if len(probe) < _header_len(probe):
+            probe = pipe.getrange(b_key, 0, _header_len(probe) - 1)
+        header = parse_header(probe)
+    except ValueError:
+        return None
+    new = _conform(new, header)
+    if new is None or header.n_rows == 0:
+        return None
+
+    # first_ts 이후의 기존 행만 다시 씀 (이보다 오래된 행이 창에 있어야 함)
+    n_rows = header.n_rows
+    window = min(n_rows, len(new["timestamp"]) + 1)
+    ts_dtype, ts_offset = next((dtype, offset) for name, dtype, offset in header.columns if name == "timestamp")
+    ts_end = ts_offset + n_rows * ts_dtype.itemsize
+    tail_ts = np.frombuffer(pipe.getrange(b_key, ts_end - window * ts_dtype.itemsize, ts_end - 1), dtype=ts_dtype)
+    replaced = int(np.count_nonzero(tail_ts >= new["timestamp"][0]))
+    if replaced == window and window < n_rows:
+        return None
+
+    keep = n_rows - replaced
+    existing: Columns = {}
+    if replaced:
+        for name, dtype, offset in header.columns:
+            end = offset + n_rows * dtype.itemsize
+            existing[name] = np.frombuffer(pipe.getrange(b_key, end - replaced * dtype.itemsize, end - 1), dtype=dtype)
+    merged = merge_columns(existing, new, max_len)
+
+    excess = max(keep + len(merged["timestamp"]) - max_len, 0)
+    drop = min(excess, keep)
+    merged = {name: array[excess - drop:] for name, array in merged.items()}
+    descriptors = [(name, _code_of(dtype)) for name, dtype, _ in header.columns]
+    args: List[Any] = [drop, keep, _pack_header(descriptors, keep - drop + len(merged["timestamp"]))]
+    for name, dtype, offset in header.columns:
+        args.extend([offset, dtype.itemsize, _column_bytes(merged[name].astype(dtype, copy=False))])
+    return args
+
+
+def _write_closed(redis_client, b_key: str, closed: List[Dict[str, Any]], max_len: int,
+                  load_all: Optional[Callable[[], Sequence[Dict[str, Any]]]]) -> None:
+    """
+    완료된 바를 blob에 원자적으로 반영
+
+    보통은 헤더와 꼬리 몇 행만 읽고 Lua로 꼬리만 교체합니다. blob이 없거나 새 컬럼이
+    생기는 등 꼬리 경로로 처리할 수 없을 때만 blob 전체를 읽어 병합합니다.
+    두 경로 모두 WATCH + MULTI로 실행되어 동시 쓰기가 서로의 변경을 덮어쓰지 않습니다.
+
+    Raises:
+        RuntimeError: 동시 쓰기 충돌 재시도 초과
+    """
+    new = rows_to_columns(sorted(closed, key=lambda r: r["timestamp"]))
+    use_script = True
+    for _ in range(MAX_WRITE_RETRIES):
+        with redis_client.pipeline() as pipe:
+            try:
+                pipe.watch(b_key)
+                args = _plan_tail_write(pipe, b_key, new, max_len) if use_script else None
+                if args is not None:
+                    pipe.multi()
+                    pipe.eval(_REPLACE_TAIL_SCRIPT, 1, b_key, *args)
+                    pipe.execute()
+                    return
+
+                existing = pipe.get(b_key)
+                base: Columns = {}
+                if existing:
+                    try:
+                        base = unpack_columns(existing)
+                    except ValueError as e:
+                        logger.warning(f"컬럼형 캔들 blob 재생성: {b_key} - {e}")
+                rows = closed
+                if not base and load_all is not None:
+                    rows = [row for row in load_all() if not row.get(LIVE_FLAG)]
+                merged = merge_columns(base, rows_to_columns(sorted(rows, key=lambda r: r["timestamp"])), max_len)
+                pipe.multi()
+                pipe.set(b_key, pack_columns(merged))
+                pipe.execute()
+                return
+            except WatchError:
+                continue
+            except ResponseError as e:
+                # 스크립트를 실행할 수 없는 서버: 전체 병합으로 처리
+                if not use_script:
+                    raise
+                logger.warning(f"컬럼형 캔들 꼬리 스크립트 실패, 전체 병합으로 대체: {b_key} - {e}")
+                use_script = False
+
+    raise RuntimeError(f"컬럼형 캔들 저장 충돌 재시도 초과: {b_key}")
+
+
+def write_rows(redis_client, list_key: str, rows: Sequence[Dict[str, Any]], max_len: int,
+               load_all: Optional[Callable[[], Sequence[Dict[str, Any]]]] = None) -> None:
+    """
+    저장된 JSON 행을 컬럼형 캐시에 반영 (동기 클라이언트)
+
+    - is_current 행 → tail 키 (진행 중인 바)
+    - 나머지 → blob에 timestamp 기준 병합 (꼬리만 교체, 원자적)
+    - blob이 없으면 load_all()(보통 JSON 리스트 전체)로 새로 생성
+
+    Args:
+        rows: 새로 기록된 행
+        load_all: blob이 없을 때 전체 행을 돌려주는 함수 (None이면 rows만 사용)
+    """
+    b_key = blob_key(list_key)
+    t_key = tail_key(list_key)
+    if b_key is None:
+        return
+
+    live = [row for row in rows if row.get(LIVE_FLAG)]
+    closed = [row for row in rows if not row.get(LIVE_FLAG)]
+
+    if closed:
+        _write_closed(redis_client, b_key, closed, max_len, load_all)
+
+    if live:
+        redis_client.set(t_key, pack_columns(rows_to_columns(live[-1:])), ex=TAIL_TTL)
+
+
+def replace_rows(redis_client, list_key: str, rows: Sequence[Dict[str, Any]], max_len: int) -> None:
+    """컬럼형 캐시 전체 교체 (JSON 리스트 전체 재작성과 짝)"""
+    b_key = blob_key(list_key)
+    if b_key is None:
+        return
+    closed = sorted((row for row in rows if not row.get(LIVE_FLAG)), key=lambda r: r["timestamp"])
+    if not closed:
+        redis_client.delete(b_key)
+        return
+    redis_client.set(b_key, pack_columns(merge_columns({}, rows_to_columns(closed), max_len)))
+
+
+# ==================== Read ====================
+
+def _read_plan(header: ColumnarHeader, count: Optional[int], names: Optional[Sequence[str]]):
+    """부분 읽기할 컬럼별 (name, dtype, start, end) 바이트 범위"""
+    n = min(count, header.n_rows) if count else header.n_rows
+    wanted = set(names) if names is not None else None
+    plan = []
+    for name, dtype, offset in header.columns:
+        if wanted is not None and name not in wanted and name != "timestamp":
+            continue
+        end = offset + header.n_rows * dtype.itemsize
+        plan.append((name, dtype, end - n * dtype.itemsize, end))
+    return plan
+
+
+def _with_tail(columns: Optional[Columns], tail_buf: Optional[bytes]) -> Optional[Columns]:
+    """tail 바가 blob 마지막 바보다 새로우면 뒤에 붙임"""
+    if not tail_buf:
+        return columns
+    try:
+        tail = unpack_columns(tail_buf)
+    except ValueError:
+        return columns
+    if not columns:
+        return {name: array.copy() for name, array in tail.items()}
+    if len(columns["timestamp"]) and tail["timestamp"][-1] <= columns["timestamp"][-1]:
+        return columns
+    out = {}
+    for name, array in columns.items():
+        extra = tail[name].astype(array.dtype) if name in tail else _empty_like(array.dtype, 1)
+        out[name] = np.concatenate([array, extra])
+    if LIVE_FLAG in tail and LIVE_FLAG not in out:
+        out[LIVE_FLAG] = np.concatenate([_empty_like(tail[LIVE_FLAG].dtype, len(columns["timestamp"])), tail[LIVE_FLAG]])
+    return out
+
+
+def _is_binary_client(redis_client) -> bool:
+    pool = getattr(redis_client, "connection_pool", None)
+    kwargs = getattr(pool, "connection_kwargs", None)
+    # 설정을 확인할 수 없는 클라이언트(프록시 등)는 문자열 클라이언트로 간주
+    return isinstance(kwargs, dict) and not kwargs.get("decode_responses", False)
+
+
+def read_columns(redis_client, list_key: str, count: Optional[int] = None,
+                 names: Optional[Sequence[str]] = None, include_live: bool = True) -> Optional[Columns]:
+    """
+    컬럼형 캐시 읽기 (동기, decode_responses=False 클라이언트)
+
+    Args:
+        count: 최근 N개 완료 바 (None이면 전체)
+        names: 읽을 컬럼 (timestamp는 항상 포함)
+        include_live: 진행 중인 바(tail)가 더 새로우면 끝에 붙임
+
+    Returns:
+        컬럼 배열, 캐시가 없으면 None
+    """
+    b_key, t_key = blob_key(list_key), tail_key(list_key)
+    if b_key is None or not _is_binary_client(redis_client):
+        return None
+
+    for _ in range(MAX_READ_RETRIES):
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.getrange(b_key, 0, HEADER_PROBE_BYTES - 1)
+            pipe.get(t_key)
+            probe, tail_buf = pipe.execute()
+        if not probe:
+            return None
+        if not include_live:
+            tail_buf = None
+        if len(probe) < _header_len(probe):
+            probe = redis_client.getrange(b_key, 0, _header_len(probe) - 1)
+        header = parse_header(probe)
+        plan = _read_plan(header, count, names)
+        with redis_client.pipeline(transaction=True) as pipe:
+            pipe.getrange(b_key, 0, header.header_len - 1)
+            for _, _, start, end in plan:
+                pipe.getrange(b_key, start, end - 1)
+            results = pipe.execute()
+        if _header_changed(header, results[0]):
+            continue
+        columns = {name: np.frombuffer(chunk, dtype=dtype) for (name, dtype, _, _), chunk in zip(plan, results[1:])}
+        return _with_tail(columns, tail_buf)
+
+    # 동시 쓰기가 계속 겹치면 blob 전체를 한 번에 읽음
+    buf = redis_client.get(b_key)
+    if not buf:
+        return None
+    return _with_tail(unpack_columns(buf, count, names), redis_client.get(t_key) if include_live else None)
+
+
+async def read_columns_async(redis, list_key: str, count: Optional[int] = None,
+                             names: Optional[Sequence[str]] = None, include_live: bool = True) -> Optional[Columns]:
+    """read_columns()의 비동기 버전 (decode_responses=False 클라이언트)"""
+    b_key, t_key = blob_key(list_key), tail_key(list_key)
+    if b_key is None or not _is_binary_client(redis):
+        return None
+
+    for _ in range(MAX_READ_RETRIES):
+        async with redis.pipeline(transaction=False) as pipe:
+            pipe.getrange(b_key, 0, HEADER_PROBE_BYTES - 1)
+            pipe.get(t_key)
+            probe, tail_buf = await pipe.execute()
+        if not probe:
+            return None
+        if not include_live:
+            tail_buf = None
+        if len(probe) < _header_len(probe):
+            probe = await redis.getrange(b_key, 0, _header_len(probe) - 1)
+        header = parse_header(probe)
+        plan = _read_plan(header, count, names)
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.getrange(b_key, 0, header.header_len - 1)
+            for _, _, start, end in plan:
+                pipe.getrange(b_key, start, end - 1)
+            results = await pipe.execute()
+        if _header_changed(header, results[0]):
+            continue
+        columns = {name: np.frombuffer(chunk, dtype=dtype) for (name, dtype, _, _), chunk in zip(plan, results[1:])}
+        return _with_tail(columns, tail_buf)
+
+    buf = await redis.get(b_key)
+    if not buf:
+        return None
+    return _with_tail(unpack_columns(buf, count, names), await redis.get(t_key) if include_live else None)
+
+
+def _header_len(probe: bytes) -> int:
+    if len(probe) < _FIXED_HEADER.size:
+        raise ValueError("헤더가 잘렸습니다")
+    return _FIXED_HEADER.unpack_from(probe, 0)[5]
+
+
+def _header_changed(header: ColumnarHeader, current: bytes) -> bool:
+    """1차 조회 이후 blob 레이아웃(행 수/컬럼)이 바뀌었는지"""
+    try:
+        latest = parse_header(current)
+    except ValueError:
+        return True
+    return latest.n_rows != header.n_rows or latest.columns != header.columns
@@ -0,0 +1,374 @@
+"""
+Timestamp-keyed candle store on Redis lists
+
+`candles:{symbol}:{tf}` (CSV) 및 `candles_with_indicators:{symbol}:{tf}` (JSON)
+리스트를 timestamp 오름차순으로 유지하면서, 전체 LRANGE → DELETE → RPUSH 재작성 대신
+바뀐 바만 기록합니다.
+
+- 같은 timestamp가 있으면 LSET (진행 중인 바 교체 포함)
+- 마지막보다 새로운 timestamp면 RPUSH
+- 중간에 빠진 바(갭 채우기)는 삽입 지점 이후 꼬리만 LTRIM + RPUSH로 재작성
+- 마지막에 LTRIM으로 최대 길이 유지
+
+모든 쓰기는 WATCH/MULTI 트랜잭션 한 번으로 적용되므로 읽는 쪽은 항상 완전한 리스트를
+보게 되고, 네트워크 전송량은 전체 길이가 아닌 변경된 바 수에 비례합니다.
+저장 형식은 기존 리스트와 같으므로 LRANGE/LINDEX를 직접 쓰는 기존 코드도 그대로 동작하며,
+새 코드는 read_candles()/read_last_candle() 호환 리더를 사용합니다.
+
+candles_with_indicators 키는 컬럼형 바이너리 캐시(candle_columnar)에도 함께 기록되며
+(settings.CANDLE_COLUMNAR_WRITE), 리더는 settings.CANDLE_COLUMNAR_READ일 때 이를 우선 사용합니다.
+
+Usage:
+    from shared.database.candle_store import upsert_candles, read_candles_async
+
+    # 쓰기 (동기 클라이언트: 데이터 수집기/Celery)
+    upsert_candles(redis_client, "candles_with_indicators:BTC-USDT-SWAP:1m", rows, max_len=3000)
+
+    # 읽기 (비동기 클라이언트: 트레이딩 로직)
+    candles = await read_candles_async(redis, "candles_with_indicators:BTC-USDT-SWAP:1m", count=14)
+"""
+
+import bisect
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis.exceptions import WatchError
+
+from shared.database import candle_columnar
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 리스트 항목 형식
+CSV_FORMAT = "csv"    # "ts,open,high,low,close,volume" (candles:*)
+JSON_FORMAT = "json"  # {"timestamp": ..., ...} (candles_with_indicators:*)
+
+CSV_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# WATCH 충돌 시 재시도 횟수
+MAX_WATCH_RETRIES = 5
+
+# (기존 항목, 새 항목, 직전 항목) → 저장할 항목 (None이면 기존 항목 유지)
+MergeFn = Callable[[Optional[Dict[str, Any]], Dict[str, Any], Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]
+
+
+def _columnar_write_enabled() -> bool:
+    from shared.config import settings
+    return settings.CANDLE_COLUMNAR_WRITE
+
+
+def _columnar_read_enabled() -> bool:
+    from shared.config import settings
+    return settings.CANDLE_COLUMNAR_READ
+
+
+# ==================== Encoding ====================
+
+def encode_candle(candle: Dict[str, Any], fmt: str = JSON_FORMAT) -> str:
+    """캔들 dict → 리스트 항목 문자열"""
+    if fmt == CSV_FORMAT:
+        return ",".join(str(candle[field]) for field in CSV_FIELDS)
+    return json.dumps(candle)
+
+
+def decode_candle(item: Any) -> Optional[Dict[str, Any]]:
+    """
+    리스트 항목(JSON 또는 CSV, str/bytes) → 캔들 dict
+
+    Returns:
+        timestamp가 있는 캔들 dict, 해석할 수 없으면 None
+    """
+    text = item.decode("utf-8") if isinstance(item, bytes) else item
+    if not text:
+        return None
+    try:
+        if text[0] == "{":
+            obj = json.loads(text)
+            return obj if isinstance(obj, dict) and "timestamp" in obj else None
+        parts = text.split(",")
+        if len(parts) < len(CSV_FIELDS):
+            return None
+        candle: Dict[str, Any] = {"timestamp": int(parts[0])}
+        for field, value in zip(CSV_FIELDS[1:], parts[1:]):
+            candle[field] = float(value)
+        return candle
+    except (ValueError, TypeError):
+        return None
+
+
+def replace_merge(existing, new, previous):
+    """기본 병합: 같은 timestamp면 새 항목으로 교체"""
+    return new
+
+
+def keep_existing_merge(existing, new, previous):
+    """이미 있는 timestamp는 유지하고 새로운 바만 추가"""
+    return new if existing is None else None
+
+
+# ==================== Write ====================
+
+def _plan_upsert(
+    tail: List[Tuple[str, Optional[Dict[str, Any]]]],
+    rows: List[Dict[str, Any]],
+    fmt: str,
+    merge: MergeFn,
+) -> Tuple[Dict[int, str], Optional[int], List[Tuple[str, Optional[Dict[str, Any]]]], List[Dict[str, Any]]]:
+    """
+    꼬리 창(tail)에 rows를 병합하는 연산 계획
+
+    Returns:
+        (lsets, rewrite_from, entries, written)
+        - lsets: 꼬리 창 내 위치 → 새 항목 문자열
+        - rewrite_from: 삽입이 발생한 첫 위치 (이후는 재작성), 없으면 None
+        - entries: 병합 후 꼬리 창 [(항목 문자열, dict)]
+        - written: 실제로 기록된 캔들 dict 리스트
+    """
+    entries = list(tail)
+    # 해석 불가 항목은 직전 timestamp로 취급해 정렬 위치만 유지
+    keys: List[int] = []
+    last_key = -1
+    for _, obj in entries:
+        if obj is not None:
+            last_key = int(obj["timestamp"])
+        keys.append(last_key)
+
+    lsets: Dict[int, str] = {}
+    rewrite_from: Optional[int] = None
+    written: List[Dict[str, Any]] = []
+
+    for row in rows:
+        ts = int(row["timestamp"])
+        pos = bisect.bisect_left(keys, ts)
+        exists = pos < len(entries) and entries[pos][1] is not None and keys[pos] == ts
+        previous = entries[pos - 1][1] if pos > 0 else None
+        new = merge(entries[pos][1] if exists else None, row, previous)
+        if new is None:
+            continue
+        raw = encode_candle(new, fmt)
+        if exists:
+            if raw == entries[pos][0]:
+                continue
+            entries[pos] = (raw, new)
+            if rewrite_from is None or pos < rewrite_from:
+                lsets[pos] = raw
+        else:
+            entries.insert(pos, (raw, new))
+            keys.insert(pos, ts)
+            if pos < len(entries) - 1:
+                # 중간 삽입: 이 위치 이후 꼬리 재작성
+                rewrite_from = pos if rewrite_from is None else min(rewrite_from, pos)
+        written.append(new)
+
+    if rewrite_from is not None:
+        lsets = {pos: raw for pos, raw in lsets.items() if pos < rewrite_from}
+    return lsets, rewrite_from, entries, written
+
+
+def upsert_candles(
+    redis_client,
+    key: str,
+    candles: List[Dict[str, Any]],
+    max_len: int,
+    fmt: str = JSON_FORMAT,
+    merge: MergeFn = replace_merge,
+) -> List[Dict[str, Any]]:
+    """
+    timestamp 기준으로 캔들을 리스트에 병합 (바뀐 바만 기록, 원자적)
+
+    Args:
+        redis_client: 동기 Redis 클라이언트
+        key: 리스트 키
+        candles: 캔들 dict 리스트 (순서 무관, 같은 timestamp는 뒤쪽 우선)
+        max_len: 유지할 최대 길이
+        fmt: CSV_FORMAT 또는 JSON_FORMAT
+        merge: (기존, 새, 직전) → 저장할 항목, None이면 건너뜀
+
+    Returns:
+        실제로 기록된 캔들 dict 리스트 (timestamp 오름차순)
+    """
+    if not candles:
+        return []
+    by_ts = {int(c["timestamp"]): c for c in candles}
+    rows = [by_ts[ts] for ts in sorted(by_ts)]
+    first_ts = int(rows[0]["timestamp"])
+
+    for _ in range(MAX_WATCH_RETRIES):
+        with redis_client.pipeline() as pipe:
+            try:
+                pipe.watch(key)
+                length = pipe.llen(key)
+
+                # first_ts 이전 항목이 창에 들어올 때까지 꼬리 창을 두 배씩 확장
+                window = min(length, len(rows) + 1)
+                while True:
+                    start = length - window
+                    raw_items = pipe.lrange(key, start, -1) if window else []
+                    tail = []
+                    for item in raw_items:
+                        text = item.decode("utf-8") if isinstance(item, bytes) else item
+                        tail.append((text, decode_candle(text)))
+                    head = next((obj for _, obj in tail if obj is not None), None)
+                    if window >= length or (head is not None and int(head["timestamp"]) < first_ts):
+                        break
+                    window = min(length, window * 2)
+
+                lsets, rewrite_from, entries, written = _plan_upsert(tail, rows, fmt, merge)
+
+                pipe.multi()
+                for pos, raw in lsets.items():
+                    pipe.lset(key, start + pos, raw)
+                if rewrite_from is not None:
+                    keep = start + rewrite_from
+                    if keep > 0:
+                        pipe.ltrim(key, 0, keep - 1)
+                    else:
+                        pipe.delete(key)
+                    pipe.rpush(key, *[raw for raw, _ in entries[rewrite_from:]])
+                elif len(entries) > len(tail):
+                    pipe.rpush(key, *[raw for raw, _ in entries[len(tail):]])
+                pipe.ltrim(key, -max_len, -1)
+                pipe.execute()
+            except WatchError:
+                continue
+            _write_columnar(redis_client, key, written, max_len)
+            return written
+
+    raise RuntimeError(f"캔들 저장 충돌 재시도 초과: {key}")
+
+
+def replace_candles(
+    redis_client,
+    key: str,
+    candles: List[Dict[str, Any]],
+    max_len: int,
+    fmt: str = JSON_FORMAT,
+) -> None:
+    """
+    리스트 전체 교체 (초기 로드/전체 재계산 전용)
+
+    DELETE + RPUSH를 MULTI 한 번으로 실행하여 읽는 쪽이 빈 리스트를 보지 않도록 함
+    """
+    by_ts = {int(c["timestamp"]): c for c in candles}
+    rows = [by_ts[ts] for ts in sorted(by_ts)][-max_len:]
+    items = [encode_candle(row, fmt) for row in rows]
+    with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(key)
+        if items:
+            pipe.rpush(key, *items)
+        pipe.execute()
+
+    if fmt == JSON_FORMAT and candle_columnar.blob_key(key) and _columnar_write_enabled():
+        try:
+            candle_columnar.replace_rows(redis_client, key, rows, max_len)
+        except Exception as e:
+            logger.warning(f"컬럼형 캔들 캐시 교체 실패 (JSON 리스트는 성공): {key} - {e}")
+
+
+def _write_columnar(redis_client, key: str, written: List[Dict[str, Any]], max_len: int) -> None:
+    """JSON 리스트에 기록된 행을 컬럼형 캐시에도 반영 (실패해도 JSON 리스트가 원본)"""
+    if not written or not candle_columnar.blob_key(key) or not _columnar_write_enabled():
+        return
+    try:
+        candle_columnar.write_rows(
+            redis_client, key, written, max_len, load_all=lambda: read_candles(redis_client, key, columnar=False)
+        )
+    except Exception as e:
+        logger.warning(f"컬럼형 캔들 캐시 기록 실패 (JSON 리스트는 성공): {key} - {e}")
+
+
+# ==================== Read (compatibility) ====================
+
+def _decode_items(items) -> List[Dict[str, Any]]:
+    candles = [obj for obj in (decode_candle(item) for item in items or []) if obj is not None]
+    candles.sort(key=lambda c: c["timestamp"])
+    return candles
+
+
+def _from_columns(columns, count: Optional[int]) -> List[Dict[str, Any]]:
+    records = candle_columnar.columns_to_records(columns)
+    return records[-count:] if count else records
+
+
+def read_candles(redis_client, key: str, count: Optional[int] = None,
+                 columnar: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """
+    캔들 리스트 읽기 (CSV/JSON 자동 판별, timestamp 오름차순)
+
+    Args:
+        count: 최근 N개만 (None이면 전체)
+        columnar: 컬럼형 캐시 우선 사용 여부 (None이면 settings.CANDLE_COLUMNAR_READ)
+    """
+    if columnar is None:
+        columnar = _columnar_read_enabled()
+    if columnar and candle_columnar.blob_key(key):
+        try:
+            columns = candle_columnar.read_columns(redis_client, key, count)
+            if columns is not None:
+                return _from_columns(columns, count)
+        except Exception as e:
+            logger.debug(f"컬럼형 캔들 캐시 읽기 실패, JSON 리스트 사용: {key} - {e}")
+    start = -count if count else 0
+    return _decode_items(redis_client.lrange(key, start, -1))
+
+
+def read_last_candle(redis_client, key: str) -> Optional[Dict[str, Any]]:
+    """마지막(가장 최근) 캔들, 없으면 None"""
+    if _columnar_read_enabled() and candle_columnar.blob_key(key):
+        candles = read_candles(redis_client, key, count=1, columnar=True)
+        return candles[-1] if candles else None
+    item = redis_client.lindex(key, -1)
+    return decode_candle(item) if item else None
+
+
+def stage_read_candles(pipe, key: str, count: Optional[int] = None) -> bool:
+    """
+    캔들 리스트 읽기를 파이프라인에 추가 (결과는 decode_candles()로 변환)
+
+    컬럼형 캐시는 binary 클라이언트가 필요해 파이프라인에 담을 수 없으므로
+    settings.CANDLE_COLUMNAR_READ일 때는 아무것도 추가하지 않고 False를 반환합니다.
+    이 경우 read_candles_async()로 따로 읽습니다.
+    """
+    if _columnar_read_enabled() and candle_columnar.blob_key(key):
+        return False
+    start = -count if count else 0
+    pipe.lrange(key, start, -1)
+    return True
+
+
+def decode_candles(items) -> List[Dict[str, Any]]:
+    """LRANGE 결과를 캔들 리스트로 변환 (timestamp 오름차순)"""
+    return _decode_items(items)
+
+
+async def _binary_client(redis):
+    """컬럼형 캐시는 bytes 응답이 필요하므로 문자열 클라이언트면 binary 클라이언트로 교체"""
+    if candle_columnar._is_binary_client(redis):
+        return redis
+    from shared.database.redis import get_redis_binary
+    return await get_redis_binary()
+
+
+async def read_candles_async(redis, key: str, count: Optional[int] = None,
+                             columnar: Optional[bool] = None) -> List[Dict[str, Any]]:
+    """read_candles()의 비동기 버전"""
+    if columnar is None:
+        columnar = _columnar_read_enabled()
+    if columnar and candle_columnar.blob_key(key):
+        try:
+            columns = await candle_columnar.read_columns_async(await _binary_client(redis), key, count)
+            if columns is not None:
+                return _from_columns(columns, count)
+        except Exception as e:
+            logger.debug(f"컬럼형 캔들 캐시 읽기 실패, JSON 리스트 사용: {key} - {e}")
+    start = -count if count else 0
+    return _decode_items(await redis.lrange(key, start, -1))
+
+
+async def read_last_candle_async(redis, key: str) -> Optional[Dict[str, Any]]:
+    """read_last_candle()의 비동기 버전"""
+    if _columnar_read_enabled() and candle_columnar.blob_key(key):
+        candles = await read_candles_async(redis, key, count=1, columnar=True)
+        return candles[-1] if candles else None
+    item = await redis.lindex(key, -1)
+    return decode_candle(item) if item else None
@@ -0,0 +1,222 @@
+"""Unit Tests for the columnar candle cache
+
+Checks that the binary blob round-trips candles_with_indicators rows, that
+partial GETRANGE reads return the same tail as a full read, and that
+candle_store keeps the JSON list and the columnar cache in step.
+
+Run tests:
+    pytest shared/database/tests/test_candle_columnar.py -v
+"""
+
+import random
+
+import fakeredis
+import numpy as np
+import pytest
+
+from shared.database import candle_columnar, candle_store
+from shared.database.candle_columnar import (
+    columns_to_records,
+    merge_columns,
+    pack_columns,
+    parse_header,
+    read_columns,
+    read_columns_async,
+    rows_to_columns,
+    unpack_columns,
+    write_rows,
+)
+from shared.database.candle_store import read_candles, read_candles_async, upsert_candles
+
+KEY = "candles_with_indicators:BTC-USDT-SWAP:1m"
+
+
+def _row(ts, close=100.0, **extra):
+    row = {
+        "timestamp": ts, "open": close, "high": close, "low": close, "close": close, "volume": 1.0,
+        "rsi": close / 2, "BB_State": 1, "CYCLE_Bull": True, "human_time": "2024-01-01 00:00:00",
+    }
+    row.update(extra)
+    return row
+
+
+def _numeric(row):
+    return {k: v for k, v in row.items() if not isinstance(v, str)}
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def redis_client(server):
+    return fakeredis.FakeRedis(server=server)
+
+
+def test_pack_round_trip_keeps_types():
+    rows = [_row(0), _row(60, rsi=None, BB_State=-2, CYCLE_Bull=False)]
+
+    columns = unpack_columns(pack_columns(rows_to_columns(rows)))
+
+    assert columns["BB_State"].dtype == np.int8
+    assert columns["CYCLE_Bull"].dtype == np.bool_
+    assert "human_time" not in columns
+    records = columns_to_records(columns)
+    assert records == [_numeric(r) for r in rows]
+    assert records[1]["rsi"] is None and type(records[1]["BB_State"]) is int
+
+
+def test_unknown_version_is_rejected():
+    buf = bytearray(pack_columns(rows_to_columns([_row(0)])))
+    buf[4] = 99
+    with pytest.raises(ValueError):
+        parse_header(bytes(buf))
+
+
+def test_partial_read_matches_full_read(redis_client):
+    rows = [_row(ts * 60, close=random.Random(ts).random()) for ts in range(300)]
+    write_rows(redis_client, KEY, rows, max_len=1000)
+
+    full = read_columns(redis_client, KEY)
+    last = read_columns(redis_client, KEY, count=14, names=["close"])
+
+    assert set(last) == {"timestamp", "close"}
+    np.testing.assert_array_equal(last["close"], full["close"][-14:])
+    np.testing.assert_array_equal(last["timestamp"], full["timestamp"][-14:])
+
+
+def test_live_bar_is_appended_only_when_newer(redis_client):
+    write_rows(redis_client, KEY, [_row(0), _row(60)], max_len=100)
+    write_rows(redis_client, KEY, [_row(120, close=5.0, is_current=True)], max_len=100)
+
+    assert list(read_columns(redis_client, KEY)["timestamp"]) == [0, 60, 120]
+    assert list(read_columns(redis_client, KEY, include_live=False)["timestamp"]) == [0, 60]
+
+    # 바가 마감되면 blob이 같은 timestamp를 가지므로 이전 tail은 무시됨
+    write_rows(redis_client, KEY, [_row(120, close=6.0)], max_len=100)
+    columns = read_columns(redis_client, KEY)
+    assert list(columns["timestamp"]) == [0, 60, 120]
+    assert columns["close"][-1] == 6.0
+
+
+def test_write_rows_merges_inserts_and_trims(redis_client):
+    write_rows(redis_client, KEY, [_row(ts) for ts in (0, 60, 240)], max_len=4)
+    write_rows(redis_client, KEY, [_row(120, close=1.0), _row(180), _row(240, close=2.0)], max_len=4)
+
+    columns = read_columns(redis_client, KEY)
+    assert list(columns["timestamp"]) == [60, 120, 180, 240]
+    assert list(columns["close"]) == [100.0, 1.0, 100.0, 2.0]
+
+
+def test_tail_writes_match_full_merge(redis_client):
+    rng = random.Random(3)
+    expected = {}
+    for step in range(80):
+        ts = step * 60
+        # 마감 바 + 최근 바 재기록, 가끔 직전 몇 개 바 보정
+        rows = [_row(t, close=rng.random()) for t in range(max(ts - 60 * rng.randint(0, 3), 0), ts + 60, 60)]
+        write_rows(redis_client, KEY, rows, max_len=40)
+        expected = merge_columns(expected, rows_to_columns(rows), 40)
+
+    assert redis_client.get(candle_columnar.blob_key(KEY)) == pack_columns(expected)
+
+
+def test_tail_write_does_not_read_whole_blob(monkeypatch, redis_client):
+    pytest.importorskip("lupa")
+    write_rows(redis_client, KEY, [_row(ts) for ts in range(0, 600, 60)], max_len=8)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("blob 전체를 읽음")
+
+    monkeypatch.setattr(candle_columnar, "unpack_columns", fail)
+    write_rows(redis_client, KEY, [_row(540, close=1.0), _row(600, close=2.0)], max_len=8)
+    monkeypatch.undo()
+
+    columns = read_columns(redis_client, KEY)
+    assert list(columns["timestamp"]) == list(range(180, 660, 60))
+    assert list(columns["close"][-2:]) == [1.0, 2.0]
+
+
+def test_concurrent_write_is_not_lost(monkeypatch, server, redis_client):
+    write_rows(redis_client, KEY, [_row(0), _row(60)], max_len=100)
+    other = fakeredis.FakeRedis(server=server)
+    plan = candle_columnar._plan_tail_write
+    calls = []
+
+    def racing_plan(pipe, b_key, new, max_len):
+        # WATCH 이후, EXEC 이전에 다른 작성자가 끼어듦
+        calls.append(b_key)
+        if len(calls) == 1:
+            write_rows(other, KEY, [_row(120, close=7.0)], max_len=100)
+        return plan(pipe, b_key, new, max_len)
+
+    monkeypatch.setattr(candle_columnar, "_plan_tail_write", racing_plan)
+    write_rows(redis_client, KEY, [_row(180, close=8.0)], max_len=100)
+
+    columns = read_columns(redis_client, KEY)
+    assert list(columns["timestamp"]) == [0, 60, 120, 180]
+    assert list(columns["close"][-2:]) == [7.0, 8.0]
+
+
+def test_new_column_falls_back_to_full_merge(redis_client):
+    write_rows(redis_client, KEY, [_row(0), _row(60)], max_len=100)
+    write_rows(redis_client, KEY, [_row(120, atr=3.0)], max_len=100)
+
+    columns = read_columns(redis_client, KEY)
+    assert list(columns["timestamp"]) == [0, 60, 120]
+    assert np.isnan(columns["atr"][0]) and columns["atr"][-1] == 3.0
+
+
+def test_missing_blob_is_rebuilt_from_load_all(redis_client):
+    history = [_row(ts) for ts in range(0, 600, 60)]
+    write_rows(redis_client, KEY, [_row(600)], max_len=100, load_all=lambda: history + [_row(600)])
+
+    assert len(read_columns(redis_client, KEY)["timestamp"]) == 11
+
+
+def test_string_client_returns_none():
+    client = fakeredis.FakeRedis(decode_responses=True)
+    assert read_columns(client, KEY) is None
+
+
+@pytest.mark.asyncio
+async def test_async_reader(server, redis_client):
+    write_rows(redis_client, KEY, [_row(ts) for ts in range(0, 600, 60)], max_len=100)
+    redis = fakeredis.FakeAsyncRedis(server=server)
+
+    columns = await read_columns_async(redis, KEY, count=3)
+
+    assert list(columns["timestamp"]) == [420, 480, 540]
+
+
+@pytest.mark.parametrize("read_flag", [True, False])
+def test_candle_store_dual_write(monkeypatch, redis_client, read_flag):
+    monkeypatch.setattr(candle_store, "_columnar_write_enabled", lambda: True)
+    monkeypatch.setattr(candle_store, "_columnar_read_enabled", lambda: read_flag)
+    rng = random.Random(7)
+    for step in range(120):
+        ts = step * 60
+        new = [_row(ts - 60, close=rng.random()), _row(ts, close=rng.random(), is_current=True)]
+        upsert_candles(redis_client, KEY, [r for r in new if r["timestamp"] >= 0], max_len=50)
+
+    from_list = read_candles(redis_client, KEY, count=20, columnar=False)
+    from_columns = read_candles(redis_client, KEY, count=20, columnar=True)
+
+    assert [_numeric(r) for r in from_list] == from_columns
+    assert read_candles(redis_client, KEY, count=20) == (from_columns if read_flag else from_list)
+    assert from_columns[-1]["is_current"] is True
+
+
+@pytest.mark.asyncio
+async def test_async_candle_store_falls_back_to_list(monkeypatch, server, redis_client):
+    monkeypatch.setattr(candle_store, "_columnar_read_enabled", lambda: True)
+    upsert_candles(redis_client, KEY, [_row(ts) for ts in range(0, 300, 60)], max_len=50)
+    redis_client.delete(candle_columnar.blob_key(KEY))
+    redis = fakeredis.FakeAsyncRedis(server=server)
+
+    candles = await read_candles_async(redis, KEY, count=2)
+
+    assert [c["timestamp"] for c in candles] == [180, 240]
+    # JSON 리스트에서 읽었으므로 문자열 필드도 포함
+    assert candles[-1]["human_time"] == "2024-01-01 00:00:00"
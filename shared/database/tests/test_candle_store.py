@@ -0,0 +1,134 @@
+"""Unit Tests for the timestamp-keyed candle store
+
+Checks that upsert_candles() produces the same list a full
+LRANGE → dict merge → DELETE → RPUSH rewrite would, using fakeredis.
+
+Run tests:
+    pytest shared/database/tests/test_candle_store.py -v
+"""
+
+import json
+import random
+
+import fakeredis
+import pytest
+
+from shared.database.candle_store import (
+    CSV_FORMAT,
+    decode_candle,
+    decode_candles,
+    keep_existing_merge,
+    read_candles,
+    read_candles_async,
+    read_last_candle,
+    replace_candles,
+    stage_read_candles,
+    upsert_candles,
+)
+
+KEY = "candles_with_indicators:BTC-USDT-SWAP:1m"
+
+
+def _candle(ts, close=100.0, **extra):
+    return {"timestamp": ts, "open": close, "high": close, "low": close, "close": close, "volume": 1.0, **extra}
+
+
+def _reference(existing, new, max_len):
+    merged = {c["timestamp"]: c for c in existing}
+    merged.update({c["timestamp"]: c for c in new})
+    return [merged[ts] for ts in sorted(merged)][-max_len:]
+
+
+@pytest.fixture(params=[True, False], ids=["str", "bytes"])
+def redis_client(request):
+    return fakeredis.FakeRedis(decode_responses=request.param)
+
+
+def test_append_and_replace_tail(redis_client):
+    replace_candles(redis_client, KEY, [_candle(ts) for ts in range(0, 600, 60)], max_len=100)
+
+    written = upsert_candles(redis_client, KEY, [_candle(540, close=101.0), _candle(600)], max_len=100)
+
+    assert [c["timestamp"] for c in written] == [540, 600]
+    candles = read_candles(redis_client, KEY)
+    assert [c["timestamp"] for c in candles] == list(range(0, 660, 60))
+    assert candles[-2]["close"] == 101.0
+
+
+def test_gap_fill_inserts_in_order(redis_client):
+    replace_candles(redis_client, KEY, [_candle(ts) for ts in (0, 60, 300, 360)], max_len=100)
+
+    upsert_candles(redis_client, KEY, [_candle(ts, close=1.0) for ts in (120, 180, 240, 420)], max_len=100)
+
+    assert [c["timestamp"] for c in read_candles(redis_client, KEY)] == list(range(0, 480, 60))
+
+
+def test_unchanged_rows_are_not_written(redis_client):
+    replace_candles(redis_client, KEY, [_candle(ts) for ts in range(0, 300, 60)], max_len=100)
+    assert upsert_candles(redis_client, KEY, [_candle(240)], max_len=100) == []
+
+
+def test_keep_existing_merge_only_adds_new_bars(redis_client):
+    replace_candles(redis_client, KEY, [_candle(ts) for ts in range(0, 300, 60)], max_len=100)
+
+    written = upsert_candles(
+        redis_client, KEY, [_candle(240, close=5.0), _candle(300, close=5.0)],
+        max_len=100, merge=keep_existing_merge,
+    )
+
+    assert [c["timestamp"] for c in written] == [300]
+    assert read_candles(redis_client, KEY, count=2)[0]["close"] == 100.0
+
+
+def test_csv_format_and_trim(redis_client):
+    key = "candles:BTC-USDT-SWAP:1m"
+    upsert_candles(redis_client, key, [_candle(ts) for ts in range(0, 600, 60)], max_len=5, fmt=CSV_FORMAT)
+
+    raw = redis_client.lindex(key, -1)
+    assert (raw.decode() if isinstance(raw, bytes) else raw) == "540,100.0,100.0,100.0,100.0,1.0"
+    assert redis_client.llen(key) == 5
+    assert read_last_candle(redis_client, key)["timestamp"] == 540
+
+
+def test_random_upserts_match_full_rewrite(redis_client):
+    rng = random.Random(3)
+    expected = []
+    for step in range(200):
+        base = step * 60
+        # 대부분은 마지막 바 교체/추가, 가끔 과거 갭 채우기
+        choices = [base, base - 60] + ([rng.randrange(0, base + 1, 60)] if base and rng.random() < 0.2 else [])
+        new = [_candle(ts, close=rng.random()) for ts in choices if ts >= 0]
+        upsert_candles(redis_client, KEY, new, max_len=50)
+        expected = _reference(expected, new, 50)
+
+    items = redis_client.lrange(KEY, 0, -1)
+    assert [decode_candle(item) for item in items] == expected
+
+
+def test_decode_candle_handles_both_formats():
+    assert decode_candle(json.dumps(_candle(60)).encode()) == _candle(60)
+    assert decode_candle("60,1,2,0.5,1.5,10")["high"] == 2.0
+    assert decode_candle("not a candle") is None
+
+
+@pytest.mark.asyncio
+async def test_async_reader():
+    redis = fakeredis.FakeAsyncRedis()
+    await redis.rpush(KEY, *[json.dumps(_candle(ts)) for ts in range(0, 300, 60)])
+
+    candles = await read_candles_async(redis, KEY, count=2)
+
+    assert [c["timestamp"] for c in candles] == [180, 240]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_read_matches_reader():
+    redis = fakeredis.FakeAsyncRedis()
+    await redis.rpush(KEY, *[json.dumps(_candle(ts)) for ts in range(0, 900, 60)])
+
+    pipe = redis.pipeline(transaction=False)
+    pipe.get("other")
+    assert stage_read_candles(pipe, KEY, count=14)
+    _, items = await pipe.execute()
+
+    assert decode_candles(items) == await read_candles_async(redis, KEY, count=14)
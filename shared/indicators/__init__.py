@@ -5,13 +5,19 @@ Shared Indicators Package
 
 사용 예시:
     from shared.indicators import calc_rsi, calc_sma, compute_all_indicators
+
+배열 기반 엔진 (딕셔너리 변환 없이 float64 컬럼으로 계산):
+    from shared.indicators import compute_indicator_arrays
+
+증분 계산 (실시간 캔들 갱신용, 바 단위 O(지표 수)):
+    from shared.indicators import StreamingIndicatorState
 """
 
 # ADX
 from ._adx import calculate_adx, calculate_dm_tr, calculate_tr, rma
 
 # All indicators computation
-from ._all_indicators import compute_all_indicators, add_auto_trend_state_to_candles
+from ._all_indicators import add_auto_trend_state_to_candles, compute_all_indicators, compute_indicator_arrays
 
 # ATR
 from ._atr import calc_atr
@@ -37,9 +43,35 @@ from ._moving_averages import calc_ema, calc_jma, calc_rma, calc_sma, calc_t3, c
 # RSI
 from ._rsi import calc_rsi
 
+# Streaming (incremental) state
+from ._streaming import StreamingIndicatorState
+
 # Trend analysis
 from ._trend import compute_trend_state, rational_quadratic
 
+# Vectorized (NumPy) engine
+from ._vectorized import (
+    align_bucket_closes_np,
+    bucket_closes_np,
+    calc_atr_np,
+    calc_bollinger_bands_np,
+    calc_ema_np,
+    calc_jma_np,
+    calc_rma_np,
+    calc_rsi_np,
+    calc_sma_np,
+    calc_stddev_np,
+    calc_t3_np,
+    calc_vidya_np,
+    candles_to_arrays,
+    mtf_close_minutes,
+    pivothigh_np,
+    pivotlow_np,
+    rational_quadratic_np,
+    resample_close_np,
+    timestamps_to_seconds,
+)
+
 __all__ = [
     # Core
     'crossover',
@@ -76,7 +108,30 @@ __all__ = [
     'hilbert_transform',
     'compute_component',
     'compute_alpha',
+    # Vectorized engine
+    'calc_sma_np',
+    'calc_ema_np',
+    'calc_rma_np',
+    'calc_jma_np',
+    'calc_t3_np',
+    'calc_vidya_np',
+    'calc_rsi_np',
+    'calc_atr_np',
+    'calc_stddev_np',
+    'calc_bollinger_bands_np',
+    'pivothigh_np',
+    'pivotlow_np',
+    'rational_quadratic_np',
+    'resample_close_np',
+    'bucket_closes_np',
+    'align_bucket_closes_np',
+    'mtf_close_minutes',
+    'candles_to_arrays',
+    'timestamps_to_seconds',
     # All
     'compute_all_indicators',
+    'compute_indicator_arrays',
     'add_auto_trend_state_to_candles',
+    # Streaming
+    'StreamingIndicatorState',
 ]
@@ -1,46 +1,16 @@
 """
 ATR (Average True Range) indicator
 """
+from ._vectorized import calc_atr_np, candles_to_arrays
 
 
 def calc_atr(candles: list[dict[str, float]], length: int = 14) -> list[float | None]:
     """
     ATR(Average True Range) 계산
     length: ATR 기간 (기본값 14)
-    """
-    n = len(candles)
-    tr_list = [0.0]*n
-    atr_list: list[float | None] = [None]*n
-
-    # 1) True Range 계산
-    for i in range(n):
-        high = candles[i]["high"]
-        low = candles[i]["low"]
-
-        if i == 0:
-            # 첫 캔들은 고가 - 저가
-            tr_list[i] = high - low
-        else:
-            prev_close = candles[i-1]["close"]
-            # TR = max(고가-저가, |고가-전종가|, |저가-전종가|)
-            tr_list[i] = max(
-                high - low,
-                abs(high - prev_close),
-                abs(low - prev_close)
-            )
 
-    # 2) ATR 계산 (Wilder's Smoothing)
-    for i in range(n):
-        if i < length:
-            # length 미만: 단순평균
-            if i == 0:
-                atr_list[i] = tr_list[i]
-            else:
-                atr_list[i] = sum(tr_list[:i+1]) / (i+1)
-        else:
-            # length 이상: Wilder 공식
-            prev_atr = atr_list[i-1]
-            assert prev_atr is not None, "Previous ATR should be calculated by now"
-            atr_list[i] = (prev_atr * (length-1) + tr_list[i]) / length
-
-    return atr_list
+    TR = max(고가-저가, |고가-전종가|, |저가-전종가|) (첫 캔들은 고가 - 저가),
+    length 미만은 단순평균, 이후 Wilder's Smoothing
+    """
+    cols = candles_to_arrays(candles, fields=("high", "low", "close"))
+    return calc_atr_np(cols["high"], cols["low"], cols["close"], length).tolist()
@@ -276,44 +276,9 @@ def pivothigh(series, left_bars, right_bars):
         list: 각 인덱스의 pivot high 값 (없으면 None)
               인덱스 i의 값은 i-leftbars 위치의 pivot을 나타냄
     """
-    result = [None] * len(series)
-
-    # i >= left_bars + right_bars 필요 (충분한 데이터)
-    for i in range(left_bars + right_bars, len(series)):
-        # pivot 후보: i - left_bars
-        pivot_idx = i - left_bars
-        current = series[pivot_idx]
-
-        # NaN 체크
-        if current is None or (isinstance(current, float) and current != current):
-            continue
-
-        # 좌측 비교: pivot_idx - left_bars ~ pivot_idx - 1
-        is_pivot = True
-        for j in range(pivot_idx - left_bars, pivot_idx):
-            if j < 0:
-                break
-            if series[j] is None:
-                continue
-            if series[j] >= current:
-                is_pivot = False
-                break
-
-        if not is_pivot:
-            continue
-
-        # 우측 비교: pivot_idx + 1 ~ pivot_idx + right_bars
-        for j in range(pivot_idx + 1, min(pivot_idx + right_bars + 1, len(series))):
-            if series[j] is None:
-                continue
-            if series[j] >= current:
-                is_pivot = False
-                break
-
-        if is_pivot:
-            result[i] = current  # i 위치에 저장 (pivot_idx의 값)
+    from ._vectorized import pivot_to_list, pivothigh_np
 
-    return result
+    return pivot_to_list(pivothigh_np(series, left_bars, right_bars))
 
 
 def pivotlow(series, left_bars, right_bars):
@@ -335,44 +300,9 @@ def pivotlow(series, left_bars, right_bars):
         list: 각 인덱스의 pivot low 값 (없으면 None)
               인덱스 i의 값은 i-leftbars 위치의 pivot을 나타냄
     """
-    result = [None] * len(series)
-
-    # i >= left_bars + right_bars 필요 (충분한 데이터)
-    for i in range(left_bars + right_bars, len(series)):
-        # pivot 후보: i - left_bars
-        pivot_idx = i - left_bars
-        current = series[pivot_idx]
-
-        # NaN 체크
-        if current is None or (isinstance(current, float) and current != current):
-            continue
-
-        # 좌측 비교: pivot_idx - left_bars ~ pivot_idx - 1
-        is_pivot = True
-        for j in range(pivot_idx - left_bars, pivot_idx):
-            if j < 0:
-                break
-            if series[j] is None:
-                continue
-            if series[j] <= current:
-                is_pivot = False
-                break
-
-        if not is_pivot:
-            continue
-
-        # 우측 비교: pivot_idx + 1 ~ pivot_idx + right_bars
-        for j in range(pivot_idx + 1, min(pivot_idx + right_bars + 1, len(series))):
-            if series[j] is None:
-                continue
-            if series[j] <= current:
-                is_pivot = False
-                break
-
-        if is_pivot:
-            result[i] = current  # i 위치에 저장 (pivot_idx의 값)
+    from ._vectorized import pivot_to_list, pivotlow_np
 
-    return result
+    return pivot_to_list(pivotlow_np(series, left_bars, right_bars))
 
 
 def dynamic_round(value):
@@ -3,6 +3,8 @@ Moving Average indicators
 """
 import math
 
+from ._vectorized import calc_ema_np, calc_jma_np, calc_sma_np, calc_t3_np, calc_vidya_np
+
 
 def calc_sma(series: list[float], length: int) -> list[float | None]:
     """
@@ -10,40 +12,14 @@ def calc_sma(series: list[float], length: int) -> list[float | None]:
 
     Pine Script's ta.sma() skips NaN values and only averages valid values in the window.
     """
-    n = len(series)
-    out: list[float | None] = [math.nan]*n
-    if length <= 0:
-        return out
-
-    for i in range(n):
-        # Get window: last 'length' values up to and including index i
-        start = max(0, i - length + 1)
-        window = series[start:i+1]
-
-        # Filter out NaN values (Pine Script behavior)
-        valid_values = [v for v in window if not (math.isnan(v) if isinstance(v, float) else False)]
-
-        if len(valid_values) > 0:
-            out[i] = sum(valid_values) / len(valid_values)
-        else:
-            out[i] = math.nan
-
-    return out
+    return calc_sma_np(series, length).tolist()
 
 
 def calc_ema(series, length):
     """Exponential Moving Average"""
     if not series:
         return []
-    alpha = 2 / (length + 1.0)
-    ema_values = []
-    prev = series[0]
-    ema_values.append(prev)
-    for i in range(1, len(series)):
-        curr = series[i] * alpha + prev * (1 - alpha)
-        ema_values.append(curr)
-        prev = curr
-    return ema_values
+    return calc_ema_np(series, length).tolist()
 
 
 def calc_rma(series, length):
@@ -77,29 +53,7 @@ def calc_t3(series, length=5):
     """
     if not series:
         return []
-    # 여러 번 EMA
-    e1 = calc_ema(series, length)
-    e2 = calc_ema(e1, length)
-    e3 = calc_ema(e2, length)
-    e4 = calc_ema(e3, length)
-    e5 = calc_ema(e4, length)
-    e6 = calc_ema(e5, length)
-
-    out = []
-    ab = 0.7
-    ac1 = -ab**3
-    ac2 = 3*ab**2 + 3*ab**3
-    ac3 = -6*ab**2 - 3*ab - 3*ab**3
-    ac4 = 1 + 3*ab + ab**3 + 3*ab**2
-
-    for i in range(len(series)):
-        if math.isnan(e1[i]) or math.isnan(e2[i]) or math.isnan(e3[i]) or \
-           math.isnan(e4[i]) or math.isnan(e5[i]) or math.isnan(e6[i]):
-            out.append(math.nan)
-        else:
-            t3_val = ac1*e6[i] + ac2*e5[i] + ac3*e4[i] + ac4*e3[i]
-            out.append(t3_val)
-    return out
+    return calc_t3_np(series, length).tolist()
 
 
 def calc_vidya(series, smooth_period=9, momentum_source=None):
@@ -116,97 +70,12 @@ def calc_vidya(series, smooth_period=9, momentum_source=None):
     """
     if not series:
         return []
-
-    # momentum_source가 없으면 series 자체를 사용 (기존 동작 유지)
-    if momentum_source is None:
-        momentum_source = series
-
-    result = []
-    # 초깃값
-    vidya_prev = series[0]
-    result.append(vidya_prev)
-
-    for i in range(1, len(series)):
-        # Chande Momentum Oscillator (CMO) 계산 - N=9 고정
-        # Pine Script: for k = 1 to 9, diff = close[k] - close[k-1]
-        # close[k] = k개 전 바, close[k-1] = k-1개 전 바 (close[0] = 현재)
-        sum_up, sum_down = 0.0, 0.0
-        for k in range(1, 10):
-            if i - k < 0:
-                break
-
-            # Pine: close[k] - close[k-1] = (k개 전) - (k-1개 전)
-            # Python: momentum_source[i-k] - momentum_source[i-k+1] = (k개 전) - (k-1개 전)
-            curr_val = momentum_source[i - k]
-            prev_val = momentum_source[i - k + 1]  # 수정: i-k-1 → i-k+1 (Pine의 close[k-1] = k-1개 전)
-            diff = curr_val - prev_val
-
-            if diff > 0:
-                sum_up += diff
-            else:
-                sum_down -= diff
-
-        # CMO 값 계산
-        chande_momentum = 1.0
-        if (sum_up + sum_down) != 0:
-            chande_momentum = abs((sum_up - sum_down) / (sum_up + sum_down))
-
-        # VIDYA 계산: series에 적용 (Pine의 vidya_price = _src)
-        alpha = 2.0 / (smooth_period + 1.0)
-        factor = alpha * chande_momentum
-        vidya_val = vidya_prev + factor * (series[i] - vidya_prev)
-        result.append(vidya_val)
-        vidya_prev = vidya_val
-
-    return result
+    return calc_vidya_np(series, smooth_period, momentum_source=momentum_source).tolist()
 
 
 def calc_jma(series: list[float], length: int = 5, phase: int = 50, power: int = 2) -> list[float | None]:
     """Jurik Moving Average"""
-    n = len(series)
-    out: list[float | None] = [None]*n
-    if n == 0:
-        return out
-
-    if phase < -100:
-        phase_ratio = 0.5
-    elif phase > 100:
-        phase_ratio = 2.5
-    else:
-        phase_ratio = (phase / 100.0) + 1.5
-
-    beta = 0.45*(length-1) / (0.45*(length-1) + 2) if length > 1 else 0
-    alpha1 = beta ** power
-
-    e0 = [0.0]*n
-    e1 = [0.0]*n
-    e2 = [0.0]*n
-    jma= [0.0]*n
-
-    for i in range(n):
-        src = series[i]
-        if i == 0:
-            e0[i] = src
-            e1[i] = 0.0
-            e2[i] = 0.0
-            jma[i]= src
-            out[i] = src
-        else:
-            # JMA 내부 상태는 계속 업데이트 (부드러운 초기화)
-            e0[i] = (1 - alpha1)*src + alpha1*e0[i-1]
-            e1[i] = (src - e0[i])*(1 - beta) + beta*e1[i-1]
-            e2[i] = ( e0[i] + phase_ratio*e1[i] - jma[i-1] ) * ((1 - alpha1)**2) \
-                     + (alpha1**2)*e2[i-1]
-            jma[i] = e2[i] + jma[i-1]
-
-        if i < length:
-            # 길이 부족: 단순평균
-            out[i] = sum(series[:i+1]) / (i+1)
-        else:
-            # 정상 구간: JMA 값
-            out[i] = jma[i]
-
-    return out
+    return calc_jma_np(series, length, phase, power).tolist()
 
 
 def get_ma(source, ma_type, length=20, phase_jma=50, power_jma=2, momentum_source=None):
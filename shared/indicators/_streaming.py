@@ -0,0 +1,578 @@
+"""
+Streaming (incremental) indicator state
+
+compute_all_indicators()가 캔들 배열 전체를 다시 계산하는 것과 달리,
+(심볼, 타임프레임)별 상태 객체에 누산기와 고정 길이 윈도우만 유지하여
+새 바 추가(update) / 진행 중인 바 갱신(replace_last)을 바 개수와 무관한
+비용으로 처리합니다.
+
+원칙:
+- 결과는 compute_all_indicators(candles) (MTF 리샘플링 없음, 기본 Trend 설정)의
+  마지막 바 값과 비트 단위로 동일해야 함 → 덧셈 순서를 배열 엔진과 맞춤
+- replace_last()는 마지막 바 적용 직전 상태(스냅샷)로 되돌린 후 다시 적용
+- to_dict()/from_dict()로 Redis 등에 체크포인트 가능 (스냅샷 + 마지막 바 저장)
+
+제약:
+- use_longer_trend / MTF 캔들(candles_higher_tf 등) / current_timeframe_minutes는
+  미래 바를 포함하는 리샘플링에 의존하므로 지원하지 않습니다.
+"""
+import math
+from collections import deque
+
+import numpy as np
+
+from ._core import dynamic_round
+
+# compute_indicator_arrays()와 동일한 고정 길이
+SMA_LENGTHS = (5, 20, 50, 100, 200)
+EMA_LENGTHS = (5, 7, 14, 20, 200)
+JMA_LENGTHS = (5, 10, 20)
+BB_LENGTH = 20
+BB_MULT = 2.0
+
+# _calc_bb_state_from_closes() 상수
+BBW_2ND_LENGTH = 60
+PIVOT_LEFT = 20
+PIVOT_RIGHT = 10
+PIVOT_LEFT_2ND = 30
+PIVOT_RIGHT_2ND = 10
+PIVOT_ARRAY_SIZE = 50
+MULT_PLPH = 0.7
+
+# T3 가중치 (calc_t3_np와 동일한 식)
+_T3_AB = 0.7
+_T3_AC1 = -_T3_AB**3
+_T3_AC2 = 3*_T3_AB**2 + 3*_T3_AB**3
+_T3_AC3 = -6*_T3_AB**2 - 3*_T3_AB - 3*_T3_AB**3
+_T3_AC4 = 1 + 3*_T3_AB + _T3_AB**3 + 3*_T3_AB**2
+
+STATE_VERSION = 1
+
+
+def _nan_mean(window):
+    """NaN을 건너뛰는 평균 (calc_sma_np와 같은 덧셈 순서: 오래된 값부터)"""
+    total = 0.0
+    count = 0
+    for v in window:
+        if v == v:
+            total += v
+            count += 1
+    return total / count if count else math.nan
+
+
+def _is_pivot(history, left_bars, right_bars, is_high):
+    """
+    history[-1]이 현재 바일 때 pivothigh_np/pivotlow_np의 현재 바 값 (없으면 NaN)
+
+    left_bars >= right_bars인 경우만 인과적(미래 바 불필요)이므로 그 경우만 사용합니다.
+    """
+    n = len(history)
+    pos = n - 1 - left_bars
+    if pos < right_bars:
+        # 바 인덱스 < left + right
+        return math.nan
+    current = history[pos]
+    if current != current:
+        return math.nan
+    if pos - left_bars >= 0:
+        for j in range(pos - left_bars, pos):
+            neighbor = history[j]
+            if (neighbor >= current) if is_high else (neighbor <= current):
+                return math.nan
+    for j in range(pos + 1, pos + right_bars + 1):
+        neighbor = history[j]
+        if (neighbor >= current) if is_high else (neighbor <= current):
+            return math.nan
+    return current
+
+
+class StreamingIndicatorState:
+    """
+    compute_all_indicators()의 증분 버전 (바 단위 O(지표 수))
+
+    사용 예:
+        state = StreamingIndicatorState.from_candles(candles)
+        values = state.update(new_bar)        # 새 바 추가
+        values = state.replace_last(tick_bar) # 진행 중인 바 갱신
+
+    반환되는 dict는 compute_all_indicators()가 캔들에 기록하는 값과 같습니다
+    (dynamic_round 적용, bb_upper/bb_lower는 초기 19개 바에서 None).
+    """
+
+    def __init__(self, rsi_period=14, atr_period=14,
+                 use_custom_length=False,
+                 custom_length=10,
+                 rq_lookback=30,
+                 rq_rel_weight=0.5,
+                 rq_start_bar=5,
+                 bb_length=15,
+                 bb_mult=1.5,
+                 bb_ma_len=100,
+                 ):
+        self.rsi_period = rsi_period
+        self.atr_period = atr_period
+        self.use_custom_length = use_custom_length
+        self.custom_length = custom_length
+        self.rq_lookback = rq_lookback
+        self.rq_rel_weight = rq_rel_weight
+        self.rq_start_bar = rq_start_bar
+        self.bb_length = bb_length
+        self.bb_mult = bb_mult
+        self.bb_ma_len = bb_ma_len
+
+        # Trend State MA 길이 (compute_indicator_arrays (A)와 동일)
+        if use_custom_length:
+            self.cycle_lengths = (max(custom_length+1, 1), round(custom_length * 2.6), round(custom_length * 4.8))
+            self.cycle_type = "T3"
+        else:
+            self.cycle_lengths = (5, 10, 20)
+            self.cycle_type = "JMA"
+        self._jma_lengths = tuple(sorted(set(JMA_LENGTHS) | (set(self.cycle_lengths) if self.cycle_type == "JMA" else set())))
+        self._rq_weights = [
+            (1.0 + (lag**2) / ((rq_lookback**2) * 2 * rq_rel_weight))**(-rq_rel_weight)
+            for lag in range(1 + rq_start_bar + 1)
+        ]
+
+        # 윈도우 최대 길이 (stddev는 빠져나가는 값까지 필요하므로 +1)
+        self._maxlen = {
+            "closes": max(max(SMA_LENGTHS), BB_LENGTH, bb_length + 1, BBW_2ND_LENGTH + 1),
+            "bbw": max(bb_ma_len, 2*PIVOT_LEFT + 1, 4),
+            "bbw_2nd": 2*PIVOT_LEFT_2ND + 1,
+            "ph_array": PIVOT_ARRAY_SIZE,
+            "pl_array": PIVOT_ARRAY_SIZE,
+            "pl_array_2nd": PIVOT_ARRAY_SIZE,
+            "rsi_gains": rsi_period,
+            "rsi_losses": rsi_period,
+            "ma1": rq_start_bar + 2,
+            "ma2": rq_start_bar + 2,
+            "ma3": rq_start_bar + 2,
+        }
+
+        self._state = self._initial_state()
+        self._committed = None   # 마지막 바 적용 직전 상태
+        self._last_bar = None
+        self._last_values = None
+
+    # ------------------------------------------------------------------
+    # 상태 관리
+    # ------------------------------------------------------------------
+    def _initial_state(self):
+        state = {
+            "count": 0,
+            "prev_close": math.nan,
+            # RSI (Wilder)
+            "avg_gain": 0.0,
+            "avg_loss": 0.0,
+            # ATR
+            "tr_sum": 0.0,
+            "atr": math.nan,
+            # Stddev 러닝 합 (bb_length, 60)
+            "sd1_sum": 0.0, "sd1_sum_sq": 0.0,
+            "sd2_sum": 0.0, "sd2_sum_sq": 0.0,
+            # BB_State
+            "ph_avg": None, "pl_avg": None, "pl_avg_2nd": None,
+            "prev_buzz": math.nan,
+            "bbw_2nd_squeeze": True,
+            "bb_state": 0,
+            "trend_state": 0,
+        }
+        for name, maxlen in self._maxlen.items():
+            state[name] = deque(maxlen=maxlen)
+        for length in EMA_LENGTHS:
+            state[f"ema{length}"] = math.nan
+        for length in self._jma_lengths:
+            # [e0, e1, e2, jma, 누적합]
+            state[f"jma{length}"] = [math.nan, 0.0, 0.0, math.nan, 0.0]
+        if self.cycle_type == "T3":
+            for length in self.cycle_lengths:
+                state[f"t3_{length}"] = [math.nan] * 6
+        return state
+
+    @staticmethod
+    def _copy_state(state):
+        return {k: (v.copy() if isinstance(v, (deque, list)) else v) for k, v in state.items()}
+
+    @property
+    def count(self):
+        """적용된 바 개수"""
+        return self._state["count"]
+
+    @property
+    def last_timestamp(self):
+        """마지막으로 적용된 바의 timestamp (없으면 None)"""
+        return self._last_bar.get("timestamp") if self._last_bar else None
+
+    @property
+    def last_values(self):
+        """마지막 바의 지표 값 (update/replace_last 반환값과 동일)"""
+        return self._last_values
+
+    def update(self, bar):
+        """새 바를 추가하고 해당 바의 지표 값을 반환"""
+        self._committed = self._copy_state(self._state)
+        return self._apply(bar)
+
+    def replace_last(self, bar):
+        """마지막 바를 bar로 교체(진행 중인 캔들 갱신)하고 지표 값을 반환"""
+        if self._committed is None:
+            raise ValueError("replace_last() requires at least one bar")
+        self._state = self._copy_state(self._committed)
+        return self._apply(bar)
+
+    @classmethod
+    def from_candles(cls, candles, **params):
+        """캔들 리스트(과거->현재)를 순서대로 적용한 상태 생성"""
+        state = cls(**params)
+        if not candles:
+            return state
+        # 마지막 바를 제외하면 스냅샷이 필요 없으므로 바로 적용
+        for candle in candles[:-1]:
+            state._apply(candle)
+        state.update(candles[-1])
+        return state
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+    # ------------------------------------------------------------------
+    def params(self):
+        return {
+            "rsi_period": self.rsi_period,
+            "atr_period": self.atr_period,
+            "use_custom_length": self.use_custom_length,
+            "custom_length": self.custom_length,
+            "rq_lookback": self.rq_lookback,
+            "rq_rel_weight": self.rq_rel_weight,
+            "rq_start_bar": self.rq_start_bar,
+            "bb_length": self.bb_length,
+            "bb_mult": self.bb_mult,
+            "bb_ma_len": self.bb_ma_len,
+        }
+
+    def to_dict(self):
+        """
+        상태를 JSON 직렬화 가능한 dict로 변환
+
+        마지막 바 적용 직전 상태와 마지막 바를 저장하므로, 복원 후에도
+        replace_last()를 그대로 사용할 수 있습니다.
+        """
+        base = self._committed if self._committed is not None else self._state
+        return {
+            "version": STATE_VERSION,
+            "params": self.params(),
+            "state": {k: (list(v) if isinstance(v, (deque, list)) else v) for k, v in base.items()},
+            "last_bar": self._last_bar,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict() 결과에서 상태 복원"""
+        if data.get("version") != STATE_VERSION:
+            raise ValueError(f"Unsupported indicator state version: {data.get('version')}")
+        state = cls(**data["params"])
+        restored = state._initial_state()
+        for key, value in data["state"].items():
+            if key not in restored:
+                raise ValueError(f"Unknown indicator state field: {key}")
+            if isinstance(restored[key], deque):
+                restored[key].extend(value)
+            else:
+                restored[key] = value
+        state._state = restored
+        if data.get("last_bar") is not None:
+            state.update(data["last_bar"])
+        return state
+
+    # ------------------------------------------------------------------
+    # 계산
+    # ------------------------------------------------------------------
+    def _apply(self, bar):
+        s = self._state
+        high = float(bar["high"])
+        low = float(bar["low"])
+        close = float(bar["close"])
+        i = s["count"]
+        prev_close = s["prev_close"]
+
+        closes = s["closes"]
+        closes.append(close)
+        window = list(closes)
+        out = {}
+
+        # 1) SMA (NaN 스킵, 부분 윈도우)
+        for length in SMA_LENGTHS:
+            out[f"sma{length}"] = _nan_mean(window[-length:])
+        out["sma60"] = out["sma50"]
+
+        # JMA (초기 length개는 누적 평균)
+        jma_values = {}
+        for length in self._jma_lengths:
+            jma_values[length] = self._update_jma(s[f"jma{length}"], close, i, length)
+        for length in JMA_LENGTHS:
+            out[f"jma{length}"] = jma_values[length]
+
+        # EMA (첫 값으로 시드)
+        for length in EMA_LENGTHS:
+            key = f"ema{length}"
+            if i == 0:
+                s[key] = close
+            else:
+                alpha = 2 / (length + 1.0)
+                s[key] = close * alpha + s[key] * (1 - alpha)
+            out[key] = s[key]
+
+        # 3) RSI / ATR
+        out["rsi"] = self._update_rsi(s, close, prev_close, i)
+        out["atr14"] = self._update_atr(s, high, low, prev_close, i)
+
+        # 4) Bollinger Bands(20, mult=2)
+        middle = out["sma20"]
+        if i >= BB_LENGTH - 1:
+            stdev = float(np.std(np.array(window[-BB_LENGTH:]), ddof=1))
+            out["bb_upper"] = middle + BB_MULT*stdev
+            out["bb_lower"] = middle - BB_MULT*stdev
+        else:
+            out["bb_upper"] = math.nan
+            out["bb_lower"] = math.nan
+        out["bb_middle"] = middle
+
+        # Trend State: CYCLE MA → rationalQuadratic
+        ms = []
+        for slot, length in zip(("ma1", "ma2", "ma3"), self.cycle_lengths):
+            if self.cycle_type == "T3":
+                value = self._update_t3(s[f"t3_{length}"], close, i, length)
+            else:
+                value = jma_values[length]
+            history = s[slot]
+            history.append(value)
+            ms.append(self._rational_quadratic(history))
+        m1, m2, m3 = ms
+        cycle_bull = (m1 > m2 and m2 > m3) or (m2 > m1 and m1 > m3)
+        cycle_bear = m3 > m2 and m2 > m1
+
+        # BB_State (MTF 없음 → BB_State_MTF와 동일)
+        bb_state = self._update_bb_state(s, window, close, i)
+
+        prev_state = s["trend_state"]
+        if cycle_bull and bb_state == 2:
+            trend_state = 2
+        elif prev_state == 2 and not cycle_bull:
+            trend_state = 0
+        elif cycle_bear and bb_state == -2:
+            trend_state = -2
+        elif prev_state == -2 and not cycle_bear:
+            trend_state = 0
+        else:
+            trend_state = prev_state
+        s["trend_state"] = trend_state
+
+        s["prev_close"] = close
+        s["count"] = i + 1
+
+        values = {name: dynamic_round(out[name]) for name in (
+            "sma5", "sma20", "sma50", "sma60", "sma100", "sma200",
+            "jma5", "jma10", "jma20",
+            "ema5", "ema7", "ema14", "ema20", "ema200",
+            "rsi",
+            "bb_upper", "bb_middle", "bb_lower",
+            "atr14",
+        )}
+        if i < BB_LENGTH - 1:
+            values["bb_upper"] = None
+            values["bb_lower"] = None
+        values["CYCLE_Bull"] = bool(cycle_bull)
+        values["CYCLE_Bear"] = bool(cycle_bear)
+        values["BB_State"] = bb_state
+        values["trend_state"] = trend_state
+
+        self._last_bar = {k: bar[k] for k in ("timestamp", "open", "high", "low", "close", "volume") if k in bar}
+        self._last_values = values
+        return values
+
+    @staticmethod
+    def _update_jma(st, src, i, length, phase=50, power=2):
+        """calc_jma_np의 한 스텝 (st = [e0, e1, e2, jma, 누적합])"""
+        phase_ratio = (phase / 100.0) + 1.5
+        beta = 0.45*(length-1) / (0.45*(length-1) + 2) if length > 1 else 0
+        alpha1 = beta ** power
+        if i == 0:
+            st[0] = src
+            st[1] = 0.0
+            st[2] = 0.0
+            st[3] = src
+            st[4] = src
+        else:
+            e0 = (1 - alpha1)*src + alpha1*st[0]
+            e1 = (src - e0)*(1 - beta) + beta*st[1]
+            e2 = (e0 + phase_ratio*e1 - st[3]) * ((1 - alpha1)**2) + (alpha1**2)*st[2]
+            st[0], st[1], st[2] = e0, e1, e2
+            st[3] = e2 + st[3]
+            st[4] = st[4] + src
+        if i < length:
+            return st[4] / (i + 1)
+        return st[3]
+
+    @staticmethod
+    def _update_t3(st, src, i, length):
+        """calc_t3_np의 한 스텝 (st = EMA 6단계)"""
+        if i == 0:
+            for k in range(6):
+                st[k] = src
+        else:
+            alpha = 2 / (length + 1.0)
+            keep = 1 - alpha
+            value = src
+            for k in range(6):
+                st[k] = value * alpha + st[k] * keep
+                value = st[k]
+        return _T3_AC1*st[5] + _T3_AC2*st[4] + _T3_AC3*st[3] + _T3_AC4*st[2]
+
+    def _update_rsi(self, s, close, prev_close, i):
+        """calc_rsi_np의 한 스텝"""
+        period = self.rsi_period
+        delta = 0.0 if i == 0 else close - prev_close
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i < period:
+            # 첫 period개 gain/loss는 np.mean 시드용으로 보관
+            s["rsi_gains"].append(gain)
+            s["rsi_losses"].append(loss)
+            return 0.0
+        if i == period:
+            s["avg_gain"] = float(np.mean(np.array(s["rsi_gains"])))
+            s["avg_loss"] = float(np.mean(np.array(s["rsi_losses"])))
+        else:
+            s["avg_gain"] = (s["avg_gain"] * (period-1) + gain) / period
+            s["avg_loss"] = (s["avg_loss"] * (period-1) + loss) / period
+        avg_loss = s["avg_loss"]
+        rs = s["avg_gain"] / (1e-10 if avg_loss == 0 else avg_loss)
+        return 100 - (100 / (1 + rs))
+
+    def _update_atr(self, s, high, low, prev_close, i):
+        """calc_atr_np의 한 스텝"""
+        length = self.atr_period
+        tr = high - low
+        if i > 0:
+            for candidate in (abs(high - prev_close), abs(low - prev_close)):
+                if candidate > tr:
+                    tr = candidate
+        if i < length:
+            s["tr_sum"] = s["tr_sum"] + tr
+            s["atr"] = s["tr_sum"] / (i + 1)
+        else:
+            s["atr"] = (s["atr"] * (length-1) + tr) / length
+        return s["atr"]
+
+    def _rational_quadratic(self, history):
+        """rational_quadratic_np의 현재 바 값 (history[-1] = 현재)"""
+        w_sum = 0.0
+        val_sum = 0.0
+        n = len(history)
+        for lag, w in enumerate(self._rq_weights):
+            if lag >= n:
+                break
+            y = history[n - 1 - lag]
+            if y == y:
+                w_sum += w
+                val_sum += y * w
+        return val_sum / w_sum if w_sum > 0 else history[-1]
+
+    @staticmethod
+    def _update_stddev(s, prefix, window, length, i):
+        """calc_stddev_np의 한 스텝 (러닝 합: 더하기 → 빼기 순서)"""
+        value = window[-1]
+        s[f"{prefix}_sum"] = s[f"{prefix}_sum"] + value
+        s[f"{prefix}_sum_sq"] = s[f"{prefix}_sum_sq"] + value * value
+        if i >= length:
+            old = window[-length - 1]
+            s[f"{prefix}_sum"] = s[f"{prefix}_sum"] - old
+            s[f"{prefix}_sum_sq"] = s[f"{prefix}_sum_sq"] - old * old
+        if i < length - 1:
+            return math.nan
+        mean = s[f"{prefix}_sum"] / length
+        var = (s[f"{prefix}_sum_sq"] / length) - (mean * mean)
+        return math.sqrt(var) if var > 0 else 0.0
+
+    @staticmethod
+    def _bbw(close, basis, stdev, mult):
+        """_calc_bbw의 한 스텝 → (bbw, bbr)"""
+        upper = basis + mult * stdev
+        lower = basis - mult * stdev
+        width = upper - lower
+        bbw = width * 10.0 / basis if basis != 0 else math.nan
+        bbr = (close - lower) / width if width != 0 else math.nan
+        return bbw, bbr
+
+    @staticmethod
+    def _push_pivot(s, key, avg_key, pivot, collect):
+        """_running_pivot_avg의 한 스텝: collect 바에서만 배열/평균 갱신"""
+        if collect:
+            array = s[key]
+            array.append(pivot)
+            s[avg_key] = sum(array) / len(array)
+        return s[avg_key]
+
+    def _update_bb_state(self, s, window, close, i):
+        """_calc_bb_state_from_closes의 한 스텝"""
+        # BBW 1st
+        basis = _nan_mean(window[-self.bb_length:])
+        stdev = self._update_stddev(s, "sd1", window, self.bb_length, i)
+        bbw, bbr = self._bbw(close, basis, stdev, self.bb_mult)
+        bbw_hist = s["bbw"]
+        prev_bbw = bbw_hist[-1] if bbw_hist else math.nan
+        bbw_hist.append(bbw)
+        bbw_list = list(bbw_hist)
+        bbw_ma = _nan_mean(bbw_list[-self.bb_ma_len:])
+
+        ph = _is_pivot(bbw_list, PIVOT_LEFT, PIVOT_RIGHT, is_high=True)
+        pl = _is_pivot(bbw_list, PIVOT_LEFT, PIVOT_RIGHT, is_high=False)
+        ph_avg = self._push_pivot(s, "ph_array", "ph_avg", ph, bbw > bbw_ma and ph > 0)
+        pl_avg = self._push_pivot(s, "pl_array", "pl_avg", pl, bbw < bbw_ma and pl > 0)
+        if ph_avg is None:
+            ph_avg = 5.0 if bbw != bbw else (5.0 if 5 > bbw else bbw)
+        if pl_avg is None:
+            pl_avg = 5.0 if bbw != bbw else (5.0 if 5 < bbw else bbw)
+        buzz = ph_avg * MULT_PLPH
+        squeeze = pl_avg * (1 / MULT_PLPH)
+
+        # BBW 2nd
+        basis_2nd = _nan_mean(window[-BBW_2ND_LENGTH:])
+        stdev_2nd = self._update_stddev(s, "sd2", window, BBW_2ND_LENGTH, i)
+        bbw_2nd, _ = self._bbw(close, basis_2nd, stdev_2nd, self.bb_mult)
+        bbw_2nd_hist = s["bbw_2nd"]
+        bbw_2nd_hist.append(bbw_2nd)
+        pl_2nd = _is_pivot(list(bbw_2nd_hist), PIVOT_LEFT_2ND, PIVOT_RIGHT_2ND, is_high=False)
+        pl_avg_2nd = self._push_pivot(s, "pl_array_2nd", "pl_avg_2nd", pl_2nd, bbw_2nd < 1 and pl_2nd > 0)
+        if pl_avg_2nd is None:
+            pl_avg_2nd = 5.0 if bbw_2nd != bbw_2nd else (5.0 if 5 < bbw_2nd else bbw_2nd)
+        squeeze_2nd = pl_avg_2nd * (1 / MULT_PLPH)
+        if bbw_2nd > squeeze_2nd or bbw_2nd < squeeze_2nd:
+            s["bbw_2nd_squeeze"] = bbw_2nd < squeeze_2nd
+
+        prev_buzz = s["prev_buzz"]
+        s["prev_buzz"] = buzz
+
+        current_state = s["bb_state"]
+        if i == 0:
+            return current_state
+        if bbw != bbw or bbr != bbr or buzz != buzz or squeeze != squeeze:
+            return current_state
+
+        crossed = bbw > buzz and prev_bbw <= prev_buzz
+        rising1 = not (bbw <= prev_bbw)
+        falling3 = i >= 3 and all(not (bbw_list[-k] >= bbw_list[-k - 1]) for k in (1, 2, 3))
+
+        if crossed:
+            current_state = 2 if bbr > 0.5 else -2
+        if bbw < squeeze and s["bbw_2nd_squeeze"]:
+            current_state = -1
+        if current_state == 2 and bbr < 0.2:
+            current_state = -2
+        if current_state == -2 and bbr > 0.8:
+            current_state = 2
+        if (current_state == 2 or current_state == -2) and falling3:
+            current_state = 0
+        if bbw > pl_avg and current_state == -1 and rising1:
+            current_state = 0
+
+        s["bb_state"] = current_state
+        return current_state
@@ -6,6 +6,7 @@ import math
 from ._bollinger import calc_stddev
 from ._core import crossover, rising, falling, pivothigh, pivotlow, resample_candles, resample_candles_raw
 from ._moving_averages import calc_sma, get_ma
+from ._vectorized import rational_quadratic_np
 
 
 def _forward_fill_mtf_to_current_tf(candles_current, candles_mtf, mtf_values, is_backtest=True, debug_name=None):
@@ -371,43 +372,7 @@ def rational_quadratic(series, lookback=30, relative_weight=0.5, start_at_bar=5)
 
     중요: Pine Script에서 _size는 항상 1! lookback이 아님!
     """
-    import math
-    N = len(series)
-    out = []
-
-    # Pine Script의 _size = array.size(array.from(_src)) = 1
-    _size = 1
-
-    for curr_idx in range(N):
-        w_sum = 0.0
-        val_sum = 0.0
-
-        # Pine: for i = 0 to _size + startAtBar = for i = 0 to 6 (7개 반복: i=0,1,2,3,4,5,6)
-        for lag in range(_size + start_at_bar + 1):  # +1 because "to" is inclusive in Pine
-            look_back_idx = curr_idx - lag
-
-            # 인덱스 범위 체크
-            if look_back_idx < 0:
-                break
-
-            y = series[look_back_idx]
-
-            # NaN 처리 (Pine의 nz() 동작)
-            if math.isnan(y):
-                continue
-
-            # Weight: (1 + (lag^2 / (lookback^2 * 2 * relative_weight)))^(-relative_weight)
-            w = (1.0 + (lag**2) / ((lookback**2) * 2 * relative_weight))**(-relative_weight)
-            w_sum += w
-            val_sum += y * w
-
-        # 가중치 합이 0이면 현재 값 사용 (데이터 부족)
-        if w_sum > 0:
-            out.append(val_sum / w_sum)
-        else:
-            out.append(series[curr_idx] if curr_idx < len(series) else 0)
-
-    return out
+    return rational_quadratic_np(series, lookback, relative_weight, start_at_bar).tolist()
 
 
 def compute_trend_state(
@@ -0,0 +1,637 @@
+"""
+Vectorized (NumPy) indicator engine
+
+OHLCV를 연속된 float64 배열로 받아 지표를 계산하는 컬럼 기반 엔진입니다.
+기존 리스트/딕셔너리 API(calc_sma, compute_all_indicators 등)는 이 모듈의
+얇은 어댑터로 동작합니다.
+
+원칙:
+- NaN/None 배치는 기존 Pine 호환 구현과 완전히 동일해야 함
+- 덧셈 순서를 기존 루프와 동일하게 유지 (윈도우 합은 오프셋별 누적,
+  러닝 합은 cumsum) → 대부분의 결과가 비트 단위로 일치
+- 재귀형 지표(EMA/JMA/VIDYA/Wilder)는 상태 의존이라 스칼라 루프로 남기되,
+  numpy 스칼라 인덱싱 대신 Python float 위에서 돌려 오버헤드를 줄임
+"""
+import math
+from datetime import datetime
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from ._core import dynamic_round
+
+# Pine Script "자동" 로직 상수 (Line 32, 212, 355)
+CYCLE_2ND_MINUTES = 240
+
+
+def as_float_array(series) -> np.ndarray:
+    """리스트/배열을 연속된 float64 배열로 변환 (None은 NaN으로 취급)"""
+    if isinstance(series, np.ndarray) and series.dtype == np.float64:
+        return np.ascontiguousarray(series)
+    return np.array([math.nan if v is None else v for v in series], dtype=np.float64)
+
+
+def timestamps_to_seconds(candles) -> np.ndarray:
+    """
+    캔들 timestamp를 초 단위 int64 배열로 변환
+
+    resample_candles()와 동일한 규칙: ISO 문자열, datetime, 숫자(int 변환) 지원
+    """
+    out = np.empty(len(candles), dtype=np.int64)
+    for i, candle in enumerate(candles):
+        ts = candle["timestamp"]
+        if isinstance(ts, str):
+            out[i] = int(datetime.fromisoformat(ts.replace('Z', '+00:00')).timestamp())
+        elif isinstance(ts, datetime):
+            out[i] = int(ts.timestamp())
+        else:
+            out[i] = int(ts)
+    return out
+
+
+def candles_to_arrays(candles, fields=("open", "high", "low", "close")) -> dict[str, np.ndarray]:
+    """딕셔너리 캔들 리스트 → 컬럼별 float64 배열"""
+    return {
+        field: np.fromiter((c[field] for c in candles), dtype=np.float64, count=len(candles))
+        for field in fields
+    }
+
+
+# =============================================================================
+# Moving averages
+# =============================================================================
+
+def calc_sma_np(series, length: int) -> np.ndarray:
+    """
+    NaN을 건너뛰는 SMA (Pine ta.sma 동작, calc_sma와 동일)
+
+    윈도우 내 유효값만 평균하며, 초기 구간은 부분 윈도우 평균입니다.
+    오프셋별로 오래된 값부터 누적하므로 Python sum()과 덧셈 순서가 같습니다.
+    """
+    x = as_float_array(series)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if length <= 0 or n == 0:
+        return out
+
+    valid = ~np.isnan(x)
+    values = np.where(valid, x, 0.0)
+    counts = valid.astype(np.int64)
+
+    width = min(length, n)
+    acc = np.zeros(n)
+    cnt = np.zeros(n, dtype=np.int64)
+    # k번째 오프셋: 인덱스 i의 윈도우에서 (width-1-k)개 이전 값
+    for k in range(width):
+        lag = width - 1 - k
+        if lag == 0:
+            acc += values
+            cnt += counts
+        else:
+            acc[lag:] += values[:-lag]
+            cnt[lag:] += counts[:-lag]
+
+    has_value = cnt > 0
+    out[has_value] = acc[has_value] / cnt[has_value]
+    return out
+
+
+def calc_ema_np(series, length) -> np.ndarray:
+    """EMA (첫 값으로 시드, calc_ema와 동일)"""
+    x = as_float_array(series)
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+    alpha = 2 / (length + 1.0)
+    keep = 1 - alpha
+    values = x.tolist()
+    out = [0.0] * n
+    prev = values[0]
+    out[0] = prev
+    for i in range(1, n):
+        prev = values[i] * alpha + prev * keep
+        out[i] = prev
+    return np.array(out)
+
+
+def calc_rma_np(series, length: int) -> np.ndarray:
+    """
+    Wilder RMA (인덱스 정렬 버전)
+
+    calc_rma는 길이가 줄어든 리스트를 반환하지만, 여기서는 원본과 같은 길이로
+    정렬합니다: ``calc_rma_np(x, L)[L-1:] == calc_rma(x, L)`` (len(x) >= L).
+    """
+    x = as_float_array(series)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n == 0:
+        return out
+    seed_len = length if n >= length else n
+    prev = float(np.cumsum(x[:seed_len])[-1]) / seed_len
+    out[seed_len - 1] = prev
+    alpha = 1.0 / length
+    values = x.tolist()
+    for i in range(length, n):
+        prev = alpha * values[i] + (1 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+def calc_t3_np(series, length=5) -> np.ndarray:
+    """T3 이동평균 (EMA 6회 적용 후 가중 결합)"""
+    x = as_float_array(series)
+    if len(x) == 0:
+        return np.empty(0)
+    e1 = calc_ema_np(x, length)
+    e2 = calc_ema_np(e1, length)
+    e3 = calc_ema_np(e2, length)
+    e4 = calc_ema_np(e3, length)
+    e5 = calc_ema_np(e4, length)
+    e6 = calc_ema_np(e5, length)
+
+    ab = 0.7
+    ac1 = -ab**3
+    ac2 = 3*ab**2 + 3*ab**3
+    ac3 = -6*ab**2 - 3*ab - 3*ab**3
+    ac4 = 1 + 3*ab + ab**3 + 3*ab**2
+    return ac1*e6 + ac2*e5 + ac3*e4 + ac4*e3
+
+
+def chande_momentum_np(momentum_source, window: int = 9) -> np.ndarray:
+    """
+    VIDYA용 |CMO| (Pine FuncVIDYA, N=9 고정)
+
+    바 i에서 k=1..window에 대해 diff = src[i-k] - src[i-k+1]을 순서대로 누적합니다.
+    합이 0이면 1.0을 반환합니다.
+    """
+    m = as_float_array(momentum_source)
+    n = len(m)
+    sum_up = np.zeros(n)
+    sum_down = np.zeros(n)
+    for k in range(1, window + 1):
+        if k >= n:
+            break
+        # Pine: close[k] - close[k-1]
+        diff = m[:n - k] - m[1:n - k + 1]
+        up = diff > 0
+        sum_up[k:] += np.where(up, diff, 0.0)
+        sum_down[k:] -= np.where(up, 0.0, diff)
+
+    total = sum_up + sum_down
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cmo = np.abs((sum_up - sum_down) / total)
+    return np.where(total != 0, cmo, 1.0)
+
+
+def calc_vidya_np(series, smooth_period=9, momentum_source=None) -> np.ndarray:
+    """VIDYA (calc_vidya와 동일, CMO는 벡터화)"""
+    x = as_float_array(series)
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+    cmo = chande_momentum_np(x if momentum_source is None else momentum_source)
+
+    alpha = 2.0 / (smooth_period + 1.0)
+    values = x.tolist()
+    factors = cmo.tolist()
+    out = [0.0] * n
+    prev = values[0]
+    out[0] = prev
+    for i in range(1, n):
+        prev = prev + (alpha * factors[i]) * (values[i] - prev)
+        out[i] = prev
+    return np.array(out)
+
+
+def calc_jma_np(series, length: int = 5, phase: int = 50, power: int = 2) -> np.ndarray:
+    """Jurik Moving Average (calc_jma와 동일, 초기 length개는 누적 평균)"""
+    x = as_float_array(series)
+    n = len(x)
+    if n == 0:
+        return np.empty(0)
+
+    if phase < -100:
+        phase_ratio = 0.5
+    elif phase > 100:
+        phase_ratio = 2.5
+    else:
+        phase_ratio = (phase / 100.0) + 1.5
+
+    beta = 0.45*(length-1) / (0.45*(length-1) + 2) if length > 1 else 0
+    alpha1 = beta ** power
+    one_minus_alpha1 = 1 - alpha1
+    one_minus_beta = 1 - beta
+    e2_gain = (1 - alpha1)**2
+    e2_decay = alpha1**2
+
+    values = x.tolist()
+    out = [0.0] * n
+    e0 = values[0]
+    e1 = 0.0
+    e2 = 0.0
+    jma = values[0]
+    out[0] = jma
+    for i in range(1, n):
+        src = values[i]
+        e0 = one_minus_alpha1*src + alpha1*e0
+        e1 = (src - e0)*one_minus_beta + beta*e1
+        e2 = (e0 + phase_ratio*e1 - jma) * e2_gain + e2_decay*e2
+        jma = e2 + jma
+        out[i] = jma
+
+    result = np.array(out)
+    warmup = min(max(length, 0), n)
+    if warmup > 0:
+        # 길이 부족 구간: 단순 누적 평균 (cumsum은 Python sum과 같은 순서로 누적)
+        result[:warmup] = np.cumsum(x[:warmup]) / np.arange(1, warmup + 1)
+    return result
+
+
+# =============================================================================
+# RSI / ATR / Bollinger
+# =============================================================================
+
+def calc_rsi_np(prices, period: int = 14) -> np.ndarray:
+    """RSI (calc_rsi와 동일, Wilder 평균은 Python float 루프)"""
+    try:
+        x = as_float_array(prices)
+        n = len(x)
+        deltas = np.empty(n)
+        deltas[0] = 0
+        deltas[1:] = np.diff(x)
+
+        gains = np.where(deltas > 0, deltas, 0)
+        losses = np.where(deltas < 0, -deltas, 0)
+
+        avg_gain = np.zeros(n)
+        avg_loss = np.zeros(n)
+        avg_gain[period] = np.mean(gains[:period])
+        avg_loss[period] = np.mean(losses[:period])
+
+        gain_list = gains.tolist()
+        loss_list = losses.tolist()
+        ag = float(avg_gain[period])
+        al = float(avg_loss[period])
+        tail_gain = []
+        tail_loss = []
+        for i in range(period + 1, n):
+            ag = (ag * (period-1) + gain_list[i]) / period
+            al = (al * (period-1) + loss_list[i]) / period
+            tail_gain.append(ag)
+            tail_loss.append(al)
+        if tail_gain:
+            avg_gain[period + 1:] = tail_gain
+            avg_loss[period + 1:] = tail_loss
+
+        rs = avg_gain / np.where(avg_loss == 0, 1e-10, avg_loss)
+        return 100 - (100 / (1 + rs))
+
+    except Exception as e:
+        raise Exception(f"RSI 계산 중 오류 발생: {str(e)}")
+
+
+def true_range_np(high, low, close) -> np.ndarray:
+    """True Range (첫 바는 고가 - 저가)"""
+    h = as_float_array(high)
+    lo = as_float_array(low)
+    c = as_float_array(close)
+    tr = h - lo
+    if len(tr) > 1:
+        prev_close = c[:-1]
+        # 내장 max()와 같은 비교 순서 (NaN 처리 포함)
+        body = tr[1:]
+        for candidate in (np.abs(h[1:] - prev_close), np.abs(lo[1:] - prev_close)):
+            body = np.where(candidate > body, candidate, body)
+        tr[1:] = body
+    return tr
+
+
+def calc_atr_np(high, low, close, length: int = 14) -> np.ndarray:
+    """ATR (calc_atr와 동일: length 미만은 누적 평균, 이후 Wilder 공식)"""
+    tr = true_range_np(high, low, close)
+    n = len(tr)
+    atr = np.empty(n)
+    warmup = min(length, n)
+    if warmup > 0:
+        atr[:warmup] = np.cumsum(tr[:warmup]) / np.arange(1, warmup + 1)
+    if n > length:
+        tr_list = tr.tolist()
+        prev = float(atr[length - 1])
+        tail = []
+        for i in range(length, n):
+            prev = (prev * (length-1) + tr_list[i]) / length
+            tail.append(prev)
+        atr[length:] = tail
+    return atr
+
+
+def calc_stddev_np(series, length: int) -> np.ndarray:
+    """
+    러닝 합 기반 모표준편차 (calc_stddev와 동일)
+
+    기존 구현의 "더하기 → 빼기" 순서를 교차 배열의 cumsum으로 재현하므로
+    누적 오차까지 같은 값이 나옵니다. 분산이 0 이하(또는 NaN)이면 0을 반환합니다.
+    """
+    x = as_float_array(series)
+    n = len(x)
+    out = np.full(n, np.nan)
+    if n == 0 or length <= 0 or n < length:
+        return out
+
+    def running_window_sum(values: np.ndarray) -> np.ndarray:
+        # [v0..v(L-1), vL, -v0, v(L+1), -v1, ...] 누적 → 각 바의 윈도우 합
+        steps = np.empty(length + 2 * (n - length))
+        steps[:length] = values[:length]
+        steps[length::2] = values[length:]
+        steps[length + 1::2] = -values[:n - length]
+        cum = np.cumsum(steps)
+        sums = np.empty(n - length + 1)
+        sums[0] = cum[length - 1]
+        sums[1:] = cum[length + 1::2]
+        return sums
+
+    sum_ = running_window_sum(x)
+    sum_sq = running_window_sum(x * x)
+    mean = sum_ / length
+    var = (sum_sq / length) - (mean * mean)
+    positive = var > 0
+    out[length - 1:] = np.where(positive, np.sqrt(np.where(positive, var, 0.0)), 0.0)
+    return out
+
+
+def calc_bollinger_bands_np(series, length=20, mult=2.0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger Bands (calc_bollinger_bands와 동일)
+
+    middle은 NaN 스킵 SMA, upper/lower는 표본 표준편차(ddof=1)를 사용하며
+    데이터가 부족한 초기 length-1 구간은 NaN입니다 (리스트 API에서는 None).
+    """
+    x = as_float_array(series)
+    n = len(x)
+    middle = calc_sma_np(x, length)
+    upper = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    if n == 0 or length <= 0 or n < length:
+        return upper, middle, lower
+
+    if length == 1:
+        # np.std(ddof=1) of one value → NaN
+        stdev = np.full(n, np.nan)
+    else:
+        stdev = sliding_window_view(x, length).std(axis=1, ddof=1)
+    m = middle[length - 1:]
+    upper[length - 1:] = m + mult*stdev
+    lower[length - 1:] = m - mult*stdev
+    return upper, middle, lower
+
+
+# =============================================================================
+# Pivots / Rational Quadratic
+# =============================================================================
+
+def _pivot_np(series, left_bars: int, right_bars: int, is_high: bool) -> np.ndarray:
+    x = as_float_array(series)
+    n = len(x)
+    out = np.full(n, np.nan)
+    start = left_bars + right_bars
+    if n <= start:
+        return out
+
+    idx = np.arange(start, n)
+    pivot_idx = idx - left_bars
+    current = x[pivot_idx]
+    is_pivot = ~np.isnan(current)
+
+    # 좌측 비교: pivot_idx - left_bars >= 0 인 경우에만 (기존 구현은 음수 인덱스에서 즉시 break)
+    has_left = pivot_idx - left_bars >= 0
+    for d in range(1, left_bars + 1):
+        neighbor = x[np.maximum(pivot_idx - d, 0)]
+        beaten = neighbor >= current if is_high else neighbor <= current
+        is_pivot &= ~(beaten & has_left)
+
+    # 우측 비교: pivot_idx + 1 ~ pivot_idx + right_bars (배열 끝까지)
+    for d in range(1, right_bars + 1):
+        pos = pivot_idx + d
+        in_range = pos < n
+        neighbor = x[np.minimum(pos, n - 1)]
+        beaten = neighbor >= current if is_high else neighbor <= current
+        is_pivot &= ~(beaten & in_range)
+
+    out[idx[is_pivot]] = current[is_pivot]
+    return out
+
+
+def pivothigh_np(series, left_bars: int, right_bars: int) -> np.ndarray:
+    """ta.pivothigh (pivothigh와 동일, 피벗이 아니면 NaN)"""
+    return _pivot_np(series, left_bars, right_bars, is_high=True)
+
+
+def pivotlow_np(series, left_bars: int, right_bars: int) -> np.ndarray:
+    """ta.pivotlow (pivotlow와 동일, 피벗이 아니면 NaN)"""
+    return _pivot_np(series, left_bars, right_bars, is_high=False)
+
+
+def rational_quadratic_np(series, lookback=30, relative_weight=0.5, start_at_bar=5) -> np.ndarray:
+    """
+    rationalQuadratic 커널 (rational_quadratic와 동일)
+
+    Pine의 _size는 항상 1이므로 lag 0..start_at_bar+1 만 사용합니다.
+    NaN 값은 건너뛰고, 가중치 합이 0이면 현재 값을 그대로 반환합니다.
+    """
+    y = as_float_array(series)
+    n = len(y)
+    w_sum = np.zeros(n)
+    val_sum = np.zeros(n)
+    for lag in range(1 + start_at_bar + 1):
+        if lag >= n:
+            break
+        w = (1.0 + (lag**2) / ((lookback**2) * 2 * relative_weight))**(-relative_weight)
+        lagged = y[:n - lag] if lag else y
+        valid = ~np.isnan(lagged)
+        w_sum[lag:] += np.where(valid, w, 0.0)
+        val_sum[lag:] += np.where(valid, lagged * w, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        kernel = val_sum / w_sum
+    return np.where(w_sum > 0, kernel, y)
+
+
+# =============================================================================
+# Multi-timeframe resampling
+# =============================================================================
+
+def resample_close_np(close, timestamps, target_minutes: int, is_backtest: bool = True) -> np.ndarray:
+    """
+    resample_candles()의 close 컬럼만 배열로 계산
+
+    그룹 마감 종가를 원본 길이로 forward fill하고, is_backtest=True이면
+    request.security()[1]처럼 한 칸 shift 합니다 (첫 바는 원본 종가).
+    """
+    c = as_float_array(close)
+    n = len(c)
+    if n == 0 or target_minutes <= 0:
+        return c.copy()
+
+    ts = np.asarray(timestamps, dtype=np.int64)
+    target_seconds = target_minutes * 60
+    group_start = (ts // target_seconds) * target_seconds
+
+    # 새 그룹: 현재 그룹 시작(=지금까지의 최대값)보다 클 때만
+    running_max = np.maximum.accumulate(group_start)
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    new_group[1:] = group_start[1:] > running_max[:-1]
+    first_idx = np.flatnonzero(new_group)
+    last_idx = np.append(first_idx[1:] - 1, n - 1)
+    group_close = c[last_idx]
+    group_starts = group_start[first_idx].tolist()
+
+    # forward fill 매핑 (한 바에 최대 한 그룹씩 전진 - 기존 루프와 동일)
+    mapping = np.empty(n, dtype=np.int64)
+    resampled_idx = 0
+    n_groups = len(group_starts)
+    for i, gs in enumerate(group_start.tolist()):
+        if resampled_idx + 1 < n_groups and gs >= group_starts[resampled_idx + 1]:
+            resampled_idx += 1
+        mapping[i] = resampled_idx
+    filled = group_close[mapping]
+
+    if not is_backtest:
+        return filled
+    shifted = np.empty(n)
+    shifted[0] = c[0]
+    shifted[1:] = filled[:-1]
+    return shifted
+
+
+def bucket_closes_np(close, timestamps, target_minutes: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    버킷(상위 TF 봉)별 시작 시각(초)과 마감 종가
+
+    TimescaleDB의 time_bucket(...) + last(close, time) 집계와 같은 결과입니다.
+    """
+    c = as_float_array(close)
+    ts = np.asarray(timestamps, dtype=np.int64)
+    if len(c) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+    target_seconds = target_minutes * 60
+    group_start = (ts // target_seconds) * target_seconds
+    last_idx = np.append(np.flatnonzero(group_start[1:] != group_start[:-1]), len(c) - 1)
+    return group_start[last_idx], c[last_idx]
+
+
+def align_bucket_closes_np(close, timestamps, target_minutes: int, bucket_starts, bucket_close,
+                           is_backtest: bool = True) -> np.ndarray:
+    """
+    미리 집계된 버킷 종가를 현재 TF 바에 정렬
+
+    정렬된 입력에서 resample_close_np(close, timestamps, target_minutes)와 같은
+    배열을 돌려줍니다. 버킷이 없는 바는 현재 종가를 사용합니다.
+    """
+    c = as_float_array(close)
+    n = len(c)
+    if n == 0 or target_minutes <= 0:
+        return c.copy()
+
+    target_seconds = target_minutes * 60
+    group_start = (np.asarray(timestamps, dtype=np.int64) // target_seconds) * target_seconds
+    starts = np.asarray(bucket_starts, dtype=np.int64)
+    closes = as_float_array(bucket_close)
+    if len(starts):
+        idx = np.minimum(np.searchsorted(starts, group_start), len(starts) - 1)
+        filled = np.where(starts[idx] == group_start, closes[idx], c)
+    else:
+        filled = c.copy()
+
+    if not is_backtest:
+        return filled
+    shifted = np.empty(n)
+    shifted[0] = c[0]
+    shifted[1:] = filled[:-1]
+    return shifted
+
+
+def mtf_close_minutes(current_timeframe_minutes) -> dict[str, int]:
+    """
+    compute_indicator_arrays()가 사용하는 MTF 종가 인자 → 상위 TF(분)
+
+    현재 TF를 그대로 쓰는 인자는 포함하지 않습니다.
+    """
+    minutes = {"close_4h": CYCLE_2ND_MINUTES}
+    res_minutes = get_res_minutes(current_timeframe_minutes)
+    if res_minutes is not None:
+        minutes["close_higher_tf"] = res_minutes
+    bb_mtf_minutes = get_bb_mtf_minutes(current_timeframe_minutes)
+    if bb_mtf_minutes is not None:
+        minutes["close_bb_mtf"] = bb_mtf_minutes
+    return minutes
+
+
+def get_res_minutes(current_timeframe_minutes):
+    """Pine Script Line 32: res_ 타임프레임 (CYCLE용)"""
+    if current_timeframe_minutes is None:
+        return None
+    if current_timeframe_minutes <= 3:
+        return 15
+    if current_timeframe_minutes <= 30:
+        return 30
+    if current_timeframe_minutes < 240:
+        return 60
+    return 480
+
+
+def get_bb_mtf_minutes(current_timeframe_minutes):
+    """Pine Script Line 355: bb_mtf 타임프레임 (BB_State_MTF용)"""
+    if current_timeframe_minutes is None:
+        return None
+    if current_timeframe_minutes <= 3:
+        return 5
+    if current_timeframe_minutes <= 15:
+        return 15
+    return 60
+
+
+# =============================================================================
+# Output helpers
+# =============================================================================
+
+_ROUND_THRESHOLDS = (0.0001, 0.01, 1, 1000, 100000, 1000000)
+_ROUND_DIGITS = (8, 6, 4, 3, 2, 1)
+
+
+def dynamic_round_array(values) -> list:
+    """
+    dynamic_round()를 배열 전체에 적용해 Python 리스트로 반환
+
+    rint(x * 10^d) / 10^d는 정수부가 정확하면 내장 round()와 같은 double을
+    돌려주므로 벡터로 계산하고, .5 경계에 너무 가까워 곱셈 오차가 결과를 바꿀 수
+    있는 값과 범위 밖 값(>= 1e6, NaN/inf)만 dynamic_round()로 다시 계산합니다.
+    결과는 요소별 dynamic_round()와 동일합니다.
+    """
+    arr = as_float_array(values)
+    abs_vals = np.abs(arr)
+    with np.errstate(invalid="ignore"):
+        digits = np.select([abs_vals < t for t in _ROUND_THRESHOLDS], _ROUND_DIGITS, default=-1)
+    scale = np.power(10.0, np.maximum(digits, 0))
+    scaled = arr * scale
+    with np.errstate(invalid="ignore"):
+        rounded = np.rint(scaled) / scale
+        frac = scaled - np.floor(scaled)
+        near_tie = np.abs(frac - 0.5) < 1e-6
+    out = rounded.tolist()
+    for i in np.flatnonzero((digits < 0) | near_tie).tolist():
+        out[i] = dynamic_round(float(arr[i]))
+    return out
+
+
+def to_optional_list(values, none_before: int = 0) -> list:
+    """배열을 리스트로 변환하며 앞쪽 none_before개는 None으로 채움 (웜업 구간)"""
+    out = as_float_array(values).tolist()
+    for i in range(min(none_before, len(out))):
+        out[i] = None
+    return out
+
+
+def pivot_to_list(values) -> list:
+    """피벗 배열(NaN=없음)을 기존 리스트 형식(None=없음)으로 변환"""
+    return [None if v != v else v for v in as_float_array(values).tolist()]
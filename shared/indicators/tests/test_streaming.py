@@ -0,0 +1,126 @@
+"""Unit Tests for StreamingIndicatorState
+
+Every streamed bar must match a full compute_all_indicators() recompute over
+the same history, including after intrabar replace_last() ticks and after a
+to_dict()/from_dict() checkpoint round trip.
+
+Run tests:
+    pytest shared/indicators/tests/test_streaming.py -v
+"""
+
+import copy
+import json
+import math
+import random
+
+import pytest
+
+from shared.indicators import StreamingIndicatorState, compute_all_indicators
+
+INDICATOR_KEYS = (
+    "sma5", "sma20", "sma50", "sma60", "sma100", "sma200",
+    "jma5", "jma10", "jma20",
+    "ema5", "ema7", "ema14", "ema20", "ema200",
+    "rsi", "bb_upper", "bb_middle", "bb_lower", "atr14",
+    "CYCLE_Bull", "CYCLE_Bear", "BB_State", "trend_state",
+)
+# compute_all_indicators()의 RSI는 period개 이하의 캔들에서 예외를 던짐
+RSI_PERIOD = 14
+
+
+def _make_candles(n, seed=5):
+    rng = random.Random(seed)
+    price = 30000.0
+    candles = []
+    for i in range(n):
+        open_ = price
+        # 변동성 구간을 섞어 BB_State/trend_state 전이가 일어나도록 함
+        vol = 0.004 if (i // 150) % 2 else 0.0008
+        close = price * (1 + rng.gauss(0, vol))
+        candles.append({
+            "timestamp": 1_700_000_000 + i * 60,
+            "open": open_,
+            "high": max(open_, close) * (1 + abs(rng.gauss(0, vol / 3))),
+            "low": min(open_, close) * (1 - abs(rng.gauss(0, vol / 3))),
+            "close": close,
+            "volume": rng.random() * 10,
+        })
+        price = close
+    return candles
+
+
+def _tick(bar, frac):
+    """진행 중인 캔들 (종가가 open → close 사이)"""
+    tick = dict(bar)
+    tick["close"] = bar["open"] + (bar["close"] - bar["open"]) * frac
+    tick["high"] = max(bar["open"], tick["close"])
+    tick["low"] = min(bar["open"], tick["close"])
+    return tick
+
+
+def _assert_matches(values, expected, index):
+    for key in INDICATOR_KEYS:
+        got, want = values[key], expected[key]
+        if isinstance(want, float) and math.isnan(want):
+            assert math.isnan(got), (index, key)
+        else:
+            assert got == want and type(got) is type(want), (index, key, got, want)
+
+
+@pytest.fixture(scope="module")
+def candles():
+    return _make_candles(700)
+
+
+@pytest.mark.parametrize("params", [{}, {"use_custom_length": True, "custom_length": 7}])
+def test_stream_matches_full_recompute(candles, params):
+    full = compute_all_indicators(copy.deepcopy(candles), **params)
+    state = StreamingIndicatorState(**params)
+    transitions = set()
+    for i, bar in enumerate(candles):
+        state.update(_tick(bar, 0.3))
+        state.replace_last(_tick(bar, 0.8))
+        values = state.replace_last(bar)
+        if i > RSI_PERIOD:
+            _assert_matches(values, full[i], i)
+        transitions.add(values["BB_State"])
+    # 상태 머신이 실제로 여러 상태를 거쳤는지 확인
+    assert len(transitions) >= 3
+
+
+def test_last_bar_matches_recompute_of_prefix(candles):
+    state = StreamingIndicatorState.from_candles(candles[:400])
+    for n in (400, 401, 450):
+        if n > state.count:
+            for bar in candles[state.count:n]:
+                state.update(bar)
+        full = compute_all_indicators(copy.deepcopy(candles[:n]))
+        _assert_matches(state.last_values, full[-1], n - 1)
+        assert state.last_timestamp == candles[n - 1]["timestamp"]
+
+
+def test_checkpoint_round_trip(candles):
+    state = StreamingIndicatorState.from_candles(candles[:500])
+    state.replace_last(_tick(candles[499], 0.5))
+
+    restored = StreamingIndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+    assert restored.count == state.count
+    assert restored.last_values == state.last_values
+
+    # 복원된 상태에서도 진행 중인 바 교체와 새 바 추가가 동일해야 함
+    for s in (state, restored):
+        s.replace_last(candles[499])
+    for bar in candles[500:560]:
+        assert restored.update(bar) == state.update(bar)
+
+
+def test_replace_last_requires_bar():
+    with pytest.raises(ValueError):
+        StreamingIndicatorState().replace_last(_make_candles(1)[0])
+
+
+def test_from_dict_rejects_unknown_version(candles):
+    data = StreamingIndicatorState.from_candles(candles[:50]).to_dict()
+    data["version"] = -1
+    with pytest.raises(ValueError):
+        StreamingIndicatorState.from_dict(data)
@@ -0,0 +1,301 @@
+"""Unit Tests for the vectorized indicator engine
+
+Compares the NumPy kernels in shared.indicators._vectorized against the
+original per-bar loop implementations (kept here as references) and checks
+that compute_all_indicators() stays a thin adapter over compute_indicator_arrays().
+
+Run tests:
+    pytest shared/indicators/tests/test_vectorized.py -v
+"""
+
+import copy
+import math
+import random
+
+import numpy as np
+import pytest
+
+from shared.indicators import (
+    calc_atr,
+    calc_bollinger_bands,
+    calc_jma,
+    calc_sma,
+    calc_stddev,
+    calc_vidya,
+    candles_to_arrays,
+    compute_all_indicators,
+    compute_indicator_arrays,
+    rational_quadratic,
+    timestamps_to_seconds,
+)
+from shared.indicators._core import dynamic_round, pivothigh
+from shared.indicators._vectorized import dynamic_round_array
+
+# =============================================================================
+# Reference (loop) implementations
+# =============================================================================
+
+def ref_sma(series, length):
+    out = []
+    for i in range(len(series)):
+        window = series[max(0, i - length + 1):i + 1]
+        valid = [v for v in window if not math.isnan(v)]
+        out.append(sum(valid) / len(valid) if valid else math.nan)
+    return out
+
+
+def ref_stddev(series, length):
+    sum_ = sum_sq = 0.0
+    out = []
+    for i, val in enumerate(series):
+        sum_ += val
+        sum_sq += val * val
+        if i >= length:
+            old = series[i - length]
+            sum_ -= old
+            sum_sq -= old * old
+        if i < length - 1:
+            out.append(math.nan)
+        else:
+            mean = sum_ / length
+            var = (sum_sq / length) - (mean * mean)
+            out.append(math.sqrt(var) if var > 0 else 0)
+    return out
+
+
+def ref_pivothigh(series, left_bars, right_bars):
+    result = [None] * len(series)
+    for i in range(left_bars + right_bars, len(series)):
+        pivot_idx = i - left_bars
+        current = series[pivot_idx]
+        if current != current:
+            continue
+        is_pivot = True
+        for j in range(pivot_idx - left_bars, pivot_idx):
+            if j < 0:
+                break
+            if series[j] >= current:
+                is_pivot = False
+                break
+        if is_pivot:
+            for j in range(pivot_idx + 1, min(pivot_idx + right_bars + 1, len(series))):
+                if series[j] >= current:
+                    is_pivot = False
+                    break
+        if is_pivot:
+            result[i] = current
+    return result
+
+
+def ref_rational_quadratic(series, lookback=30, relative_weight=0.5, start_at_bar=5):
+    out = []
+    for idx in range(len(series)):
+        w_sum = val_sum = 0.0
+        for lag in range(1 + start_at_bar + 1):
+            if idx - lag < 0:
+                break
+            y = series[idx - lag]
+            if math.isnan(y):
+                continue
+            w = (1.0 + (lag**2) / ((lookback**2) * 2 * relative_weight))**(-relative_weight)
+            w_sum += w
+            val_sum += y * w
+        out.append(val_sum / w_sum if w_sum > 0 else series[idx])
+    return out
+
+
+def ref_vidya(series, smooth_period=9):
+    result = [series[0]]
+    for i in range(1, len(series)):
+        sum_up = sum_down = 0.0
+        for k in range(1, 10):
+            if i - k < 0:
+                break
+            diff = series[i - k] - series[i - k + 1]
+            if diff > 0:
+                sum_up += diff
+            else:
+                sum_down -= diff
+        cmo = abs((sum_up - sum_down) / (sum_up + sum_down)) if (sum_up + sum_down) != 0 else 1.0
+        alpha = 2.0 / (smooth_period + 1.0)
+        result.append(result[-1] + alpha * cmo * (series[i] - result[-1]))
+    return result
+
+
+def ref_jma(series, length=5, phase=50, power=2):
+    phase_ratio = (phase / 100.0) + 1.5
+    beta = 0.45*(length-1) / (0.45*(length-1) + 2) if length > 1 else 0
+    alpha1 = beta ** power
+    e0, e1, e2, jma = series[0], 0.0, 0.0, series[0]
+    out = []
+    for i, src in enumerate(series):
+        if i > 0:
+            e0 = (1 - alpha1)*src + alpha1*e0
+            e1 = (src - e0)*(1 - beta) + beta*e1
+            e2 = (e0 + phase_ratio*e1 - jma) * ((1 - alpha1)**2) + (alpha1**2)*e2
+            jma = e2 + jma
+        out.append(sum(series[:i+1]) / (i+1) if i < length else jma)
+    return out
+
+
+def ref_atr(candles, length=14):
+    tr = []
+    for i, c in enumerate(candles):
+        if i == 0:
+            tr.append(c["high"] - c["low"])
+        else:
+            pc = candles[i-1]["close"]
+            tr.append(max(c["high"] - c["low"], abs(c["high"] - pc), abs(c["low"] - pc)))
+    atr = []
+    for i in range(len(tr)):
+        if i < length:
+            atr.append(sum(tr[:i+1]) / (i+1))
+        else:
+            atr.append((atr[i-1] * (length-1) + tr[i]) / length)
+    return atr
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+def _make_candles(n, timeframe_minutes=1, seed=7):
+    rng = random.Random(seed)
+    price = 100.0
+    start = 1_700_000_000 - (1_700_000_000 % 14400)
+    candles = []
+    for i in range(n):
+        open_ = price
+        close = price * (1 + rng.gauss(0, 0.003))
+        high = max(open_, close) * (1 + abs(rng.gauss(0, 0.001)))
+        low = min(open_, close) * (1 - abs(rng.gauss(0, 0.001)))
+        candles.append({
+            "timestamp": start + i * 60 * timeframe_minutes,
+            "open": open_, "high": high, "low": low, "close": close,
+            "volume": rng.random() * 100,
+        })
+        price = close
+    return candles
+
+
+@pytest.fixture
+def closes():
+    return [c["close"] for c in _make_candles(600)]
+
+
+@pytest.fixture
+def closes_with_nan(closes):
+    rng = random.Random(11)
+    return [v if rng.random() > 0.1 else math.nan for v in closes]
+
+
+def _assert_same(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None or a is None:
+            assert a is None and e is None
+        elif isinstance(e, float) and math.isnan(e):
+            assert math.isnan(a)
+        else:
+            assert a == e
+
+
+# =============================================================================
+# Kernels vs reference loops (bit-for-bit)
+# =============================================================================
+
+@pytest.mark.parametrize("length", [1, 5, 20, 200, 1000])
+def test_sma_matches_loop(closes, closes_with_nan, length):
+    _assert_same(calc_sma(closes, length), ref_sma(closes, length))
+    _assert_same(calc_sma(closes_with_nan, length), ref_sma(closes_with_nan, length))
+
+
+@pytest.mark.parametrize("length", [15, 60])
+def test_stddev_matches_running_sum_loop(closes, length):
+    _assert_same(calc_stddev(closes, length), ref_stddev(closes, length))
+
+
+def test_bollinger_bands_keep_none_warmup(closes):
+    upper, middle, lower = calc_bollinger_bands(closes, length=20, mult=2.0)
+    assert upper[:19] == [None] * 19
+    assert lower[:19] == [None] * 19
+    for i in range(19, len(closes)):
+        stdev = float(np.std(closes[i - 19:i + 1], ddof=1))
+        assert upper[i] == middle[i] + 2.0 * stdev
+        assert lower[i] == middle[i] - 2.0 * stdev
+
+
+@pytest.mark.parametrize("left,right", [(20, 10), (3, 5), (30, 10)])
+def test_pivothigh_matches_loop(closes_with_nan, left, right):
+    _assert_same(pivothigh(closes_with_nan, left, right), ref_pivothigh(closes_with_nan, left, right))
+
+
+def test_rational_quadratic_matches_loop(closes_with_nan):
+    _assert_same(rational_quadratic(closes_with_nan), ref_rational_quadratic(closes_with_nan))
+
+
+@pytest.mark.parametrize("length", [3, 9, 21])
+def test_vidya_matches_loop(closes, length):
+    _assert_same(calc_vidya(closes, length), ref_vidya(closes, length))
+
+
+@pytest.mark.parametrize("length", [5, 10, 20])
+def test_jma_matches_loop(closes, length):
+    _assert_same(calc_jma(closes, length), ref_jma(closes, length))
+
+
+def test_atr_matches_loop():
+    candles = _make_candles(300)
+    _assert_same(calc_atr(candles, 14), ref_atr(candles, 14))
+
+
+def test_dynamic_round_array_matches_scalar():
+    rng = np.random.default_rng(3)
+    values = np.concatenate([
+        rng.lognormal(0, 6, 20000) * rng.choice([-1, 1], 20000),
+        np.array([0.125, 2.675, 0.0, -0.0, np.nan, np.inf, 999999.95, 1234567.5]),
+    ])
+    expected = [dynamic_round(float(v)) for v in values]
+    actual = dynamic_round_array(values)
+    for a, e in zip(actual, expected):
+        if e != e:
+            assert a != a
+        else:
+            assert a == e and type(a) is type(e)
+
+
+# =============================================================================
+# compute_all_indicators adapter
+# =============================================================================
+
+@pytest.mark.parametrize("timeframe", [None, 1, 15, 240])
+def test_compute_all_indicators_is_adapter_over_arrays(timeframe):
+    candles = _make_candles(800, timeframe_minutes=timeframe or 1)
+    cols = candles_to_arrays(candles)
+    arrays = compute_indicator_arrays(
+        cols["high"], cols["low"], cols["close"], timestamps_to_seconds(candles),
+        current_timeframe_minutes=timeframe,
+    )
+    result = compute_all_indicators(copy.deepcopy(candles), current_timeframe_minutes=timeframe)
+
+    assert [c["trend_state"] for c in result] == arrays["trend_state"].tolist()
+    assert [c["BB_State"] for c in result] == arrays["BB_State"].tolist()
+    assert [c["CYCLE_Bull"] for c in result] == arrays["CYCLE_Bull"].tolist()
+    assert [c["rsi"] for c in result] == [dynamic_round(v) for v in arrays["rsi"].tolist()]
+    assert [c["bb_upper"] for c in result[:19]] == [None] * 19
+    assert all(isinstance(c["trend_state"], int) for c in result)
+    assert all(isinstance(c["CYCLE_Bear"], bool) for c in result)
+
+
+def test_compute_all_indicators_uses_pine_sma_warmup():
+    candles = compute_all_indicators(_make_candles(50), current_timeframe_minutes=1)
+    closes = [c["close"] for c in candles]
+    # ta.sma 부분 윈도우 평균 (NaN이 아님)
+    assert candles[0]["sma20"] == dynamic_round(closes[0])
+    assert candles[9]["sma20"] == dynamic_round(sum(closes[:10]) / 10)
+
+
+def test_compute_all_indicators_rejects_short_mtf_series():
+    candles = _make_candles(100)
+    with pytest.raises(ValueError):
+        compute_all_indicators(candles, candles_higher_tf=candles[:50])